@@ -0,0 +1,306 @@
+# src/compareblocks/association/candidates.py
+"""
+Candidate indexes for matching engine blocks to the GBG blocks of one page.
+Replaces per-block linear scans with exact-key, character, word and spatial lookups, batched fuzzy scoring
+and score-ordered one-to-one assignment.
+"""
+
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from rapidfuzz import process
+
+from ..mapping.match import batch_iou, boxes_to_array
+from ..mapping.spatial import BoxGridIndex
+
+
+EMPTY_INDICES = np.zeros(0, dtype=np.intp)
+
+
+class BlockCandidateIndex:
+    """
+    GBG blocks of one page with set-based bookkeeping of used blocks.
+
+    Blocks are addressed by their position in the original list, so every
+    lookup returns candidates in list order and ties resolve the same way as
+    a linear scan that keeps the first best block.
+    """
+
+    def __init__(self, blocks: List[Dict[str, Any]], cell_size: float = 64.0):
+        """
+        Initialize the index.
+
+        Args:
+            blocks: GBG blocks with 'block_id', 'text' and a GBG 'bbox' dict
+            cell_size: Grid cell edge length of the spatial index in PDF points
+        """
+        self.blocks = blocks
+        self.block_ids = [block['block_id'] for block in blocks]
+        self.available = np.ones(len(blocks), dtype=bool)
+        self.used_ids: Set[str] = set()
+        self._cell_size = cell_size
+        self._grid: Optional[BoxGridIndex] = None
+        self._boxes: Optional[np.ndarray] = None
+        self._key_indexes: Dict[str, Dict[Any, List[int]]] = {}
+        self._key_cursors: Dict[str, Dict[Any, int]] = {}
+
+        self._positions_by_id: Dict[str, List[int]] = {}
+        for position, block_id in enumerate(self.block_ids):
+            self._positions_by_id.setdefault(block_id, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def mark_used(self, block_id: str) -> None:
+        """Mark every block with this id as used (ids need not belong to the page)."""
+        self.used_ids.add(block_id)
+        for position in self._positions_by_id.get(block_id, ()):
+            self.available[position] = False
+
+    def is_available(self, position: int) -> bool:
+        """Whether the block at a position is still unused."""
+        return bool(self.available[position])
+
+    @property
+    def boxes(self) -> np.ndarray:
+        """(N, 4) xywh array of the block bounding boxes."""
+        if self._boxes is None:
+            self._boxes = boxes_to_array([block.get('bbox', {}) for block in self.blocks])
+        return self._boxes
+
+    def add_key_index(self, name: str, key: Callable[[Dict[str, Any]], Any]) -> None:
+        """
+        Index blocks by a derived key (e.g. normalized text) for exact lookups.
+
+        Args:
+            name: Name of the index
+            key: Function computing a hashable key from a block
+        """
+        index: Dict[Any, List[int]] = {}
+        for position, block in enumerate(self.blocks):
+            index.setdefault(key(block), []).append(position)
+        self._key_indexes[name] = index
+        self._key_cursors[name] = {}
+
+    def first_available(self, name: str, key: Any) -> Optional[int]:
+        """
+        First unused block, in list order, whose indexed key equals key.
+
+        Args:
+            name: Name of an index added with add_key_index
+            key: Key to look up
+
+        Returns:
+            Block position, or None
+        """
+        positions = self._key_indexes[name].get(key)
+        if not positions:
+            return None
+        # Blocks never become available again, so skipped positions stay skipped
+        cursors = self._key_cursors[name]
+        cursor = cursors.get(key, 0)
+        while cursor < len(positions) and not self.available[positions[cursor]]:
+            cursor += 1
+        cursors[key] = cursor
+        return positions[cursor] if cursor < len(positions) else None
+
+    def spatial_candidates(self, bbox: Tuple[float, float, float, float]) -> np.ndarray:
+        """
+        Blocks whose boxes overlap a query box, used or not.
+
+        Args:
+            bbox: Query box as (x, y, width, height)
+
+        Returns:
+            Sorted array of block positions
+        """
+        if self._grid is None:
+            self._grid = BoxGridIndex(self.boxes, self._cell_size)
+        return self._grid.query(bbox)
+
+    def iou(self, engine_box: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """
+        IoU of one engine box against the blocks at the given positions.
+
+        Args:
+            engine_box: (1, 4) xywh array
+            positions: Block positions
+
+        Returns:
+            IoU per position (same values as mapping.match.batch_iou)
+        """
+        if not len(positions):
+            return np.zeros(0, dtype=np.float64)
+        return batch_iou(engine_box, self.boxes[positions])[0]
+
+
+def first_best(scores: np.ndarray, positions: np.ndarray, available: Optional[np.ndarray] = None
+               ) -> Tuple[Optional[int], float]:
+    """
+    First position with the highest strictly positive score, like a linear scan with ">".
+
+    Args:
+        scores: Score per candidate
+        positions: Block position per candidate, in ascending order
+        available: Optional availability mask over all block positions
+
+    Returns:
+        (block position, score), or (None, 0.0) if no candidate scores above zero
+    """
+    if available is not None and len(positions):
+        keep = available[positions]
+        scores = scores[keep]
+        positions = positions[keep]
+    if not len(positions):
+        return None, 0.0
+    best = int(scores.argmax())
+    best_score = float(scores[best])
+    if not best_score > 0.0:
+        return None, 0.0
+    return int(positions[best]), best_score
+
+
+class CharacterIndex:
+    """Positions of blocks containing each character, with the character's count in each block."""
+
+    def __init__(self, texts: Sequence[str]):
+        """
+        Initialize the index.
+
+        Args:
+            texts: Block texts, already case-normalized as the caller compares them
+        """
+        self.texts = texts
+        grouped: Dict[str, Tuple[List[int], List[int]]] = {}
+        for position, text in enumerate(texts):
+            for char, count in Counter(text).items():
+                positions, counts = grouped.setdefault(char, ([], []))
+                positions.append(position)
+                counts.append(count)
+        self._index = {
+            char: (np.asarray(positions, dtype=np.intp), np.asarray(counts, dtype=np.float64))
+            for char, (positions, counts) in grouped.items()
+        }
+
+    def containing(self, substring: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Blocks containing a substring, with its (non-overlapping) count in each.
+
+        Args:
+            substring: Character or string to look up
+
+        Returns:
+            (positions, counts) arrays in block order
+        """
+        if len(substring) == 1:
+            return self._index.get(substring, (EMPTY_INDICES, np.zeros(0, dtype=np.float64)))
+        matches = [(position, text.count(substring)) for position, text in enumerate(self.texts)
+                   if substring in text]
+        if not matches:
+            return EMPTY_INDICES, np.zeros(0, dtype=np.float64)
+        positions, counts = zip(*matches)
+        return np.asarray(positions, dtype=np.intp), np.asarray(counts, dtype=np.float64)
+
+
+class TokenOverlapIndex:
+    """Inverted index of block token sets for batched Jaccard overlap."""
+
+    def __init__(self, token_sets: Sequence[Set[str]]):
+        """
+        Initialize the index.
+
+        Args:
+            token_sets: Token set per block
+        """
+        self.sizes = np.asarray([len(tokens) for tokens in token_sets], dtype=np.float64)
+        postings: Dict[str, List[int]] = {}
+        for position, tokens in enumerate(token_sets):
+            for token in tokens:
+                postings.setdefault(token, []).append(position)
+        self._postings = {token: np.asarray(positions, dtype=np.intp) for token, positions in postings.items()}
+
+    def jaccard(self, tokens: Set[str]) -> np.ndarray:
+        """
+        Jaccard overlap |A & B| / |A | B| of a token set with every block.
+
+        Args:
+            tokens: Query token set
+
+        Returns:
+            Overlap per block (1.0 where both sets are empty)
+        """
+        shared = np.zeros(len(self.sizes), dtype=np.float64)
+        for token in tokens:
+            positions = self._postings.get(token)
+            if positions is not None:
+                shared[positions] += 1
+        union = len(tokens) + self.sizes - shared
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(union > 0, shared / union, 1.0)
+
+
+def batch_fuzzy_scores(queries: Sequence[str], choices: Sequence[str],
+                       scorers: Iterable[Callable[..., float]],
+                       score_cutoff: Optional[float] = None) -> np.ndarray:
+    """
+    Best score over several rapidfuzz scorers for every query/choice pair, scaled to 0-1.
+
+    Args:
+        queries: Query strings (already preprocessed)
+        choices: Choice strings (already preprocessed)
+        scorers: rapidfuzz scorers returning 0-100
+        score_cutoff: Optional 0-1 cutoff; lower scores may be reported as 0.0
+
+    Returns:
+        (len(queries), len(choices)) float64 array with the same values as
+        max(scorer(query, choice) / 100.0 for scorer in scorers) at or above the cutoff
+    """
+    best = np.zeros((len(queries), len(choices)), dtype=np.float64)
+    if not len(queries) or not len(choices):
+        return best
+    # Scorers compare against 0-100 cutoffs; stay just below so no score at the cutoff is dropped
+    cutoff = None if score_cutoff is None else max(0.0, score_cutoff * 100.0 - 1e-6)
+    for scorer in scorers:
+        scores = process.cdist(queries, choices, scorer=scorer, dtype=np.float64, score_cutoff=cutoff)
+        np.maximum(best, scores / 100.0, out=best)
+    return best
+
+
+def greedy_assignment(scores: np.ndarray, min_score: float,
+                      row_keys: Optional[Sequence[Any]] = None,
+                      col_keys: Optional[Sequence[Any]] = None) -> List[Tuple[int, int, float]]:
+    """
+    One-to-one assignment that accepts the highest-scoring pairs first.
+
+    Unlike taking each row's best free column in row order, the result does not
+    depend on the row order: ties resolve to the lower row, then the lower column.
+
+    Args:
+        scores: (rows, columns) score matrix
+        min_score: Lowest acceptable score (must be positive)
+        row_keys: Optional key per row; rows sharing a key are used up together
+        col_keys: Optional key per column; columns sharing a key are used up together
+
+    Returns:
+        Accepted (row, column, score) triples, sorted by row
+    """
+    rows, cols = np.nonzero(scores >= min_score)
+    if not len(rows):
+        return []
+    values = scores[rows, cols]
+    order = np.lexsort((cols, rows, -values))
+
+    row_keys = row_keys if row_keys is not None else range(scores.shape[0])
+    col_keys = col_keys if col_keys is not None else range(scores.shape[1])
+    used_rows: Set[Any] = set()
+    used_cols: Set[Any] = set()
+    assignment = []
+    for index in order.tolist():
+        row, col = int(rows[index]), int(cols[index])
+        if row_keys[row] in used_rows or col_keys[col] in used_cols:
+            continue
+        used_rows.add(row_keys[row])
+        used_cols.add(col_keys[col])
+        assignment.append((row, col, float(values[index])))
+    assignment.sort()
+    return assignment
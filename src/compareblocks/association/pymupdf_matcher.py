@@ -4,13 +4,16 @@ Specialized matcher for PyMuPDF blocks to GBG blocks.
 Since GBG uses PyMuPDF as its underlying engine, we should achieve near-perfect matching.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional
 from dataclasses import dataclass
 import json
 from pathlib import Path
 from rapidfuzz import fuzz
 import re
+import numpy as np
 from ..config.file_manager import file_manager
+from ..mapping.match import batch_iou, boxes_to_array
+from .candidates import BlockCandidateIndex, CharacterIndex, TokenOverlapIndex, batch_fuzzy_scores, first_best
 
 
 @dataclass
@@ -126,130 +129,159 @@ class PyMuPDFBlockMatcher:
                              gbg_blocks: List[Dict[str, Any]], page_num: int) -> List[PyMuPDFMatch]:
         """Match blocks on a specific page using multiple strategies."""
         matches = []
-        used_gbg_blocks = set()
         used_engine_blocks = set()
         
+        # Index the page's GBG blocks once; every strategy looks candidates up
+        # in it instead of scanning all GBG blocks per engine block
+        candidates = self._build_candidate_index(gbg_blocks)
+        
+        def record(match: PyMuPDFMatch) -> None:
+            matches.append(match)
+            candidates.mark_used(match.gbg_block_id)
+            used_engine_blocks.add(match.engine_block_id)
+        
         # Strategy 1: Exact text match (should be common since both use PyMuPDF)
         for engine_block in engine_blocks:
             if engine_block['block_id'] in used_engine_blocks:
                 continue
-            best_match = self._find_exact_text_match(engine_block, gbg_blocks, used_gbg_blocks)
+            best_match = self._find_exact_text_match(engine_block, candidates)
             if best_match:
-                matches.append(best_match)
-                used_gbg_blocks.add(best_match.gbg_block_id)
-                used_engine_blocks.add(best_match.engine_block_id)
+                record(best_match)
         
         # Strategy 2: High similarity text match for remaining blocks
         remaining_engine_blocks = [b for b in engine_blocks if b['block_id'] not in used_engine_blocks]
         
+        # Fuzzy scores for all multi-character blocks in one batched pass
+        similarity_rows = self._batch_similarity_scores(
+            [b for b in remaining_engine_blocks if len(b['text'].strip()) != 1], candidates
+        )
+        
         for engine_block in remaining_engine_blocks:
-            best_match = self._find_similarity_match(engine_block, gbg_blocks, used_gbg_blocks)
+            best_match = self._find_similarity_match(engine_block, candidates, similarity_rows.get(id(engine_block)))
             if best_match and best_match.similarity_score >= self.similarity_threshold:
-                matches.append(best_match)
-                used_gbg_blocks.add(best_match.gbg_block_id)
-                used_engine_blocks.add(best_match.engine_block_id)
+                record(best_match)
         
         # Strategy 3: SPATIAL-FIRST MATCHING - Match by position regardless of text content
         remaining_engine_blocks = [b for b in engine_blocks if b['block_id'] not in used_engine_blocks]
         
-        spatial_matches = self._find_spatial_first_matches(remaining_engine_blocks, gbg_blocks, used_gbg_blocks)
-        matches.extend(spatial_matches)
+        spatial_matches = self._find_spatial_first_matches(remaining_engine_blocks, candidates)
         for match in spatial_matches:
-            used_gbg_blocks.add(match.gbg_block_id)
-            used_engine_blocks.add(match.engine_block_id)
+            record(match)
         
         # Strategy 4: BLOCK COMBINATION MATCHING - Match multiple engine blocks to single GBG block
         remaining_engine_blocks = [b for b in engine_blocks if b['block_id'] not in used_engine_blocks]
-        remaining_gbg_blocks = [b for b in gbg_blocks if b['block_id'] not in used_gbg_blocks]
+        remaining_gbg_blocks = [gbg_blocks[i] for i in np.flatnonzero(candidates.available)]
         
         combination_matches = self._find_combination_matches(remaining_engine_blocks, remaining_gbg_blocks)
-        matches.extend(combination_matches)
         for match in combination_matches:
-            used_gbg_blocks.add(match.gbg_block_id)
-            used_engine_blocks.add(match.engine_block_id)
+            record(match)
         
         # Strategy 5: FORCE 100% MATCHING - Match any remaining blocks by best spatial fit
         remaining_engine_blocks = [b for b in engine_blocks if b['block_id'] not in used_engine_blocks]
-        remaining_gbg_blocks = [b for b in gbg_blocks if b['block_id'] not in used_gbg_blocks]
+        remaining_gbg_blocks = [gbg_blocks[i] for i in np.flatnonzero(candidates.available)]
         
         force_matches = self._force_remaining_matches(remaining_engine_blocks, remaining_gbg_blocks)
         matches.extend(force_matches)
         
         return matches
     
+    def _build_candidate_index(self, gbg_blocks: List[Dict[str, Any]]) -> '_PageCandidates':
+        """Index a page's GBG blocks by normalized text, characters, words and position."""
+        return _PageCandidates(gbg_blocks, self._normalize_text)
+    
+    def _engine_box(self, engine_block: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Engine bbox as a (1, 4) xywh array, or None if it has fewer than four values."""
+        engine_bbox = engine_block.get('bbox', [])
+        if not engine_bbox or len(engine_bbox) < 4:
+            return None
+        return boxes_to_array([engine_bbox], box_format="xyxy")
+    
     def _find_exact_text_match(self, engine_block: Dict[str, Any], 
-                              gbg_blocks: List[Dict[str, Any]], 
-                              used_blocks: set) -> Optional[PyMuPDFMatch]:
+                              candidates: '_PageCandidates') -> Optional[PyMuPDFMatch]:
         """Find exact text match between engine and GBG blocks."""
         engine_text = self._normalize_text(engine_block['text'])
         
-        for gbg_block in gbg_blocks:
-            if gbg_block['block_id'] in used_blocks:
-                continue
-            
-            gbg_text = self._normalize_text(gbg_block['text'])
-            
-            if engine_text == gbg_text:
-                return PyMuPDFMatch(
-                    engine_block_id=engine_block['block_id'],
-                    gbg_block_id=gbg_block['block_id'],
-                    similarity_score=1.0,
-                    match_type='exact_text',
-                    engine_text_preview=engine_block['text'][:100],
-                    gbg_text_preview=gbg_block['text'][:100],
-                    page_match=True,
-                    bbox_similarity=self._calculate_bbox_similarity(
-                        engine_block.get('bbox', []), gbg_block.get('bbox', {})
-                    )
-                )
+        position = candidates.first_available('normalized', engine_text)
+        if position is None:
+            return None
         
-        return None
+        gbg_block = candidates.blocks[position]
+        return PyMuPDFMatch(
+            engine_block_id=engine_block['block_id'],
+            gbg_block_id=gbg_block['block_id'],
+            similarity_score=1.0,
+            match_type='exact_text',
+            engine_text_preview=engine_block['text'][:100],
+            gbg_text_preview=gbg_block['text'][:100],
+            page_match=True,
+            bbox_similarity=self._calculate_bbox_similarity(
+                engine_block.get('bbox', []), gbg_block.get('bbox', {})
+            )
+        )
+    
+    def _batch_similarity_scores(self, engine_blocks: List[Dict[str, Any]],
+                                 candidates: '_PageCandidates',
+                                 chunk_size: int = 256) -> Dict[int, np.ndarray]:
+        """
+        _calculate_comprehensive_similarity of engine blocks against every GBG block, batched.
+        
+        Scores below the similarity threshold may be reported as 0.0; they can
+        never be accepted, and the best accepted score is unaffected.
+        
+        Args:
+            engine_blocks: Engine blocks to score
+            candidates: Candidate index of the page's GBG blocks
+            chunk_size: Engine blocks scored per rapidfuzz call (bounds memory)
+            
+        Returns:
+            id(engine block) -> similarity per GBG block position
+        """
+        rows = {}
+        for start in range(0, len(engine_blocks), chunk_size):
+            chunk = engine_blocks[start:start + chunk_size]
+            texts = [block['text'].lower().strip() for block in chunk]
+            scores = batch_fuzzy_scores(texts, candidates.similarity_texts, SIMILARITY_SCORERS,
+                                        score_cutoff=self.similarity_threshold)
+            for row, (block, text) in enumerate(zip(chunk, texts)):
+                word_overlap = candidates.words.jaccard(set(text.split()))
+                rows[id(block)] = np.maximum(scores[row], word_overlap)
+        return rows
     
     def _find_similarity_match(self, engine_block: Dict[str, Any], 
-                              gbg_blocks: List[Dict[str, Any]], 
-                              used_blocks: set) -> Optional[PyMuPDFMatch]:
+                              candidates: '_PageCandidates',
+                              similarities: Optional[np.ndarray] = None) -> Optional[PyMuPDFMatch]:
         """Find best similarity match between engine and GBG blocks."""
         engine_text = engine_block['text']
-        best_match = None
-        best_similarity = 0
         
         # Special handling for single character blocks
         if len(engine_text.strip()) == 1:
-            return self._find_single_char_match(engine_block, gbg_blocks, used_blocks)
+            return self._find_single_char_match(engine_block, candidates)
         
-        for gbg_block in gbg_blocks:
-            if gbg_block['block_id'] in used_blocks:
-                continue
-            
-            gbg_text = gbg_block['text']
-            
-            # Use multiple similarity measures
-            similarity = self._calculate_comprehensive_similarity(engine_text, gbg_text)
-            
-            # AGGRESSIVE MATCHING: Check for normalization match first
-            engine_normalized = self._normalize_text(engine_text)
-            gbg_normalized = self._normalize_text(gbg_text)
-            
-            if engine_normalized == gbg_normalized:
-                # This is an exact match after normalization (line breaks, spacing, etc.)
-                return PyMuPDFMatch(
-                    engine_block_id=engine_block['block_id'],
-                    gbg_block_id=gbg_block['block_id'],
-                    similarity_score=1.0,
-                    match_type='exact_text_normalized',
-                    engine_text_preview=engine_block['text'][:100],
-                    gbg_text_preview=gbg_block['text'][:100],
-                    page_match=True,
-                    bbox_similarity=self._calculate_bbox_similarity(
-                        engine_block.get('bbox', []), gbg_block.get('bbox', {})
-                    )
+        # AGGRESSIVE MATCHING: Check for normalization match first
+        position = candidates.first_available('normalized', self._normalize_text(engine_text))
+        if position is not None:
+            # This is an exact match after normalization (line breaks, spacing, etc.)
+            gbg_block = candidates.blocks[position]
+            return PyMuPDFMatch(
+                engine_block_id=engine_block['block_id'],
+                gbg_block_id=gbg_block['block_id'],
+                similarity_score=1.0,
+                match_type='exact_text_normalized',
+                engine_text_preview=engine_block['text'][:100],
+                gbg_text_preview=gbg_block['text'][:100],
+                page_match=True,
+                bbox_similarity=self._calculate_bbox_similarity(
+                    engine_block.get('bbox', []), gbg_block.get('bbox', {})
                 )
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = gbg_block
+            )
         
-        if best_match and best_similarity >= self.similarity_threshold:
+        if similarities is None:
+            similarities = self._batch_similarity_scores([engine_block], candidates)[id(engine_block)]
+        
+        position, best_similarity = first_best(similarities, np.arange(len(candidates)), candidates.available)
+        
+        if position is not None and best_similarity >= self.similarity_threshold:
+            best_match = candidates.blocks[position]
             # TREAT HIGH SIMILARITY AS EXACT MATCH
             # Line breaks, spacing differences are not valid content differences
             if best_similarity >= 0.90:
@@ -317,101 +349,80 @@ class PyMuPDFBlockMatcher:
         return None
     
     def _find_single_char_match(self, engine_block: Dict[str, Any], 
-                               gbg_blocks: List[Dict[str, Any]], 
-                               used_blocks: set) -> Optional[PyMuPDFMatch]:
+                               candidates: '_PageCandidates') -> Optional[PyMuPDFMatch]:
         """Find match for single character blocks that may be contained in larger GBG blocks."""
         engine_char = engine_block['text'].strip().upper()
-        engine_bbox = engine_block.get('bbox', [])
+        engine_box = self._engine_box(engine_block)
         
-        # Find GBG blocks that contain this character
-        candidate_matches = []
-        
-        for gbg_block in gbg_blocks:
-            if gbg_block['block_id'] in used_blocks:
-                continue
-            
-            gbg_text = gbg_block['text'].upper()
-            
-            # Check if the character is contained in the GBG text
-            if engine_char in gbg_text:
-                # Calculate positional relevance if bbox is available
-                positional_score = 0.0
-                if engine_bbox and len(engine_bbox) >= 4:
-                    bbox_similarity = self._calculate_bbox_similarity(
-                        engine_bbox, gbg_block.get('bbox', {})
-                    )
-                    positional_score = bbox_similarity
-                
-                # Calculate character frequency (prefer blocks where char appears less frequently)
-                char_frequency = gbg_text.count(engine_char)
-                frequency_score = 1.0 / char_frequency if char_frequency > 0 else 0.0
-                
-                # Prioritize positional matching for single characters
-                # Base score for containment, heavily weighted by position
-                if positional_score > 0.5:  # Good positional match
-                    combined_score = 0.85 + (positional_score * 0.1) + (frequency_score * 0.05)
-                else:  # Poor positional match
-                    combined_score = 0.7 + (positional_score * 0.2) + (frequency_score * 0.1)
-                
-                candidate_matches.append({
-                    'gbg_block': gbg_block,
-                    'score': combined_score,
-                    'bbox_similarity': positional_score,
-                    'char_frequency': char_frequency
-                })
+        # Find unused GBG blocks that contain this character
+        positions, char_frequency = candidates.characters.containing(engine_char)
+        keep = candidates.available[positions]
+        positions, char_frequency = positions[keep], char_frequency[keep]
         
-        if not candidate_matches:
+        if not len(positions):
             return None
         
-        # Sort by combined score and take the best match
-        candidate_matches.sort(key=lambda x: x['score'], reverse=True)
-        best_candidate = candidate_matches[0]
+        # Calculate positional relevance if bbox is available
+        if engine_box is not None:
+            positional_score = candidates.iou(engine_box, positions)
+        else:
+            positional_score = np.zeros(len(positions), dtype=np.float64)
+        
+        # Calculate character frequency (prefer blocks where char appears less frequently)
+        frequency_score = 1.0 / char_frequency
+        
+        # Prioritize positional matching for single characters
+        # Base score for containment, heavily weighted by position
+        combined_score = np.where(
+            positional_score > 0.5,
+            0.85 + (positional_score * 0.1) + (frequency_score * 0.05),  # Good positional match
+            0.7 + (positional_score * 0.2) + (frequency_score * 0.1)  # Poor positional match
+        )
+        
+        # Take the first best-scoring candidate
+        best = int(combined_score.argmax())
+        best_score = float(combined_score[best])
+        best_bbox_similarity = float(positional_score[best])
+        best_gbg_block = candidates.blocks[positions[best]]
         
         # Only match if we have reasonable confidence
         # Require higher confidence for single chars to avoid false matches
-        if best_candidate['score'] >= 0.8 and best_candidate['bbox_similarity'] > 0.3:
+        if best_score >= 0.8 and best_bbox_similarity > 0.3:
             return PyMuPDFMatch(
                 engine_block_id=engine_block['block_id'],
-                gbg_block_id=best_candidate['gbg_block']['block_id'],
-                similarity_score=best_candidate['score'],
+                gbg_block_id=best_gbg_block['block_id'],
+                similarity_score=best_score,
                 match_type='single_char_containment',
                 engine_text_preview=engine_block['text'],
-                gbg_text_preview=best_candidate['gbg_block']['text'][:100],
+                gbg_text_preview=best_gbg_block['text'][:100],
                 page_match=True,
-                bbox_similarity=best_candidate['bbox_similarity']
+                bbox_similarity=best_bbox_similarity
             )
         
         return None
     
     def _find_spatial_first_matches(self, engine_blocks: List[Dict[str, Any]], 
-                                   gbg_blocks: List[Dict[str, Any]], 
-                                   used_gbg_blocks: set) -> List[PyMuPDFMatch]:
+                                   candidates: '_PageCandidates') -> List[PyMuPDFMatch]:
         """
         Find matches based primarily on spatial position, regardless of text content.
         This handles cases where text doesn't match due to orientation, OCR errors, etc.
         """
         matches = []
         
+        # GBG blocks unused before this strategy; several engine blocks may share one
+        available = candidates.available.copy()
+        
         for engine_block in engine_blocks:
-            engine_bbox = engine_block.get('bbox', [])
-            if not engine_bbox or len(engine_bbox) < 4:
+            engine_box = self._engine_box(engine_block)
+            if engine_box is None:
                 continue
             
-            best_match = None
-            best_spatial_score = 0.0
-            
-            for gbg_block in gbg_blocks:
-                if gbg_block['block_id'] in used_gbg_blocks:
-                    continue
-                
-                gbg_bbox = gbg_block.get('bbox', {})
-                
-                # Calculate spatial similarity (IoU)
-                spatial_score = self._calculate_bbox_similarity(engine_bbox, gbg_bbox)
-                
-                if spatial_score > best_spatial_score:
-                    best_spatial_score = spatial_score
-                    best_match = gbg_block
+            # Only overlapping GBG blocks can have a positive spatial score
+            positions = candidates.spatial_candidates(tuple(engine_box[0]))
+            best_position, best_spatial_score = first_best(
+                candidates.iou(engine_box, positions), positions, available
+            )
+            best_match = candidates.blocks[best_position] if best_position is not None else None
             
             # AGGRESSIVE SPATIAL MATCHING: Accept any reasonable spatial overlap
             if best_match and best_spatial_score >= 0.1:  # 10% spatial overlap minimum
@@ -454,43 +465,56 @@ class PyMuPDFBlockMatcher:
         This handles cases where PyMuPDF extracted individual characters/words that GBG merged.
         """
         matches = []
-        used_engine_blocks = set()
+        
+        # Available engine blocks by list position; blocks leave as combinations claim their ids
+        available_blocks = dict(enumerate(engine_blocks))
+        positions_by_id = {}
+        for position, block in enumerate(engine_blocks):
+            positions_by_id.setdefault(block['block_id'], []).append(position)
+        
+        # Single-character blocks grouped by character once for all GBG blocks
+        characters = _CharacterBlocks.from_blocks([b for b in engine_blocks if len(b['text'].strip()) == 1])
         
         for gbg_block in gbg_blocks:
             gbg_text = gbg_block['text'].strip()
             if not gbg_text:
                 continue
             
+            if not available_blocks:
+                continue
+            
             # Find potential engine blocks that could combine to form this GBG block
             combination_match = self._find_best_combination_for_gbg_block(
-                gbg_block, engine_blocks, used_engine_blocks
+                gbg_block, list(available_blocks.values()), characters
             )
             
             if combination_match:
                 matches.extend(combination_match)
                 # Mark used engine blocks
                 for match in combination_match:
-                    used_engine_blocks.add(match.engine_block_id)
+                    for position in positions_by_id.pop(match.engine_block_id, ()):
+                        del available_blocks[position]
+                    characters.mark_used(match.engine_block_id)
         
         return matches
     
     def _find_best_combination_for_gbg_block(self, gbg_block: Dict[str, Any], 
-                                           engine_blocks: List[Dict[str, Any]], 
-                                           used_engine_blocks: set) -> Optional[List[PyMuPDFMatch]]:
+                                           available_blocks: List[Dict[str, Any]], 
+                                           characters: Optional['_CharacterBlocks'] = None
+                                           ) -> Optional[List[PyMuPDFMatch]]:
         """
         Find the best combination of engine blocks that match a single GBG block.
-        """
-        gbg_text = gbg_block['text'].strip().upper()
-        gbg_bbox = gbg_block.get('bbox', {})
-        
-        # Get available engine blocks (not already used)
-        available_blocks = [b for b in engine_blocks if b['block_id'] not in used_engine_blocks]
         
+        Args:
+            gbg_block: GBG block to reconstruct
+            available_blocks: Engine blocks not used by earlier combinations
+            characters: Index of the available single-character blocks (built if None)
+        """
         if not available_blocks:
             return None
         
         # Strategy 1: Character-by-character combination (for single chars like U,T,A,H -> UTAH)
-        char_combination = self._find_character_combination(gbg_block, available_blocks)
+        char_combination = self._find_character_combination(gbg_block, available_blocks, characters)
         if char_combination:
             return char_combination
         
@@ -507,7 +531,8 @@ class PyMuPDFBlockMatcher:
         return None
     
     def _find_character_combination(self, gbg_block: Dict[str, Any], 
-                                  engine_blocks: List[Dict[str, Any]]) -> Optional[List[PyMuPDFMatch]]:
+                                  engine_blocks: List[Dict[str, Any]],
+                                  characters: Optional['_CharacterBlocks'] = None) -> Optional[List[PyMuPDFMatch]]:
         """
         Enhanced character combination matching with improved spatial grouping.
         
@@ -516,6 +541,8 @@ class PyMuPDFBlockMatcher:
         2. Relaxed spatial thresholds  
         3. Sequential character detection
         4. Word boundary analysis
+        
+        characters may carry the single-character blocks of engine_blocks, already grouped.
         """
         gbg_text = gbg_block['text'].strip().upper()
         gbg_bbox = gbg_block.get('bbox', {})
@@ -525,11 +552,15 @@ class PyMuPDFBlockMatcher:
             return None
         
         # Find single-character blocks that could form this text
-        single_char_blocks = [b for b in engine_blocks if len(b['text'].strip()) == 1]
+        if characters is None:
+            characters = _CharacterBlocks.from_blocks([b for b in engine_blocks if len(b['text'].strip()) == 1])
         
-        if len(single_char_blocks) < 2:  # Need at least 2 chars to combine
+        if characters.single_char_count < 2:  # Need at least 2 chars to combine
             return None
         
+        # Spatial scores against this GBG block, shared by all strategies
+        view = characters.view(gbg_bbox)
+        
         # ENHANCEMENT 1: Enhanced spatial character grouping
         # Try multiple strategies in order of preference
         strategies = [
@@ -540,7 +571,7 @@ class PyMuPDFBlockMatcher:
         ]
         
         for strategy in strategies:
-            combination = strategy(gbg_text, single_char_blocks, gbg_bbox)
+            combination = strategy(gbg_text, view.blocks, gbg_bbox, view)
             if combination:
                 # Create matches for each character in the combination
                 matches = []
@@ -562,7 +593,8 @@ class PyMuPDFBlockMatcher:
         return None
     
     def _find_sequential_character_match(self, target_text: str, char_blocks: List[Dict[str, Any]], 
-                                       gbg_bbox: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                                       gbg_bbox: Dict[str, Any],
+                                       characters: Optional['_CharacterView'] = None) -> Optional[Dict[str, Any]]:
         """
         ENHANCEMENT 3: Sequential character detection.
         Recognize character sequences that form words by analyzing spatial ordering.
@@ -573,13 +605,9 @@ class PyMuPDFBlockMatcher:
             return None
         
         # Group blocks by character
-        char_to_blocks = {}
-        for block in char_blocks:
-            char = block['text'].strip().upper()
-            if char.isalnum():
-                if char not in char_to_blocks:
-                    char_to_blocks[char] = []
-                char_to_blocks[char].append(block)
+        if characters is None:
+            characters = _CharacterBlocks.from_blocks(char_blocks).view(gbg_bbox)
+        char_to_blocks = characters.groups
         
         # Find available characters that match target
         available_chars = set(char_to_blocks.keys())
@@ -591,48 +619,35 @@ class PyMuPDFBlockMatcher:
         
         # Try to find a sequential arrangement
         selected_blocks = []
-        used_blocks = set()
+        used_blocks = np.zeros(len(characters.blocks), dtype=bool)
         
         for target_char in target_chars:
             if target_char not in char_to_blocks:
                 continue
-                
+            
             # Find the best unused block for this character
-            best_block = None
-            best_score = 0.0
+            positions = char_to_blocks[target_char]
+            positions = positions[~used_blocks[positions]]
             
-            for block in char_to_blocks[target_char]:
-                if block['block_id'] in used_blocks:
-                    continue
-                    
-                # Calculate spatial relevance to GBG bbox
-                spatial_score = self._calculate_bbox_similarity(block.get('bbox', []), gbg_bbox)
-                
-                # Bonus for spatial sequence (blocks that are close to previously selected blocks)
-                sequence_bonus = 0.0
-                if selected_blocks:
-                    last_block = selected_blocks[-1]
-                    sequence_bonus = self._calculate_sequence_proximity(block, last_block)
-                
-                total_score = spatial_score + (sequence_bonus * 0.3)
-                
-                if total_score > best_score:
-                    best_score = total_score
-                    best_block = block
+            # Spatial relevance to GBG bbox, plus a bonus for blocks close to the previously selected block
+            total_score = characters.spatial[positions]
+            if selected_blocks:
+                total_score = total_score + (characters.proximity(positions, selected_blocks[-1]) * 0.3)
+            
+            best_block, best_score = first_best(total_score, positions)
             
-            if best_block and best_score > 0.01:  # Ultra-relaxed threshold
+            if best_block is not None and best_score > 0.01:  # Ultra-relaxed threshold
                 selected_blocks.append(best_block)
-                used_blocks.add(best_block['block_id'])
+                used_blocks[characters.positions_of(best_block)] = True
         
         if len(selected_blocks) >= max(2, len(target_chars) * 0.3):  # At least 30% coverage
-            avg_spatial_score = sum(self._calculate_bbox_similarity(b.get('bbox', []), gbg_bbox) 
-                                  for b in selected_blocks) / len(selected_blocks)
+            avg_spatial_score = sum(float(characters.spatial[p]) for p in selected_blocks) / len(selected_blocks)
             
             text_coverage = len(selected_blocks) / len(target_chars)
             combined_score = 0.6 + (avg_spatial_score * 0.3) + (text_coverage * 0.1)
             
             return {
-                'blocks': selected_blocks,
+                'blocks': [characters.blocks[p] for p in selected_blocks],
                 'score': combined_score,
                 'spatial_score': avg_spatial_score,
                 'text_coverage': text_coverage,
@@ -642,7 +657,8 @@ class PyMuPDFBlockMatcher:
         return None
     
     def _find_word_boundary_character_match(self, target_text: str, char_blocks: List[Dict[str, Any]], 
-                                          gbg_bbox: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                                          gbg_bbox: Dict[str, Any],
+                                          characters: Optional['_CharacterView'] = None) -> Optional[Dict[str, Any]]:
         """
         ENHANCEMENT 4: Word boundary analysis.
         Group characters into logical word units based on spatial clustering.
@@ -656,20 +672,16 @@ class PyMuPDFBlockMatcher:
         words = target_text.split()
         if len(words) < 2:
             # Single word - treat as character sequence
-            return self._find_sequential_character_match(target_text, char_blocks, gbg_bbox)
+            return self._find_sequential_character_match(target_text, char_blocks, gbg_bbox, characters)
         
         # Group blocks by character
-        char_to_blocks = {}
-        for block in char_blocks:
-            char = block['text'].strip().upper()
-            if char.isalnum():
-                if char not in char_to_blocks:
-                    char_to_blocks[char] = []
-                char_to_blocks[char].append(block)
+        if characters is None:
+            characters = _CharacterBlocks.from_blocks(char_blocks).view(gbg_bbox)
+        char_to_blocks = characters.groups
         
         # Try to match each word separately, then combine
         word_matches = []
-        used_blocks = set()
+        used_blocks = np.zeros(len(characters.blocks), dtype=bool)
         
         for word in words:
             word_chars = [c for c in word.upper() if c.isalnum()]
@@ -678,49 +690,40 @@ class PyMuPDFBlockMatcher:
             for char in word_chars:
                 if char not in char_to_blocks:
                     continue
-                    
+                
                 # Find best unused block for this character
-                best_block = None
-                best_score = 0.0
+                positions = char_to_blocks[char]
+                positions = positions[~used_blocks[positions]]
                 
-                for block in char_to_blocks[char]:
-                    if block['block_id'] in used_blocks:
-                        continue
-                        
-                    spatial_score = self._calculate_bbox_similarity(block.get('bbox', []), gbg_bbox)
-                    
-                    # Bonus for being close to other blocks in this word
-                    word_proximity_bonus = 0.0
-                    if word_blocks:
-                        word_proximity_bonus = max(
-                            self._calculate_sequence_proximity(block, wb) for wb in word_blocks
-                        )
-                    
-                    total_score = spatial_score + (word_proximity_bonus * 0.4)
-                    
-                    if total_score > best_score:
-                        best_score = total_score
-                        best_block = block
+                # Bonus for being close to other blocks in this word
+                total_score = characters.spatial[positions]
+                if word_blocks and len(positions):
+                    word_proximity_bonus = np.max(
+                        [characters.proximity(positions, wb) for wb in word_blocks], axis=0
+                    )
+                    total_score = total_score + (word_proximity_bonus * 0.4)
+                
+                best_block, best_score = first_best(total_score, positions)
                 
-                if best_block and best_score > 0.01:  # Ultra-relaxed threshold
+                if best_block is not None and best_score > 0.01:  # Ultra-relaxed threshold
                     word_blocks.append(best_block)
-                    used_blocks.add(best_block['block_id'])
+                    used_blocks[characters.positions_of(best_block)] = True
             
             if len(word_blocks) >= max(1, len(word_chars) * 0.4):  # At least 40% of word characters
                 word_matches.extend(word_blocks)
         
         if len(word_matches) >= max(2, len(target_chars) * 0.3):  # At least 30% coverage
-            avg_spatial_score = sum(self._calculate_bbox_similarity(b.get('bbox', []), gbg_bbox) 
-                                  for b in word_matches) / len(word_matches)
+            avg_spatial_score = sum(float(characters.spatial[p]) for p in word_matches) / len(word_matches)
             
             text_coverage = len(word_matches) / len(target_chars)
-            word_coverage = len([w for w in words if any(c in [b['text'].strip().upper() for b in word_matches] 
+            matched_chars = [characters.blocks[p]['text'].strip().upper() for p in word_matches]
+            word_coverage = len([w for w in words if any(c in matched_chars
                                                         for c in w.upper() if c.isalnum())]) / len(words)
             
             combined_score = 0.5 + (avg_spatial_score * 0.2) + (text_coverage * 0.15) + (word_coverage * 0.15)
             
             return {
-                'blocks': word_matches,
+                'blocks': [characters.blocks[p] for p in word_matches],
                 'score': combined_score,
                 'spatial_score': avg_spatial_score,
                 'text_coverage': text_coverage,
@@ -731,7 +734,8 @@ class PyMuPDFBlockMatcher:
         return None
     
     def _find_relaxed_spatial_character_match(self, target_text: str, char_blocks: List[Dict[str, Any]], 
-                                            gbg_bbox: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                                            gbg_bbox: Dict[str, Any],
+                                            characters: Optional['_CharacterView'] = None) -> Optional[Dict[str, Any]]:
         """
         ENHANCEMENT 2: Relaxed spatial thresholds.
         Allow larger gaps between characters and more flexible spatial matching.
@@ -742,13 +746,9 @@ class PyMuPDFBlockMatcher:
             return None
         
         # Group blocks by character
-        char_to_blocks = {}
-        for block in char_blocks:
-            char = block['text'].strip().upper()
-            if char.isalnum():
-                if char not in char_to_blocks:
-                    char_to_blocks[char] = []
-                char_to_blocks[char].append(block)
+        if characters is None:
+            characters = _CharacterBlocks.from_blocks(char_blocks).view(gbg_bbox)
+        char_to_blocks = characters.groups
         
         # EXTREMELY RELAXED MATCHING: Accept any available characters
         available_chars = set(char_to_blocks.keys())
@@ -762,24 +762,21 @@ class PyMuPDFBlockMatcher:
         # Collect all available blocks for matching characters
         selected_blocks = []
         for char in matching_chars:
-            # Take the first available block for each character (very relaxed)
-            if char_to_blocks[char]:
-                # Choose block with best spatial score, but accept very low scores
-                best_block = max(char_to_blocks[char], 
-                               key=lambda b: self._calculate_bbox_similarity(b.get('bbox', []), gbg_bbox))
-                selected_blocks.append(best_block)
+            # Choose block with best spatial score, but accept very low scores
+            positions = char_to_blocks[char]
+            selected_blocks.append(int(positions[characters.spatial[positions].argmax()]))
         
         if len(selected_blocks) >= 1:  # Accept even single character matches
-            avg_spatial_score = sum(self._calculate_bbox_similarity(b.get('bbox', []), gbg_bbox) 
-                                  for b in selected_blocks) / len(selected_blocks)
+            avg_spatial_score = sum(float(characters.spatial[p]) for p in selected_blocks) / len(selected_blocks)
             
-            text_coverage = len(set(b['text'].strip().upper() for b in selected_blocks) & target_char_set) / len(target_char_set)
+            text_coverage = len(set(characters.blocks[p]['text'].strip().upper() for p in selected_blocks)
+                                & target_char_set) / len(target_char_set)
             
             # Very generous scoring for relaxed matching
             combined_score = 0.3 + (avg_spatial_score * 0.3) + (text_coverage * 0.4)
             
             return {
-                'blocks': selected_blocks,
+                'blocks': [characters.blocks[p] for p in selected_blocks],
                 'score': combined_score,
                 'spatial_score': avg_spatial_score,
                 'text_coverage': text_coverage,
@@ -818,7 +815,8 @@ class PyMuPDFBlockMatcher:
         return max(0.0, proximity_score)
     
     def _find_best_char_sequence(self, target_text: str, char_blocks: List[Dict[str, Any]], 
-                               gbg_bbox: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                               gbg_bbox: Dict[str, Any],
+                               characters: Optional['_CharacterView'] = None) -> Optional[Dict[str, Any]]:
         """Find the best sequence of character blocks that forms the target text."""
         target_chars = [c for c in target_text if c.isalnum()]  # Only alphanumeric chars
         
@@ -826,13 +824,9 @@ class PyMuPDFBlockMatcher:
             return None
         
         # Group blocks by their character
-        char_to_blocks = {}
-        for block in char_blocks:
-            char = block['text'].strip().upper()
-            if char.isalnum():
-                if char not in char_to_blocks:
-                    char_to_blocks[char] = []
-                char_to_blocks[char].append(block)
+        if characters is None:
+            characters = _CharacterBlocks.from_blocks(char_blocks).view(gbg_bbox)
+        char_to_blocks = characters.groups
         
         # RELAXED MATCHING: Don't require all characters, just find spatially close ones
         available_chars = set(char_to_blocks.keys())
@@ -846,18 +840,25 @@ class PyMuPDFBlockMatcher:
         
         # Find the best spatial arrangement of available characters
         best_combination = self._find_spatially_coherent_sequence(
-            list(matching_chars), char_to_blocks, gbg_bbox
+            list(matching_chars), char_to_blocks, gbg_bbox, characters
         )
         
         return best_combination
     
     def _find_spatially_coherent_sequence(self, target_chars: List[str], 
-                                        char_to_blocks: Dict[str, List[Dict[str, Any]]], 
-                                        gbg_bbox: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                                        char_to_blocks: Dict[str, Any], 
+                                        gbg_bbox: Dict[str, Any],
+                                        characters: Optional['_CharacterView'] = None) -> Optional[Dict[str, Any]]:
         """
         Find a spatially coherent sequence of character blocks.
         ENHANCEMENT 1: Enhanced spatial character grouping with ultra-relaxed thresholds.
+        
+        char_to_blocks maps characters to blocks; when characters is given, its groups are used instead.
         """
+        if characters is None:
+            characters = _CharacterBlocks(char_to_blocks).view(gbg_bbox)
+        char_to_blocks = characters.groups
+        
         # For each available character, find the block that's closest to the GBG bbox
         selected_blocks = []
         total_spatial_score = 0.0
@@ -867,24 +868,15 @@ class PyMuPDFBlockMatcher:
                 continue  # Skip missing characters instead of failing
             
             # Find the block for this character that's closest to the GBG bbox
-            best_block = None
-            best_spatial_score = 0.0
-            
-            for block in char_to_blocks[char]:
-                spatial_score = self._calculate_bbox_similarity(
-                    block.get('bbox', []), gbg_bbox
-                )
-                
-                if spatial_score > best_spatial_score:
-                    best_spatial_score = spatial_score
-                    best_block = block
+            positions = char_to_blocks[char]
+            best_block, best_spatial_score = first_best(characters.spatial[positions], positions)
             
             # ULTRA-RELAXED SPATIAL THRESHOLD: Accept any block with minimal relevance
-            if best_block and best_spatial_score >= 0.001:  # Ultra-low threshold (0.1% overlap)
-                selected_blocks.append(best_block)
+            if best_block is not None and best_spatial_score >= 0.001:  # Ultra-low threshold (0.1% overlap)
+                selected_blocks.append(characters.blocks[best_block])
                 total_spatial_score += best_spatial_score
-            elif best_block:  # If no spatial overlap, still accept if it's the only option
-                selected_blocks.append(best_block)
+            elif best_block is not None:  # If no spatial overlap, still accept if it's the only option
+                selected_blocks.append(characters.blocks[best_block])
                 total_spatial_score += 0.001  # Minimal score
         
         # ULTRA-RELAXED REQUIREMENTS: Accept even single character matches
@@ -1015,20 +1007,17 @@ class PyMuPDFBlockMatcher:
             return None
         
         # Find engine blocks that are spatially close to the GBG block
-        nearby_blocks = []
-        for block in engine_blocks:
-            spatial_score = self._calculate_bbox_similarity(block.get('bbox', []), gbg_bbox)
-            if spatial_score > 0.3:  # Reasonably close
-                nearby_blocks.append((block, spatial_score))
+        spatial_scores = self._calculate_bbox_similarity_matrix(engine_blocks, [gbg_block])[:, 0]
+        nearby_blocks = np.flatnonzero(spatial_scores > 0.3)  # Reasonably close
         
         if len(nearby_blocks) < 2:
             return None
         
-        # Sort by spatial relevance
-        nearby_blocks.sort(key=lambda x: x[1], reverse=True)
+        # Sort by spatial relevance (stable, so ties keep list order)
+        nearby_blocks = nearby_blocks[np.argsort(-spatial_scores[nearby_blocks], kind='stable')]
         
         # Try combining the most spatially relevant blocks
-        selected_blocks = [block for block, score in nearby_blocks[:5]]  # Top 5 candidates
+        selected_blocks = [engine_blocks[i] for i in nearby_blocks[:5]]  # Top 5 candidates
         
         # Check if combined text has reasonable similarity to GBG text
         combined_text = ' '.join(block['text'].strip() for block in selected_blocks)
@@ -1036,7 +1025,7 @@ class PyMuPDFBlockMatcher:
         
         if text_similarity >= 0.6:
             matches = []
-            avg_spatial_score = sum(score for _, score in nearby_blocks[:len(selected_blocks)]) / len(selected_blocks)
+            avg_spatial_score = sum(float(spatial_scores[i]) for i in nearby_blocks[:len(selected_blocks)]) / len(selected_blocks)
             combined_score = text_similarity * 0.7 + avg_spatial_score * 0.3
             
             for block in selected_blocks:
@@ -1063,30 +1052,23 @@ class PyMuPDFBlockMatcher:
         Uses best spatial fit regardless of text quality.
         """
         matches = []
-        used_gbg_blocks = set()
+        candidates = BlockCandidateIndex(gbg_blocks)
         
         for engine_block in engine_blocks:
-            engine_bbox = engine_block.get('bbox', [])
-            if not engine_bbox or len(engine_bbox) < 4:
+            engine_box = self._engine_box(engine_block)
+            if engine_box is None:
                 continue
             
-            best_match = None
-            best_spatial_score = 0.0
-            
             # Find the best spatial match among remaining GBG blocks
-            for gbg_block in gbg_blocks:
-                if gbg_block['block_id'] in used_gbg_blocks:
-                    continue
-                
-                gbg_bbox = gbg_block.get('bbox', {})
-                spatial_score = self._calculate_bbox_similarity(engine_bbox, gbg_bbox)
-                
-                if spatial_score > best_spatial_score:
-                    best_spatial_score = spatial_score
-                    best_match = gbg_block
+            positions = candidates.spatial_candidates(tuple(engine_box[0]))
+            best_position, best_spatial_score = first_best(
+                candidates.iou(engine_box, positions), positions, candidates.available
+            )
             
             # Accept ANY spatial match, even very low ones, to achieve 100% matching
-            if best_match:
+            if best_position is not None:
+                best_match = candidates.blocks[best_position]
+                
                 # Calculate text similarity for reference
                 text_similarity = self._calculate_comprehensive_similarity(
                     engine_block.get('text', ''), best_match.get('text', '')
@@ -1115,7 +1097,7 @@ class PyMuPDFBlockMatcher:
                 )
                 
                 matches.append(match)
-                used_gbg_blocks.add(best_match['block_id'])
+                candidates.mark_used(best_match['block_id'])
         
         return matches
     
@@ -1160,6 +1142,17 @@ class PyMuPDFBlockMatcher:
         scores = [ratio_score, partial_score, token_sort_score, token_set_score, word_overlap]
         return max(scores)
     
+    def _calculate_bbox_similarity_matrix(self, engine_blocks: List[Dict[str, Any]],
+                                          gbg_blocks: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Calculate bounding box similarity for every engine/GBG block pair in one call.
+        
+        Values are identical to _calculate_bbox_similarity for each pair.
+        """
+        engine_boxes = boxes_to_array([block.get('bbox', []) for block in engine_blocks], box_format="xyxy")
+        gbg_boxes = boxes_to_array([block.get('bbox', {}) for block in gbg_blocks])
+        return batch_iou(engine_boxes, gbg_boxes)
+    
     def _calculate_bbox_similarity(self, engine_bbox: List[float], gbg_bbox: Dict[str, Any]) -> float:
         """Calculate bounding box similarity."""
         if not engine_bbox or len(engine_bbox) < 4:
@@ -1193,6 +1186,127 @@ class PyMuPDFBlockMatcher:
         return overlap_area / union_area if union_area > 0 else 0.0
 
 
+SIMILARITY_SCORERS = (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio, fuzz.token_set_ratio)
+
+
+class _PageCandidates(BlockCandidateIndex):
+    """GBG blocks of one page indexed for the text strategies of PyMuPDFBlockMatcher."""
+    
+    def __init__(self, blocks: List[Dict[str, Any]], normalize: Callable[[str], str]):
+        super().__init__(blocks)
+        self.add_key_index('normalized', lambda block: normalize(block['text']))
+        # Texts as _calculate_comprehensive_similarity and _find_single_char_match compare them
+        self.similarity_texts = [block['text'].lower().strip() for block in blocks]
+        self.words = TokenOverlapIndex([set(text.split()) for text in self.similarity_texts])
+        self.characters = CharacterIndex([block['text'].upper() for block in blocks])
+
+
+class _CharacterBlocks:
+    """
+    Single-character engine blocks grouped by character for the combination strategies.
+    
+    Groups keep the blocks' list order and blocks are addressed by position,
+    so vectorized scoring picks the same blocks as the per-block loops.
+    """
+    
+    def __init__(self, groups: Dict[str, List[Dict[str, Any]]],
+                 first_seen: Optional[List[int]] = None, single_char_count: Optional[int] = None):
+        """
+        Initialize the index.
+        
+        Args:
+            groups: Upper-case character -> blocks, in list order
+            first_seen: Original list index of every grouped block (defaults to grouped order)
+            single_char_count: Number of single-character blocks, including non-alphanumeric ones
+        """
+        self.blocks = [block for blocks in groups.values() for block in blocks]
+        self.groups = {}
+        start = 0
+        for char, blocks in groups.items():
+            self.groups[char] = np.arange(start, start + len(blocks), dtype=np.intp)
+            start += len(blocks)
+        self.first_seen = np.asarray(first_seen if first_seen is not None else range(len(self.blocks)),
+                                     dtype=np.intp)
+        self.available = np.ones(len(self.blocks), dtype=bool)
+        self.single_char_count = len(self.blocks) if single_char_count is None else single_char_count
+        self._single_char_ids = {}
+        
+        self._positions_by_id = {}
+        for position, block in enumerate(self.blocks):
+            self._positions_by_id.setdefault(block['block_id'], []).append(position)
+        
+        bboxes = [block.get('bbox', []) for block in self.blocks]
+        self.boxes = boxes_to_array(bboxes, box_format="xyxy")
+        self.has_bbox = np.array([bool(bbox) and len(bbox) >= 4 for bbox in bboxes], dtype=bool)
+        self.centers = np.array(
+            [((bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2) if valid else (0.0, 0.0)
+             for bbox, valid in zip(bboxes, self.has_bbox)], dtype=np.float64
+        ).reshape(-1, 2)
+    
+    @classmethod
+    def from_blocks(cls, char_blocks: List[Dict[str, Any]]) -> '_CharacterBlocks':
+        """Group single-character blocks by their upper-case alphanumeric character."""
+        groups, first_seen = {}, {}
+        for index, block in enumerate(char_blocks):
+            char = block['text'].strip().upper()
+            if char.isalnum():
+                groups.setdefault(char, []).append(block)
+                first_seen.setdefault(char, []).append(index)
+        characters = cls(groups, [index for indices in first_seen.values() for index in indices],
+                         single_char_count=len(char_blocks))
+        for block in char_blocks:
+            characters._single_char_ids[block['block_id']] = characters._single_char_ids.get(block['block_id'], 0) + 1
+        return characters
+    
+    def mark_used(self, block_id: str) -> None:
+        """Remove every block with this id."""
+        self.single_char_count -= self._single_char_ids.pop(block_id, 0)
+        for position in self._positions_by_id.get(block_id, ()):
+            self.available[position] = False
+    
+    def positions_of(self, position: int) -> List[int]:
+        """Positions of all blocks sharing the id of the block at a position."""
+        return self._positions_by_id[self.blocks[position]['block_id']]
+    
+    def proximity(self, positions: np.ndarray, other: int) -> np.ndarray:
+        """_calculate_sequence_proximity of the blocks at positions to the block at other."""
+        dx = self.centers[positions, 0] - self.centers[other, 0]
+        dy = self.centers[positions, 1] - self.centers[other, 1]
+        # float_power rounds like Python's ** operator
+        distance = np.float_power(np.float_power(dx, 2) + np.float_power(dy, 2), 0.5)
+        max_distance = 200
+        scores = np.where(distance > max_distance, 0.0, np.maximum(0.0, 1.0 - (distance / max_distance)))
+        return np.where(self.has_bbox[positions] & self.has_bbox[other], scores, 0.0)
+    
+    def view(self, gbg_bbox: Dict[str, Any]) -> '_CharacterView':
+        """Available blocks with their spatial scores against one GBG bbox."""
+        return _CharacterView(self, gbg_bbox)
+
+
+class _CharacterView:
+    """Available character groups of a _CharacterBlocks index, scored against one GBG bbox."""
+    
+    def __init__(self, characters: _CharacterBlocks, gbg_bbox: Dict[str, Any]):
+        self.blocks = characters.blocks
+        self.positions_of = characters.positions_of
+        self.proximity = characters.proximity
+        
+        # _calculate_bbox_similarity of every block against the GBG bbox
+        if gbg_bbox and 'x' in gbg_bbox and len(self.blocks):
+            self.spatial = batch_iou(characters.boxes, boxes_to_array([gbg_bbox]))[:, 0]
+        else:
+            self.spatial = np.zeros(len(self.blocks), dtype=np.float64)
+        
+        # Groups with available blocks, ordered by first available block like a dict built by a scan
+        groups = []
+        for char, positions in characters.groups.items():
+            positions = positions[characters.available[positions]]
+            if len(positions):
+                groups.append((int(characters.first_seen[positions[0]]), char, positions))
+        groups.sort(key=lambda group: group[0])
+        self.groups = {char: positions for _, char, positions in groups}
+
+
 def match_pymupdf_blocks_to_gbg(gbg_data: Dict[str, Any], engine_data: Dict[str, Any], 
                                similarity_threshold: float = 0.7) -> List[PyMuPDFMatch]:
     """
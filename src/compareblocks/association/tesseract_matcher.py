@@ -4,11 +4,13 @@ Specialized matcher for Tesseract OCR blocks to GBG blocks.
 Handles OCR-specific issues like character corruption, mixed case, and artifacts.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence
 from dataclasses import dataclass
 import re
+import numpy as np
 from rapidfuzz import fuzz
 from ..config.file_manager import file_manager
+from .candidates import BlockCandidateIndex, batch_fuzzy_scores, greedy_assignment
 
 
 @dataclass
@@ -26,6 +28,22 @@ class TesseractMatch:
     normalization_applied: str = ""
 
 
+@dataclass
+class OCRTextFeatures:
+    """Per-block text features of one page, computed once for all pairwise strategies."""
+    ocr_normalized: List[str]  # _normalize_ocr_text
+    content: List[str]  # Content words joined by spaces ("" if none)
+    patterns: List[set]  # _extract_text_patterns
+    
+    def subset(self, positions: Sequence[int]) -> 'OCRTextFeatures':
+        """Features of the blocks at the given positions."""
+        return OCRTextFeatures(
+            ocr_normalized=[self.ocr_normalized[i] for i in positions],
+            content=[self.content[i] for i in positions],
+            patterns=[self.patterns[i] for i in positions]
+        )
+
+
 class TesseractBlockMatcher:
     """Specialized matcher for Tesseract OCR blocks with OCR-aware matching strategies."""
     
@@ -151,185 +169,170 @@ class TesseractBlockMatcher:
                              gbg_blocks: List[Dict[str, Any]], page_num: int) -> List[TesseractMatch]:
         """Match blocks on a specific page using OCR-aware strategies."""
         matches = []
-        used_gbg_blocks = set()
         used_engine_blocks = set()
         
+        # Normalize, tokenize and pattern-extract every block once per page
+        candidates = BlockCandidateIndex(gbg_blocks)
+        candidates.add_key_index('exact', lambda block: self._exact_text_key(block['text']))
+        engine_features = self._extract_text_features(engine_blocks)
+        gbg_features = self._extract_text_features(gbg_blocks)
+        
+        def record(match: TesseractMatch) -> None:
+            matches.append(match)
+            candidates.mark_used(match.gbg_block_id)
+            used_engine_blocks.add(match.engine_block_id)
+        
         # Strategy 1: EXACT TEXT MATCHING (for clean OCR)
         for engine_block in engine_blocks:
             if engine_block['block_id'] in used_engine_blocks:
                 continue
-                
-            for gbg_block in gbg_blocks:
-                if gbg_block['block_id'] in used_gbg_blocks:
-                    continue
-                
-                match = self._try_exact_match(engine_block, gbg_block)
-                if match:
-                    matches.append(match)
-                    used_gbg_blocks.add(match.gbg_block_id)
-                    used_engine_blocks.add(match.engine_block_id)
-                    break
-        
-        # Strategy 2: OCR NORMALIZATION MATCHING (for corrupted OCR)
-        remaining_engine_blocks = [b for b in engine_blocks if b['block_id'] not in used_engine_blocks]
-        remaining_gbg_blocks = [b for b in gbg_blocks if b['block_id'] not in used_gbg_blocks]
-        
-        for engine_block in remaining_engine_blocks:
-            best_match = None
-            best_score = 0.0
-            
-            for gbg_block in remaining_gbg_blocks:
-                match = self._try_ocr_normalized_match(engine_block, gbg_block)
-                if match and match.similarity_score > best_score:
-                    best_score = match.similarity_score
-                    best_match = match
-            
-            if best_match and best_score >= self.similarity_threshold:
-                matches.append(best_match)
-                used_gbg_blocks.add(best_match.gbg_block_id)
-                used_engine_blocks.add(best_match.engine_block_id)
-        
-        # Strategy 3: FUZZY CONTENT MATCHING (for heavily corrupted OCR)
-        remaining_engine_blocks = [b for b in engine_blocks if b['block_id'] not in used_engine_blocks]
-        remaining_gbg_blocks = [b for b in gbg_blocks if b['block_id'] not in used_gbg_blocks]
-        
-        for engine_block in remaining_engine_blocks:
-            best_match = None
-            best_score = 0.0
-            
-            for gbg_block in remaining_gbg_blocks:
-                match = self._try_fuzzy_content_match(engine_block, gbg_block)
-                if match and match.similarity_score > best_score:
-                    best_score = match.similarity_score
-                    best_match = match
             
-            if best_match and best_score >= (self.similarity_threshold * 0.8):  # Lower threshold for fuzzy
-                matches.append(best_match)
-                used_gbg_blocks.add(best_match.gbg_block_id)
-                used_engine_blocks.add(best_match.engine_block_id)
-        
-        # Strategy 4: PATTERN-BASED MATCHING (for headers/footers)
-        remaining_engine_blocks = [b for b in engine_blocks if b['block_id'] not in used_engine_blocks]
-        remaining_gbg_blocks = [b for b in gbg_blocks if b['block_id'] not in used_gbg_blocks]
-        
-        for engine_block in remaining_engine_blocks:
-            best_match = None
-            best_score = 0.0
-            
-            for gbg_block in remaining_gbg_blocks:
-                match = self._try_pattern_match(engine_block, gbg_block)
-                if match and match.similarity_score > best_score:
-                    best_score = match.similarity_score
-                    best_match = match
+            position = candidates.first_available('exact', self._exact_text_key(engine_block['text']))
+            if position is not None:
+                record(self._create_match(engine_block, candidates.blocks[position], 1.0,
+                                          'exact_text', 'whitespace'))
+        
+        # Strategies 2-4 score all remaining pairs at once and assign the best-scoring pairs first
+        strategies = [
+            # OCR NORMALIZATION MATCHING (for corrupted OCR)
+            (self._ocr_normalized_scores, max(0.8, self.similarity_threshold),
+             'ocr_normalized', 'ocr_artifacts'),
+            # FUZZY CONTENT MATCHING (for heavily corrupted OCR), lower threshold for fuzzy
+            (self._fuzzy_content_scores, max(0.7, self.similarity_threshold * 0.8),
+             'fuzzy_content', 'content_words'),
+            # PATTERN-BASED MATCHING (for headers/footers), even lower for patterns
+            (self._pattern_scores, max(0.5, self.similarity_threshold * 0.7),
+             'pattern_based', 'pattern_extraction'),
+        ]
+        
+        for score_pairs, min_score, match_type, normalization in strategies:
+            engine_rows = [i for i, b in enumerate(engine_blocks) if b['block_id'] not in used_engine_blocks]
+            gbg_columns = np.flatnonzero(candidates.available)
+            if not engine_rows or not len(gbg_columns):
+                continue
             
-            if best_match and best_score >= (self.similarity_threshold * 0.7):  # Even lower for patterns
-                matches.append(best_match)
-                used_gbg_blocks.add(best_match.gbg_block_id)
-                used_engine_blocks.add(best_match.engine_block_id)
+            scores = score_pairs(engine_features.subset(engine_rows), gbg_features.subset(gbg_columns), min_score)
+            assignment = greedy_assignment(
+                scores, min_score,
+                row_keys=[engine_blocks[i]['block_id'] for i in engine_rows],
+                col_keys=[gbg_blocks[j]['block_id'] for j in gbg_columns]
+            )
+            for row, column, score in assignment:
+                record(self._create_match(engine_blocks[engine_rows[row]], gbg_blocks[gbg_columns[column]],
+                                          score, match_type, normalization))
         
         return matches
     
+    def _extract_text_features(self, blocks: List[Dict[str, Any]]) -> 'OCRTextFeatures':
+        """Normalize, tokenize and pattern-extract the text of each block once."""
+        texts = [block['text'].strip() for block in blocks]
+        return OCRTextFeatures(
+            ocr_normalized=[self._normalize_ocr_text(text) for text in texts],
+            content=[' '.join(self._extract_content_words(text)) for text in texts],
+            patterns=[self._extract_text_patterns(text) for text in texts]
+        )
+    
+    def _ocr_normalized_scores(self, engine_features: 'OCRTextFeatures', gbg_features: 'OCRTextFeatures',
+                               min_score: float) -> np.ndarray:
+        """fuzz.ratio of the OCR-normalized texts for every pair (scores below min_score may be 0.0)."""
+        return batch_fuzzy_scores(engine_features.ocr_normalized, gbg_features.ocr_normalized,
+                                  (fuzz.ratio,), score_cutoff=min_score)
+    
+    def _fuzzy_content_scores(self, engine_features: 'OCRTextFeatures', gbg_features: 'OCRTextFeatures',
+                              min_score: float) -> np.ndarray:
+        """fuzz.token_sort_ratio of the content words for every pair; 0.0 where either side has none."""
+        scores = batch_fuzzy_scores(engine_features.content, gbg_features.content,
+                                    (fuzz.token_sort_ratio,), score_cutoff=min_score)
+        has_words = np.outer([bool(content) for content in engine_features.content],
+                             [bool(content) for content in gbg_features.content])
+        return np.where(has_words, scores, 0.0)
+    
+    def _pattern_scores(self, engine_features: 'OCRTextFeatures', gbg_features: 'OCRTextFeatures',
+                        min_score: float) -> np.ndarray:
+        """Shared patterns over the larger pattern set for every pair; 0.0 without shared patterns."""
+        vocabulary = {}
+        for patterns in engine_features.patterns + gbg_features.patterns:
+            for pattern in patterns:
+                vocabulary.setdefault(pattern, len(vocabulary))
+        
+        def incidence(pattern_sets: List[set]) -> np.ndarray:
+            matrix = np.zeros((len(pattern_sets), len(vocabulary)), dtype=np.float64)
+            for row, patterns in enumerate(pattern_sets):
+                matrix[row, [vocabulary[pattern] for pattern in patterns]] = 1.0
+            return matrix
+        
+        engine_incidence = incidence(engine_features.patterns)
+        gbg_incidence = incidence(gbg_features.patterns)
+        common = engine_incidence @ gbg_incidence.T
+        largest = np.maximum.outer(engine_incidence.sum(axis=1), gbg_incidence.sum(axis=1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(common > 0, common / largest, 0.0)
+    
+    def _exact_text_key(self, text: str) -> str:
+        """Whitespace-normalized, lower-cased text used for exact matching."""
+        return re.sub(r'\s+', ' ', text.strip()).lower()
+    
+    def _create_match(self, engine_block: Dict[str, Any], gbg_block: Dict[str, Any], similarity: float,
+                      match_type: str, normalization: str) -> TesseractMatch:
+        """Build a TesseractMatch for an accepted engine/GBG block pair."""
+        return TesseractMatch(
+            engine_block_id=engine_block['block_id'],
+            gbg_block_id=gbg_block['block_id'],
+            similarity_score=similarity,
+            match_type=match_type,
+            engine_text_preview=engine_block['text'].strip()[:100],
+            gbg_text_preview=gbg_block['text'].strip()[:100],
+            page_match=True,
+            bbox_similarity=self._calculate_bbox_similarity(
+                engine_block.get('bbox', []), gbg_block.get('bbox', {})
+            ),
+            ocr_confidence=engine_block.get('confidence', 0.0),
+            normalization_applied=normalization
+        )
+    
     def _try_exact_match(self, engine_block: Dict[str, Any], gbg_block: Dict[str, Any]) -> Optional[TesseractMatch]:
         """Try exact text matching (for clean OCR)."""
-        engine_text = engine_block['text'].strip()
-        gbg_text = gbg_block['text'].strip()
-        
-        # Normalize whitespace for comparison
-        engine_normalized = re.sub(r'\s+', ' ', engine_text).lower()
-        gbg_normalized = re.sub(r'\s+', ' ', gbg_text).lower()
-        
-        if engine_normalized == gbg_normalized:
-            return TesseractMatch(
-                engine_block_id=engine_block['block_id'],
-                gbg_block_id=gbg_block['block_id'],
-                similarity_score=1.0,
-                match_type='exact_text',
-                engine_text_preview=engine_text[:100],
-                gbg_text_preview=gbg_text[:100],
-                page_match=True,
-                bbox_similarity=self._calculate_bbox_similarity(
-                    engine_block.get('bbox', []), gbg_block.get('bbox', {})
-                ),
-                ocr_confidence=engine_block.get('confidence', 0.0),
-                normalization_applied='whitespace'
-            )
+        if self._exact_text_key(engine_block['text']) == self._exact_text_key(gbg_block['text']):
+            return self._create_match(engine_block, gbg_block, 1.0, 'exact_text', 'whitespace')
         
         return None
     
     def _try_ocr_normalized_match(self, engine_block: Dict[str, Any], gbg_block: Dict[str, Any]) -> Optional[TesseractMatch]:
         """Try OCR normalization matching (for corrupted OCR)."""
-        engine_text = engine_block['text'].strip()
-        gbg_text = gbg_block['text'].strip()
-        
         # Apply OCR normalization
-        engine_normalized = self._normalize_ocr_text(engine_text)
-        gbg_normalized = self._normalize_ocr_text(gbg_text)
+        engine_normalized = self._normalize_ocr_text(engine_block['text'].strip())
+        gbg_normalized = self._normalize_ocr_text(gbg_block['text'].strip())
         
         # Calculate similarity after normalization
         similarity = fuzz.ratio(engine_normalized, gbg_normalized) / 100.0
         
         if similarity >= 0.8:  # High similarity after normalization
-            return TesseractMatch(
-                engine_block_id=engine_block['block_id'],
-                gbg_block_id=gbg_block['block_id'],
-                similarity_score=similarity,
-                match_type='ocr_normalized',
-                engine_text_preview=engine_text[:100],
-                gbg_text_preview=gbg_text[:100],
-                page_match=True,
-                bbox_similarity=self._calculate_bbox_similarity(
-                    engine_block.get('bbox', []), gbg_block.get('bbox', {})
-                ),
-                ocr_confidence=engine_block.get('confidence', 0.0),
-                normalization_applied='ocr_artifacts'
-            )
+            return self._create_match(engine_block, gbg_block, similarity, 'ocr_normalized', 'ocr_artifacts')
         
         return None
     
     def _try_fuzzy_content_match(self, engine_block: Dict[str, Any], gbg_block: Dict[str, Any]) -> Optional[TesseractMatch]:
         """Try fuzzy content matching (for heavily corrupted OCR)."""
-        engine_text = engine_block['text'].strip()
-        gbg_text = gbg_block['text'].strip()
-        
         # Extract key content words (ignore OCR artifacts)
-        engine_words = self._extract_content_words(engine_text)
-        gbg_words = self._extract_content_words(gbg_text)
+        engine_words = self._extract_content_words(engine_block['text'].strip())
+        gbg_words = self._extract_content_words(gbg_block['text'].strip())
         
         if not engine_words or not gbg_words:
             return None
         
         # Calculate word-level similarity
-        engine_content = ' '.join(engine_words)
-        gbg_content = ' '.join(gbg_words)
-        
-        similarity = fuzz.token_sort_ratio(engine_content, gbg_content) / 100.0
+        similarity = fuzz.token_sort_ratio(' '.join(engine_words), ' '.join(gbg_words)) / 100.0
         
         if similarity >= 0.7:  # Moderate similarity for content words
-            return TesseractMatch(
-                engine_block_id=engine_block['block_id'],
-                gbg_block_id=gbg_block['block_id'],
-                similarity_score=similarity,
-                match_type='fuzzy_content',
-                engine_text_preview=engine_text[:100],
-                gbg_text_preview=gbg_text[:100],
-                page_match=True,
-                bbox_similarity=self._calculate_bbox_similarity(
-                    engine_block.get('bbox', []), gbg_block.get('bbox', {})
-                ),
-                ocr_confidence=engine_block.get('confidence', 0.0),
-                normalization_applied='content_words'
-            )
+            return self._create_match(engine_block, gbg_block, similarity, 'fuzzy_content', 'content_words')
         
         return None
     
     def _try_pattern_match(self, engine_block: Dict[str, Any], gbg_block: Dict[str, Any]) -> Optional[TesseractMatch]:
         """Try pattern-based matching (for headers/footers)."""
-        engine_text = engine_block['text'].strip()
-        gbg_text = gbg_block['text'].strip()
-        
         # Extract patterns (common phrases, repeated elements)
-        engine_patterns = self._extract_text_patterns(engine_text)
-        gbg_patterns = self._extract_text_patterns(gbg_text)
+        engine_patterns = self._extract_text_patterns(engine_block['text'].strip())
+        gbg_patterns = self._extract_text_patterns(gbg_block['text'].strip())
         
         # Check for pattern overlap
         common_patterns = engine_patterns.intersection(gbg_patterns)
@@ -339,20 +342,8 @@ class TesseractBlockMatcher:
             pattern_score = len(common_patterns) / max(len(engine_patterns), len(gbg_patterns))
             
             if pattern_score >= 0.5:  # At least 50% pattern overlap
-                return TesseractMatch(
-                    engine_block_id=engine_block['block_id'],
-                    gbg_block_id=gbg_block['block_id'],
-                    similarity_score=pattern_score,
-                    match_type='pattern_based',
-                    engine_text_preview=engine_text[:100],
-                    gbg_text_preview=gbg_text[:100],
-                    page_match=True,
-                    bbox_similarity=self._calculate_bbox_similarity(
-                        engine_block.get('bbox', []), gbg_block.get('bbox', {})
-                    ),
-                    ocr_confidence=engine_block.get('confidence', 0.0),
-                    normalization_applied='pattern_extraction'
-                )
+                return self._create_match(engine_block, gbg_block, pattern_score,
+                                          'pattern_based', 'pattern_extraction')
         
         return None
     
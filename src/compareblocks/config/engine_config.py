@@ -8,13 +8,20 @@ This module provides comprehensive configuration management for OCR engines usin
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Iterator
+from typing import Dict, List, Any, Optional, Iterable, Iterator
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 import hashlib
 import uuid
 
 
+# PDF override key holding per-page settings: {"<page_num>": {setting: value}}
+PAGE_OVERRIDES_KEY = "page_overrides"
+
+# Settings that change how an extraction runs but not what it produces
+EXECUTION_SETTINGS = ("max_workers",)
+
+
 class ConfigurationScope(Enum):
     """Configuration scope levels."""
     GLOBAL = "global"
@@ -292,6 +299,48 @@ class EngineConfigurationManager:
         
         return effective_settings
     
+    def add_page_override(self, engine_name: str, pdf_path: str, page_num: int,
+                          overrides: Dict[str, Any]) -> str:
+        """Add settings for a single page of a PDF, keeping the PDF's other overrides."""
+        pdf_hash = self._calculate_pdf_hash(pdf_path)
+        current_override = next((c for c in self._load_configurations()
+                                 if c.config_type == ConfigurationType.PDF_OVERRIDE and c.engine_name == engine_name
+                                 and c.pdf_hash == pdf_hash and c.active), None)
+        
+        settings = dict(current_override.default_settings) if current_override else {}
+        page_overrides = dict(settings.get(PAGE_OVERRIDES_KEY) or {})
+        page_overrides[str(page_num)] = {**page_overrides.get(str(page_num), {}), **overrides}
+        settings[PAGE_OVERRIDES_KEY] = page_overrides
+        
+        self.archive_current_pdf_override(engine_name, pdf_path)
+        return self.add_pdf_override(engine_name, pdf_path, settings)
+    
+    def get_page_configurations(self, engine_name: str, pdf_path: str,
+                                page_numbers: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Get effective configuration per page: PDF settings plus each page's overrides."""
+        settings = self.get_effective_configuration(engine_name, pdf_path)
+        page_overrides = settings.pop(PAGE_OVERRIDES_KEY, None) or {}
+        
+        page_configurations = {}
+        for page_num in page_numbers:
+            page_settings = dict(settings)
+            page_settings.update(page_overrides.get(str(page_num), {}))
+            page_configurations[page_num] = page_settings
+        return page_configurations
+    
+    def get_page_configuration(self, engine_name: str, pdf_path: str, page_num: int) -> Dict[str, Any]:
+        """Get effective configuration for one page of a PDF."""
+        return self.get_page_configurations(engine_name, pdf_path, [page_num])[page_num]
+    
+    def get_max_workers(self, engine_name: str, pdf_path: str = None) -> int:
+        """Get the page-parallel worker count for an engine (1 = in-process)."""
+        effective_settings = self.get_effective_configuration(engine_name, pdf_path)
+        max_workers = effective_settings.get("max_workers")
+        if max_workers is None:
+            # Configurations recorded before the setting existed fall back to the engine default
+            max_workers = self._get_engine_defaults(engine_name).get("max_workers", 1)
+        return max(0, int(max_workers))
+    
     def get_parameter_status(self, engine_name: str) -> Dict[str, Dict[str, Any]]:
         """Get parameter status information for GUI awareness."""
         config = self.get_engine_configuration(engine_name)
@@ -455,6 +504,7 @@ class EngineConfigurationManager:
                 "tessedit_char_whitelist": None,
                 "tessedit_char_blacklist": None,
                 "tessedit_pageseg_mode": 6,
+                "max_workers": 1,  # Page-parallel worker processes (0 = one per CPU core)
                 # Output settings
                 "tessedit_create_hocr": 0,
                 "tessedit_create_pdf": 0,
@@ -480,7 +530,9 @@ class EngineConfigurationManager:
                 "cls_model_dir": None,
                 "cls_image_shape": "3, 48, 192",
                 "cls_batch_num": 6,
-                "cls_thresh": 0.9
+                "cls_thresh": 0.9,
+                # Performance settings
+                "max_workers": 1  # Page-parallel worker processes (0 = one per CPU core)
             },
             "pymupdf": {
                 # Extraction settings
@@ -574,6 +626,12 @@ class EngineConfigurationManager:
                     name="tessedit_create_pdf", type="choice", description="Create searchable PDF",
                     default=0, choices=["0", "1"], cli_flag="-c tessedit_create_pdf",
                     tested=True, auto_optimize=False, category="output"
+                ),
+                # Execution parameters
+                CLIParameter(
+                    name="max_workers", type="int", description="Worker processes for page-parallel OCR (0 = one per CPU core)",
+                    default=1, tested=True, auto_optimize=False, min_value=0, max_value=256,
+                    category="performance"
                 )
             ],
             "paddleocr": [
@@ -632,6 +690,12 @@ class EngineConfigurationManager:
                     name="cls_thresh", type="float", description="Classification threshold",
                     default=0.9, tested=True, auto_optimize=True, min_value=0.1, max_value=1.0,
                     category="classification"
+                ),
+                # Execution parameters
+                CLIParameter(
+                    name="max_workers", type="int", description="Worker processes for page-parallel OCR (0 = one per CPU core)",
+                    default=1, tested=True, auto_optimize=False, min_value=0, max_value=256,
+                    category="performance"
                 )
             ],
             "pymupdf": [
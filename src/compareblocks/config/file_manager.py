@@ -179,6 +179,12 @@ class FileManager:
         """Get the unit test output file path."""
         return str(self._project_root / self._config["test_files"]["unit_test_output"]["path"])
     
+    def get_cache_directory(self) -> str:
+        """Get the directory for content-addressed analysis caches."""
+        output_config = self._config["output_configuration"]
+        cache_dir = output_config.get("cache_directory", "output/cache")
+        return str(self._project_root / cache_dir)
+    
     def get_expected_pdf_pages(self) -> int:
         """Get the expected number of pages in the target PDF."""
         return self._config["target_files"]["primary_pdf"]["pages"]
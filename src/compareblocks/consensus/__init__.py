@@ -8,7 +8,8 @@ from .score import (
     ConsensusScorer,
     ScoringWeights,
     ScoringThresholds,
-    VariationScore
+    VariationScore,
+    BlockScoringContext
 )
 
 from .guard import (
@@ -31,11 +32,14 @@ from .merge import (
     TokenAlignment
 )
 
+from .parallel import ConsensusEngineConfig
+
 __all__ = [
     'ConsensusScorer',
     'ScoringWeights', 
     'ScoringThresholds',
     'VariationScore',
+    'BlockScoringContext',
     'HallucinationGuard',
     'GuardThresholds',
     'GuardDecision',
@@ -46,5 +50,6 @@ __all__ = [
     'TokenLevelMerger',
     'MergeStrategy',
     'MergeResult',
-    'TokenAlignment'
+    'TokenAlignment',
+    'ConsensusEngineConfig'
 ]
\ No newline at end of file
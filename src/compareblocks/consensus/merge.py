@@ -9,6 +9,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from .msa import CenterStarAligner
+
 
 class MergeStrategy(Enum):
     """Different strategies for merging text variations."""
@@ -62,8 +64,14 @@ class MergeResult:
 class TokenLevelMerger:
     """Implements token-level merging of text variations using dynamic programming."""
     
-    def __init__(self):
-        """Initialize the token-level merger."""
+    def __init__(self, alignment_time_budget: Optional[float] = None):
+        """
+        Initialize the token-level merger.
+        
+        Args:
+            alignment_time_budget: Optional per-block alignment budget in seconds
+        """
+        self.aligner = CenterStarAligner(time_budget=alignment_time_budget)
         self.word_separators = {' ', '\t', '\n'}
         self.punctuation = {'.', ',', '!', '?', ';', ':', '"', "'", '(', ')', '[', ']', '{', '}'}
     
@@ -134,7 +142,7 @@ class TokenLevelMerger:
     
     def _align_token_sequences(self, sequences: List[List[str]]) -> List[List[Optional[str]]]:
         """
-        Align multiple token sequences using dynamic programming.
+        Align multiple token sequences into shared columns.
         
         Args:
             sequences: List of token sequences to align
@@ -142,113 +150,7 @@ class TokenLevelMerger:
         Returns:
             List of aligned sequences (with None for gaps)
         """
-        if not sequences:
-            return []
-        
-        if len(sequences) == 1:
-            return [sequences[0]]
-        
-        # Start with pairwise alignment of first two sequences
-        aligned = self._pairwise_align(sequences[0], sequences[1])
-        
-        # Progressively align additional sequences
-        for i in range(2, len(sequences)):
-            aligned = self._align_with_existing(aligned, sequences[i])
-        
-        return aligned
-    
-    def _pairwise_align(self, seq1: List[str], seq2: List[str]) -> List[List[Optional[str]]]:
-        """
-        Align two token sequences using dynamic programming.
-        
-        Args:
-            seq1: First token sequence
-            seq2: Second token sequence
-            
-        Returns:
-            Two aligned sequences
-        """
-        # Use difflib for sequence alignment
-        matcher = difflib.SequenceMatcher(None, seq1, seq2)
-        
-        aligned_seq1 = []
-        aligned_seq2 = []
-        
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            if tag == 'equal':
-                # Tokens match
-                for k in range(i2 - i1):
-                    aligned_seq1.append(seq1[i1 + k])
-                    aligned_seq2.append(seq2[j1 + k])
-            elif tag == 'replace':
-                # Tokens differ - align them anyway
-                max_len = max(i2 - i1, j2 - j1)
-                for k in range(max_len):
-                    token1 = seq1[i1 + k] if i1 + k < i2 else None
-                    token2 = seq2[j1 + k] if j1 + k < j2 else None
-                    aligned_seq1.append(token1)
-                    aligned_seq2.append(token2)
-            elif tag == 'delete':
-                # Tokens only in seq1
-                for k in range(i2 - i1):
-                    aligned_seq1.append(seq1[i1 + k])
-                    aligned_seq2.append(None)
-            elif tag == 'insert':
-                # Tokens only in seq2
-                for k in range(j2 - j1):
-                    aligned_seq1.append(None)
-                    aligned_seq2.append(seq2[j1 + k])
-        
-        return [aligned_seq1, aligned_seq2]
-    
-    def _align_with_existing(self, existing_alignment: List[List[Optional[str]]], 
-                           new_sequence: List[str]) -> List[List[Optional[str]]]:
-        """
-        Align a new sequence with existing alignment.
-        
-        Args:
-            existing_alignment: Current alignment of sequences
-            new_sequence: New sequence to align
-            
-        Returns:
-            Updated alignment including new sequence
-        """
-        # Create consensus sequence from existing alignment for comparison
-        consensus_tokens = []
-        for i in range(len(existing_alignment[0])):
-            # Use the first non-None token at each position
-            token = None
-            for seq in existing_alignment:
-                if seq[i] is not None:
-                    token = seq[i]
-                    break
-            consensus_tokens.append(token if token is not None else "")
-        
-        # Align new sequence with consensus
-        aligned_consensus, aligned_new = self._pairwise_align(
-            [t for t in consensus_tokens if t], new_sequence
-        )
-        
-        # Expand existing alignment to match new alignment length
-        result_alignment = []
-        
-        # Add existing sequences with gaps inserted
-        consensus_idx = 0
-        for seq in existing_alignment:
-            new_seq = []
-            for token in aligned_consensus:
-                if token and consensus_idx < len(seq):
-                    new_seq.append(seq[consensus_idx])
-                    consensus_idx += 1
-                else:
-                    new_seq.append(None)
-            result_alignment.append(new_seq)
-            consensus_idx = 0  # Reset for next sequence
-        
-        # Add the new sequence
-        result_alignment.append(aligned_new)
-        
-        return result_alignment
+        return self.aligner.align(sequences).rows
     
     def _select_best_token(self, aligned_tokens: List[Optional[str]], 
                           variation_qualities: Optional[List[float]] = None) -> TokenAlignment:
@@ -376,8 +278,9 @@ class TokenLevelMerger:
         # Tokenize all variations
         tokenized_variations = [self._tokenize_text(var) for var in variations]
         
-        # Align token sequences
-        aligned_sequences = self._align_token_sequences(tokenized_variations)
+        # Align token sequences (center-star MSA)
+        alignment = self.aligner.align(tokenized_variations)
+        aligned_sequences = alignment.rows
         
         # Select best token at each position
         token_alignments = []
@@ -408,8 +311,11 @@ class TokenLevelMerger:
             'avg_token_confidence': overall_confidence,
             'tokens_with_alternatives': sum(1 for ta in token_alignments if ta.alternatives),
             'unanimous_tokens': sum(1 for ta in token_alignments if ta.confidence == 1.0),
-            'original_lengths': [len(self._tokenize_text(var)) for var in variations],
-            'merged_length': len(merged_tokens)
+            'original_lengths': [len(tokens) for tokens in tokenized_variations],
+            'merged_length': len(merged_tokens),
+            'alignment_center': alignment.center_index,
+            'unaligned_variations': alignment.unaligned_indices,
+            'alignment_seconds': alignment.elapsed_seconds
         }
         
         return MergeResult(
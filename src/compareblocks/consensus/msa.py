@@ -0,0 +1,308 @@
+# src/compareblocks/consensus/msa.py
+"""
+Center-star multiple sequence alignment over integer-encoded token sequences.
+Uses the pairwise edit distance matrix to pick the center and to bound banded DP.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+# Large sentinel for cells outside the DP band
+_INF = 1 << 40
+
+# Alignment pair: (index in first sequence or -1, index in second sequence or -1)
+AlignedPair = Tuple[int, int]
+
+
+@dataclass
+class MultipleAlignment:
+    """Result of aligning several token sequences into shared columns."""
+    rows: List[List[Optional[str]]]
+    center_index: int
+    distance_matrix: np.ndarray
+    unaligned_indices: List[int] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def column_count(self) -> int:
+        return len(self.rows[0]) if self.rows else 0
+
+
+def encode_token_sequences(sequences: Sequence[Sequence[str]]) -> Tuple[List[np.ndarray], List[str]]:
+    """
+    Encode token sequences as integer arrays over a shared vocabulary.
+
+    Args:
+        sequences: Token sequences
+
+    Returns:
+        Tuple of (encoded int32 arrays, vocabulary where vocabulary[id] is the token)
+    """
+    ids: Dict[str, int] = {}
+    encoded = []
+    for tokens in sequences:
+        encoded.append(np.fromiter(
+            (ids.setdefault(token, len(ids)) for token in tokens),
+            dtype=np.int32, count=len(tokens)
+        ))
+    vocabulary = [None] * len(ids)
+    for token, token_id in ids.items():
+        vocabulary[token_id] = token
+    return encoded, vocabulary
+
+
+def _banded_table(a: np.ndarray, b: np.ndarray, band: int,
+                  keep_rows: bool = True) -> np.ndarray:
+    """
+    Fill the edit-distance DP restricted to a diagonal band.
+
+    Row i, column k holds D[i][j] for j = i + k - band; cells outside the
+    band or the matrix are _INF.
+
+    Returns:
+        The full (m+1, 2*band+1) table, or only the last row if keep_rows is False
+    """
+    m, n = len(a), len(b)
+    width = 2 * band + 1
+    ks = np.arange(width, dtype=np.int64)
+
+    first = np.full(width, _INF, dtype=np.int64)
+    first_row = ks[band:band + n + 1] - band
+    first[band:band + len(first_row)] = first_row
+    table = np.empty((m + 1, width), dtype=np.int64) if keep_rows else None
+    if keep_rows:
+        table[0] = first
+
+    b_padded = np.concatenate(([-1], b)).astype(np.int64)
+    previous = first
+    for i in range(1, m + 1):
+        j = i + ks - band
+        valid = (j >= 0) & (j <= n)
+
+        diagonal = np.full(width, _INF, dtype=np.int64)
+        has_diagonal = valid & (j >= 1)
+        diagonal[has_diagonal] = previous[has_diagonal] + (b_padded[j[has_diagonal]] != a[i - 1])
+
+        up = np.full(width, _INF, dtype=np.int64)
+        up[:-1] = previous[1:] + 1
+
+        # Insertions: cur[k] = min over k' <= k of row[k'] + (k - k')
+        row = np.minimum(diagonal, up)
+        row = np.minimum.accumulate(row - ks) + ks
+        row[~valid] = _INF
+        if keep_rows:
+            table[i] = row
+        previous = row
+
+    return table if keep_rows else previous
+
+
+def edit_distance(a: np.ndarray, b: np.ndarray) -> int:
+    """Token-level Levenshtein distance between two encoded sequences."""
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.distance(a.tolist(), b.tolist())
+
+    # Banded DP is exact whenever the result fits in the band; widen until it does
+    m, n = len(a), len(b)
+    band = max(abs(m - n), 16)
+    while True:
+        distance = int(_banded_table(a, b, band, keep_rows=False)[n - m + band])
+        if distance <= band or band >= max(m, n):
+            return distance
+        band *= 2
+
+
+def pairwise_distance_matrix(encoded: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Compute the symmetric matrix of token edit distances.
+
+    Args:
+        encoded: Integer-encoded sequences
+
+    Returns:
+        (k, k) integer distance matrix
+    """
+    k = len(encoded)
+    matrix = np.zeros((k, k), dtype=np.int64)
+    for i in range(k):
+        for j in range(i + 1, k):
+            matrix[i, j] = matrix[j, i] = edit_distance(encoded[i], encoded[j])
+    return matrix
+
+
+def banded_alignment(a: np.ndarray, b: np.ndarray, band: int) -> List[AlignedPair]:
+    """
+    Optimal edit-distance alignment restricted to a diagonal band.
+
+    With band >= the edit distance of a and b the result is an optimal global
+    alignment, since every off-diagonal step costs one edit. Ties prefer
+    match/substitution, then deletion, then insertion, so columns are stable.
+
+    Args:
+        a: First encoded sequence
+        b: Second encoded sequence
+        band: Maximum allowed |i - j| offset from the main diagonal
+
+    Returns:
+        Aligned index pairs (-1 marks a gap)
+    """
+    m, n = len(a), len(b)
+    band = max(band, abs(m - n))
+    width = 2 * band + 1
+    table = _banded_table(a, b, band)
+
+    pairs: List[AlignedPair] = []
+    i, j = m, n
+    while i > 0 or j > 0:
+        k = j - i + band
+        current = table[i, k]
+        if i > 0 and j > 0 and current == table[i - 1, k] + (a[i - 1] != b[j - 1]):
+            pairs.append((i - 1, j - 1))
+            i -= 1
+            j -= 1
+        elif i > 0 and k + 1 < width and current == table[i - 1, k + 1] + 1:
+            pairs.append((i - 1, -1))
+            i -= 1
+        else:
+            pairs.append((-1, j - 1))
+            j -= 1
+
+    pairs.reverse()
+    return pairs
+
+
+def align_pair(a: np.ndarray, b: np.ndarray, distance: int) -> List[AlignedPair]:
+    """
+    Optimal alignment of two encoded sequences with a known edit distance.
+
+    Args:
+        a: First encoded sequence
+        b: Second encoded sequence
+        distance: Their edit distance, used as the DP band
+
+    Returns:
+        Aligned index pairs (-1 marks a gap)
+    """
+    if not RAPIDFUZZ_AVAILABLE:
+        return banded_alignment(a, b, distance)
+
+    pairs: List[AlignedPair] = []
+    for tag, i1, i2, j1, j2 in Levenshtein.opcodes(a.tolist(), b.tolist()):
+        if tag in ('equal', 'replace'):
+            pairs.extend(zip(range(i1, i2), range(j1, j2)))
+        elif tag == 'delete':
+            pairs.extend((i, -1) for i in range(i1, i2))
+        else:
+            pairs.extend((-1, j) for j in range(j1, j2))
+    return pairs
+
+
+class CenterStarAligner:
+    """Aligns token sequences to the sequence closest to all others."""
+
+    def __init__(self, time_budget: Optional[float] = None):
+        """
+        Initialize the aligner.
+
+        Args:
+            time_budget: Optional per-block budget in seconds; sequences not yet
+                         aligned when it runs out are left as all-gap rows
+        """
+        self.time_budget = time_budget
+
+    def align(self, sequences: Sequence[Sequence[str]]) -> MultipleAlignment:
+        """
+        Align token sequences into shared columns.
+
+        Args:
+            sequences: Token sequences to align
+
+        Returns:
+            MultipleAlignment with one row per input sequence
+        """
+        start = time.perf_counter()
+
+        if not sequences:
+            return MultipleAlignment(rows=[], center_index=-1,
+                                     distance_matrix=np.zeros((0, 0), dtype=np.int64))
+
+        encoded, _ = encode_token_sequences(sequences)
+        distances = pairwise_distance_matrix(encoded)
+        totals = distances.sum(axis=1)
+        # Lowest total distance wins; argmin keeps the earliest index on ties
+        center = int(np.argmin(totals))
+        center_tokens = list(sequences[center])
+        n = len(center_tokens)
+
+        # Closest sequences first so a tight budget keeps the most informative rows
+        order = sorted((i for i in range(len(sequences)) if i != center),
+                       key=lambda i: (distances[center, i], i))
+
+        # Per aligned sequence: token at each center position and insertions before it
+        placements: Dict[int, Tuple[List[Optional[str]], List[List[str]]]] = {}
+        unaligned: List[int] = []
+        for index in order:
+            if (self.time_budget is not None and placements and
+                    time.perf_counter() - start > self.time_budget):
+                unaligned.append(index)
+                continue
+
+            tokens = sequences[index]
+            assigned: List[Optional[str]] = [None] * n
+            inserts: List[List[str]] = [[] for _ in range(n + 1)]
+            center_pos = 0
+            for ci, si in align_pair(encoded[center], encoded[index], int(distances[center, index])):
+                if ci >= 0:
+                    if si >= 0:
+                        assigned[ci] = tokens[si]
+                    center_pos = ci + 1
+                else:
+                    inserts[center_pos].append(tokens[si])
+            placements[index] = (assigned, inserts)
+
+        # Gap columns before each center position are shared by all sequences
+        slots = [0] * (n + 1)
+        for _, inserts in placements.values():
+            for pos, inserted in enumerate(inserts):
+                if len(inserted) > slots[pos]:
+                    slots[pos] = len(inserted)
+        column_count = n + sum(slots)
+
+        rows: List[List[Optional[str]]] = []
+        for index in range(len(sequences)):
+            if index == center:
+                row = []
+                for pos in range(n + 1):
+                    row.extend([None] * slots[pos])
+                    if pos < n:
+                        row.append(center_tokens[pos])
+            elif index in placements:
+                assigned, inserts = placements[index]
+                row = []
+                for pos in range(n + 1):
+                    inserted = inserts[pos]
+                    row.extend(inserted)
+                    row.extend([None] * (slots[pos] - len(inserted)))
+                    if pos < n:
+                        row.append(assigned[pos])
+            else:
+                row = [None] * column_count
+            rows.append(row)
+
+        return MultipleAlignment(
+            rows=rows,
+            center_index=center,
+            distance_matrix=distances,
+            unaligned_indices=sorted(unaligned),
+            elapsed_seconds=time.perf_counter() - start
+        )
@@ -0,0 +1,162 @@
+# src/compareblocks/consensus/parallel.py
+"""
+Process-pool batch consensus across all blocks of a document.
+Blocks are sharded into chunks for worker processes and results stream back in block order.
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .score import ConsensusScorer, ScoringWeights, ScoringThresholds
+from .guard import HallucinationGuard, GuardThresholds
+from .policy import (
+    DecisionPolicyEngine, PolicyThresholds, ConsensusDecision, make_consensus_decision
+)
+from ..utils.workers import resolve_worker_count
+
+
+# Per-worker state populated by _init_worker; one policy engine per process
+_worker_state: Dict[str, Any] = {}
+
+BATCH_TASKS = ("policy_engine", "consensus")
+
+
+@dataclass
+class ConsensusEngineConfig:
+    """Picklable scorer/guard/policy configuration used to rebuild engines in workers."""
+    scoring_weights: ScoringWeights = field(default_factory=lambda: ScoringWeights().normalize())
+    scoring_thresholds: ScoringThresholds = field(default_factory=ScoringThresholds)
+    guard_thresholds: GuardThresholds = field(default_factory=GuardThresholds)
+    policy_thresholds: PolicyThresholds = field(default_factory=PolicyThresholds)
+    similarity_backend: Optional[str] = None
+    override_terms: List[str] = field(default_factory=list)
+    language_detection_seed: Optional[int] = None
+
+    @classmethod
+    def from_engine(cls, engine: DecisionPolicyEngine,
+                    language_detection_seed: Optional[int] = None) -> 'ConsensusEngineConfig':
+        """
+        Capture the configuration of an existing policy engine.
+
+        Args:
+            engine: Policy engine to capture
+            language_detection_seed: Optional langdetect seed applied in every worker
+
+        Returns:
+            ConsensusEngineConfig equivalent to the engine
+        """
+        scorer = engine.guard.scorer
+        tracker = scorer.consistency_tracker
+        return cls(
+            scoring_weights=scorer.weights,
+            scoring_thresholds=scorer.thresholds,
+            guard_thresholds=engine.guard.guard_thresholds,
+            policy_thresholds=engine.policy_thresholds,
+            similarity_backend=tracker.similarity_backend.name,
+            override_terms=sorted(tracker.override_terms),
+            language_detection_seed=language_detection_seed
+        )
+
+    def build_engine(self) -> DecisionPolicyEngine:
+        """Build a DecisionPolicyEngine from this configuration."""
+        scorer = ConsensusScorer(thresholds=self.scoring_thresholds)
+        # Weights are stored normalized; re-normalizing could shift them by an ulp
+        scorer.weights = self.scoring_weights
+        if self.similarity_backend is not None:
+            from ..features.consistency import CharacterConsistencyTracker
+            scorer.consistency_tracker = CharacterConsistencyTracker(self.similarity_backend)
+        scorer.consistency_tracker.add_override_terms(self.override_terms)
+
+        guard = HallucinationGuard(scorer=scorer, guard_thresholds=self.guard_thresholds)
+        return DecisionPolicyEngine(guard=guard, policy_thresholds=self.policy_thresholds)
+
+
+def _init_worker(config: ConsensusEngineConfig) -> None:
+    """Build the per-worker policy engine."""
+    if config.language_detection_seed is not None:
+        try:
+            from langdetect import DetectorFactory
+            DetectorFactory.seed = config.language_detection_seed
+        except ImportError:
+            pass
+
+    _worker_state["config"] = config
+    _worker_state["engine"] = config.build_engine()
+
+
+def _decide_chunk(task: str, context_texts: Optional[List[str]],
+                  chunk: List[List[Dict[str, Any]]]) -> List[ConsensusDecision]:
+    """Make decisions for one chunk of blocks in a worker process."""
+    if task == "consensus":
+        thresholds = _worker_state["config"].policy_thresholds
+        return [make_consensus_decision(variations, thresholds=thresholds) for variations in chunk]
+
+    engine = _worker_state["engine"]
+    return [engine.make_decision(variations, context_texts) for variations in chunk]
+
+
+def iter_parallel_decisions(variation_batches: Iterable[List[Dict[str, Any]]],
+                            config: Optional[ConsensusEngineConfig] = None,
+                            task: str = "policy_engine",
+                            context_texts: Optional[List[str]] = None,
+                            max_workers: Optional[int] = None,
+                            chunk_size: int = 64) -> Iterator[ConsensusDecision]:
+    """
+    Stream consensus decisions for many blocks using a process pool.
+
+    Blocks are read lazily and at most a few chunks per worker are in flight,
+    so memory stays bounded for very large documents.
+
+    Args:
+        variation_batches: Iterable of variation lists (one per block)
+        config: Engine configuration (defaults if None)
+        task: "policy_engine" for DecisionPolicyEngine.make_decision or
+              "consensus" for make_consensus_decision
+        context_texts: Optional context texts for similarity scoring
+        max_workers: Number of worker processes (None = one per CPU core)
+        chunk_size: Number of blocks sent to a worker per task
+
+    Returns:
+        Iterator over decisions, in the same order as variation_batches
+    """
+    if task not in BATCH_TASKS:
+        raise ValueError(f"Unknown batch task: {task}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    config = config if config else ConsensusEngineConfig()
+    workers = resolve_worker_count(max_workers)
+    max_in_flight = workers * 2
+
+    def _iterate() -> Iterator[ConsensusDecision]:
+        blocks = iter(variation_batches)
+        # spawn avoids forking a parent that may hold MuPDF/Qt state
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config,)
+        ) as executor:
+            pending = deque()
+
+            def _submit_next() -> bool:
+                chunk = list(islice(blocks, chunk_size))
+                if not chunk:
+                    return False
+                pending.append(executor.submit(_decide_chunk, task, context_texts, chunk))
+                return True
+
+            while len(pending) < max_in_flight and _submit_next():
+                pass
+
+            # Futures are consumed in submission order, which keeps output deterministic
+            while pending:
+                decisions = pending.popleft().result()
+                _submit_next()
+                yield from decisions
+
+    return _iterate()
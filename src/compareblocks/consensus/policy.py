@@ -4,7 +4,7 @@ Decision policy engine for consensus decisions.
 Implements pick/merge/review threshold logic with decision tree.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -305,17 +305,25 @@ class DecisionPolicyEngine:
         )
     
     def batch_decisions(self, variation_batches: List[List[Dict[str, Any]]], 
-                       context_texts: Optional[List[str]] = None) -> List[ConsensusDecision]:
+                       context_texts: Optional[List[str]] = None,
+                       max_workers: Optional[int] = 1,
+                       chunk_size: int = 64) -> List[ConsensusDecision]:
         """
         Make decisions for multiple batches of variations.
         
         Args:
             variation_batches: List of variation lists (one per block)
             context_texts: Optional context texts for similarity scoring
+            max_workers: Worker processes (1 = in-process, None/0 = one per CPU core)
+            chunk_size: Blocks per worker task when running in parallel
             
         Returns:
-            List of ConsensusDecision objects
+            List of ConsensusDecision objects, in block order
         """
+        if max_workers != 1:
+            return list(self.iter_batch_decisions(
+                variation_batches, context_texts, max_workers, chunk_size))
+        
         decisions = []
         
         for variations in variation_batches:
@@ -324,6 +332,32 @@ class DecisionPolicyEngine:
         
         return decisions
     
+    def iter_batch_decisions(self, variation_batches: Iterable[List[Dict[str, Any]]],
+                             context_texts: Optional[List[str]] = None,
+                             max_workers: Optional[int] = None,
+                             chunk_size: int = 64) -> Iterator[ConsensusDecision]:
+        """
+        Stream decisions for many blocks from a process pool, in block order.
+        
+        Args:
+            variation_batches: Iterable of variation lists (one per block)
+            context_texts: Optional context texts for similarity scoring
+            max_workers: Number of worker processes (None = one per CPU core)
+            chunk_size: Blocks per worker task
+            
+        Returns:
+            Iterator over ConsensusDecision objects
+        """
+        from .parallel import ConsensusEngineConfig, iter_parallel_decisions
+        
+        return iter_parallel_decisions(
+            variation_batches,
+            config=ConsensusEngineConfig.from_engine(self),
+            context_texts=context_texts,
+            max_workers=max_workers,
+            chunk_size=chunk_size
+        )
+    
     def get_decision_statistics(self, decisions: List[ConsensusDecision]) -> Dict[str, Any]:
         """
         Get statistics for a set of decisions.
@@ -571,17 +605,32 @@ def make_consensus_decision(variations: List[Dict[str, Any]],
 
 
 def batch_consensus_decisions(variation_batches: List[List[Dict[str, Any]]], 
-                            thresholds: PolicyThresholds = None) -> List[ConsensusDecision]:
+                            thresholds: PolicyThresholds = None,
+                            max_workers: Optional[int] = 1,
+                            chunk_size: int = 64) -> List[ConsensusDecision]:
     """
     Make consensus decisions for multiple batches of variations.
     
     Args:
         variation_batches: List of variation lists
         thresholds: Policy thresholds (uses defaults if None)
+        max_workers: Worker processes (1 = in-process, None/0 = one per CPU core)
+        chunk_size: Blocks per worker task when running in parallel
         
     Returns:
         List[ConsensusDecision]: Decision results for each batch
     """
+    if max_workers != 1:
+        from .parallel import ConsensusEngineConfig, iter_parallel_decisions
+        
+        config = ConsensusEngineConfig(
+            policy_thresholds=thresholds if thresholds else create_default_policy_thresholds()
+        )
+        return list(iter_parallel_decisions(
+            variation_batches, config=config, task="consensus",
+            max_workers=max_workers, chunk_size=chunk_size
+        ))
+    
     decisions = []
     for batch in variation_batches:
         decision = make_consensus_decision(batch, thresholds=thresholds)
@@ -95,6 +95,16 @@ class VariationScore:
         return result
 
 
+@dataclass
+class BlockScoringContext:
+    """Block-wide features shared by every variation of one block."""
+    variation_texts: List[str]
+    length_consistency: Dict[str, float]
+    character_consistency_score: float
+    character_consistency: Optional[CharacterConsistency] = None
+    expected_orientation: Optional[float] = None
+
+
 class ConsensusScorer:
     """Implements consensus scoring algorithms for text variations."""
     
@@ -187,12 +197,61 @@ class ConsensusScorer:
         
         return score
     
+    def build_block_context(self, variation_texts: List[str],
+                            orientations: Optional[List[Optional[float]]] = None,
+                            block_id: Optional[str] = None) -> BlockScoringContext:
+        """
+        Compute the block-wide scoring features once for all variations.
+        
+        Args:
+            variation_texts: All variation texts of the block
+            orientations: Optional per-variation orientations in degrees
+            block_id: Optional block identifier for character consistency tracking
+            
+        Returns:
+            BlockScoringContext shared by every variation of the block
+            
+        Raises:
+            ValueError: If orientations is given with a different length than variation_texts
+        """
+        if orientations is not None and len(orientations) != len(variation_texts):
+            raise ValueError(f"Got {len(orientations)} orientations for {len(variation_texts)} variation texts")
+        
+        length_consistency = self.core_extractor.compute_consistency_score(variation_texts)
+        
+        character_consistency = None
+        if block_id:
+            character_consistency = self.consistency_tracker.track_consistency_for_block(
+                block_id, variation_texts
+            )
+            character_consistency_score = character_consistency.character_consistency_score
+        else:
+            # Fallback to simple character consistency calculation
+            character_consistency_score, _ = self.consistency_tracker.calculate_character_consistency(
+                variation_texts)
+        
+        # Expected orientation is the most common orientation
+        known_orientations = [o for o in (orientations or []) if o is not None]
+        expected_orientation = None
+        if known_orientations:
+            expected_orientation = (statistics.mode(known_orientations)
+                                    if len(set(known_orientations)) > 1 else known_orientations[0])
+        
+        return BlockScoringContext(
+            variation_texts=variation_texts,
+            length_consistency=length_consistency,
+            character_consistency_score=character_consistency_score,
+            character_consistency=character_consistency,
+            expected_orientation=expected_orientation
+        )
+    
     def score_variation(self, variation_text: str, engine_name: str, 
                        variation_index: int, all_variations: List[str],
                        expected_orientation: Optional[float] = None,
                        actual_orientation: Optional[float] = None,
                        context_texts: Optional[List[str]] = None,
-                       block_id: Optional[str] = None) -> VariationScore:
+                       block_id: Optional[str] = None,
+                       block_context: Optional[BlockScoringContext] = None) -> VariationScore:
         """
         Score a single text variation.
         
@@ -204,12 +263,18 @@ class ConsensusScorer:
             expected_orientation: Expected text orientation in degrees
             actual_orientation: Actual text orientation in degrees
             context_texts: Optional context texts for similarity scoring
+            block_id: Optional block identifier for character consistency tracking
+            block_context: Precomputed block-wide features; when given, the
+                           consistency passes over all_variations are skipped
             
         Returns:
             VariationScore object with complete scoring information
         """
         flags = []
         
+        if block_context is None:
+            block_context = self.build_block_context(all_variations, block_id=block_id)
+        
         # Extract features
         length_features = self.core_extractor.extract_length_features(variation_text)
         language_features = self.language_extractor.extract_language_features(variation_text)
@@ -217,22 +282,10 @@ class ConsensusScorer:
         context_features = self.context_extractor.extract_context_features(
             variation_text, context_texts)
         
-        # Calculate consistency score with all variations
-        consistency_scores = self.core_extractor.compute_consistency_score(all_variations)
-        length_consistency = consistency_scores.get(str(variation_index), 0.0)
-        
-        # Calculate character-level consistency
-        character_consistency = None
-        character_consistency_score = 0.0
-        if block_id:
-            character_consistency = self.consistency_tracker.track_consistency_for_block(
-                block_id, all_variations
-            )
-            character_consistency_score = character_consistency.character_consistency_score
-        else:
-            # Fallback to simple character consistency calculation
-            char_score, _ = self.consistency_tracker.calculate_character_consistency(all_variations)
-            character_consistency_score = char_score
+        # Block-wide length and character consistency
+        length_consistency = block_context.length_consistency.get(str(variation_index), 0.0)
+        character_consistency = block_context.character_consistency
+        character_consistency_score = block_context.character_consistency_score
         
         # Calculate individual component scores
         length_score = length_consistency
@@ -328,11 +381,12 @@ class ConsensusScorer:
         # Extract text variations for consistency scoring
         variation_texts = [var.get('text', '') for var in variations]
         
-        # Determine expected orientation (use most common orientation)
-        orientations = [var.get('orientation') for var in variations if var.get('orientation') is not None]
-        expected_orientation = None
-        if orientations:
-            expected_orientation = statistics.mode(orientations) if len(set(orientations)) > 1 else orientations[0]
+        # Block-wide features are computed once and shared by every variation
+        block_context = self.build_block_context(
+            variation_texts,
+            orientations=[var.get('orientation') for var in variations],
+            block_id=block_id
+        )
         
         # Score each variation
         scores = []
@@ -346,10 +400,11 @@ class ConsensusScorer:
                 engine_name=engine,
                 variation_index=i,
                 all_variations=variation_texts,
-                expected_orientation=expected_orientation,
+                expected_orientation=block_context.expected_orientation,
                 actual_orientation=actual_orientation,
                 context_texts=context_texts,
-                block_id=block_id
+                block_id=block_id,
+                block_context=block_context
             )
             scores.append(score)
         
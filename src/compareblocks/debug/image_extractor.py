@@ -7,13 +7,12 @@ Extracts and saves image regions for visual inspection and debugging.
 import cv2
 import numpy as np
 import fitz  # PyMuPDF
-from PIL import Image
-import io
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import json
 
 from ..config.file_manager import file_manager
+from ..io.raster import render_page_array
 
 
 class ImageRegionExtractor:
@@ -44,14 +43,8 @@ class ImageRegionExtractor:
         pdf_document = fitz.open(pdf_path)
         page = pdf_document[page_num]
         
-        # Render page as high-resolution image
-        mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better quality
-        pix = page.get_pixmap(matrix=mat)
-        img_data = pix.tobytes("png")
-        
-        # Convert to PIL Image and then to OpenCV
-        pil_image = Image.open(io.BytesIO(img_data))
-        cv_image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+        # Render page at 2x zoom (144 DPI) via the shared raster cache and convert to OpenCV
+        cv_image = cv2.cvtColor(render_page_array(page, 144), cv2.COLOR_RGB2BGR)
         
         extracted_regions = []
         
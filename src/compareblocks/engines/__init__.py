@@ -2,75 +2,72 @@
 """
 PDF extraction engines module.
 Provides multiple engines for PDF text extraction including PyMuPDF, Tesseract, PaddleOCR, etc.
+
+Engine modules are imported on first attribute access, so importing this package
+does not load OCR or document-model stacks. Use discovery.detect_available_engines
+to check which engines are installed without importing them.
 """
 
-from .pymupdf_engine import PyMuPDFEngine, extract_raw_pymupdf, save_raw_pymupdf_extraction
-from .tesseract_engine import TesseractEngine, extract_tesseract_ocr, save_tesseract_extraction
-from .paddleocr_engine import PaddleOCREngine, extract_paddleocr, save_paddleocr_extraction
-from .kreuzberg_engine import KreuzbergEngine, extract_kreuzberg, save_kreuzberg_extraction
-from .docling_engine import DoclingEngine, extract_docling, save_docling_extraction
-from .manager import (
-    ExtractionEngineManager, 
-    EngineResult,
-    extract_with_all_engines,
-    extract_with_engines,
-    get_available_engines
-)
-from .integrated_processor import (
-    IntegratedEngineProcessor,
-    IntegratedResult,
-    BlockAlignment,
-    process_pdf_with_integrated_engines,
-    save_integrated_engine_processing
-)
-from .dual_output_processor import (
-    DualOutputEngineProcessor,
-    DualOutputResult,
-    process_engine_dual_output,
-    process_all_engines_dual_output
-)
-from .gbg_integrated_processor import (
-    GBGIntegratedEngineProcessor,
-    GBGIntegratedResult,
-    process_engines_with_gbg_integration
-)
+import importlib
 
-__all__ = [
+# Public name -> submodule providing it
+_LAZY_ATTRIBUTES = {
     # Engine classes
-    'PyMuPDFEngine',
-    'TesseractEngine', 
-    'PaddleOCREngine',
-    'KreuzbergEngine',
-    'DoclingEngine',
-    'ExtractionEngineManager',
-    'IntegratedEngineProcessor',
-    'DualOutputEngineProcessor',
-    'GBGIntegratedEngineProcessor',
+    'PyMuPDFEngine': '.pymupdf_engine',
+    'TesseractEngine': '.tesseract_engine',
+    'PaddleOCREngine': '.paddleocr_engine',
+    'KreuzbergEngine': '.kreuzberg_engine',
+    'DoclingEngine': '.docling_engine',
+    'ExtractionEngineManager': '.manager',
+    'IntegratedEngineProcessor': '.integrated_processor',
+    'DualOutputEngineProcessor': '.dual_output_processor',
+    'GBGIntegratedEngineProcessor': '.gbg_integrated_processor',
     
     # Data classes
-    'EngineResult',
-    'IntegratedResult',
-    'BlockAlignment',
-    'DualOutputResult',
-    'GBGIntegratedResult',
+    'EngineResult': '.manager',
+    'IntegratedResult': '.integrated_processor',
+    'BlockAlignment': '.integrated_processor',
+    'DualOutputResult': '.dual_output_processor',
+    'GBGIntegratedResult': '.gbg_integrated_processor',
     
     # Convenience functions
-    'extract_raw_pymupdf',
-    'save_raw_pymupdf_extraction',
-    'extract_tesseract_ocr',
-    'save_tesseract_extraction',
-    'extract_paddleocr',
-    'save_paddleocr_extraction',
-    'extract_kreuzberg',
-    'save_kreuzberg_extraction',
-    'extract_docling',
-    'save_docling_extraction',
-    'extract_with_all_engines',
-    'extract_with_engines',
-    'get_available_engines',
-    'process_pdf_with_integrated_engines',
-    'save_integrated_engine_processing',
-    'process_engine_dual_output',
-    'process_all_engines_dual_output',
-    'process_engines_with_gbg_integration'
-]
\ No newline at end of file
+    'extract_raw_pymupdf': '.pymupdf_engine',
+    'save_raw_pymupdf_extraction': '.pymupdf_engine',
+    'extract_tesseract_ocr': '.tesseract_engine',
+    'save_tesseract_extraction': '.tesseract_engine',
+    'extract_paddleocr': '.paddleocr_engine',
+    'save_paddleocr_extraction': '.paddleocr_engine',
+    'extract_kreuzberg': '.kreuzberg_engine',
+    'save_kreuzberg_extraction': '.kreuzberg_engine',
+    'extract_docling': '.docling_engine',
+    'save_docling_extraction': '.docling_engine',
+    'extract_with_all_engines': '.manager',
+    'extract_with_engines': '.manager',
+    'get_available_engines': '.manager',
+    'process_pdf_with_integrated_engines': '.integrated_processor',
+    'save_integrated_engine_processing': '.integrated_processor',
+    'process_engine_dual_output': '.dual_output_processor',
+    'process_all_engines_dual_output': '.dual_output_processor',
+    'process_engines_with_gbg_integration': '.gbg_integrated_processor',
+    
+    # Discovery
+    'detect_available_engines': '.discovery',
+    'probe_engine': '.discovery',
+    'EngineAvailabilityCache': '.discovery',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """Import the submodule providing a public name on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
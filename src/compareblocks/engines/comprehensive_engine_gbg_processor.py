@@ -8,12 +8,15 @@ and integrates results into the GBG full analysis.
 import json
 import hashlib
 import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 from .manager import ExtractionEngineManager, EngineResult
+from .output import merge_output_metadata, write_engine_json
+from .incremental import INCREMENTAL_ENGINES, FingerprintInputs, configuration_fingerprint_inputs
 from ..config.engine_config import EngineConfigurationManager
 from ..gbg.processor import GBGProcessor
 from ..io.pdf_metadata import PDFMetadataExtractor
@@ -46,8 +49,8 @@ class ComprehensiveEngineResult:
     is_optimized: bool
     config_source: str
     configuration_used: Dict[str, Any]
-    configuration_hash: str  # Hash of configuration for duplicate detection
-    processing_timestamp: str  # ISO timestamp of processing
+    configuration_hash: str = ""  # Hash of configuration for duplicate detection
+    processing_timestamp: str = ""  # ISO timestamp of processing
     error_message: str = ""
     metadata: Dict[str, Any] = None
     was_skipped: bool = False  # True if processing was skipped due to existing result
@@ -332,26 +335,36 @@ class ComprehensiveEngineGBGProcessor:
                 output_data = json.load(f)
             
             # Add extraction metadata
-            config_hash = self.generate_config_hash(config_result.configuration)
-            
-            extraction_metadata = {
-                "configuration_used": config_result.configuration,
-                "config_hash": config_hash,
-                "is_optimized": config_result.is_optimized,
-                "config_source": config_result.config_source,
-                "extraction_timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
-                "processing_time_seconds": processing_time
-            }
-            
-            output_data["extraction_metadata"] = extraction_metadata
+            metadata = self.build_configuration_metadata(config_result)
+            metadata["extraction_metadata"]["processing_time_seconds"] = processing_time
+            merge_output_metadata(output_data, metadata)
             
             # Save enhanced output
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            write_engine_json(output_data, output_path, self.engine_manager.json_format)
                 
         except Exception as e:
             print(f"Warning: Could not enhance output with configuration: {e}")
     
+    def build_configuration_metadata(self, config_result: EngineConfigurationResult) -> Dict[str, Any]:
+        """
+        Configuration metadata for an engine output, written with the results in one pass.
+        
+        Args:
+            config_result: Configuration used
+            
+        Returns:
+            Output section name -> fields
+        """
+        return {
+            "extraction_metadata": {
+                "configuration_used": config_result.configuration,
+                "config_hash": self.generate_config_hash(config_result.configuration),
+                "is_optimized": config_result.is_optimized,
+                "config_source": config_result.config_source,
+                "extraction_timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+            }
+        }
+    
     def get_engine_configuration(self, engine_name: str, pdf_path: str) -> EngineConfigurationResult:
         """
         Get optimized or default configuration for an engine.
@@ -398,9 +411,32 @@ class ComprehensiveEngineGBGProcessor:
                 config_source="default"
             )
     
+    def get_fingerprint_inputs(self, engine_name: str, pdf_path: str,
+                               gbg_analysis_path: Optional[str] = None) -> Optional[FingerprintInputs]:
+        """
+        Fingerprint inputs for page-level re-extraction of an OCR engine.
+        
+        Args:
+            engine_name: Name of the engine
+            pdf_path: Path to PDF file
+            gbg_analysis_path: Path to GBG analysis file whose block ids are fingerprinted
+            
+        Returns:
+            FingerprintInputs, or None if the engine is always extracted whole
+        """
+        if engine_name not in INCREMENTAL_ENGINES:
+            return None
+        try:
+            return configuration_fingerprint_inputs(self.config_manager, engine_name, pdf_path,
+                                                    gbg_analysis_path)
+        except Exception as e:
+            print(f"Warning: Could not fingerprint pages for {engine_name}: {e}")
+            return None
+    
     def process_engine_with_configuration(self, engine_name: str, 
                                         config_result: EngineConfigurationResult,
-                                        pdf_path: str, overwrite_mode: bool = True) -> ComprehensiveEngineResult:
+                                        pdf_path: str, overwrite_mode: bool = True,
+                                        gbg_analysis_path: Optional[str] = None) -> ComprehensiveEngineResult:
         """
         Process a single engine with its configuration.
         
@@ -409,6 +445,8 @@ class ComprehensiveEngineGBGProcessor:
             config_result: Configuration to use
             pdf_path: Path to PDF file
             overwrite_mode: Whether to overwrite existing results
+            gbg_analysis_path: Path to GBG analysis file; OCR engines re-extract only
+                pages whose content, configuration or GBG blocks changed
             
         Returns:
             ComprehensiveEngineResult with processing results
@@ -416,50 +454,20 @@ class ComprehensiveEngineGBGProcessor:
         start_time = time.time()
         
         try:
-            # Check for existing extraction results
-            existing_found, existing_path = self.check_existing_extraction_results(
-                engine_name, config_result, pdf_path
-            )
-            
-            # Determine if we should process this engine
-            if not self.should_process_engine(engine_name, overwrite_mode, existing_found, existing_path):
-                # Return result indicating skipped
-                return ComprehensiveEngineResult(
-                    engine_name=engine_name,
-                    success=True,  # Consider skipped as successful
-                    output_path=existing_path or "",
-                    extraction_time=0,
-                    is_optimized=config_result.is_optimized,
-                    config_source=config_result.config_source,
-                    configuration_used=config_result.configuration,
-                    error_message="Skipped - existing results found with same configuration",
-                    metadata={"skipped": True}
-                )
+            skipped = self._check_skip(engine_name, config_result, pdf_path, overwrite_mode)
+            if skipped is not None:
+                return skipped
             
             # Apply configuration to engine (this would be engine-specific)
-            # For now, we'll use the standard extraction method
-            engine_result = self.engine_manager.extract_with_engine(engine_name, pdf_path)
-            
-            processing_time = time.time() - start_time
-            
-            # Enhance output file with configuration metadata
-            if engine_result.success and engine_result.output_path:
-                self.enhance_engine_output_with_configuration(
-                    engine_result.output_path, config_result, processing_time
-                )
-            
-            return ComprehensiveEngineResult(
-                engine_name=engine_name,
-                success=engine_result.success,
-                output_path=engine_result.output_path,
-                extraction_time=processing_time,
-                is_optimized=config_result.is_optimized,
-                config_source=config_result.config_source,
-                configuration_used=config_result.configuration,
-                error_message=engine_result.error_message,
-                metadata=engine_result.metadata
+            # For now, we'll use the standard extraction method; the configuration
+            # metadata is written together with the results
+            engine_result = self.engine_manager.extract_with_engine(
+                engine_name, pdf_path, output_metadata=self.build_configuration_metadata(config_result),
+                fingerprint_inputs=self.get_fingerprint_inputs(engine_name, pdf_path, gbg_analysis_path)
             )
             
+            return self._complete_engine_result(engine_result, config_result, time.time() - start_time)
+            
         except Exception as e:
             processing_time = time.time() - start_time
             return ComprehensiveEngineResult(
@@ -473,6 +481,109 @@ class ComprehensiveEngineGBGProcessor:
                 error_message=str(e)
             )
     
+    def process_engines_scheduled(self, engine_configs: Dict[str, EngineConfigurationResult],
+                                  pdf_path: str, overwrite_mode: bool = True,
+                                  gbg_analysis_path: Optional[str] = None
+                                  ) -> Dict[str, ComprehensiveEngineResult]:
+        """
+        Process engines concurrently in separate processes via the engine scheduler.
+        
+        Cheap engines run first, and each engine process writes its configuration
+        metadata together with its results.
+        
+        Args:
+            engine_configs: Configuration per engine to process
+            pdf_path: Path to PDF file
+            overwrite_mode: Whether to overwrite existing results
+            gbg_analysis_path: Path to GBG analysis file; OCR engines re-extract only
+                pages whose content, configuration or GBG blocks changed
+            
+        Returns:
+            Dictionary of engine name to ComprehensiveEngineResult
+        """
+        results = {}
+        to_run = []
+        for engine_name, config_result in engine_configs.items():
+            skipped = self._check_skip(engine_name, config_result, pdf_path, overwrite_mode)
+            if skipped is not None:
+                results[engine_name] = skipped
+            else:
+                to_run.append(engine_name)
+        
+        def complete(engine_result: EngineResult) -> None:
+            config_result = engine_configs[engine_result.engine_name]
+            try:
+                results[engine_result.engine_name] = self._complete_engine_result(
+                    engine_result, config_result, engine_result.extraction_time
+                )
+            except Exception as e:
+                results[engine_result.engine_name] = ComprehensiveEngineResult(
+                    engine_name=engine_result.engine_name,
+                    success=False,
+                    output_path="",
+                    extraction_time=engine_result.extraction_time,
+                    is_optimized=config_result.is_optimized,
+                    config_source=config_result.config_source,
+                    configuration_used=config_result.configuration,
+                    error_message=str(e)
+                )
+        
+        if to_run:
+            output_metadata = {
+                name: self.build_configuration_metadata(engine_configs[name]) for name in to_run
+            }
+            fingerprint_inputs = {
+                name: self.get_fingerprint_inputs(name, pdf_path, gbg_analysis_path) for name in to_run
+            }
+            self.engine_manager.run_engines_scheduled(to_run, pdf_path, on_result=complete,
+                                                      output_metadata=output_metadata,
+                                                      fingerprint_inputs=fingerprint_inputs)
+        
+        return {name: results[name] for name in engine_configs if name in results}
+    
+    def _check_skip(self, engine_name: str, config_result: EngineConfigurationResult,
+                    pdf_path: str, overwrite_mode: bool) -> Optional[ComprehensiveEngineResult]:
+        """Return a skipped result if existing output with the same configuration should be kept."""
+        # Check for existing extraction results
+        existing_found, existing_path = self.check_existing_extraction_results(
+            engine_name, config_result, pdf_path
+        )
+        
+        # Determine if we should process this engine
+        if self.should_process_engine(engine_name, overwrite_mode, existing_found, existing_path):
+            return None
+        
+        # Return result indicating skipped
+        return ComprehensiveEngineResult(
+            engine_name=engine_name,
+            success=True,  # Consider skipped as successful
+            output_path=existing_path or "",
+            extraction_time=0,
+            is_optimized=config_result.is_optimized,
+            config_source=config_result.config_source,
+            configuration_used=config_result.configuration,
+            error_message="Skipped - existing results found with same configuration",
+            metadata={"skipped": True}
+        )
+    
+    def _complete_engine_result(self, engine_result: EngineResult,
+                                config_result: EngineConfigurationResult,
+                                processing_time: float) -> ComprehensiveEngineResult:
+        """Build the comprehensive result; the engine wrote the configuration with its output."""
+        return ComprehensiveEngineResult(
+            engine_name=engine_result.engine_name,
+            success=engine_result.success,
+            output_path=engine_result.output_path,
+            extraction_time=processing_time,
+            is_optimized=config_result.is_optimized,
+            config_source=config_result.config_source,
+            configuration_used=config_result.configuration,
+            configuration_hash=self.generate_config_hash(config_result.configuration),
+            processing_timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            error_message=engine_result.error_message,
+            metadata=engine_result.metadata
+        )
+    
     def load_existing_gbg_analysis(self, gbg_analysis_path: str) -> Optional[Dict[str, Any]]:
         """
         Load existing GBG analysis file.
@@ -539,8 +650,8 @@ class ComprehensiveEngineGBGProcessor:
             if result.success and engine_name not in integrated_engines:
                 integrated_engines.append(engine_name)
         
-        # Add engine results section
-        gbg_analysis["engine_results"] = {}
+        # Add engine results section; engines not run this time keep their previous entry
+        gbg_analysis.setdefault("engine_results", {})
         for engine_name, result in engine_results.items():
             gbg_analysis["engine_results"][engine_name] = {
                 "success": result.success,
@@ -552,6 +663,9 @@ class ComprehensiveEngineGBGProcessor:
                 "error_message": result.error_message,
                 "metadata": result.metadata
             }
+            if result.metadata and result.metadata.get("incremental"):
+                # Pages spliced from the previous output were not re-extracted
+                gbg_analysis["engine_results"][engine_name]["incremental"] = result.metadata["incremental"]
         
         # Add optimization status tracking
         if "optimization_status" not in gbg_analysis["processing_metadata"]:
@@ -628,7 +742,8 @@ class ComprehensiveEngineGBGProcessor:
     
     def process_all_engines_comprehensive(self, pdf_path: Optional[str] = None,
                                         gbg_analysis_path: Optional[str] = None,
-                                        overwrite_mode: bool = True) -> ComprehensiveProcessingResult:
+                                        overwrite_mode: bool = True,
+                                        parallel: bool = False) -> ComprehensiveProcessingResult:
         """
         Process all available engines with optimized configurations and integrate into GBG analysis.
         
@@ -636,6 +751,8 @@ class ComprehensiveEngineGBGProcessor:
             pdf_path: Path to PDF file
             gbg_analysis_path: Path to existing GBG analysis file
             overwrite_mode: Whether to overwrite existing extraction results (True) or skip them (False)
+            parallel: Opt in to running engines concurrently in separate processes under the
+                engine scheduler (default runs them one after another in this process)
             
         Returns:
             ComprehensiveProcessingResult with all results
@@ -679,24 +796,35 @@ class ComprehensiveEngineGBGProcessor:
         engines_failed = 0
         engines_skipped = 0
         
-        for engine_name in available_engines:
-            print(f"Processing {engine_name}...")
-            
-            # Get configuration for this engine
-            config_result = self.get_engine_configuration(engine_name, pdf_path)
-            
-            if config_result.is_optimized:
-                print(f"  Using optimized configuration from {config_result.config_source}")
-                engines_optimized += 1
-            else:
-                print(f"  Using default configuration")
-            
-            # Process engine
-            result = self.process_engine_with_configuration(
-                engine_name, config_result, pdf_path, overwrite_mode
-            )
-            engine_results[engine_name] = result
-            
+        engine_configs = {}
+        run_parallel = parallel and len(available_engines) > 1
+        # Sequential engines share page renders; scheduled engines render in their own processes
+        raster_scope = nullcontext() if run_parallel else self.engine_manager.shared_raster_scope(pdf_path)
+        with raster_scope:
+            for engine_name in available_engines:
+                print(f"Processing {engine_name}...")
+                
+                # Get configuration for this engine
+                config_result = self.get_engine_configuration(engine_name, pdf_path)
+                engine_configs[engine_name] = config_result
+                
+                if config_result.is_optimized:
+                    print(f"  Using optimized configuration from {config_result.config_source}")
+                    engines_optimized += 1
+                else:
+                    print(f"  Using default configuration")
+                
+                if not run_parallel:
+                    # Process engine
+                    engine_results[engine_name] = self.process_engine_with_configuration(
+                        engine_name, config_result, pdf_path, overwrite_mode, str(gbg_analysis_path)
+                    )
+        
+        if run_parallel:
+            engine_results = self.process_engines_scheduled(engine_configs, pdf_path, overwrite_mode,
+                                                            str(gbg_analysis_path))
+        
+        for engine_name, result in engine_results.items():
             if result.metadata and result.metadata.get("skipped"):
                 print(f"  ⏭️ {engine_name}: Skipped (existing results with same configuration)")
                 engines_skipped += 1
@@ -778,7 +906,8 @@ class ComprehensiveEngineGBGProcessor:
     def process_specific_engines(self, engine_names: List[str],
                                pdf_path: Optional[str] = None,
                                gbg_analysis_path: Optional[str] = None,
-                               overwrite_mode: bool = True) -> ComprehensiveProcessingResult:
+                               overwrite_mode: bool = True,
+                               parallel: bool = False) -> ComprehensiveProcessingResult:
         """
         Process specific engines with optimized configurations.
         
@@ -787,6 +916,7 @@ class ComprehensiveEngineGBGProcessor:
             pdf_path: Path to PDF file
             gbg_analysis_path: Path to existing GBG analysis file
             overwrite_mode: Whether to overwrite existing extraction results
+            parallel: Opt in to running engines concurrently in separate processes
             
         Returns:
             ComprehensiveProcessingResult with results
@@ -814,7 +944,7 @@ class ComprehensiveEngineGBGProcessor:
         self.engine_manager.get_available_engines = lambda: requested_engines
         
         try:
-            result = self.process_all_engines_comprehensive(pdf_path, gbg_analysis_path, overwrite_mode)
+            result = self.process_all_engines_comprehensive(pdf_path, gbg_analysis_path, overwrite_mode, parallel)
             return result
         finally:
             # Restore original method
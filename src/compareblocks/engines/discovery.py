@@ -0,0 +1,268 @@
+# src/compareblocks/engines/discovery.py
+"""
+Import-free engine availability discovery.
+Probes installed packages and binaries without importing engine stacks, and caches the result on disk.
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+MANIFEST_VERSION = "1.1.0"
+_MANIFEST_NAME = "engine_availability.json"
+
+
+@dataclass(frozen=True)
+class EngineRequirements:
+    """
+    Top-level packages and executables an engine needs.
+
+    alternatives lists interchangeable backends; one of them must be satisfied
+    in addition to modules and binaries.
+    """
+    modules: Tuple[str, ...] = ()
+    binaries: Tuple[str, ...] = ()
+    alternatives: Tuple["EngineRequirements", ...] = ()
+
+
+ENGINE_REQUIREMENTS: Dict[str, EngineRequirements] = {
+    'pymupdf': EngineRequirements(modules=('fitz',)),
+    # tesserocr links libtesseract directly; pytesseract drives the tesseract executable
+    'tesseract': EngineRequirements(modules=('PIL',), alternatives=(
+        EngineRequirements(modules=('tesserocr',)),
+        EngineRequirements(modules=('pytesseract',), binaries=('tesseract',)),
+    )),
+    # paddleocr imports the PaddlePaddle framework, which is installed separately
+    'paddleocr': EngineRequirements(modules=('paddleocr', 'paddle')),
+    'kreuzberg': EngineRequirements(modules=('kreuzberg',)),
+    'docling': EngineRequirements(modules=('docling',)),
+}
+
+
+@dataclass
+class EngineProbe:
+    """Availability of one engine and what is missing for it."""
+    engine_name: str
+    available: bool
+    missing_modules: List[str] = field(default_factory=list)
+    missing_binaries: List[str] = field(default_factory=list)
+
+    @property
+    def reason(self) -> str:
+        """Human-readable reason the engine is unavailable ("" if available)."""
+        missing = ([f"package '{name}'" for name in self.missing_modules] +
+                   [f"executable '{name}'" for name in self.missing_binaries])
+        return f"Missing {', '.join(missing)}" if missing else ""
+
+
+def module_installed(module_name: str) -> bool:
+    """
+    Check whether a top-level module can be imported, without importing it.
+
+    Args:
+        module_name: Top-level module name
+
+    Returns:
+        True if an import would find the module
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name] is not None
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _missing_requirements(requirements: EngineRequirements) -> Tuple[List[str], List[str]]:
+    """Packages and executables of a requirement set that are not installed."""
+    missing_modules = [name for name in requirements.modules if not module_installed(name)]
+    missing_binaries = [name for name in requirements.binaries if shutil.which(name) is None]
+    return missing_modules, missing_binaries
+
+
+def probe_engine(engine_name: str) -> EngineProbe:
+    """
+    Probe one engine's packages and executables.
+
+    Args:
+        engine_name: Name of the engine
+
+    Returns:
+        EngineProbe for the engine (unknown engines are unavailable)
+    """
+    requirements = ENGINE_REQUIREMENTS.get(engine_name)
+    if requirements is None:
+        return EngineProbe(engine_name, False)
+
+    missing_modules, missing_binaries = _missing_requirements(requirements)
+    if requirements.alternatives:
+        # Report what the closest backend lacks when none is usable
+        missing = min((_missing_requirements(alternative) for alternative in requirements.alternatives),
+                      key=lambda pair: len(pair[0]) + len(pair[1]))
+        missing_modules += missing[0]
+        missing_binaries += missing[1]
+    return EngineProbe(
+        engine_name=engine_name,
+        available=not missing_modules and not missing_binaries,
+        missing_modules=missing_modules,
+        missing_binaries=missing_binaries
+    )
+
+
+def probe_engines(engine_names: Optional[Sequence[str]] = None) -> Dict[str, EngineProbe]:
+    """Probe several engines (all known engines by default)."""
+    names = list(engine_names) if engine_names is not None else list(ENGINE_REQUIREMENTS)
+    return {name: probe_engine(name) for name in names}
+
+
+def environment_fingerprint() -> str:
+    """
+    Fingerprint of the interpreter, engine requirements, import path and executable search path.
+
+    Installing or removing a package or binary touches one of the fingerprinted
+    directories, so a cached manifest with a matching fingerprint is still valid.
+
+    Returns:
+        Hex digest
+    """
+    path_dirs = [p for p in os.environ.get("PATH", "").split(os.pathsep) if p]
+    parts = [sys.executable, sys.version, MANIFEST_VERSION, repr(sorted(ENGINE_REQUIREMENTS.items()))]
+    for directory in list(sys.path) + path_dirs:
+        try:
+            mtime = os.stat(directory or ".").st_mtime_ns
+        except OSError:
+            mtime = -1
+        parts.append(f"{directory}:{mtime}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class EngineAvailabilityCache:
+    """Availability manifest cached on disk and keyed by the environment fingerprint."""
+
+    def __init__(self, manifest_path: Optional[str] = None, max_age: Optional[float] = 7 * 24 * 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            manifest_path: Manifest file (defaults to <configured cache directory>/engine_availability.json)
+            max_age: Seconds before a manifest is re-probed even if the environment looks unchanged
+                (None = never)
+        """
+        if manifest_path is None:
+            from ..config.file_manager import file_manager
+            manifest_path = Path(file_manager.get_cache_directory()) / _MANIFEST_NAME
+        self.manifest_path = Path(manifest_path)
+        self.max_age = max_age
+
+    def load(self) -> Optional[Dict[str, EngineProbe]]:
+        """
+        Load the cached probes if the manifest matches this environment.
+
+        Returns:
+            Cached probes, or None if missing, stale or unreadable
+        """
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get("fingerprint") != environment_fingerprint():
+                return None
+            if self.max_age is not None and time.time() - manifest.get("probed_at", 0) > self.max_age:
+                return None
+            return {name: EngineProbe(**probe) for name, probe in manifest["engines"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, probes: Dict[str, EngineProbe]) -> None:
+        """Write the manifest atomically; failures only cost a re-probe next time."""
+        manifest = {
+            "manifest_version": MANIFEST_VERSION,
+            "fingerprint": environment_fingerprint(),
+            "probed_at": time.time(),
+            "engines": {name: asdict(probe) for name, probe in probes.items()}
+        }
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.manifest_path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, indent=2)
+                os.replace(tmp_path, self.manifest_path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            print(f"Warning: Could not write engine availability manifest: {e}")
+
+    def invalidate(self) -> None:
+        """Delete the manifest so the next lookup re-probes."""
+        self.manifest_path.unlink(missing_ok=True)
+
+    def get_probes(self, refresh: bool = False) -> Dict[str, EngineProbe]:
+        """
+        Cached probes for all known engines, re-probing when stale.
+
+        Args:
+            refresh: Ignore the manifest and probe again
+
+        Returns:
+            Dictionary of engine name to probe
+        """
+        probes = None if refresh else self.load()
+        if probes is None or set(probes) != set(ENGINE_REQUIREMENTS):
+            probes = probe_engines()
+            self.save(probes)
+        return probes
+
+
+def detect_available_engines(refresh: bool = False, use_cache: bool = True,
+                             cache: Optional[EngineAvailabilityCache] = None) -> Dict[str, bool]:
+    """
+    Detect which extraction engines are installed, without importing them.
+
+    Args:
+        refresh: Re-probe even if a valid manifest exists
+        use_cache: Read and write the on-disk availability manifest
+        cache: Manifest cache to use (defaults to the configured cache directory)
+
+    Returns:
+        Dictionary of engine name to availability
+    """
+    if use_cache:
+        try:
+            probes = (cache or EngineAvailabilityCache()).get_probes(refresh=refresh)
+        except Exception as e:
+            print(f"Warning: Engine availability manifest unavailable: {e}")
+            probes = probe_engines()
+    else:
+        probes = probe_engines()
+    return {name: probe.available for name, probe in probes.items()}
+
+
+def lazy_function(module_name: str, function_name: str) -> Callable[..., Any]:
+    """
+    Stand-in for a function in an engine module that imports the module on first call.
+
+    Args:
+        module_name: Module relative to this package (e.g. ".tesseract_engine")
+        function_name: Function in that module
+
+    Returns:
+        Callable forwarding to the real function
+    """
+    def call(*args, **kwargs):
+        module = importlib.import_module(module_name, __package__)
+        return getattr(module, function_name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = function_name
+    call.__doc__ = f"Lazily imported {module_name.lstrip('.')}.{function_name}."
+    return call
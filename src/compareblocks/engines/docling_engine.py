@@ -4,7 +4,6 @@ Docling engine for PDF text extraction.
 Provides advanced PDF understanding using Docling framework.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
@@ -17,6 +16,7 @@ except ImportError:
     DOCLING_AVAILABLE = False
 
 from ..io.pdf_metadata import PDFMetadataExtractor
+from .output import EngineOutput, save_engine_output
 from ..config.file_manager import file_manager
 
 
@@ -276,16 +276,20 @@ class DoclingEngine:
         }
     
     def save_extraction(self, pdf_path: Optional[str] = None, 
-                       output_path: Optional[str] = None) -> str:
+                       output_path: Optional[str] = None,
+                       json_format: str = "indented",
+                       metadata: Optional[Dict[str, Any]] = None) -> Optional[EngineOutput]:
         """
         Extract and save Docling data.
         
         Args:
             pdf_path: Path to PDF file
             output_path: Path to save results
+            json_format: JSON layout: "indented", "compact" or "stream"
+            metadata: Section name -> fields merged into the results before writing
             
         Returns:
-            Path to saved file
+            EngineOutput with the saved file's path and summary (None if extraction failed)
         """
         # Extract data
         results = self.extract_pdf(pdf_path)
@@ -293,7 +297,7 @@ class DoclingEngine:
         # Check for errors
         if "error" in results:
             print(f"Docling extraction failed: {results['error']}")
-            return ""
+            return None
         
         # Determine output path
         if output_path is None:
@@ -305,16 +309,11 @@ class DoclingEngine:
             processing_dir = Path(file_manager.get_processing_directory())
             output_path = processing_dir / filename
         
-        # Ensure output directory exists
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save results
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Save results, with caller metadata merged in the same pass
+        output_path = save_engine_output(results, output_path, json_format, metadata)
         
         print(f"Docling extraction saved to: {output_path}")
-        return str(output_path)
+        return output_path
 
 
 # Convenience functions
@@ -329,7 +328,10 @@ def extract_docling(pdf_path: Optional[str] = None,
 def save_docling_extraction(pdf_path: Optional[str] = None, 
                            output_path: Optional[str] = None,
                            pipeline: str = 'default',
-                           export_format: str = 'markdown') -> str:
+                           export_format: str = 'markdown',
+                           json_format: str = "indented",
+                           metadata: Optional[Dict[str, Any]] = None) -> Optional[EngineOutput]:
     """Extract and save Docling data."""
     engine = DoclingEngine(pipeline=pipeline, export_format=export_format)
-    return engine.save_extraction(pdf_path, output_path)
\ No newline at end of file
+    return engine.save_extraction(pdf_path, output_path,
+                                  json_format=json_format, metadata=metadata)
\ No newline at end of file
@@ -12,10 +12,9 @@ Key features:
 
 import cv2
 import numpy as np
-import pytesseract
-from PIL import Image, ImageOps
 import fitz  # PyMuPDF
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from concurrent.futures import Future
 import re
 from pathlib import Path
 import json
@@ -23,6 +22,12 @@ from dataclasses import dataclass
 from collections import Counter
 
 from ..config.file_manager import file_manager
+from ..io.raster import page_raster_scope, render_page_array
+from .ocr_pool import TesseractWorkerPool, get_tesseract_pool
+from .orientation_search import (
+    ORIENTATION_ANGLES, OrientationSearchConfig, OrientationSearchState, OrientationSearchStats,
+    plan_orientation_stages, predicted_angle, projection_axis_angle
+)
 
 
 @dataclass
@@ -52,10 +57,31 @@ class GBGGuidedBlock:
 class GBGGuidedTesseractEngine:
     """Tesseract OCR engine guided by GBG analysis for optimal text extraction."""
     
-    def __init__(self):
-        """Initialize the GBG-guided Tesseract engine."""
+    # PSM 6 (single uniform block) works best for clear text blocks
+    OCR_CONFIG = '--psm 6'
+    
+    def __init__(self, ocr_pool: Optional[TesseractWorkerPool] = None,
+                 orientation_search: Optional[OrientationSearchConfig] = None):
+        """
+        Initialize the GBG-guided Tesseract engine.
+        
+        Args:
+            ocr_pool: Worker pool for OCR calls (defaults to the shared English pool)
+            orientation_search: Early-exit orientation search settings (an
+                early_exit_confidence above 1.0 always tests all four angles)
+        """
         self.common_patterns = self._build_common_patterns()
         self.orientation_cache = {}  # Cache orientation results
+        self._ocr_pool = ocr_pool
+        self.orientation_search = orientation_search or OrientationSearchConfig()
+        self.orientation_stats = OrientationSearchStats()
+    
+    @property
+    def ocr_pool(self) -> TesseractWorkerPool:
+        """Worker pool used for OCR, created on first use."""
+        if self._ocr_pool is None:
+            self._ocr_pool = get_tesseract_pool('eng')
+        return self._ocr_pool
         
     def _build_common_patterns(self) -> List[str]:
         """Build list of common text patterns for orientation validation."""
@@ -80,6 +106,7 @@ class GBGGuidedTesseractEngine:
         
         # Open PDF
         pdf_document = fitz.open(pdf_path)
+        self.orientation_stats = OrientationSearchStats()
         
         # Initialize results
         all_blocks = []
@@ -92,23 +119,26 @@ class GBGGuidedTesseractEngine:
             'pattern_validation': True
         }
         
-        # Process each page with GBG guidance
-        for page_num in range(len(pdf_document)):
-            print(f"Processing page {page_num + 1}/{len(pdf_document)} with GBG guidance")
-            
-            page_blocks = self._process_page_with_gbg_guidance(
-                pdf_document, page_num, gbg_data
-            )
-            all_blocks.extend(page_blocks)
-        
-        pdf_document.close()
+        # Process each page with GBG guidance, sharing renders with any enclosing raster scope
+        try:
+            with page_raster_scope(pdf_path):
+                for page_num in range(len(pdf_document)):
+                    print(f"Processing page {page_num + 1}/{len(pdf_document)} with GBG guidance")
+                    
+                    page_blocks = self._process_page_with_gbg_guidance(
+                        pdf_document, page_num, gbg_data
+                    )
+                    all_blocks.extend(page_blocks)
+        finally:
+            pdf_document.close()
         
         # Calculate statistics
         processing_metadata.update({
             'total_blocks': len(all_blocks),
             'avg_confidence': np.mean([b.ocr_confidence for b in all_blocks]) if all_blocks else 0.0,
             'orientation_distribution': self._calculate_orientation_distribution(all_blocks),
-            'pattern_matches': sum(b.orientation.pattern_matches for b in all_blocks)
+            'pattern_matches': sum(b.orientation.pattern_matches for b in all_blocks),
+            'orientation_search': self.orientation_stats.to_dict()
         })
         
         # Convert to standard format
@@ -147,24 +177,33 @@ class GBGGuidedTesseractEngine:
             print(f"  No GBG blocks found for page {page_num}, skipping")
             return []
         
-        # Render page as image
-        mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better OCR
-        pix = page.get_pixmap(matrix=mat)
-        img_data = pix.tobytes("png")
-        
-        # Convert to PIL Image
-        pil_image = Image.open(io.BytesIO(img_data))
-        cv_image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-        
-        processed_blocks = []
+        # Render page at 2x zoom (144 DPI) for better OCR via the shared raster cache
+        cv_image = cv2.cvtColor(render_page_array(page, 144), cv2.COLOR_RGB2BGR)
         
-        # Process each GBG block as an OCR region
+        # Search every block's orientation together so each stage keeps the OCR pool busy
+        queued = []
         for i, gbg_block in enumerate(gbg_blocks):
             block_id = f"gbg_guided_tesseract_p{page_num}_b{i}"
             
             try:
-                processed_block = self._process_gbg_block_region(
-                    cv_image, gbg_block, block_id, page_num
+                extracted = self._extract_block_region(cv_image, gbg_block)
+                if extracted:
+                    region, bbox = extracted
+                    expected_text = gbg_block.get('text_content', '').strip()
+                    state = self._start_orientation_search(region, expected_text, gbg_block)
+                    queued.append((block_id, gbg_block, bbox, state))
+            except Exception as e:
+                print(f"    Error processing block {block_id}: {e}")
+                continue
+        
+        self._search_orientations([state for _, _, _, state in queued])
+        
+        processed_blocks = []
+        for block_id, gbg_block, bbox, state in queued:
+            try:
+                best_orientation = self._best_orientation(state.results)
+                processed_block = self._build_guided_block(
+                    best_orientation, block_id, gbg_block, bbox, page_num
                 )
                 if processed_block:
                     processed_blocks.append(processed_block)
@@ -196,10 +235,23 @@ class GBGGuidedTesseractEngine:
     def _process_gbg_block_region(self, cv_image: np.ndarray, gbg_block: Dict[str, Any], 
                                  block_id: str, page_num: int) -> Optional[GBGGuidedBlock]:
         """Process a single GBG block region with orientation testing."""
-        bbox = gbg_block.get('bbox', {})
-        gbg_block_id = gbg_block.get('block_id', '')
+        extracted = self._extract_block_region(cv_image, gbg_block)
+        if extracted is None:
+            return None
+        
+        region, bbox = extracted
         expected_text = gbg_block.get('text_content', '').strip()
         
+        # Test different orientations
+        best_orientation = self._test_orientations(region, expected_text, page_num, gbg_block)
+        
+        return self._build_guided_block(best_orientation, block_id, gbg_block, bbox, page_num)
+    
+    def _extract_block_region(self, cv_image: np.ndarray,
+                              gbg_block: Dict[str, Any]) -> Optional[Tuple[np.ndarray, List[float]]]:
+        """Cut a GBG block out of the 2x page image; returns (region, bbox in PDF units)."""
+        bbox = gbg_block.get('bbox', {})
+        
         # Extract region coordinates (scale by 2x for the zoomed image)
         x = int(bbox.get('x', 0) * 2)
         y = int(bbox.get('y', 0) * 2)
@@ -222,17 +274,21 @@ class GBGGuidedTesseractEngine:
         if region.size == 0:
             return None
         
-        # Test different orientations
-        best_orientation = self._test_orientations(region, expected_text, page_num)
-        
+        # Convert back to original scale
+        return region, [x/2, y/2, (x+width)/2, (y+height)/2]
+    
+    def _build_guided_block(self, best_orientation: OrientationResult, block_id: str,
+                            gbg_block: Dict[str, Any], bbox: List[float],
+                            page_num: int) -> Optional[GBGGuidedBlock]:
+        """Create the output block if the best orientation is confident enough."""
         # Use the best orientation result
         if best_orientation.confidence > 0.1:  # Minimum confidence threshold
             return GBGGuidedBlock(
                 block_id=block_id,
                 page=page_num,
                 text=best_orientation.text,
-                bbox=[x/2, y/2, (x+width)/2, (y+height)/2],  # Convert back to original scale
-                gbg_block_id=gbg_block_id,
+                bbox=bbox,
+                gbg_block_id=gbg_block.get('block_id', ''),
                 orientation=best_orientation,
                 ocr_confidence=best_orientation.ocr_confidence,
                 processing_method='gbg_guided_orientation_tested'
@@ -240,65 +296,92 @@ class GBGGuidedTesseractEngine:
         
         return None
     
-    def _test_orientations(self, region: np.ndarray, expected_text: str, page_num: int) -> OrientationResult:
-        """Test different orientations (0°, 90°, 180°, 270°) and return the best result."""
-        orientations = [0, 90, 180, 270]
+    def _test_orientations(self, region: np.ndarray, expected_text: str, page_num: int,
+                           gbg_block: Optional[Dict[str, Any]] = None) -> OrientationResult:
+        """Search the orientations (0°, 90°, 180°, 270°) and return the best result."""
+        state = self._start_orientation_search(region, expected_text, gbg_block)
+        self._search_orientations([state])
+        return self._best_orientation(state.results)
+    
+    def _start_orientation_search(self, region: np.ndarray, expected_text: str,
+                                  gbg_block: Optional[Dict[str, Any]] = None) -> OrientationSearchState:
+        """Preprocess a region and plan the order in which its orientations are tried."""
+        # Grayscale and bilateral filtering commute with 90° rotations, so preprocess once
+        processed_region = self._preprocess_for_ocr(region)
+        
+        config = self.orientation_search
+        first_angle = predicted_angle(gbg_block) if config.use_gbg_hints else 0
+        axis_angle = None
+        if config.use_projection_precheck:
+            axis_angle = projection_axis_angle(processed_region, config.projection_min_confidence)
+        
+        return OrientationSearchState(
+            region=processed_region,
+            expected_text=expected_text,
+            stages=plan_orientation_stages(first_angle, axis_angle)
+        )
+    
+    def _search_orientations(self, states: List[OrientationSearchState]) -> None:
+        """
+        Run the staged orientation search for several regions at once.
+        
+        Each stage queues the next angles of every unfinished region before
+        waiting, and a region stops once a result reaches the early-exit confidence.
+        
+        Args:
+            states: Search states from _start_orientation_search (updated in place)
+        """
+        stats = self.orientation_stats
+        stage_count = max((len(state.stages) for state in states), default=0)
+        
+        for stage_index in range(stage_count):
+            queued = []
+            for state in states:
+                if state.done or stage_index >= len(state.stages):
+                    continue
+                angles = state.stages[stage_index]
+                queued.append((state, self._submit_rotations(state.region, angles)))
+                stats.ocr_passes += len(angles)
+            
+            for state, pending in queued:
+                state.results.extend(self._score_pending(pending, state.expected_text))
+                best = max(result.confidence for result in state.results)
+                if best >= self.orientation_search.early_exit_confidence:
+                    state.done = True
+                    if stage_index < len(state.stages) - 1:
+                        stats.early_exits += 1
+        
+        for state in states:
+            stats.blocks += 1
+            if state.results and self._best_orientation(state.results).angle == state.stages[0][0]:
+                stats.predicted_hits += 1
+    
+    def _submit_rotations(self, processed_region: np.ndarray,
+                          angles: Sequence[int]) -> List[Tuple[int, Optional[Future]]]:
+        """Queue OCR of an already preprocessed region at the given angles."""
+        pending = []
+        for angle in angles:
+            try:
+                rotated_region = self._rotate_region(processed_region, angle)
+                pending.append((angle, self.ocr_pool.submit(rotated_region, self.OCR_CONFIG)))
+            except Exception:
+                pending.append((angle, None))
+        return pending
+    
+    def _best_orientation(self, results: List[OrientationResult]) -> OrientationResult:
+        """Pick the most confident result; ties go to the earlier angle in 0°, 90°, 180°, 270°."""
+        return max(results, key=lambda r: (r.confidence, -ORIENTATION_ANGLES.index(r.angle)))
+    
+    def _score_pending(self, pending: List[Tuple[int, Optional[Future]]],
+                       expected_text: str) -> List[OrientationResult]:
+        """Wait for queued orientation OCR and score each angle."""
         results = []
         
-        for angle in orientations:
+        for angle, future in pending:
             try:
-                # Rotate image
-                if angle == 0:
-                    rotated_region = region
-                elif angle == 90:
-                    rotated_region = cv2.rotate(region, cv2.ROTATE_90_CLOCKWISE)
-                elif angle == 180:
-                    rotated_region = cv2.rotate(region, cv2.ROTATE_180)
-                elif angle == 270:
-                    rotated_region = cv2.rotate(region, cv2.ROTATE_90_COUNTERCLOCKWISE)
-                
-                # Preprocess for OCR
-                processed_region = self._preprocess_for_ocr(rotated_region)
-                
-                # Perform OCR with optimized configuration
-                # PSM 6 (single uniform block) works best for clear text blocks
-                ocr_result = pytesseract.image_to_data(
-                    processed_region, 
-                    output_type=pytesseract.Output.DICT,
-                    config='--psm 6'
-                )
-                
-                # Extract text and confidence
-                text_parts = []
-                confidences = []
-                
-                for i, conf in enumerate(ocr_result['conf']):
-                    if int(conf) > 0:  # Valid confidence
-                        word = ocr_result['text'][i].strip()
-                        if word:
-                            text_parts.append(word)
-                            confidences.append(int(conf))
-                
-                text = ' '.join(text_parts)
-                avg_confidence = np.mean(confidences) if confidences else 0.0
-                
-                # Calculate orientation quality metrics
-                word_count = len([w for w in text.split() if len(w) >= 2])
-                pattern_matches = self._count_pattern_matches(text)
-                
-                # Calculate overall confidence
-                orientation_confidence = self._calculate_orientation_confidence(
-                    text, expected_text, word_count, pattern_matches, avg_confidence
-                )
-                
-                results.append(OrientationResult(
-                    angle=angle,
-                    confidence=orientation_confidence,
-                    word_count=word_count,
-                    pattern_matches=pattern_matches,
-                    text=text,
-                    ocr_confidence=avg_confidence / 100.0
-                ))
+                if future is None:
+                    raise RuntimeError(f"OCR was not queued for {angle}°")
+                results.append(self._score_orientation(angle, future.result(), expected_text))
                 
             except Exception as e:
                 # If orientation fails, create a low-confidence result
@@ -311,9 +394,54 @@ class GBGGuidedTesseractEngine:
                     ocr_confidence=0.0
                 ))
         
-        # Return the best orientation
-        best_result = max(results, key=lambda r: r.confidence)
-        return best_result
+        return results
+    
+    def _rotate_region(self, region: np.ndarray, angle: int) -> np.ndarray:
+        """Rotate a region clockwise by a multiple of 90°."""
+        if angle == 0:
+            return region
+        elif angle == 90:
+            return cv2.rotate(region, cv2.ROTATE_90_CLOCKWISE)
+        elif angle == 180:
+            return cv2.rotate(region, cv2.ROTATE_180)
+        elif angle == 270:
+            return cv2.rotate(region, cv2.ROTATE_90_COUNTERCLOCKWISE)
+        raise ValueError(f"Unsupported rotation: {angle}")
+    
+    def _score_orientation(self, angle: int, ocr_result: Dict[str, List[Any]],
+                           expected_text: str) -> OrientationResult:
+        """Turn one orientation's OCR output into a scored OrientationResult."""
+        # Extract text and confidence
+        text_parts = []
+        confidences = []
+        
+        for i, conf in enumerate(ocr_result['conf']):
+            if int(conf) > 0:  # Valid confidence
+                word = ocr_result['text'][i].strip()
+                if word:
+                    text_parts.append(word)
+                    confidences.append(int(conf))
+        
+        text = ' '.join(text_parts)
+        avg_confidence = np.mean(confidences) if confidences else 0.0
+        
+        # Calculate orientation quality metrics
+        word_count = len([w for w in text.split() if len(w) >= 2])
+        pattern_matches = self._count_pattern_matches(text)
+        
+        # Calculate overall confidence
+        orientation_confidence = self._calculate_orientation_confidence(
+            text, expected_text, word_count, pattern_matches, avg_confidence
+        )
+        
+        return OrientationResult(
+            angle=angle,
+            confidence=orientation_confidence,
+            word_count=word_count,
+            pattern_matches=pattern_matches,
+            text=text,
+            ocr_confidence=avg_confidence / 100.0
+        )
     
     def _preprocess_for_ocr(self, image: np.ndarray) -> np.ndarray:
         """Preprocess image region for optimal OCR - optimized for clear text."""
@@ -378,7 +506,3 @@ class GBGGuidedTesseractEngine:
                 distribution[angle] += 1
         
         return distribution
-
-
-# Import required modules at the top
-import io
\ No newline at end of file
@@ -13,6 +13,7 @@ import time
 from .dual_output_processor import DualOutputEngineProcessor, DualOutputResult
 from .gbg_guided_tesseract_engine import GBGGuidedTesseractEngine
 from ..gbg.processor import GBGProcessor
+from ..gbg.cache import GBGAnalysisCache
 from ..io.pdf_metadata import PDFMetadataExtractor
 from ..config.file_manager import file_manager
 from ..association.pymupdf_matcher import match_pymupdf_blocks_to_gbg
@@ -33,7 +34,7 @@ class GBGIntegratedEngineProcessor:
     def __init__(self):
         """Initialize the GBG-integrated processor."""
         self.dual_processor = DualOutputEngineProcessor()
-        self.gbg_processor = GBGProcessor()
+        self.gbg_processor = GBGProcessor(cache=GBGAnalysisCache())
         self.metadata_extractor = PDFMetadataExtractor()
     
     def process_with_gbg_guidance(self, pdf_path: Optional[str] = None, page_num: Optional[int] = None, engines: Optional[List[str]] = None) -> Dict[str, Any]:
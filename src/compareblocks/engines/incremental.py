@@ -0,0 +1,365 @@
+# src/compareblocks/engines/incremental.py
+"""
+Incremental page-level re-extraction for the OCR engines.
+Stores per-page and per-block fingerprints with each output and re-extracts only pages whose inputs changed.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+from .output import EngineOutput, save_engine_output
+from ..io.pdf_metadata import PDFMetadataExtractor
+from ..config.engine_config import EXECUTION_SETTINGS
+from ..config.file_manager import file_manager
+
+
+# Engines whose outputs are keyed by page and can be re-extracted page by page
+INCREMENTAL_ENGINES = ('tesseract', 'paddleocr')
+
+FINGERPRINT_VERSION = "1.0.0"
+
+# Configuration settings each engine applies when it extracts a page; only these
+# reach a page's fingerprint, so a changed setting always changes the output
+ENGINE_PAGE_SETTINGS = {
+    'tesseract': ('dpi', 'lang'),
+    'paddleocr': ('lang', 'use_gpu'),
+}
+
+
+@dataclass
+class PageFingerprint:
+    """Inputs that determine one page of an engine output."""
+    content_hash: str  # PDF page content, geometry and embedded streams
+    config_hash: str  # Engine configuration effective for the page
+    block_ids: List[str] = field(default_factory=list)  # GBG blocks on the page
+    block_fingerprints: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class FingerprintInputs:
+    """Configuration and GBG inputs for fingerprinting an engine's pages (picklable)."""
+    page_config_hashes: Dict[int, str] = field(default_factory=dict)
+    default_config_hash: str = ""  # Used for pages without an entry in page_config_hashes
+    gbg_analysis_path: Optional[str] = None
+    # Engine settings to extract each page with (pages without an entry use the given engine)
+    page_settings: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+
+def hash_configuration(configuration: Dict[str, Any]) -> str:
+    """
+    Hash an engine configuration (same scheme as the comprehensive processor).
+
+    Execution-only settings such as max_workers are left out, so changing them
+    does not mark pages dirty.
+
+    Args:
+        configuration: Configuration dictionary
+
+    Returns:
+        MD5 hex digest of the sorted JSON
+    """
+    configuration = {key: value for key, value in configuration.items() if key not in EXECUTION_SETTINGS}
+    return hashlib.md5(json.dumps(configuration, sort_keys=True).encode()).hexdigest()
+
+
+def page_content_hash(doc: fitz.Document, page_num: int) -> str:
+    """
+    Hash what a page renders from: its geometry, content stream, images and form XObjects.
+
+    Args:
+        doc: Open PDF document
+        page_num: Page number (0-indexed)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    page = doc[page_num]
+    digest = hashlib.sha256()
+    digest.update(repr((tuple(page.rect), page.rotation)).encode())
+    digest.update(page.read_contents())
+
+    xrefs = sorted({image[0] for image in page.get_images(full=True)} |
+                   {xobject[0] for xobject in page.get_xobjects()})
+    for xref in xrefs:
+        digest.update(str(xref).encode())
+        digest.update(doc.xref_stream_raw(xref) or b"")
+    return digest.hexdigest()
+
+
+def block_fingerprint(content_hash: str, config_hash: str, block: Dict[str, Any]) -> str:
+    """Fingerprint of one GBG block: its page content, configuration, id and geometry."""
+    parts = [content_hash, config_hash, str(block.get("block_id", "")),
+             json.dumps(block.get("bbox"), sort_keys=True, default=str)]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def load_gbg_blocks_by_page(gbg_analysis_path: Optional[str]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Load GBG blocks per page from a GBG analysis file.
+
+    Args:
+        gbg_analysis_path: Path to the GBG analysis JSON (None or missing = no blocks)
+
+    Returns:
+        Page number -> GBG blocks
+    """
+    if not gbg_analysis_path or not Path(gbg_analysis_path).exists():
+        return {}
+    try:
+        with open(gbg_analysis_path, 'r', encoding='utf-8') as f:
+            analysis = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read GBG analysis for fingerprints: {e}")
+        return {}
+    return {int(page_num): page.get("blocks", [])
+            for page_num, page in analysis.get("pages", {}).items() if isinstance(page, dict)}
+
+
+def build_page_fingerprints(pdf_path: str, inputs: FingerprintInputs) -> Dict[int, PageFingerprint]:
+    """
+    Fingerprint every page of a PDF for one engine.
+
+    Args:
+        pdf_path: Path to the PDF file
+        inputs: Per-page configuration hashes and GBG analysis location
+
+    Returns:
+        Page number -> fingerprint
+    """
+    gbg_blocks = load_gbg_blocks_by_page(inputs.gbg_analysis_path)
+    fingerprints = {}
+
+    with fitz.open(str(pdf_path)) as doc:
+        for page_num in range(len(doc)):
+            content_hash = page_content_hash(doc, page_num)
+            config_hash = inputs.page_config_hashes.get(page_num, inputs.default_config_hash)
+            blocks = gbg_blocks.get(page_num, [])
+            fingerprints[page_num] = PageFingerprint(
+                content_hash=content_hash,
+                config_hash=config_hash,
+                block_ids=[str(block.get("block_id", "")) for block in blocks],
+                block_fingerprints={
+                    str(block.get("block_id", "")): block_fingerprint(content_hash, config_hash, block)
+                    for block in blocks
+                }
+            )
+    return fingerprints
+
+
+def configuration_fingerprint_inputs(config_manager, engine_name: str, pdf_path: str,
+                                     gbg_analysis_path: Optional[str] = None) -> FingerprintInputs:
+    """
+    Fingerprint inputs from an engine configuration manager, including page overrides.
+
+    Each page is hashed and extracted with the settings in ENGINE_PAGE_SETTINGS
+    taken from its effective configuration.
+
+    Args:
+        config_manager: EngineConfigurationManager
+        engine_name: Name of the engine
+        pdf_path: Path to the PDF file
+        gbg_analysis_path: Path to the GBG analysis JSON
+
+    Returns:
+        FingerprintInputs with one configuration hash per page
+    """
+    with fitz.open(str(pdf_path)) as doc:
+        page_count = len(doc)
+    page_configurations = config_manager.get_page_configurations(engine_name, pdf_path, range(page_count))
+    page_settings = {
+        page_num: {key: configuration[key] for key in ENGINE_PAGE_SETTINGS[engine_name]
+                   if configuration.get(key) is not None}
+        for page_num, configuration in page_configurations.items()
+    }
+    return FingerprintInputs(
+        page_config_hashes={page_num: hash_configuration(settings) for page_num, settings in page_settings.items()},
+        gbg_analysis_path=str(gbg_analysis_path) if gbg_analysis_path else None,
+        page_settings=page_settings
+    )
+
+
+def find_dirty_pages(stored: Dict[str, Dict[str, Any]], current: Dict[int, PageFingerprint],
+                     extracted_pages: Optional[set] = None) -> List[int]:
+    """
+    Pages whose fingerprint changed or that were never extracted.
+
+    Args:
+        stored: Fingerprints saved with the previous output (page number as string)
+        current: Fingerprints of the current inputs
+        extracted_pages: Page keys present in the previous output
+
+    Returns:
+        Sorted page numbers to re-extract
+    """
+    dirty = []
+    for page_num, fingerprint in current.items():
+        key = str(page_num)
+        previous = stored.get(key)
+        if extracted_pages is not None and key not in extracted_pages:
+            dirty.append(page_num)
+        elif previous is None or previous != asdict(fingerprint):
+            dirty.append(page_num)
+    return sorted(dirty)
+
+
+def _create_engine(engine_name: str, settings: Optional[Dict[str, Any]] = None):
+    """Build an in-process engine for incremental extraction with the given settings."""
+    if engine_name == 'tesseract':
+        from .tesseract_engine import TesseractEngine
+        return TesseractEngine(**(settings or {}))
+    if engine_name == 'paddleocr':
+        from .paddleocr_engine import PaddleOCREngine
+        return PaddleOCREngine(**(settings or {}))
+    raise ValueError(f"Engine does not support incremental extraction: {engine_name}")
+
+
+def group_pages_by_settings(page_numbers: List[int],
+                            inputs: FingerprintInputs) -> List[Tuple[Dict[str, Any], List[int]]]:
+    """
+    Group pages that are extracted with the same engine settings.
+
+    Args:
+        page_numbers: Pages to extract
+        inputs: Fingerprint inputs carrying per-page settings
+
+    Returns:
+        (settings, pages) pairs in order of each group's first page; settings are
+        empty for pages without an entry in inputs.page_settings
+    """
+    groups: Dict[str, Tuple[Dict[str, Any], List[int]]] = {}
+    for page_num in sorted(page_numbers):
+        settings = inputs.page_settings.get(page_num, {})
+        key = json.dumps(settings, sort_keys=True, default=str)
+        groups.setdefault(key, (settings, []))[1].append(page_num)
+    return list(groups.values())
+
+
+def _load_reusable_output(output_path: Path, engine_name: str) -> Optional[Dict[str, Any]]:
+    """Load a previous whole-document output that carries fingerprints, if any."""
+    if not output_path.exists():
+        return None
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            results = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read previous {engine_name} output: {e}")
+        return None
+
+    extraction_metadata = results.get("extraction_metadata", {})
+    if (results.get("engine") != engine_name or "error" in results
+            or results.get("fingerprint_version") != FINGERPRINT_VERSION
+            or not isinstance(results.get("page_fingerprints"), dict)
+            or "page_range" in extraction_metadata or "pages_extracted" in extraction_metadata):
+        return None
+    return results
+
+
+def splice_pages(results: Dict[str, Any], partial: Dict[str, Any], total_pages: int) -> None:
+    """
+    Splice re-extracted pages into a previous output.
+
+    Args:
+        results: Previous output (modified in place)
+        partial: Output of the pages-only extraction
+        total_pages: Pages in the current document; pages beyond it are dropped
+    """
+    pages = {key: value for key, value in results.get("pages", {}).items() if int(key) < total_pages}
+    pages.update(partial.get("pages", {}))
+    results["pages"] = {key: pages[key] for key in sorted(pages, key=int)}
+
+    # Document-level fields describe the current run
+    for key in ("engine_version", "pdf_path", "pdf_name", "pdf_display_name", "pdf_metadata"):
+        if key in partial:
+            results[key] = partial[key]
+    extraction_metadata = dict(partial.get("extraction_metadata", {}))
+    extraction_metadata.pop("pages_extracted", None)
+    results["extraction_metadata"] = extraction_metadata
+
+
+def extract_engine_incrementally(engine_name: str, pdf_path: Optional[str], inputs: FingerprintInputs,
+                                 output_path: Optional[str] = None, max_workers: int = 1,
+                                 json_format: str = "indented",
+                                 metadata: Optional[Dict[str, Any]] = None,
+                                 engine=None) -> Optional[EngineOutput]:
+    """
+    Extract with an OCR engine, re-extracting only pages whose fingerprint changed.
+
+    Without a previous fingerprinted output the whole document is extracted.
+    Either way the saved output carries the current fingerprints, and its summary
+    lists which pages were re-extracted and which were reused.
+
+    Args:
+        engine_name: "tesseract" or "paddleocr"
+        pdf_path: Path to the PDF file (uses the target PDF if None)
+        inputs: Per-page configuration hashes and GBG analysis location
+        output_path: Output file (defaults to the engine's processing-directory file)
+        max_workers: Worker processes for page-parallel OCR (1 = in-process)
+        json_format: JSON layout: "indented", "compact" or "stream"
+        metadata: Section name -> fields merged into the output before writing
+        engine: Engine for pages without settings in inputs.page_settings (created if None);
+            pages with settings are extracted by an engine built with them
+
+    Returns:
+        EngineOutput with the saved file's path and summary (None if extraction failed)
+    """
+    if engine_name not in INCREMENTAL_ENGINES:
+        raise ValueError(f"Engine does not support incremental extraction: {engine_name}")
+    if pdf_path is None:
+        pdf_path = file_manager.get_target_pdf_path()
+
+    if output_path is None:
+        display_name = PDFMetadataExtractor().get_display_name(str(pdf_path))
+        output_path = Path(file_manager.get_processing_directory()) / f"{display_name}_{engine_name}.json"
+    output_path = Path(output_path)
+
+    current = build_page_fingerprints(pdf_path, inputs)
+    results = _load_reusable_output(output_path, engine_name)
+    full_extraction = results is None
+
+    if full_extraction:
+        dirty = sorted(current)
+    else:
+        dirty = find_dirty_pages(results["page_fingerprints"], current, set(results.get("pages", {})))
+    groups = group_pages_by_settings(dirty, inputs)
+
+    def engine_for(settings):
+        if settings or engine is None:
+            return _create_engine(engine_name, settings)
+        return engine
+
+    if full_extraction and len(groups) == 1:
+        # One configuration for the whole document: a plain full extraction
+        results = engine_for(groups[0][0]).extract_pdf(pdf_path, max_workers=max_workers)
+    elif groups:
+        if full_extraction:
+            results = {"engine": engine_name, "pages": {}}
+        for settings, pages in groups:
+            group_engine = engine_for(settings)
+            partial = group_engine.extract_pdf(pdf_path, max_workers=max_workers, pages=pages)
+            if "error" in partial:
+                results = partial
+                break
+            splice_pages(results, partial, len(current))
+        else:
+            results["summary"] = group_engine.summarize_pages(results["pages"])
+
+    if "error" in results:
+        print(f"{engine_name} extraction failed: {results['error']}")
+        return None
+
+    results["fingerprint_version"] = FINGERPRINT_VERSION
+    results["page_fingerprints"] = {str(page_num): asdict(fingerprint) for page_num, fingerprint in current.items()}
+    results["summary"]["incremental"] = {
+        "full_extraction": full_extraction,
+        "reextracted_pages": dirty,
+        "reused_pages": [page_num for page_num in sorted(current) if page_num not in set(dirty)]
+    }
+
+    output = save_engine_output(results, str(output_path), json_format, metadata)
+    print(f"{engine_name} incremental extraction: {len(dirty)}/{len(current)} pages re-extracted -> {output}")
+    return output
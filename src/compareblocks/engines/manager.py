@@ -5,21 +5,26 @@ Manages PyMuPDF, Tesseract, PaddleOCR, and other extraction engines.
 """
 
 import json
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Callable, Dict, List, Any, Optional, Set
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
-from .pymupdf_engine import PyMuPDFEngine, save_raw_pymupdf_extraction
-from .tesseract_engine import TesseractEngine, save_tesseract_extraction
-from .paddleocr_engine import PaddleOCREngine, save_paddleocr_extraction
-from .kreuzberg_engine import KreuzbergEngine, save_kreuzberg_extraction
-from .docling_engine import DoclingEngine, save_docling_extraction
-from .kreuzberg_engine import KreuzbergEngine, save_kreuzberg_extraction
-from .docling_engine import DoclingEngine, save_docling_extraction
-from ..io.pdf_metadata import PDFMetadataExtractor
 from ..config.file_manager import file_manager
+from ..config.engine_config import EngineConfigurationManager
+from .scheduler import EngineRunOutcome, EngineScheduler
+from .discovery import detect_available_engines, lazy_function
+from .output import EngineOutput
+
+
+# Engine modules load on first use, so creating a manager never imports OCR stacks
+save_raw_pymupdf_extraction = lazy_function('.pymupdf_engine', 'save_raw_pymupdf_extraction')
+save_tesseract_extraction = lazy_function('.tesseract_engine', 'save_tesseract_extraction')
+save_paddleocr_extraction = lazy_function('.paddleocr_engine', 'save_paddleocr_extraction')
+save_kreuzberg_extraction = lazy_function('.kreuzberg_engine', 'save_kreuzberg_extraction')
+save_docling_extraction = lazy_function('.docling_engine', 'save_docling_extraction')
+extract_engine_incrementally = lazy_function('.incremental', 'extract_engine_incrementally')
 
 
 @dataclass
@@ -33,16 +38,98 @@ class EngineResult:
     metadata: Dict[str, Any] = None
 
 
+# Engines whose extraction can shard pages across worker processes and
+# re-extract only changed pages (see incremental.INCREMENTAL_ENGINES)
+PAGE_PARALLEL_ENGINES = ('tesseract', 'paddleocr')
+
+
+def run_engine_extraction(engine_name: str, pdf_path: Optional[str] = None,
+                          max_workers: int = 1, json_format: str = "indented",
+                          metadata: Optional[Dict[str, Any]] = None,
+                          fingerprint_inputs=None) -> Optional[EngineOutput]:
+    """
+    Run one engine's extraction and save its output.
+    
+    Args:
+        engine_name: Name of the engine to use
+        pdf_path: Path to PDF file
+        max_workers: Page-parallel worker processes for OCR engines
+        json_format: JSON layout of the output: "indented", "compact" or "stream"
+        metadata: Section name -> fields merged into the output before it is written
+        fingerprint_inputs: incremental.FingerprintInputs for OCR engines; when given,
+            only pages whose fingerprint changed since the saved output are re-extracted
+        
+    Returns:
+        EngineOutput with the saved file's path and summary (None if the engine produced none)
+    """
+    options = {}
+    if json_format != "indented":
+        options['json_format'] = json_format
+    if metadata:
+        options['metadata'] = metadata
+    
+    if fingerprint_inputs is not None and engine_name in PAGE_PARALLEL_ENGINES:
+        return extract_engine_incrementally(engine_name, pdf_path, fingerprint_inputs,
+                                            max_workers=max_workers, **options)
+    if engine_name == 'pymupdf':
+        return save_raw_pymupdf_extraction(pdf_path, **options)
+    elif engine_name == 'tesseract':
+        return save_tesseract_extraction(pdf_path, max_workers=max_workers, **options)
+    elif engine_name == 'paddleocr':
+        return save_paddleocr_extraction(pdf_path, max_workers=max_workers, **options)
+    elif engine_name == 'kreuzberg':
+        return save_kreuzberg_extraction(pdf_path, **options)
+    elif engine_name == 'docling':
+        return save_docling_extraction(pdf_path, **options)
+    raise ValueError(f"Unsupported engine: {engine_name}")
+
+
+def load_engine_summary(output: Optional[EngineOutput]) -> Optional[Dict[str, Any]]:
+    """Summary of an engine output (None if the engine produced none)."""
+    return output.summary if output is not None else None
+
+
 class ExtractionEngineManager:
     """Manages multiple PDF extraction engines."""
     
-    def __init__(self):
-        """Initialize the engine manager."""
-        self.metadata_extractor = PDFMetadataExtractor()
+    def __init__(self, config_manager: Optional[EngineConfigurationManager] = None,
+                 scheduler: Optional[EngineScheduler] = None,
+                 json_format: str = "indented"):
+        """
+        Initialize the engine manager.
+        
+        Args:
+            config_manager: Engine configuration source for per-engine settings
+                such as max_workers (created on first use)
+            scheduler: Process scheduler for parallel runs (defaults to one sized for this machine)
+            json_format: JSON layout of engine outputs: "indented", "compact" or "stream"
+        """
+        self._metadata_extractor = None
+        self._config_manager = config_manager
+        self.scheduler = scheduler or EngineScheduler()
+        self.json_format = json_format
         self.available_engines = self._detect_available_engines()
     
+    @property
+    def metadata_extractor(self):
+        """PDF metadata extractor, created on first use (it loads PyMuPDF and jsonschema)."""
+        if self._metadata_extractor is None:
+            from ..io.pdf_metadata import PDFMetadataExtractor
+            self._metadata_extractor = PDFMetadataExtractor()
+        return self._metadata_extractor
+    
+    def _get_max_workers(self, engine_name: str, pdf_path: Optional[str]) -> int:
+        """Configured page-parallel worker count for an OCR engine (1 if unavailable)."""
+        try:
+            if self._config_manager is None:
+                self._config_manager = EngineConfigurationManager()
+            return self._config_manager.get_max_workers(engine_name, pdf_path)
+        except Exception as e:
+            print(f"Warning: Could not read max_workers for {engine_name}: {e}")
+            return 1
+    
     def _detect_available_engines(self) -> Dict[str, bool]:
-        """Detect which engines are available."""
+        """Detect which engines are available from installed packages and binaries."""
         engines = {
             'pymupdf': True,  # Always available (required dependency)
             'tesseract': False,
@@ -51,33 +138,14 @@ class ExtractionEngineManager:
             'docling': False
         }
         
-        # Check Tesseract
-        try:
-            tesseract_engine = TesseractEngine()
-            engines['tesseract'] = tesseract_engine.is_available()
-        except Exception:
-            engines['tesseract'] = False
-        
-        # Check PaddleOCR
-        try:
-            paddleocr_engine = PaddleOCREngine()
-            engines['paddleocr'] = paddleocr_engine.is_available()
-        except Exception:
-            engines['paddleocr'] = False
-        
-        # Check Kreuzberg
         try:
-            kreuzberg_engine = KreuzbergEngine()
-            engines['kreuzberg'] = kreuzberg_engine.is_available()
-        except Exception:
-            engines['kreuzberg'] = False
+            detected = detect_available_engines()
+        except Exception as e:
+            print(f"Warning: Engine detection failed: {e}")
+            return engines
         
-        # Check Docling
-        try:
-            docling_engine = DoclingEngine()
-            engines['docling'] = docling_engine.is_available()
-        except Exception:
-            engines['docling'] = False
+        for name in engines:
+            engines[name] = engines[name] or detected.get(name, False)
         
         return engines
     
@@ -85,13 +153,19 @@ class ExtractionEngineManager:
         """Get list of available engine names."""
         return [name for name, available in self.available_engines.items() if available]
     
-    def extract_with_engine(self, engine_name: str, pdf_path: Optional[str] = None) -> EngineResult:
+    def extract_with_engine(self, engine_name: str, pdf_path: Optional[str] = None,
+                            output_metadata: Optional[Dict[str, Any]] = None,
+                            fingerprint_inputs=None) -> EngineResult:
         """
         Extract text using a specific engine.
         
         Args:
             engine_name: Name of the engine to use
             pdf_path: Path to PDF file
+            output_metadata: Section name -> fields written into the engine output
+                in the same pass as the results
+            fingerprint_inputs: incremental.FingerprintInputs enabling page-level
+                re-extraction for OCR engines
             
         Returns:
             EngineResult with extraction results
@@ -117,35 +191,23 @@ class ExtractionEngineManager:
         start_time = time.time()
         
         try:
-            if engine_name == 'pymupdf':
-                output_path = save_raw_pymupdf_extraction(pdf_path)
-            elif engine_name == 'tesseract':
-                output_path = save_tesseract_extraction(pdf_path)
-            elif engine_name == 'paddleocr':
-                output_path = save_paddleocr_extraction(pdf_path)
-            elif engine_name == 'kreuzberg':
-                output_path = save_kreuzberg_extraction(pdf_path)
-            elif engine_name == 'docling':
-                output_path = save_docling_extraction(pdf_path)
-            else:
-                raise ValueError(f"Unsupported engine: {engine_name}")
+            max_workers = 1
+            if engine_name in PAGE_PARALLEL_ENGINES:
+                max_workers = self._get_max_workers(engine_name, pdf_path)
+            output = run_engine_extraction(engine_name, pdf_path, max_workers,
+                                           json_format=self.json_format,
+                                           metadata=output_metadata,
+                                           fingerprint_inputs=fingerprint_inputs)
             
             extraction_time = time.time() - start_time
             
-            # Load metadata from saved file
-            metadata = None
-            if output_path and Path(output_path).exists():
-                try:
-                    with open(output_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        metadata = data.get('summary', {})
-                except Exception:
-                    pass
+            # Summary comes from the returned EngineOutput, without re-reading the file
+            metadata = load_engine_summary(output)
             
             return EngineResult(
                 engine_name=engine_name,
-                success=bool(output_path),
-                output_path=output_path,
+                success=output is not None,
+                output_path=output.path if output is not None else "",
                 extraction_time=extraction_time,
                 metadata=metadata
             )
@@ -160,6 +222,84 @@ class ExtractionEngineManager:
                 error_message=str(e)
             )
     
+    def shared_raster_scope(self, pdf_path: Optional[str] = None):
+        """
+        Share page renders between engines run one after another in this process.
+        
+        Args:
+            pdf_path: Path to PDF file (defaults to configured target PDF)
+            
+        Returns:
+            Context manager; the renders are released when it exits
+        """
+        path = pdf_path or file_manager.get_target_pdf_path()
+        if not path or not Path(path).is_file():
+            return nullcontext()
+        # Imported here: the raster cache loads fitz, which creating a manager must not
+        from ..io.raster import page_raster_scope
+        return page_raster_scope(path)
+    
+    def run_engines_scheduled(self, engine_names: List[str], pdf_path: Optional[str] = None,
+                              on_result: Optional[Callable[[EngineResult], None]] = None,
+                              output_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+                              fingerprint_inputs: Optional[Dict[str, Any]] = None
+                              ) -> Dict[str, EngineResult]:
+        """
+        Run engines in separate processes through the resource-aware scheduler.
+        
+        Cheap engines start first and each result is reported as soon as its
+        engine finishes, so callers can start downstream work early.
+        
+        Args:
+            engine_names: Names of available engines to run
+            pdf_path: Path to PDF file
+            on_result: Called with each EngineResult in completion order
+            output_metadata: Per-engine section name -> fields, written into each
+                engine's output by its own process in the same pass as the results
+            fingerprint_inputs: Per-engine incremental.FingerprintInputs enabling
+                page-level re-extraction for OCR engines
+            
+        Returns:
+            Dictionary of engine results
+        """
+        max_workers = {
+            name: self._get_max_workers(name, pdf_path)
+            for name in engine_names if name in PAGE_PARALLEL_ENGINES
+        }
+        engine_options = {}
+        for name in engine_names:
+            options = {}
+            if self.json_format != "indented":
+                options['json_format'] = self.json_format
+            if output_metadata and output_metadata.get(name):
+                options['metadata'] = output_metadata[name]
+            if fingerprint_inputs and fingerprint_inputs.get(name) is not None:
+                options['fingerprint_inputs'] = fingerprint_inputs[name]
+            if options:
+                engine_options[name] = options
+        results = {}
+        
+        def collect(outcome: EngineRunOutcome) -> None:
+            result = self._result_from_outcome(outcome)
+            results[outcome.engine_name] = result
+            if on_result is not None:
+                on_result(result)
+        
+        self.scheduler.run(engine_names, pdf_path, max_workers=max_workers,
+                           engine_options=engine_options, on_result=collect)
+        return results
+    
+    def _result_from_outcome(self, outcome: EngineRunOutcome) -> EngineResult:
+        """Convert a scheduler outcome to an EngineResult."""
+        return EngineResult(
+            engine_name=outcome.engine_name,
+            success=outcome.success,
+            output_path=outcome.output_path,
+            extraction_time=outcome.elapsed,
+            error_message=outcome.error_message,
+            metadata=outcome.summary if outcome.success else None
+        )
+    
     def extract_with_all_engines(self, pdf_path: Optional[str] = None, 
                                 parallel: bool = True) -> Dict[str, EngineResult]:
         """
@@ -167,7 +307,7 @@ class ExtractionEngineManager:
         
         Args:
             pdf_path: Path to PDF file
-            parallel: Whether to run engines in parallel
+            parallel: Whether to run engines in parallel processes
             
         Returns:
             Dictionary of engine results
@@ -182,46 +322,26 @@ class ExtractionEngineManager:
         print(f"Running extraction with engines: {available_engines}")
         
         if parallel and len(available_engines) > 1:
-            # Run engines in parallel
-            with ThreadPoolExecutor(max_workers=len(available_engines)) as executor:
-                # Submit all extraction tasks
-                future_to_engine = {
-                    executor.submit(self.extract_with_engine, engine, pdf_path): engine
-                    for engine in available_engines
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_engine):
-                    engine = future_to_engine[future]
-                    try:
-                        result = future.result()
-                        results[engine] = result
-                        
-                        if result.success:
-                            print(f"✅ {engine}: {result.extraction_time:.1f}s -> {result.output_path}")
-                        else:
-                            print(f"❌ {engine}: {result.error_message}")
-                            
-                    except Exception as e:
-                        results[engine] = EngineResult(
-                            engine_name=engine,
-                            success=False,
-                            output_path="",
-                            extraction_time=0,
-                            error_message=f"Execution failed: {e}"
-                        )
-                        print(f"❌ {engine}: Execution failed: {e}")
-        else:
-            # Run engines sequentially
-            for engine in available_engines:
-                print(f"Running {engine}...")
-                result = self.extract_with_engine(engine, pdf_path)
-                results[engine] = result
-                
+            # Run engines in parallel processes within the resource budget
+            def report(result: EngineResult) -> None:
                 if result.success:
-                    print(f"✅ {engine}: {result.extraction_time:.1f}s -> {result.output_path}")
+                    print(f"✅ {result.engine_name}: {result.extraction_time:.1f}s -> {result.output_path}")
                 else:
-                    print(f"❌ {engine}: {result.error_message}")
+                    print(f"❌ {result.engine_name}: {result.error_message}")
+            
+            results = self.run_engines_scheduled(available_engines, pdf_path, on_result=report)
+        else:
+            # Run engines sequentially
+            with self.shared_raster_scope(pdf_path):
+                for engine in available_engines:
+                    print(f"Running {engine}...")
+                    result = self.extract_with_engine(engine, pdf_path)
+                    results[engine] = result
+                    
+                    if result.success:
+                        print(f"✅ {engine}: {result.extraction_time:.1f}s -> {result.output_path}")
+                    else:
+                        print(f"❌ {engine}: {result.error_message}")
         
         return results
     
@@ -234,7 +354,7 @@ class ExtractionEngineManager:
         Args:
             engine_names: List of engine names to use
             pdf_path: Path to PDF file
-            parallel: Whether to run engines in parallel
+            parallel: Whether to run engines in parallel processes
             
         Returns:
             Dictionary of engine results
@@ -252,42 +372,25 @@ class ExtractionEngineManager:
         results = {}
         
         if parallel and len(available_engines) > 1:
-            # Run engines in parallel
-            with ThreadPoolExecutor(max_workers=len(available_engines)) as executor:
-                future_to_engine = {
-                    executor.submit(self.extract_with_engine, engine, pdf_path): engine
-                    for engine in available_engines
-                }
-                
-                for future in as_completed(future_to_engine):
-                    engine = future_to_engine[future]
-                    try:
-                        result = future.result()
-                        results[engine] = result
-                        
-                        if result.success:
-                            print(f"✅ {engine}: {result.extraction_time:.1f}s")
-                        else:
-                            print(f"❌ {engine}: {result.error_message}")
-                            
-                    except Exception as e:
-                        results[engine] = EngineResult(
-                            engine_name=engine,
-                            success=False,
-                            output_path="",
-                            extraction_time=0,
-                            error_message=f"Execution failed: {e}"
-                        )
-        else:
-            # Run engines sequentially
-            for engine in available_engines:
-                result = self.extract_with_engine(engine, pdf_path)
-                results[engine] = result
-                
+            # Run engines in parallel processes within the resource budget
+            def report(result: EngineResult) -> None:
                 if result.success:
-                    print(f"✅ {engine}: {result.extraction_time:.1f}s")
+                    print(f"✅ {result.engine_name}: {result.extraction_time:.1f}s")
                 else:
-                    print(f"❌ {engine}: {result.error_message}")
+                    print(f"❌ {result.engine_name}: {result.error_message}")
+            
+            results = self.run_engines_scheduled(available_engines, pdf_path, on_result=report)
+        else:
+            # Run engines sequentially
+            with self.shared_raster_scope(pdf_path):
+                for engine in available_engines:
+                    result = self.extract_with_engine(engine, pdf_path)
+                    results[engine] = result
+                    
+                    if result.success:
+                        print(f"✅ {engine}: {result.extraction_time:.1f}s")
+                    else:
+                        print(f"❌ {engine}: {result.error_message}")
         
         return results
     
@@ -0,0 +1,273 @@
+# src/compareblocks/engines/ocr_pool.py
+"""
+Long-lived Tesseract worker pool shared by the OCR engines.
+Workers keep a loaded Tesseract model per thread and return results through futures.
+
+Importing this module sets OMP_THREAD_LIMIT=1 unless it is already set: the
+pool runs one worker per core, and Tesseract's own OpenMP threads on top of
+that oversubscribe the CPU. The limit reaches tesseract processes started by
+pytesseract and libtesseract loaded by tesserocr (OpenMP reads it at load).
+"""
+
+import atexit
+import os
+import shlex
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.workers import resolve_worker_count
+
+# Set before tesserocr loads libtesseract; see the module docstring
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    import pytesseract
+    PYTESSERACT_AVAILABLE = True
+except ImportError:
+    PYTESSERACT_AVAILABLE = False
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+
+OCR_BACKENDS = ("tesserocr", "pytesseract")
+
+# Column header of Tesseract's TSV output; the C API omits it
+_TSV_HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext"
+
+
+@dataclass(frozen=True)
+class _TesserocrOptions:
+    """Tesseract command-line options that map onto PyTessBaseAPI arguments."""
+    psm: Optional[int] = None
+    oem: Optional[int] = None
+    variables: Tuple[Tuple[str, str], ...] = ()
+
+
+def tsv_to_dict(tsv: str) -> Dict[str, List[Any]]:
+    """
+    Parse Tesseract TSV output (without header) into pytesseract's Output.DICT layout.
+
+    Args:
+        tsv: TSV rows as produced by TessBaseAPI.GetTSVText
+
+    Returns:
+        Dictionary of column name to values; numeric columns are ints
+    """
+    header = _TSV_HEADER.split('\t')
+    result: Dict[str, List[Any]] = {name: [] for name in header}
+    for line in tsv.rstrip('\n').split('\n'):
+        if not line:
+            continue
+        cells = line.split('\t')
+        # A trailing empty text cell may be missing
+        cells += [''] * (len(header) - len(cells))
+        for name, cell in zip(header[:-1], cells[:-1]):
+            try:
+                result[name].append(int(float(cell)))
+            except ValueError:
+                result[name].append(cell)
+        result['text'].append(cells[len(header) - 1])
+    return result
+
+
+class TesseractWorkerPool:
+    """Fixed-size pool of OCR worker threads with one Tesseract instance each."""
+
+    def __init__(self, max_workers: Optional[int] = None, lang: str = 'eng',
+                 backend: Optional[str] = None):
+        """
+        Initialize the worker pool.
+
+        With tesserocr installed each worker thread keeps its own TessBaseAPI,
+        so the language model is loaded once per worker and recognition runs
+        without the GIL. Otherwise workers call pytesseract, which still spawns
+        a tesseract process per image but keeps the pool's concurrency bound.
+        The tesserocr backend applies --psm, --oem and -c options itself; other
+        options are passed to pytesseract.
+
+        Args:
+            max_workers: Number of worker threads (None = one per CPU core)
+            lang: Tesseract language code
+            backend: "tesserocr", "pytesseract" or None to pick the best available
+        """
+        if backend is None:
+            backend = "tesserocr" if TESSEROCR_AVAILABLE else "pytesseract"
+        if backend not in OCR_BACKENDS:
+            raise ValueError(f"Unknown OCR backend: {backend}")
+        if backend == "tesserocr" and not TESSEROCR_AVAILABLE:
+            raise ImportError("tesserocr is not installed")
+        if backend == "pytesseract" and not PYTESSERACT_AVAILABLE:
+            raise ImportError("pytesseract is not installed")
+
+        self.max_workers = resolve_worker_count(max_workers)
+        self.lang = lang
+        self.backend = backend
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="tesseract")
+        self._local = threading.local()
+        self._apis: List[Any] = []
+        self._apis_lock = threading.Lock()
+
+    def submit(self, image: np.ndarray, config: str = "") -> Future:
+        """
+        Queue one image for OCR.
+
+        Args:
+            image: Grayscale or RGB image (NumPy array or PIL image)
+            config: Extra Tesseract arguments (e.g. '--psm 6')
+
+        Returns:
+            Future resolving to a pytesseract-style Output.DICT result
+        """
+        return self._executor.submit(self._run, image, config)
+
+    def submit_batch(self, images: Sequence[np.ndarray], config: str = "") -> List[Future]:
+        """
+        Queue several images for OCR.
+
+        Args:
+            images: Images to recognize
+            config: Extra Tesseract arguments shared by the batch
+
+        Returns:
+            Futures in the same order as images
+        """
+        return [self.submit(image, config) for image in images]
+
+    def image_to_data(self, image: np.ndarray, config: str = "") -> Dict[str, List[Any]]:
+        """Run OCR on one image through the pool and wait for the result."""
+        return self.submit(image, config).result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers and release their Tesseract instances."""
+        self._executor.shutdown(wait=wait)
+        with self._apis_lock:
+            for api in self._apis:
+                api.End()
+            self._apis.clear()
+
+    def _run(self, image: Any, config: str) -> Dict[str, List[Any]]:
+        """OCR one image on a worker thread."""
+        if self.backend == "tesserocr":
+            options = self._parse_config(config)
+            if options is not None:
+                return self._run_tesserocr(image, options)
+            if not PYTESSERACT_AVAILABLE:
+                raise ValueError(f"Tesseract config {config!r} is not supported by the tesserocr backend "
+                                 "(only --psm, --oem and -c) and pytesseract is not installed")
+
+        kwargs = {"config": config} if config else {}
+        return pytesseract.image_to_data(
+            image, lang=self.lang, output_type=pytesseract.Output.DICT, **kwargs
+        )
+
+    def _run_tesserocr(self, image: Any, options: _TesserocrOptions) -> Dict[str, List[Any]]:
+        """OCR with this thread's persistent TessBaseAPI."""
+        api = self._get_api(options)
+        if isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
+        api.SetImage(image)
+        api.Recognize()
+        tsv = api.GetTSVText(0)
+        return tsv_to_dict(tsv)
+
+    def _get_api(self, options: _TesserocrOptions):
+        """Get or create the calling thread's TessBaseAPI for a set of options."""
+        apis = getattr(self._local, "apis", None)
+        if apis is None:
+            apis = self._local.apis = {}
+
+        api = apis.get(options)
+        if api is None:
+            kwargs: Dict[str, Any] = {}
+            if options.psm is not None:
+                kwargs["psm"] = options.psm
+            if options.oem is not None:
+                kwargs["oem"] = options.oem
+            if options.variables:
+                # Passed at init so initialization-only variables take effect too
+                kwargs["variables"] = dict(options.variables)
+            api = tesserocr.PyTessBaseAPI(lang=self.lang, **kwargs)
+            apis[options] = api
+            with self._apis_lock:
+                self._apis.append(api)
+        return api
+
+    @staticmethod
+    def _parse_config(config: str) -> Optional[_TesserocrOptions]:
+        """
+        Map '--psm N', '--oem N' and '-c name=value' options onto PyTessBaseAPI arguments.
+
+        Returns:
+            The options, or None if the config holds anything else
+        """
+        try:
+            tokens = shlex.split(config)
+        except ValueError:
+            return None
+        psm = oem = None
+        variables = []
+        while tokens:
+            option = tokens.pop(0)
+            if option in ("--psm", "--oem") and tokens and tokens[0].isdigit():
+                value = int(tokens.pop(0))
+                if option == "--psm":
+                    psm = value
+                else:
+                    oem = value
+            elif option.startswith("-c") and (len(option) > 2 or tokens):
+                name, sep, value = (option[2:] or tokens.pop(0)).partition("=")
+                if not name or not sep:
+                    return None
+                variables.append((name, value))
+            else:
+                return None
+        return _TesserocrOptions(psm=psm, oem=oem, variables=tuple(variables))
+
+
+# Shared pools keyed by language
+_shared_pools: Dict[str, TesseractWorkerPool] = {}
+_shared_lock = threading.Lock()
+
+
+def get_tesseract_pool(lang: str = 'eng') -> TesseractWorkerPool:
+    """
+    Get the process-wide Tesseract worker pool for a language.
+
+    Args:
+        lang: Tesseract language code
+
+    Returns:
+        Shared TesseractWorkerPool sized by core count
+    """
+    with _shared_lock:
+        pool = _shared_pools.get(lang)
+        if pool is None:
+            pool = _shared_pools[lang] = TesseractWorkerPool(lang=lang)
+        return pool
+
+
+def shutdown_tesseract_pools() -> None:
+    """Shut down all shared Tesseract worker pools."""
+    with _shared_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_tesseract_pools)
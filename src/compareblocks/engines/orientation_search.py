@@ -0,0 +1,127 @@
+# src/compareblocks/engines/orientation_search.py
+"""
+Orientation search strategy for GBG-guided OCR.
+Orders the 0/90/180/270 candidates by GBG hints and a projection pre-check, with early exit.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+ORIENTATION_ANGLES = (0, 90, 180, 270)
+
+
+@dataclass
+class OrientationSearchConfig:
+    """Configuration for the staged orientation search."""
+    early_exit_confidence: float = 0.9  # Stop once an orientation scores at least this
+    use_gbg_hints: bool = True  # Try the GBG page rotation first
+    use_projection_precheck: bool = True  # Order the remaining angles by projection profile
+    projection_min_confidence: float = 0.05  # Below this the projection axis is ignored
+
+    def __post_init__(self):
+        """Validate configuration."""
+        if self.early_exit_confidence < 0.0:
+            raise ValueError("early_exit_confidence must not be negative")
+
+
+@dataclass
+class OrientationSearchStats:
+    """Per-document counters of OCR passes made and saved by the search."""
+    blocks: int = 0
+    ocr_passes: int = 0
+    early_exits: int = 0
+    predicted_hits: int = 0
+
+    @property
+    def passes_saved(self) -> int:
+        return self.blocks * len(ORIENTATION_ANGLES) - self.ocr_passes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for processing metadata."""
+        return {
+            'blocks': self.blocks,
+            'ocr_passes': self.ocr_passes,
+            'ocr_passes_saved': self.passes_saved,
+            'early_exits': self.early_exits,
+            'predicted_hits': self.predicted_hits
+        }
+
+
+@dataclass
+class OrientationSearchState:
+    """Progress of the search for one block region."""
+    region: np.ndarray
+    expected_text: str
+    stages: List[List[int]]
+    results: List[Any] = field(default_factory=list)
+    done: bool = False
+
+
+def predicted_angle(gbg_block: Optional[Dict[str, Any]]) -> int:
+    """
+    Orientation predicted by a GBG block's orientation hints.
+
+    Args:
+        gbg_block: GBG block dictionary (may lack orientation_hints)
+
+    Returns:
+        The page rotation snapped to 0/90/180/270 (0 when unknown)
+    """
+    hints = (gbg_block or {}).get('orientation_hints') or {}
+    try:
+        rotation = float(hints.get('page_rotation', 0.0))
+    except (TypeError, ValueError):
+        return 0
+    return int(round(rotation / 90.0)) % 4 * 90
+
+
+def projection_axis_angle(region: np.ndarray, min_confidence: float = 0.05) -> Optional[int]:
+    """
+    Cheap text-axis estimate of a grayscale region from its projection profiles.
+
+    Args:
+        region: Preprocessed grayscale region
+        min_confidence: Minimum separation between the axes to trust the estimate
+
+    Returns:
+        0 if text lines look horizontal, 90 if vertical, None if undecided
+    """
+    if region.ndim != 2 or region.size == 0:
+        return None
+
+    row_variance = float(np.var(region.sum(axis=1, dtype=np.int64)))
+    column_variance = float(np.var(region.sum(axis=0, dtype=np.int64)))
+    best = max(row_variance, column_variance)
+    if best <= 0:
+        return None
+
+    confidence = (best - (row_variance + column_variance) / 2) / best
+    if confidence < min_confidence:
+        return None
+    return 0 if row_variance >= column_variance else 90
+
+
+def plan_orientation_stages(first_angle: int, axis_angle: Optional[int]) -> List[List[int]]:
+    """
+    Order the four rotations into OCR stages.
+
+    The predicted angle runs alone first. If the projection pre-check picks
+    the other text axis, both of its angles come next; otherwise the
+    predicted angle's 180-degree partner does. Whatever is left runs last.
+
+    Args:
+        first_angle: Angle to try first
+        axis_angle: Projection estimate (0 = horizontal, 90 = vertical, None = unknown)
+
+    Returns:
+        List of stages, each a list of angles
+    """
+    partner = (first_angle + 180) % 360
+    others = [a for a in ORIENTATION_ANGLES if a not in (first_angle, partner)]
+
+    if axis_angle is not None and axis_angle % 180 != first_angle % 180:
+        return [[first_angle], others, [partner]]
+    return [[first_angle], [partner], others]
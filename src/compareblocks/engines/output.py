@@ -0,0 +1,111 @@
+# src/compareblocks/engines/output.py
+"""
+Single-pass writing of engine extraction outputs.
+Saves engine results once, with caller metadata merged in, and returns the summary to the caller.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, IO, Optional
+
+
+JSON_FORMATS = ("indented", "compact", "stream")
+
+
+@dataclass
+class EngineOutput:
+    """
+    A saved engine output: its path and the summary section of its results.
+
+    Only the summary is kept, so holding an output never keeps the full
+    results alive. str() and os.fspath() give the path.
+    """
+    path: str
+    summary: Dict[str, Any] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        return self.path
+
+    def __fspath__(self) -> str:
+        return self.path
+
+
+def merge_output_metadata(results: Dict[str, Any], metadata: Optional[Dict[str, Any]]) -> None:
+    """
+    Merge caller metadata into top-level sections of engine results.
+
+    Args:
+        results: Engine results (modified in place)
+        metadata: Section name -> fields; dict fields update an existing dict section,
+            anything else replaces the section
+    """
+    for section, values in (metadata or {}).items():
+        if isinstance(values, dict) and isinstance(results.get(section), dict):
+            results[section].update(values)
+        else:
+            results[section] = values
+
+
+def _stream_json(data: Dict[str, Any], f: IO[str]) -> None:
+    """Write a dict as compact JSON one nested entry at a time (e.g. one page per write)."""
+    dumps_options = {"ensure_ascii": False, "separators": (",", ":")}
+    f.write("{")
+    for i, (key, value) in enumerate(data.items()):
+        if i:
+            f.write(",")
+        if isinstance(value, dict) and value:
+            f.write(json.dumps(str(key), ensure_ascii=False) + ":{")
+            for j, (inner_key, inner_value) in enumerate(value.items()):
+                if j:
+                    f.write(",")
+                # Encoding a one-entry dict keeps json's key conversion rules
+                f.write(json.dumps({inner_key: inner_value}, **dumps_options)[1:-1])
+            f.write("}")
+        else:
+            f.write(json.dumps({key: value}, **dumps_options)[1:-1])
+    f.write("}")
+
+
+def write_engine_json(results: Dict[str, Any], output_path: str, json_format: str = "indented") -> None:
+    """
+    Write engine results as JSON.
+
+    Args:
+        results: Engine results
+        output_path: File to write
+        json_format: "indented" (human-readable), "compact" (no whitespace) or
+            "stream" (compact, encoded one section entry at a time to bound memory)
+    """
+    if json_format not in JSON_FORMATS:
+        raise ValueError(f"Unknown JSON format: {json_format}. Expected one of {JSON_FORMATS}")
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        if json_format == "indented":
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        elif json_format == "compact":
+            f.write(json.dumps(results, ensure_ascii=False, separators=(",", ":")))
+        else:
+            _stream_json(results, f)
+
+
+def save_engine_output(results: Dict[str, Any], output_path: str, json_format: str = "indented",
+                       metadata: Optional[Dict[str, Any]] = None) -> EngineOutput:
+    """
+    Save engine results in one pass.
+
+    Args:
+        results: Engine results (metadata is merged into them in place)
+        output_path: File to write
+        json_format: JSON layout, see write_engine_json
+        metadata: Section name -> fields merged into the results before writing
+
+    Returns:
+        EngineOutput with the saved file's path and summary
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    merge_output_metadata(results, metadata)
+    write_engine_json(results, str(output_path), json_format)
+    return EngineOutput(str(output_path), results.get("summary", {}))
@@ -4,9 +4,8 @@ PaddleOCR engine for PDF text extraction.
 Provides OCR-based text extraction using PaddleOCR.
 """
 
-import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
 import fitz  # PyMuPDF for PDF to image conversion
 import numpy as np
@@ -18,6 +17,9 @@ except ImportError:
     PADDLEOCR_AVAILABLE = False
 
 from ..io.pdf_metadata import PDFMetadataExtractor
+from ..io.raster import page_raster_scope, render_page_array
+from .parallel import map_engine_pages, page_range_suffix, resolve_page_numbers
+from .output import EngineOutput, save_engine_output
 from ..config.file_manager import file_manager
 
 
@@ -87,12 +89,21 @@ class PaddleOCREngine:
         except Exception:
             return False
     
-    def extract_pdf(self, pdf_path: Optional[str] = None) -> Dict[str, Any]:
+    def extract_pdf(self, pdf_path: Optional[str] = None, max_workers: int = 1,
+                    page_range: Optional[Sequence[int]] = None,
+                    pages: Optional[Sequence[int]] = None) -> Dict[str, Any]:
         """
         Extract text from PDF using PaddleOCR.
         
+        With max_workers > 1 pages are sharded across worker processes that
+        each load the PaddleOCR models once; the per-page output is identical
+        to the in-process path.
+        
         Args:
             pdf_path: Path to PDF file (defaults to configured target PDF)
+            max_workers: Number of worker processes (1 = in-process, 0 = one per CPU core)
+            page_range: (start, end) 0-indexed pages to process, end exclusive (None = all)
+            pages: Explicit 0-indexed pages to process (overrides page_range)
             
         Returns:
             PaddleOCR extraction results
@@ -116,74 +127,88 @@ class PaddleOCREngine:
         pdf_metadata = self.metadata_extractor.extract_pdf_metadata(str(pdf_path))
         display_name = self.metadata_extractor.get_display_name(str(pdf_path))
         
-        # Open PDF document
-        doc = fitz.open(str(pdf_path))
-        
-        try:
-            # Initialize results structure
-            results = {
-                "engine": "paddleocr",
-                "engine_version": self._get_paddleocr_version(),
-                "pdf_path": pdf_metadata["file_info"]["relative_path"],
-                "pdf_name": pdf_metadata["file_info"]["normalized_filename"],
-                "pdf_display_name": display_name,
-                "pdf_metadata": pdf_metadata,
-                "extraction_metadata": {
-                    "total_pages": len(doc),
-                    "extraction_type": "paddleocr",
-                    "language": self.lang,
-                    "use_gpu": self.use_gpu,
-                    "processing_notes": "OCR-based text extraction using PaddleOCR"
-                },
-                "pages": {},
-                "summary": {}
-            }
+        # Pages rendered during this run are shared with engines in an enclosing scope
+        with page_raster_scope(str(pdf_path)):
+            # Open PDF document
+            doc = fitz.open(str(pdf_path))
             
-            all_blocks = []
-            page_summaries = []
-            
-            # Get OCR engine
-            ocr = self._get_ocr_engine()
-            if ocr is None:
-                return {
-                    "error": "Failed to initialize PaddleOCR engine"
+            try:
+                # Initialize results structure
+                results = {
+                    "engine": "paddleocr",
+                    "engine_version": self._get_paddleocr_version(),
+                    "pdf_path": pdf_metadata["file_info"]["relative_path"],
+                    "pdf_name": pdf_metadata["file_info"]["normalized_filename"],
+                    "pdf_display_name": display_name,
+                    "pdf_metadata": pdf_metadata,
+                    "extraction_metadata": {
+                        "total_pages": len(doc),
+                        "extraction_type": "paddleocr",
+                        "language": self.lang,
+                        "use_gpu": self.use_gpu,
+                        "processing_notes": "OCR-based text extraction using PaddleOCR"
+                    },
+                    "pages": {},
+                    "summary": {}
                 }
-            
-            # Process each page
-            for page_num in range(len(doc)):
-                print(f"PaddleOCR processing page {page_num + 1}/{len(doc)}")
                 
-                page = doc[page_num]
-                page_data = self._extract_page_ocr(page, page_num, ocr)
+                page_numbers = resolve_page_numbers(len(doc), page_range, pages)
+                if pages is not None:
+                    results["extraction_metadata"]["pages_extracted"] = list(page_numbers)
+                elif page_range is not None:
+                    results["extraction_metadata"]["page_range"] = [page_numbers.start, page_numbers.stop]
                 
-                results["pages"][str(page_num)] = asdict(page_data)
+                all_blocks = []
+                page_summaries = []
                 
-                # Collect blocks for summary
-                all_blocks.extend(page_data.blocks)
-                page_summaries.append({
-                    "page": page_num,
-                    "block_count": len(page_data.blocks),
-                    "text_blocks": len([b for b in page_data.blocks if b.text.strip()]),
-                    "avg_confidence": page_data.avg_confidence
-                })
-            
-            # Generate summary
-            results["summary"] = self._generate_summary(all_blocks, page_summaries, len(doc))
-            
-            return results
-            
-        finally:
-            doc.close()
+                # Get OCR engine
+                ocr = self._get_ocr_engine()
+                if ocr is None:
+                    return {
+                        "error": "Failed to initialize PaddleOCR engine"
+                    }
+                
+                # Process each page
+                for page_num, page_data in self._iter_page_results(doc, str(pdf_path), page_numbers,
+                                                                   max_workers, ocr):
+                    results["pages"][str(page_num)] = asdict(page_data)
+                    
+                    # Collect blocks for summary
+                    all_blocks.extend(page_data.blocks)
+                    page_summaries.append({
+                        "page": page_num,
+                        "block_count": len(page_data.blocks),
+                        "text_blocks": len([b for b in page_data.blocks if b.text.strip()]),
+                        "avg_confidence": page_data.avg_confidence
+                    })
+                
+                # Generate summary
+                results["summary"] = self._generate_summary(all_blocks, page_summaries, len(page_numbers))
+                
+                return results
+                
+            finally:
+                doc.close()
+    
+    def _iter_page_results(self, doc: fitz.Document, pdf_path: str, page_numbers: Sequence[int],
+                           max_workers: int, ocr) -> Iterator[Tuple[int, PaddleOCRPage]]:
+        """Yield (page_num, page_data) in page order, from worker processes or in-process."""
+        if max_workers != 1 and len(page_numbers) > 1:
+            engine_kwargs = {"lang": self.lang, "use_gpu": self.use_gpu}
+            pages = map_engine_pages("paddleocr", pdf_path, page_numbers, max_workers or None, engine_kwargs)
+            for page_num, page_data in zip(page_numbers, pages):
+                print(f"PaddleOCR processed page {page_num + 1}/{len(doc)}")
+                yield page_num, page_data
+            return
+        
+        for page_num in page_numbers:
+            print(f"PaddleOCR processing page {page_num + 1}/{len(doc)}")
+            yield page_num, self._extract_page_ocr(doc[page_num], page_num, ocr)
     
     def _extract_page_ocr(self, page: fitz.Page, page_num: int, ocr) -> PaddleOCRPage:
         """Extract OCR data from a single page using PaddleOCR."""
-        # Convert page to image
-        mat = fitz.Matrix(2.0, 2.0)  # 2x scale for better OCR
-        pix = page.get_pixmap(matrix=mat)
-        img_data = pix.tobytes("png")
-        
-        # Convert to numpy array for PaddleOCR
-        img_array = np.frombuffer(img_data, dtype=np.uint8)
+        # 2x scale (144 DPI) for better OCR; PaddleOCR expects BGR channel order
+        img_array = np.ascontiguousarray(render_page_array(page, 144)[:, :, ::-1])
         
         # Perform OCR
         try:
@@ -293,59 +318,86 @@ class PaddleOCREngine:
             "use_gpu": self.use_gpu
         }
     
+    def summarize_pages(self, pages: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Rebuild the extraction summary from serialized pages.
+        
+        Used after spliced re-extraction, where only some pages come from this run.
+        
+        Args:
+            pages: Page number -> page data as stored in the results
+            
+        Returns:
+            Extraction summary
+        """
+        all_blocks = []
+        page_summaries = []
+        for page_data in pages.values():
+            blocks = [PaddleOCRBlock(**block) for block in page_data.get("blocks", [])]
+            all_blocks.extend(blocks)
+            page_summaries.append({"text_blocks": len([b for b in blocks if b.text.strip()])})
+        return self._generate_summary(all_blocks, page_summaries, len(pages))
+    
     def save_extraction(self, pdf_path: Optional[str] = None, 
-                       output_path: Optional[str] = None) -> str:
+                       output_path: Optional[str] = None, max_workers: int = 1,
+                       page_range: Optional[Sequence[int]] = None,
+                       json_format: str = "indented",
+                       metadata: Optional[Dict[str, Any]] = None) -> Optional[EngineOutput]:
         """
         Extract and save PaddleOCR data.
         
         Args:
             pdf_path: Path to PDF file
             output_path: Path to save results
+            max_workers: Number of worker processes (1 = in-process, 0 = one per CPU core)
+            page_range: (start, end) 0-indexed pages to process, end exclusive (None = all)
+            json_format: JSON layout: "indented", "compact" or "stream"
+            metadata: Section name -> fields merged into the results before writing
             
         Returns:
-            Path to saved file
+            EngineOutput with the saved file's path and summary (None if extraction failed)
         """
         # Extract data
-        results = self.extract_pdf(pdf_path)
+        results = self.extract_pdf(pdf_path, max_workers=max_workers, page_range=page_range)
         
         # Check for errors
         if "error" in results:
             print(f"PaddleOCR extraction failed: {results['error']}")
-            return ""
+            return None
         
         # Determine output path
         if output_path is None:
             # Create filename based on PDF display name
             display_name = results["pdf_display_name"]
-            filename = f"{display_name}_paddleocr.json"
+            filename = f"{display_name}_paddleocr{page_range_suffix(results)}.json"
             
             # Save to processing directory
             processing_dir = Path(file_manager.get_processing_directory())
             output_path = processing_dir / filename
         
-        # Ensure output directory exists
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save results
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Save results, with caller metadata merged in the same pass
+        output_path = save_engine_output(results, output_path, json_format, metadata)
         
         print(f"PaddleOCR extraction saved to: {output_path}")
-        return str(output_path)
+        return output_path
 
 
 # Convenience functions
 def extract_paddleocr(pdf_path: Optional[str] = None, 
-                     lang: str = 'en', use_gpu: bool = False) -> Dict[str, Any]:
+                     lang: str = 'en', use_gpu: bool = False, max_workers: int = 1,
+                     page_range: Optional[Sequence[int]] = None) -> Dict[str, Any]:
     """Extract text using PaddleOCR."""
     engine = PaddleOCREngine(lang=lang, use_gpu=use_gpu)
-    return engine.extract_pdf(pdf_path)
+    return engine.extract_pdf(pdf_path, max_workers=max_workers, page_range=page_range)
 
 
 def save_paddleocr_extraction(pdf_path: Optional[str] = None, 
                              output_path: Optional[str] = None,
-                             lang: str = 'en', use_gpu: bool = False) -> str:
+                             lang: str = 'en', use_gpu: bool = False, max_workers: int = 1,
+                             page_range: Optional[Sequence[int]] = None,
+                             json_format: str = "indented",
+                             metadata: Optional[Dict[str, Any]] = None) -> Optional[EngineOutput]:
     """Extract and save PaddleOCR data."""
     engine = PaddleOCREngine(lang=lang, use_gpu=use_gpu)
-    return engine.save_extraction(pdf_path, output_path)
\ No newline at end of file
+    return engine.save_extraction(pdf_path, output_path, max_workers=max_workers, page_range=page_range,
+                                  json_format=json_format, metadata=metadata)
\ No newline at end of file
@@ -0,0 +1,159 @@
+# src/compareblocks/engines/parallel.py
+"""
+Page-sharded, process-parallel execution for the OCR extraction engines.
+Each worker process opens the PDF and builds its engine once, so OCR models load once per worker.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+import fitz  # PyMuPDF
+
+from ..utils.workers import resolve_worker_count
+
+
+# Per-worker state populated by _init_worker; one open document and engine per process
+_worker_state: Dict[str, Any] = {}
+
+PAGE_ENGINES = ("tesseract", "paddleocr")
+
+
+def create_page_engine(engine_name: str, engine_kwargs: Optional[Dict[str, Any]] = None):
+    """
+    Build an engine instance for page-level OCR inside a worker.
+
+    Args:
+        engine_name: "tesseract" or "paddleocr"
+        engine_kwargs: Constructor arguments of the engine
+
+    Returns:
+        Engine instance
+    """
+    engine_kwargs = dict(engine_kwargs or {})
+
+    if engine_name == "tesseract":
+        from .ocr_pool import TesseractWorkerPool
+        from .tesseract_engine import TesseractEngine
+
+        # Parallelism comes from the processes; one OCR thread each avoids oversubscription
+        lang = engine_kwargs.get("lang", "eng")
+        engine_kwargs.setdefault("ocr_pool", TesseractWorkerPool(max_workers=1, lang=lang))
+        return TesseractEngine(**engine_kwargs)
+
+    if engine_name == "paddleocr":
+        from .paddleocr_engine import PaddleOCREngine
+        return PaddleOCREngine(**engine_kwargs)
+
+    raise ValueError(f"Unknown page engine: {engine_name}")
+
+
+def _init_worker(engine_name: str, pdf_path: str, engine_kwargs: Dict[str, Any]) -> None:
+    """Open the document and build the per-worker engine."""
+    engine = create_page_engine(engine_name, engine_kwargs)
+
+    _worker_state["engine_name"] = engine_name
+    _worker_state["engine"] = engine
+    _worker_state["doc"] = fitz.open(pdf_path)
+
+    if engine_name == "paddleocr":
+        # Load the model once, not per page
+        _worker_state["ocr"] = engine._get_ocr_engine()
+
+
+def _run_page_task(page_num: int) -> Any:
+    """OCR a single page with the worker's engine and open document."""
+    engine = _worker_state["engine"]
+    page = _worker_state["doc"][page_num]
+
+    try:
+        if _worker_state["engine_name"] == "paddleocr":
+            return engine._extract_page_ocr(page, page_num, _worker_state["ocr"])
+        return engine._extract_page_ocr(page, page_num)
+    except Exception as e:
+        # Some OCR exceptions cannot be unpickled and would break the whole pool
+        raise RuntimeError(f"OCR failed on page {page_num}: {type(e).__name__}: {e}") from None
+
+
+def resolve_page_numbers(total_pages: int, page_range: Optional[Sequence[int]] = None,
+                         pages: Optional[Iterable[int]] = None) -> Sequence[int]:
+    """
+    Resolve an optional page range or page list against a document.
+
+    Args:
+        total_pages: Number of pages in the document
+        page_range: (start, end) 0-indexed pages, end exclusive; None = all pages
+        pages: Explicit 0-indexed pages, taking precedence over page_range
+
+    Returns:
+        Page numbers to process, in ascending order
+    """
+    if pages is not None:
+        pages = sorted(set(pages))
+        if pages and pages[0] < 0:
+            raise ValueError(f"Invalid page numbers: {pages}")
+        return [page_num for page_num in pages if page_num < total_pages]
+
+    if page_range is None:
+        return range(total_pages)
+
+    start, end = page_range
+    if start < 0 or end < start:
+        raise ValueError(f"Invalid page range: {page_range}")
+    return range(min(start, total_pages), min(end, total_pages))
+
+
+def page_range_suffix(results: Dict[str, Any]) -> str:
+    """
+    Output filename suffix for a page-range extraction.
+
+    Args:
+        results: Engine extraction results
+
+    Returns:
+        "_p<start>-<end>" for page-range runs, "" for whole documents
+    """
+    page_range = results.get("extraction_metadata", {}).get("page_range")
+    if not page_range:
+        return ""
+    return f"_p{page_range[0]}-{page_range[1]}"
+
+
+def map_engine_pages(engine_name: str, pdf_path: str, page_numbers: Iterable[int],
+                     max_workers: Optional[int] = None,
+                     engine_kwargs: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """
+    Fan OCR pages for one PDF out across a process pool.
+
+    Args:
+        engine_name: "tesseract" or "paddleocr"
+        pdf_path: Path to the PDF file
+        page_numbers: Page numbers (0-indexed) to process
+        max_workers: Number of worker processes (None = one per CPU core)
+        engine_kwargs: Constructor arguments for each worker's engine
+
+    Returns:
+        Iterator over page dataclasses, in the order of page_numbers
+    """
+    if engine_name not in PAGE_ENGINES:
+        raise ValueError(f"Unknown page engine: {engine_name}")
+
+    page_numbers = list(page_numbers)
+    if not page_numbers:
+        return iter(())
+
+    workers = resolve_worker_count(max_workers, len(page_numbers))
+    # OCR pages are expensive, so hand them out one at a time for balance
+    initargs = (engine_name, str(pdf_path), dict(engine_kwargs or {}))
+
+    def _iterate() -> Iterator[Any]:
+        # spawn avoids forking a parent that may hold MuPDF/Paddle state
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=initargs
+        ) as executor:
+            yield from executor.map(_run_page_task, page_numbers)
+
+    return _iterate()
@@ -4,13 +4,13 @@ Raw PyMuPDF extraction engine for direct PDF text extraction.
 Provides unprocessed PyMuPDF output before GBG processing.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 import fitz  # PyMuPDF
 
 from ..io.pdf_metadata import PDFMetadataExtractor
+from .output import EngineOutput, save_engine_output
 from ..config.file_manager import file_manager
 
 
@@ -209,16 +209,20 @@ class PyMuPDFEngine:
         }
     
     def save_extraction(self, pdf_path: Optional[str] = None, 
-                       output_path: Optional[str] = None) -> str:
+                       output_path: Optional[str] = None,
+                       json_format: str = "indented",
+                       metadata: Optional[Dict[str, Any]] = None) -> Optional[EngineOutput]:
         """
         Extract and save raw PyMuPDF data.
         
         Args:
             pdf_path: Path to PDF file
             output_path: Path to save results
+            json_format: JSON layout: "indented", "compact" or "stream"
+            metadata: Section name -> fields merged into the results before writing
             
         Returns:
-            Path to saved file
+            EngineOutput with the saved file's path and summary (None if extraction failed)
         """
         # Extract data
         results = self.extract_pdf(pdf_path)
@@ -233,16 +237,11 @@ class PyMuPDFEngine:
             processing_dir = Path(file_manager.get_processing_directory())
             output_path = processing_dir / filename
         
-        # Ensure output directory exists
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save results
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Save results, with caller metadata merged in the same pass
+        output_path = save_engine_output(results, output_path, json_format, metadata)
         
         print(f"Raw PyMuPDF extraction saved to: {output_path}")
-        return str(output_path)
+        return output_path
 
 
 # Convenience functions
@@ -253,7 +252,10 @@ def extract_raw_pymupdf(pdf_path: Optional[str] = None) -> Dict[str, Any]:
 
 
 def save_raw_pymupdf_extraction(pdf_path: Optional[str] = None, 
-                               output_path: Optional[str] = None) -> str:
+                               output_path: Optional[str] = None,
+                               json_format: str = "indented",
+                               metadata: Optional[Dict[str, Any]] = None) -> Optional[EngineOutput]:
     """Extract and save raw PyMuPDF data."""
     engine = PyMuPDFEngine()
-    return engine.save_extraction(pdf_path, output_path)
\ No newline at end of file
+    return engine.save_extraction(pdf_path, output_path,
+                                  json_format=json_format, metadata=metadata)
\ No newline at end of file
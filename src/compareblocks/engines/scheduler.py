@@ -0,0 +1,351 @@
+# src/compareblocks/engines/scheduler.py
+"""
+Process-based scheduler for extraction engines.
+Runs each engine in its own process under a global CPU and memory budget, cheapest engines first.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from .output import EngineOutput
+
+
+class CostProfile(Enum):
+    """Dominant resource cost of an extraction engine."""
+    IO_LIGHT = "io_light"
+    CPU_BOUND = "cpu_bound"
+    MEMORY_HEAVY = "memory_heavy"
+
+
+# Cheap engines run first so downstream matching can start early
+_COST_PRIORITY = {
+    CostProfile.IO_LIGHT: 0,
+    CostProfile.CPU_BOUND: 1,
+    CostProfile.MEMORY_HEAVY: 2,
+}
+
+
+@dataclass(frozen=True)
+class EngineResourceProfile:
+    """Declared resource needs of one engine run."""
+    cost: CostProfile
+    cpu_slots: int = 1
+    memory_mb: int = 512
+
+    @property
+    def priority(self) -> int:
+        """Scheduling priority (lower runs first)."""
+        return _COST_PRIORITY[self.cost]
+
+
+ENGINE_PROFILES: Dict[str, EngineResourceProfile] = {
+    'pymupdf': EngineResourceProfile(CostProfile.IO_LIGHT, cpu_slots=1, memory_mb=256),
+    'tesseract': EngineResourceProfile(CostProfile.CPU_BOUND, cpu_slots=2, memory_mb=512),
+    'kreuzberg': EngineResourceProfile(CostProfile.CPU_BOUND, cpu_slots=1, memory_mb=1024),
+    'paddleocr': EngineResourceProfile(CostProfile.MEMORY_HEAVY, cpu_slots=2, memory_mb=3072),
+    'docling': EngineResourceProfile(CostProfile.MEMORY_HEAVY, cpu_slots=2, memory_mb=4096),
+}
+
+DEFAULT_PROFILE = EngineResourceProfile(CostProfile.CPU_BOUND, cpu_slots=1, memory_mb=1024)
+
+RUN_STATUSES = ("completed", "failed", "timeout", "cancelled")
+
+
+def get_engine_profile(engine_name: str) -> EngineResourceProfile:
+    """Get the declared resource profile of an engine."""
+    return ENGINE_PROFILES.get(engine_name, DEFAULT_PROFILE)
+
+
+def detect_memory_budget_mb(fraction: float = 0.75, fallback_mb: int = 4096) -> int:
+    """
+    Memory budget for concurrently running engines.
+
+    Args:
+        fraction: Share of physical memory the engines may claim
+        fallback_mb: Budget used when physical memory cannot be determined
+
+    Returns:
+        Budget in megabytes
+    """
+    try:
+        total = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        return fallback_mb
+    return max(1, int(total * fraction / (1024 * 1024)))
+
+
+@dataclass
+class SchedulerBudget:
+    """Global resource budget shared by all running engines."""
+    cpu_slots: int = field(default_factory=lambda: os.cpu_count() or 1)
+    memory_mb: int = field(default_factory=detect_memory_budget_mb)
+
+
+@dataclass
+class EngineRunOutcome:
+    """Outcome of one scheduled engine run."""
+    engine_name: str
+    status: str  # One of RUN_STATUSES
+    output_path: str = ""
+    elapsed: float = 0.0
+    error_message: str = ""
+    summary: Optional[Dict[str, Any]] = None  # Output summary sent back by the engine process
+
+    @property
+    def success(self) -> bool:
+        return self.status == "completed" and bool(self.output_path)
+
+
+@dataclass
+class _EngineJob:
+    """An engine waiting to run."""
+    engine_name: str
+    profile: EngineResourceProfile
+    max_workers: int
+    timeout: Optional[float]
+    cpu_slots: int
+    memory_mb: int
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _RunningEngine:
+    """An engine process in flight."""
+    job: _EngineJob
+    process: Any
+    conn: Any
+    started: float
+
+    def expired(self, now: float) -> bool:
+        return self.job.timeout is not None and now - self.started >= self.job.timeout
+
+
+def _engine_process_main(runner: Optional[Callable], engine_name: str, pdf_path: Optional[str],
+                         max_workers: int, conn, options: Optional[Dict[str, Any]] = None) -> None:
+    """Entry point of an engine process; reports (status, output_path, error, summary) through conn."""
+    try:
+        if runner is None:
+            from .manager import run_engine_extraction as runner
+        output = runner(engine_name, pdf_path, max_workers, **(options or {}))
+        # Only the path and summary travel back; the full results stay in this process
+        if output is None:
+            message = ("completed", "", "", None)
+        else:
+            message = ("completed", output.path, "", output.summary)
+    except BaseException as e:
+        message = ("failed", "", f"{type(e).__name__}: {e}", None)
+    try:
+        conn.send(message)
+    finally:
+        conn.close()
+
+
+class EngineScheduler:
+    """Runs extraction engines in separate processes within a resource budget."""
+
+    def __init__(self, budget: Optional[SchedulerBudget] = None,
+                 profiles: Optional[Dict[str, EngineResourceProfile]] = None,
+                 timeouts: Optional[Dict[str, float]] = None,
+                 default_timeout: Optional[float] = None,
+                 runner: Optional[Callable[..., Optional[EngineOutput]]] = None,
+                 poll_interval: float = 0.1):
+        """
+        Initialize the scheduler.
+
+        Args:
+            budget: CPU slots and memory shared by running engines (defaults to this machine)
+            profiles: Per-engine resource profiles overriding ENGINE_PROFILES
+            timeouts: Per-engine timeouts in seconds
+            default_timeout: Timeout for engines without an entry in timeouts (None = no limit)
+            runner: Picklable callable (engine_name, pdf_path, max_workers, **options) -> EngineOutput or None
+                run in each engine process (defaults to the engine manager's extraction)
+            poll_interval: Seconds between checks for timeouts and cancellations
+        """
+        self.budget = budget or SchedulerBudget()
+        self.profiles = dict(profiles or {})
+        self.timeouts = dict(timeouts or {})
+        self.default_timeout = default_timeout
+        self.runner = runner
+        self.poll_interval = poll_interval
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._cancelled: set = set()
+
+    def get_profile(self, engine_name: str) -> EngineResourceProfile:
+        """Resource profile used for an engine."""
+        return self.profiles.get(engine_name) or get_engine_profile(engine_name)
+
+    def cancel(self, engine_name: str) -> None:
+        """
+        Cancel an engine: pending runs are dropped, running processes terminated.
+
+        Safe to call from another thread or from an on_result callback, and before run():
+        cancellations last for the scheduler's lifetime.
+        """
+        with self._lock:
+            self._cancelled.add(engine_name)
+
+    def run(self, engine_names: Sequence[str], pdf_path: Optional[str] = None,
+            max_workers: Optional[Dict[str, int]] = None,
+            on_result: Optional[Callable[[EngineRunOutcome], None]] = None,
+            engine_options: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, EngineRunOutcome]:
+        """
+        Run engines and wait for all of them.
+
+        Args:
+            engine_names: Engines to run
+            pdf_path: Path to the PDF file
+            max_workers: Per-engine page-parallel worker counts passed to the runner
+            on_result: Called in this thread as each engine finishes, in completion order
+            engine_options: Per-engine keyword arguments passed to the runner
+
+        Returns:
+            Dictionary of engine name to outcome
+        """
+        max_workers = max_workers or {}
+        engine_options = engine_options or {}
+        pending = sorted(
+            (self._make_job(name, max_workers.get(name, 1), engine_options.get(name))
+             for name in engine_names),
+            key=lambda job: job.profile.priority
+        )
+        running: Dict[str, _RunningEngine] = {}
+        outcomes: Dict[str, EngineRunOutcome] = {}
+
+        def finish(outcome: EngineRunOutcome) -> None:
+            outcomes[outcome.engine_name] = outcome
+            if on_result is not None:
+                try:
+                    on_result(outcome)
+                except Exception as e:
+                    print(f"Warning: result callback failed for {outcome.engine_name}: {e}")
+
+        try:
+            while pending or running:
+                with self._lock:
+                    cancelled = set(self._cancelled)
+
+                for job in [job for job in pending if job.engine_name in cancelled]:
+                    pending.remove(job)
+                    finish(EngineRunOutcome(job.engine_name, "cancelled", error_message="Cancelled before start"))
+
+                now = time.time()
+                for name, run in list(running.items()):
+                    if name in cancelled:
+                        self._stop(run)
+                        del running[name]
+                        finish(EngineRunOutcome(name, "cancelled", elapsed=now - run.started,
+                                                error_message="Cancelled"))
+                    elif run.expired(now):
+                        self._stop(run)
+                        del running[name]
+                        finish(EngineRunOutcome(name, "timeout", elapsed=now - run.started,
+                                                error_message=f"Timed out after {run.job.timeout:g}s"))
+
+                for job in list(pending):
+                    if self._fits(job, running.values()):
+                        pending.remove(job)
+                        running[job.engine_name] = self._start(job, pdf_path)
+
+                if not running:
+                    continue
+
+                wait([run.process.sentinel for run in running.values()] +
+                     [run.conn for run in running.values()],
+                     timeout=self._wait_timeout(running.values()))
+
+                for name, run in list(running.items()):
+                    outcome = self._poll(run)
+                    if outcome is not None:
+                        del running[name]
+                        finish(outcome)
+        finally:
+            for run in running.values():
+                self._stop(run)
+
+        return outcomes
+
+    def _make_job(self, engine_name: str, max_workers: int,
+                  options: Optional[Dict[str, Any]] = None) -> _EngineJob:
+        """Resolve an engine's profile, budget share and timeout."""
+        profile = self.get_profile(engine_name)
+        workers = max_workers if max_workers else (os.cpu_count() or 1)
+        # Engines larger than the whole budget still run, alone
+        cpu_slots = min(max(profile.cpu_slots, workers), self.budget.cpu_slots)
+        memory_mb = min(profile.memory_mb, self.budget.memory_mb)
+        return _EngineJob(
+            engine_name=engine_name,
+            profile=profile,
+            max_workers=max_workers,
+            timeout=self.timeouts.get(engine_name, self.default_timeout),
+            cpu_slots=cpu_slots,
+            memory_mb=memory_mb,
+            options=dict(options or {})
+        )
+
+    def _fits(self, job: _EngineJob, running) -> bool:
+        """Whether a job fits in the budget left by the running engines."""
+        used_cpu = sum(run.job.cpu_slots for run in running)
+        used_memory = sum(run.job.memory_mb for run in running)
+        return (used_cpu + job.cpu_slots <= self.budget.cpu_slots and
+                used_memory + job.memory_mb <= self.budget.memory_mb)
+
+    def _start(self, job: _EngineJob, pdf_path: Optional[str]) -> _RunningEngine:
+        """Start an engine process."""
+        parent_conn, child_conn = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_engine_process_main,
+            args=(self.runner, job.engine_name, pdf_path, job.max_workers, child_conn, job.options),
+            name=f"engine-{job.engine_name}"
+        )
+        process.start()
+        child_conn.close()
+        print(f"Started {job.engine_name} ({job.profile.cost.value}, "
+              f"{job.cpu_slots} CPU, {job.memory_mb} MB)")
+        return _RunningEngine(job=job, process=process, conn=parent_conn, started=time.time())
+
+    def _poll(self, run: _RunningEngine) -> Optional[EngineRunOutcome]:
+        """Collect a finished engine's outcome, or None if it is still running."""
+        name = run.job.engine_name
+        message = None
+        try:
+            if run.conn.poll():
+                message = run.conn.recv()
+        except (EOFError, OSError):
+            message = None
+
+        if message is None and run.process.is_alive():
+            return None
+
+        elapsed = time.time() - run.started
+        run.process.join()
+        run.conn.close()
+        if message is None:
+            return EngineRunOutcome(name, "failed", elapsed=elapsed,
+                                    error_message=f"Engine process exited with code {run.process.exitcode}")
+
+        status, output_path, error_message, summary = message
+        return EngineRunOutcome(name, status, output_path=output_path, elapsed=elapsed,
+                                error_message=error_message, summary=summary)
+
+    def _stop(self, run: _RunningEngine) -> None:
+        """Terminate an engine process."""
+        if run.process.is_alive():
+            run.process.terminate()
+        run.process.join(timeout=5)
+        if run.process.is_alive():
+            run.process.kill()
+            run.process.join()
+        run.conn.close()
+
+    def _wait_timeout(self, running) -> float:
+        """Time until the next poll: the poll interval or the nearest deadline."""
+        now = time.time()
+        deadlines = [run.started + run.job.timeout - now for run in running if run.job.timeout is not None]
+        return max(0.0, min([self.poll_interval] + deadlines))
@@ -4,21 +4,26 @@ Tesseract OCR engine for PDF text extraction.
 Provides OCR-based text extraction using Tesseract.
 """
 
-import json
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
 import fitz  # PyMuPDF for PDF to image conversion
 
+from ..io.pdf_metadata import PDFMetadataExtractor
+from ..io.raster import page_raster_scope, render_page_array
+from .ocr_pool import (
+    PYTESSERACT_AVAILABLE, TESSEROCR_AVAILABLE, TesseractWorkerPool, get_tesseract_pool
+)
+
 try:
-    import pytesseract
     from PIL import Image
-    TESSERACT_AVAILABLE = True
+    # The OCR pool runs on either backend
+    TESSERACT_AVAILABLE = PYTESSERACT_AVAILABLE or TESSEROCR_AVAILABLE
 except ImportError:
     TESSERACT_AVAILABLE = False
-
-from ..io.pdf_metadata import PDFMetadataExtractor
+from .parallel import map_engine_pages, page_range_suffix, resolve_page_numbers
+from .output import EngineOutput, save_engine_output
 from ..config.file_manager import file_manager
 
 
@@ -46,25 +51,39 @@ class TesseractPage:
 class TesseractEngine:
     """Tesseract OCR extraction engine."""
     
-    def __init__(self, dpi: int = 300, lang: str = 'eng'):
+    def __init__(self, dpi: int = 300, lang: str = 'eng',
+                 ocr_pool: Optional[TesseractWorkerPool] = None):
         """
         Initialize Tesseract engine.
         
         Args:
             dpi: DPI for PDF to image conversion
             lang: Tesseract language code
+            ocr_pool: Worker pool for OCR calls (defaults to the shared pool for lang)
         """
         self.dpi = dpi
         self.lang = lang
         self.metadata_extractor = PDFMetadataExtractor()
+        self._ocr_pool = ocr_pool
         
         if not TESSERACT_AVAILABLE:
-            print("Warning: Tesseract dependencies not available. Install with: pip install pytesseract pillow")
+            print("Warning: Tesseract dependencies not available. Install with: pip install tesserocr pillow "
+                  "(or pytesseract and the tesseract executable)")
+    
+    @property
+    def ocr_pool(self) -> TesseractWorkerPool:
+        """Worker pool used for OCR, created on first use."""
+        if self._ocr_pool is None:
+            self._ocr_pool = get_tesseract_pool(self.lang)
+        return self._ocr_pool
     
     def is_available(self) -> bool:
         """Check if Tesseract is available."""
         if not TESSERACT_AVAILABLE:
             return False
+        if TESSEROCR_AVAILABLE:
+            # tesserocr links libtesseract and needs no executable
+            return True
         
         try:
             # Check if tesseract executable is available
@@ -74,12 +93,21 @@ class TesseractEngine:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
     
-    def extract_pdf(self, pdf_path: Optional[str] = None) -> Dict[str, Any]:
+    def extract_pdf(self, pdf_path: Optional[str] = None, max_workers: int = 1,
+                    page_range: Optional[Sequence[int]] = None,
+                    pages: Optional[Sequence[int]] = None) -> Dict[str, Any]:
         """
         Extract text from PDF using Tesseract OCR.
         
+        With max_workers > 1 pages are sharded across worker processes, each
+        with its own engine; the per-page output is identical to the
+        in-process path.
+        
         Args:
             pdf_path: Path to PDF file (defaults to configured target PDF)
+            max_workers: Number of worker processes (1 = in-process, 0 = one per CPU core)
+            page_range: (start, end) 0-indexed pages to process, end exclusive (None = all)
+            pages: Explicit 0-indexed pages to process (overrides page_range)
             
         Returns:
             Tesseract OCR extraction results
@@ -87,7 +115,7 @@ class TesseractEngine:
         if not self.is_available():
             return {
                 "error": "Tesseract OCR not available",
-                "message": "Install tesseract and pytesseract to use OCR extraction"
+                "message": "Install tesserocr, or tesseract and pytesseract, to use OCR extraction"
             }
         
         if pdf_path is None:
@@ -103,74 +131,97 @@ class TesseractEngine:
         pdf_metadata = self.metadata_extractor.extract_pdf_metadata(str(pdf_path))
         display_name = self.metadata_extractor.get_display_name(str(pdf_path))
         
-        # Open PDF document
-        doc = fitz.open(str(pdf_path))
-        
-        try:
-            # Initialize results structure
-            results = {
-                "engine": "tesseract",
-                "engine_version": self._get_tesseract_version(),
-                "pdf_path": pdf_metadata["file_info"]["relative_path"],
-                "pdf_name": pdf_metadata["file_info"]["normalized_filename"],
-                "pdf_display_name": display_name,
-                "pdf_metadata": pdf_metadata,
-                "extraction_metadata": {
-                    "total_pages": len(doc),
-                    "extraction_type": "tesseract_ocr",
-                    "dpi": self.dpi,
-                    "language": self.lang,
-                    "processing_notes": "OCR-based text extraction using Tesseract"
-                },
-                "pages": {},
-                "summary": {}
-            }
-            
-            all_blocks = []
-            page_summaries = []
+        # Pages rendered during this run are shared with engines in an enclosing scope
+        with page_raster_scope(str(pdf_path)):
+            # Open PDF document
+            doc = fitz.open(str(pdf_path))
             
-            # Process each page
-            for page_num in range(len(doc)):
-                print(f"OCR processing page {page_num + 1}/{len(doc)}")
+            try:
+                # Initialize results structure
+                results = {
+                    "engine": "tesseract",
+                    "engine_version": self._get_tesseract_version(),
+                    "pdf_path": pdf_metadata["file_info"]["relative_path"],
+                    "pdf_name": pdf_metadata["file_info"]["normalized_filename"],
+                    "pdf_display_name": display_name,
+                    "pdf_metadata": pdf_metadata,
+                    "extraction_metadata": {
+                        "total_pages": len(doc),
+                        "extraction_type": "tesseract_ocr",
+                        "dpi": self.dpi,
+                        "language": self.lang,
+                        "processing_notes": "OCR-based text extraction using Tesseract"
+                    },
+                    "pages": {},
+                    "summary": {}
+                }
                 
-                page = doc[page_num]
-                page_data = self._extract_page_ocr(page, page_num)
+                page_numbers = resolve_page_numbers(len(doc), page_range, pages)
+                if pages is not None:
+                    results["extraction_metadata"]["pages_extracted"] = list(page_numbers)
+                elif page_range is not None:
+                    results["extraction_metadata"]["page_range"] = [page_numbers.start, page_numbers.stop]
                 
-                results["pages"][str(page_num)] = asdict(page_data)
+                all_blocks = []
+                page_summaries = []
                 
-                # Collect blocks for summary
-                all_blocks.extend(page_data.blocks)
-                page_summaries.append({
-                    "page": page_num,
-                    "block_count": len(page_data.blocks),
-                    "text_blocks": len([b for b in page_data.blocks if b.text.strip()]),
-                    "avg_confidence": page_data.ocr_confidence
-                })
-            
-            # Generate summary
-            results["summary"] = self._generate_summary(all_blocks, page_summaries, len(doc))
+                # Process each page
+                for page_num, page_data in self._iter_page_results(doc, str(pdf_path), page_numbers, max_workers):
+                    results["pages"][str(page_num)] = asdict(page_data)
+                    
+                    # Collect blocks for summary
+                    all_blocks.extend(page_data.blocks)
+                    page_summaries.append({
+                        "page": page_num,
+                        "block_count": len(page_data.blocks),
+                        "text_blocks": len([b for b in page_data.blocks if b.text.strip()]),
+                        "avg_confidence": page_data.ocr_confidence
+                    })
+                
+                # Generate summary
+                results["summary"] = self._generate_summary(all_blocks, page_summaries, len(page_numbers))
+                
+                return results
+                
+            finally:
+                doc.close()
+    
+    def _iter_page_results(self, doc: fitz.Document, pdf_path: str, page_numbers: Sequence[int],
+                           max_workers: int) -> Iterator[Tuple[int, TesseractPage]]:
+        """Yield (page_num, page_data) in page order, from worker processes or in-process."""
+        if max_workers != 1 and len(page_numbers) > 1:
+            engine_kwargs = {"dpi": self.dpi, "lang": self.lang}
+            pages = map_engine_pages("tesseract", pdf_path, page_numbers, max_workers or None, engine_kwargs)
+            for page_num, page_data in zip(page_numbers, pages):
+                print(f"OCR processed page {page_num + 1}/{len(doc)}")
+                yield page_num, page_data
+            return
+        
+        # Keep a few pages per worker queued so the pool stays busy
+        window = self.ocr_pool.max_workers * 2
+        pending = {}
+        for page_num in page_numbers[:window]:
+            pending[page_num] = self.ocr_pool.submit(self._render_page_image(doc[page_num]))
+        
+        for index, page_num in enumerate(page_numbers):
+            print(f"OCR processing page {page_num + 1}/{len(doc)}")
             
-            return results
+            if index + window < len(page_numbers):
+                next_page = page_numbers[index + window]
+                pending[next_page] = self.ocr_pool.submit(self._render_page_image(doc[next_page]))
             
-        finally:
-            doc.close()
+            yield page_num, self._extract_page_ocr(doc[page_num], page_num, pending.pop(page_num).result())
+    
+    def _render_page_image(self, page: fitz.Page):
+        """Page image from the shared raster cache, wrapped without re-encoding."""
+        return Image.fromarray(render_page_array(page, self.dpi))
     
-    def _extract_page_ocr(self, page: fitz.Page, page_num: int) -> TesseractPage:
+    def _extract_page_ocr(self, page: fitz.Page, page_num: int,
+                          ocr_data: Optional[Dict[str, List[Any]]] = None) -> TesseractPage:
         """Extract OCR data from a single page."""
-        # Convert page to image
-        mat = fitz.Matrix(self.dpi / 72, self.dpi / 72)  # Scale for DPI
-        pix = page.get_pixmap(matrix=mat)
-        img_data = pix.tobytes("ppm")
-        
-        # Convert to PIL Image
-        image = Image.open(io.BytesIO(img_data))
-        
-        # Perform OCR with detailed data
-        ocr_data = pytesseract.image_to_data(
-            image, 
-            lang=self.lang,
-            output_type=pytesseract.Output.DICT
-        )
+        # Perform OCR with detailed data unless the caller already queued it
+        if ocr_data is None:
+            ocr_data = self.ocr_pool.image_to_data(self._render_page_image(page))
         
         # Process OCR results into blocks
         blocks = []
@@ -302,63 +353,86 @@ class TesseractEngine:
             "language": self.lang
         }
     
+    def summarize_pages(self, pages: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Rebuild the extraction summary from serialized pages.
+        
+        Used after spliced re-extraction, where only some pages come from this run.
+        
+        Args:
+            pages: Page number -> page data as stored in the results
+            
+        Returns:
+            Extraction summary
+        """
+        all_blocks = []
+        page_summaries = []
+        for page_data in pages.values():
+            blocks = [TesseractBlock(**block) for block in page_data.get("blocks", [])]
+            all_blocks.extend(blocks)
+            page_summaries.append({"text_blocks": len([b for b in blocks if b.text.strip()])})
+        return self._generate_summary(all_blocks, page_summaries, len(pages))
+    
     def save_extraction(self, pdf_path: Optional[str] = None, 
-                       output_path: Optional[str] = None) -> str:
+                       output_path: Optional[str] = None, max_workers: int = 1,
+                       page_range: Optional[Sequence[int]] = None,
+                       json_format: str = "indented",
+                       metadata: Optional[Dict[str, Any]] = None) -> Optional[EngineOutput]:
         """
         Extract and save Tesseract OCR data.
         
         Args:
             pdf_path: Path to PDF file
             output_path: Path to save results
+            max_workers: Number of worker processes (1 = in-process, 0 = one per CPU core)
+            page_range: (start, end) 0-indexed pages to process, end exclusive (None = all)
+            json_format: JSON layout: "indented", "compact" or "stream"
+            metadata: Section name -> fields merged into the results before writing
             
         Returns:
-            Path to saved file
+            EngineOutput with the saved file's path and summary (None if extraction failed)
         """
         # Extract data
-        results = self.extract_pdf(pdf_path)
+        results = self.extract_pdf(pdf_path, max_workers=max_workers, page_range=page_range)
         
         # Check for errors
         if "error" in results:
             print(f"Tesseract extraction failed: {results['error']}")
-            return ""
+            return None
         
         # Determine output path
         if output_path is None:
             # Create filename based on PDF display name
             display_name = results["pdf_display_name"]
-            filename = f"{display_name}_tesseract.json"
+            filename = f"{display_name}_tesseract{page_range_suffix(results)}.json"
             
             # Save to processing directory
             processing_dir = Path(file_manager.get_processing_directory())
             output_path = processing_dir / filename
         
-        # Ensure output directory exists
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save results
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Save results, with caller metadata merged in the same pass
+        output_path = save_engine_output(results, output_path, json_format, metadata)
         
         print(f"Tesseract OCR extraction saved to: {output_path}")
-        return str(output_path)
-
-
-# Add missing import
-import io
+        return output_path
 
 
 # Convenience functions
 def extract_tesseract_ocr(pdf_path: Optional[str] = None, 
-                         dpi: int = 300, lang: str = 'eng') -> Dict[str, Any]:
+                         dpi: int = 300, lang: str = 'eng', max_workers: int = 1,
+                         page_range: Optional[Sequence[int]] = None) -> Dict[str, Any]:
     """Extract text using Tesseract OCR."""
     engine = TesseractEngine(dpi=dpi, lang=lang)
-    return engine.extract_pdf(pdf_path)
+    return engine.extract_pdf(pdf_path, max_workers=max_workers, page_range=page_range)
 
 
 def save_tesseract_extraction(pdf_path: Optional[str] = None, 
                              output_path: Optional[str] = None,
-                             dpi: int = 300, lang: str = 'eng') -> str:
+                             dpi: int = 300, lang: str = 'eng', max_workers: int = 1,
+                             page_range: Optional[Sequence[int]] = None,
+                             json_format: str = "indented",
+                             metadata: Optional[Dict[str, Any]] = None) -> Optional[EngineOutput]:
     """Extract and save Tesseract OCR data."""
     engine = TesseractEngine(dpi=dpi, lang=lang)
-    return engine.save_extraction(pdf_path, output_path)
\ No newline at end of file
+    return engine.save_extraction(pdf_path, output_path, max_workers=max_workers, page_range=page_range,
+                                  json_format=json_format, metadata=metadata)
\ No newline at end of file
@@ -335,6 +335,12 @@ class AnomalyDetector:
         Returns:
             List of AnomalyFeatures
         """
+        # Imported here: anomaly_batch builds on this module
+        from .anomaly_batch import BATCH_MIN_VARIATIONS, extract_anomaly_feature_array, features_from_array
+        
+        # Subclasses may override the per-text metrics, which the batch kernel would bypass
+        if type(self) is AnomalyDetector and len(variations) >= BATCH_MIN_VARIATIONS:
+            return features_from_array(extract_anomaly_feature_array(variations, self))
         return [self.extract_anomaly_features(text) for text in variations]
     
     def get_anomaly_statistics(self, variations: List[str]) -> Dict[str, Any]:
@@ -0,0 +1,308 @@
+# src/compareblocks/features/anomaly_batch.py
+"""
+Batched anomaly feature extraction for many text variations at once.
+Works on the code points of all texts together and reproduces AnomalyDetector exactly.
+"""
+
+import math
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .anomaly import AnomalyDetector, AnomalyFeatures
+
+
+# Flag names in the order AnomalyDetector.detect_specific_patterns reports them
+ANOMALY_FLAG_NAMES = (
+    'one_char_per_line', 'excessive_punctuation', 'repeated_characters',
+    'excessive_caps', 'unusual_char_patterns', 'excessive_single_char_words'
+)
+
+# One record per text; anomaly_flags is a bitmask over ANOMALY_FLAG_NAMES
+ANOMALY_FEATURE_DTYPE = np.dtype([
+    ('entropy_score', np.float64),
+    ('repetition_score', np.float64),
+    ('space_ratio', np.float64),
+    ('char_per_line_ratio', np.float64),
+    ('special_char_ratio', np.float64),
+    ('digit_ratio', np.float64),
+    ('anomaly_flags', np.uint8),
+    ('overall_anomaly_score', np.float64),
+])
+
+# Below this many texts the per-text AnomalyDetector path is faster
+BATCH_MIN_VARIATIONS = 8
+
+# Character class bits, matching str.isspace/isalnum/isdigit/isalpha/isupper
+_SPACE, _ALNUM, _DIGIT, _ALPHA, _UPPER = 1, 2, 4, 8, 16
+
+_NEWLINE = ord('\n')
+_UNDERSCORE = ord('_')
+_OCR_CONFUSABLES = np.array([ord(c) for c in 'Il1|'], dtype=np.uint32)
+
+# Class table for the Basic Multilingual Plane, built on first use
+_bmp_classes: Optional[np.ndarray] = None
+
+
+def _char_classes(char: str) -> int:
+    return ((_SPACE if char.isspace() else 0) | (_ALNUM if char.isalnum() else 0)
+            | (_DIGIT if char.isdigit() else 0) | (_ALPHA if char.isalpha() else 0)
+            | (_UPPER if char.isupper() else 0))
+
+
+def _classify(code_points: np.ndarray) -> np.ndarray:
+    """Class bits for each code point."""
+    global _bmp_classes
+    if _bmp_classes is None:
+        _bmp_classes = np.array([_char_classes(chr(cp)) for cp in range(0x10000)], dtype=np.uint8)
+
+    in_bmp = code_points < 0x10000
+    classes = np.zeros(len(code_points), dtype=np.uint8)
+    classes[in_bmp] = _bmp_classes[code_points[in_bmp]]
+    if not in_bmp.all():
+        astral, inverse = np.unique(code_points[~in_bmp], return_inverse=True)
+        astral_classes = np.array([_char_classes(chr(cp)) for cp in astral.tolist()], dtype=np.uint8)
+        classes[~in_bmp] = astral_classes[inverse.reshape(-1)]
+    return classes
+
+
+def _count_per_text(mask: np.ndarray, text_ids: np.ndarray, n_texts: int) -> np.ndarray:
+    return np.bincount(text_ids[mask], minlength=n_texts)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise numerator / denominator, 0.0 where the denominator is 0."""
+    result = np.zeros(len(numerator), dtype=np.float64)
+    nonzero = denominator > 0
+    result[nonzero] = numerator[nonzero] / denominator[nonzero]
+    return result
+
+
+def _sequence_hits(masks: List[np.ndarray], text_ids: np.ndarray) -> np.ndarray:
+    """Start positions i where masks[k] holds at position i+k for every k, inside one text."""
+    width = len(masks)
+    if len(text_ids) < width:
+        return np.zeros(0, dtype=bool)
+    count = len(text_ids) - width + 1
+    hit = masks[0][:count].copy()
+    for offset in range(1, width):
+        hit &= masks[offset][offset:offset + count]
+    return hit & (text_ids[:count] == text_ids[width - 1:])
+
+
+def _entropy(code_points: np.ndarray, text_ids: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Shannon entropy, summed in the first-occurrence order Counter uses."""
+    n_texts = len(lengths)
+    keys = (text_ids.astype(np.int64) << 32) | code_points.astype(np.int64)
+    _, first_positions, counts = np.unique(keys, return_index=True, return_counts=True)
+    order = np.argsort(first_positions, kind='stable')
+    first_positions, counts = first_positions[order], counts[order]
+    group_texts = text_ids[first_positions]
+
+    probabilities = counts / lengths[group_texts]
+    # math.log2 per distinct probability keeps the scalar implementation's rounding
+    unique_probabilities, inverse = np.unique(probabilities, return_inverse=True)
+    log2 = np.array([math.log2(p) for p in unique_probabilities.tolist()], dtype=np.float64)
+    terms = probabilities * log2[inverse.reshape(-1)]
+
+    # Rank of each character within its text; summing rank by rank keeps each text's order
+    group_starts = np.searchsorted(group_texts, np.arange(n_texts))
+    ranks = np.arange(len(group_texts)) - group_starts[group_texts]
+    by_rank = np.argsort(ranks, kind='stable')
+    rank_bounds = np.searchsorted(ranks[by_rank], np.arange(ranks.max() + 2 if len(ranks) else 1))
+    totals = np.zeros(n_texts, dtype=np.float64)
+    for start, end in zip(rank_bounds[:-1], rank_bounds[1:]):
+        selected = by_rank[start:end]
+        totals[group_texts[selected]] += terms[selected]
+    return 0.0 - totals
+
+
+def _repetition(code_points: np.ndarray, text_ids: np.ndarray, lengths: np.ndarray,
+                starts: np.ndarray, texts: Sequence[str]) -> np.ndarray:
+    """Highest repeated 2/3/4-gram ratio for texts of at least 4 characters."""
+    n_texts = len(lengths)
+    scores = np.full(n_texts, -np.inf)
+    eligible = lengths >= 4
+    # Renumber the characters present densely so packed n-gram keys stay small
+    present = np.zeros(int(code_points.max()) + 1 if len(code_points) else 1, dtype=np.int64)
+    present[code_points] = 1
+    base = int(present.sum()) or 1
+    dense = (np.cumsum(present) - 1)[code_points]
+    local = np.arange(len(code_points)) - starts[text_ids]
+
+    for n in (2, 3, 4):
+        totals = lengths - n + 1
+        if n_texts * base ** n < 2 ** 62:
+            valid = (local <= lengths[text_ids] - n) & eligible[text_ids]
+            positions = np.flatnonzero(valid)
+            keys = text_ids[positions].astype(np.int64)
+            for offset in range(n):
+                keys = keys * base + dense[positions + offset]
+            # Sorting and comparing neighbours is much faster than np.unique's hash path here
+            keys.sort()
+            distinct = keys[np.append(True, keys[1:] != keys[:-1])] if len(keys) else keys
+            unique_counts = np.bincount(distinct // base ** n, minlength=n_texts)
+        else:
+            # Too many distinct characters to pack n-grams into one integer
+            unique_counts = np.array([len(set(zip(*(text[i:] for i in range(n))))) if eligible[t] else 0
+                                      for t, text in enumerate(texts)])
+        ratios = 1.0 - _ratio(unique_counts, totals)
+        scores = np.where(eligible, np.maximum(scores, ratios), scores)
+    return np.where(eligible, scores, 0.0)
+
+
+def extract_anomaly_feature_array(texts: Sequence[str],
+                                  detector: Optional[AnomalyDetector] = None) -> np.ndarray:
+    """
+    Extract anomaly features for many texts in one batch.
+
+    All texts are concatenated into one array of code points. Character
+    classes are looked up once per code point, and every count, line
+    statistic and pattern test is computed with array operations over all
+    texts together. Values equal AnomalyDetector.extract_anomaly_features
+    exactly.
+
+    Args:
+        texts: Text variations (for example every variation of a page)
+        detector: Detector whose thresholds are applied (defaults to AnomalyDetector())
+
+    Returns:
+        Structured array with ANOMALY_FEATURE_DTYPE, one record per text
+    """
+    detector = detector if detector is not None else AnomalyDetector()
+    n_texts = len(texts)
+    features = np.zeros(n_texts, dtype=ANOMALY_FEATURE_DTYPE)
+    if n_texts == 0:
+        return features
+
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=n_texts)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    code_points = np.frombuffer(''.join(texts).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    text_ids = np.repeat(np.arange(n_texts), lengths)
+    classes = _classify(code_points)
+
+    is_space = (classes & _SPACE) != 0
+    is_alnum = (classes & _ALNUM) != 0
+    is_special = ~is_alnum & ~is_space
+    is_word = is_alnum | (code_points == _UNDERSCORE)
+    is_alpha = (classes & _ALPHA) != 0
+
+    space_count = _count_per_text(is_space, text_ids, n_texts)
+    special_count = _count_per_text(is_special, text_ids, n_texts)
+    digit_count = _count_per_text((classes & _DIGIT) != 0, text_ids, n_texts)
+    punctuation_count = _count_per_text(is_special & ~is_word, text_ids, n_texts)
+    alpha_count = _count_per_text(is_alpha, text_ids, n_texts)
+    upper_count = _count_per_text(is_alpha & ((classes & _UPPER) != 0), text_ids, n_texts)
+
+    # Lines: split on '\n', each stripped of surrounding whitespace
+    is_newline = code_points == _NEWLINE
+    newline_count = _count_per_text(is_newline, text_ids, n_texts)
+    line_count = newline_count + 1
+    line_ids = np.cumsum(is_newline) - is_newline + text_ids
+    line_texts = np.repeat(np.arange(n_texts), line_count)
+    content = np.flatnonzero(~is_space)
+    content_lines, first = np.unique(line_ids[content], return_index=True)
+    last = np.append(first[1:], len(content)) - 1
+    stripped_lengths = content[last] - content[first] + 1
+    content_line_texts = line_texts[content_lines]
+    non_empty_lines = np.bincount(content_line_texts, minlength=n_texts)
+    stripped_total = np.bincount(content_line_texts, weights=stripped_lengths, minlength=n_texts)
+    single_char_lines = _count_per_text(stripped_lengths == 1, content_line_texts, n_texts)
+
+    # Words: maximal runs of \w characters
+    word_starts = is_word.copy()
+    word_starts[1:] &= ~is_word[:-1] | (text_ids[1:] != text_ids[:-1])
+    word_start_positions = np.flatnonzero(word_starts)
+    word_ends = is_word.copy()
+    word_ends[:-1] &= ~is_word[1:] | (text_ids[1:] != text_ids[:-1])
+    word_lengths = np.flatnonzero(word_ends) - word_start_positions + 1
+    word_texts = text_ids[word_start_positions]
+    word_count = np.bincount(word_texts, minlength=n_texts)
+    single_char_words = _count_per_text(word_lengths == 1, word_texts, n_texts)
+
+    # Pattern searches: (.)\1{4,}, [0-9][A-Za-z][0-9], [A-Za-z][0-9][A-Za-z] and [Il1|]{3,}
+    same_as_next = np.zeros(len(code_points), dtype=bool)
+    same_as_next[:-1] = ((code_points[:-1] == code_points[1:]) & ~is_newline[:-1]
+                         & (text_ids[:-1] == text_ids[1:]))
+    repeated_hits = _sequence_hits([same_as_next] * 4, text_ids)
+    repeated_texts = text_ids[:len(repeated_hits)][repeated_hits]
+
+    ascii_digit = (code_points >= 48) & (code_points <= 57)
+    ascii_letter = ((code_points >= 65) & (code_points <= 90)) | ((code_points >= 97) & (code_points <= 122))
+    confusable = np.isin(code_points, _OCR_CONFUSABLES)
+    unusual_hits = (_sequence_hits([ascii_digit, ascii_letter, ascii_digit], text_ids)
+                    | _sequence_hits([ascii_letter, ascii_digit, ascii_letter], text_ids)
+                    | _sequence_hits([confusable] * 3, text_ids))
+    unusual_texts = text_ids[:len(unusual_hits)][unusual_hits]
+
+    flag_masks = [
+        (line_count > 1) & (_ratio(single_char_lines, line_count) > 0.5),
+        _ratio(punctuation_count, lengths) > 0.3,
+        np.bincount(repeated_texts, minlength=n_texts) > 0,
+        (alpha_count > 10) & (_ratio(upper_count, alpha_count) > 0.8),
+        np.bincount(unusual_texts, minlength=n_texts) > 0,
+        (word_count > 0) & (_ratio(single_char_words, word_count) > 0.4),
+    ]
+    flag_bits = np.zeros(n_texts, dtype=np.uint8)
+    flag_total = np.zeros(n_texts, dtype=np.int64)
+    for bit, mask in enumerate(flag_masks):
+        flag_bits |= (mask.astype(np.uint8) << bit)
+        flag_total += mask
+
+    features['entropy_score'] = _entropy(code_points, text_ids, lengths)
+    features['repetition_score'] = _repetition(code_points, text_ids, lengths, starts, texts)
+    features['space_ratio'] = _ratio(space_count, lengths)
+    features['char_per_line_ratio'] = _ratio(stripped_total, non_empty_lines)
+    features['special_char_ratio'] = _ratio(special_count, lengths)
+    features['digit_ratio'] = _ratio(digit_count, lengths)
+    features['anomaly_flags'] = flag_bits
+
+    # Same additions, in the same order, as the scalar score
+    score = np.zeros(n_texts, dtype=np.float64)
+    for mask, weight in (
+        (features['entropy_score'] < detector.low_entropy_threshold, 0.3),
+        (features['repetition_score'] > detector.high_repetition_threshold, 0.3),
+        (features['space_ratio'] > detector.extreme_space_ratio_threshold, 0.2),
+        (features['char_per_line_ratio'] < detector.one_char_per_line_threshold, 0.2),
+        (features['special_char_ratio'] > detector.high_special_char_threshold, 0.2),
+        (features['digit_ratio'] > detector.high_digit_ratio_threshold, 0.2),
+    ):
+        score = np.where(mask, score + weight, score)
+    score = score + flag_total * 0.1
+    features['overall_anomaly_score'] = np.minimum(1.0, score)
+
+    # Empty text has no measurements and is fully anomalous
+    empty = lengths == 0
+    for name in ANOMALY_FEATURE_DTYPE.names:
+        features[name][empty] = 0
+    features['overall_anomaly_score'][empty] = 1.0
+    return features
+
+
+def features_from_array(features: np.ndarray) -> List[AnomalyFeatures]:
+    """
+    Convert a feature array into AnomalyFeatures objects.
+
+    Args:
+        features: Structured array from extract_anomaly_feature_array
+
+    Returns:
+        List of AnomalyFeatures, one per record
+    """
+    columns = {name: features[name].tolist() for name in ANOMALY_FEATURE_DTYPE.names}
+    flag_lists = {}
+    results = []
+    for i, bits in enumerate(columns['anomaly_flags']):
+        if bits not in flag_lists:
+            flag_lists[bits] = [name for bit, name in enumerate(ANOMALY_FLAG_NAMES) if bits >> bit & 1]
+        results.append(AnomalyFeatures(
+            entropy_score=columns['entropy_score'][i],
+            repetition_score=columns['repetition_score'][i],
+            space_ratio=columns['space_ratio'][i],
+            char_per_line_ratio=columns['char_per_line_ratio'][i],
+            special_char_ratio=columns['special_char_ratio'][i],
+            digit_ratio=columns['digit_ratio'][i],
+            anomaly_flags=list(flag_lists[bits]),
+            overall_anomaly_score=columns['overall_anomaly_score'][i]
+        ))
+    return results
@@ -4,13 +4,15 @@ Character-level consistency tracking across all associated files.
 Implements dynamic consistency percentages and word-level accuracy scoring.
 """
 
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Union
 from dataclasses import dataclass, field
 from collections import defaultdict, Counter
 import re
 import statistics
 from difflib import SequenceMatcher
 
+from .similarity import SimilarityBackend, get_similarity_backend
+
 
 @dataclass
 class CharacterConsistency:
@@ -58,8 +60,18 @@ class WordConsistency:
 class CharacterConsistencyTracker:
     """Tracks character-level consistency across all associated files."""
     
-    def __init__(self):
-        """Initialize consistency tracker."""
+    def __init__(self, similarity_backend: Optional[Union[str, SimilarityBackend]] = None):
+        """
+        Initialize consistency tracker.
+        
+        Args:
+            similarity_backend: Backend instance or name for edit distance, LCS and
+                                Jaccard scoring (None = fastest available)
+        """
+        if isinstance(similarity_backend, SimilarityBackend):
+            self.similarity_backend = similarity_backend
+        else:
+            self.similarity_backend = get_similarity_backend(similarity_backend)
         self.override_terms: Set[str] = set()
         self.acronym_patterns = [
             r'\b[A-Z]{2,}\b',  # All caps words (acronyms)
@@ -182,8 +194,9 @@ class CharacterConsistencyTracker:
         # Method 3: Edit Distance (Levenshtein) based
         total_edit_similarity = 0.0
         for variation in variations:
-            edit_distance = self._levenshtein_distance(reference_text, variation)
             max_length = max(len(reference_text), len(variation))
+            # Any distance of max_length or more scores 0, so the backend may stop there
+            edit_distance = self._levenshtein_distance(reference_text, variation, max(max_length - 1, 0))
             edit_similarity = 1.0 - (edit_distance / max_length) if max_length > 0 else 1.0
             total_edit_similarity += max(0.0, edit_similarity)
         methods['edit_distance_similarity'] = total_edit_similarity / len(variations) if variations else 0.0
@@ -207,57 +220,15 @@ class CharacterConsistencyTracker:
     
     def _longest_common_subsequence_length(self, text1: str, text2: str) -> int:
         """Calculate the length of the longest common subsequence."""
-        m, n = len(text1), len(text2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if text1[i-1] == text2[j-1]:
-                    dp[i][j] = dp[i-1][j-1] + 1
-                else:
-                    dp[i][j] = max(dp[i-1][j], dp[i][j-1])
-        
-        return dp[m][n]
-    
-    def _levenshtein_distance(self, text1: str, text2: str) -> int:
-        """Calculate the Levenshtein (edit) distance between two strings."""
-        m, n = len(text1), len(text2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        # Initialize base cases
-        for i in range(m + 1):
-            dp[i][0] = i
-        for j in range(n + 1):
-            dp[0][j] = j
-        
-        # Fill the DP table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if text1[i-1] == text2[j-1]:
-                    dp[i][j] = dp[i-1][j-1]
-                else:
-                    dp[i][j] = 1 + min(dp[i-1][j], dp[i][j-1], dp[i-1][j-1])
-        
-        return dp[m][n]
+        return self.similarity_backend.lcs_length(text1, text2)
+    
+    def _levenshtein_distance(self, text1: str, text2: str, max_distance: Optional[int] = None) -> int:
+        """Calculate the Levenshtein (edit) distance, capped at max_distance + 1 when given."""
+        return self.similarity_backend.levenshtein_distance(text1, text2, max_distance)
     
     def _jaccard_similarity_chars(self, text1: str, text2: str, n: int = 2) -> float:
         """Calculate Jaccard similarity using character n-grams."""
-        def get_ngrams(text: str, n: int) -> Set[str]:
-            return set(text[i:i+n] for i in range(len(text) - n + 1))
-        
-        if len(text1) < n and len(text2) < n:
-            return 1.0 if text1 == text2 else 0.0
-        
-        ngrams1 = get_ngrams(text1, n)
-        ngrams2 = get_ngrams(text2, n)
-        
-        if not ngrams1 and not ngrams2:
-            return 1.0
-        
-        intersection = len(ngrams1.intersection(ngrams2))
-        union = len(ngrams1.union(ngrams2))
-        
-        return intersection / union if union > 0 else 0.0
+        return self.similarity_backend.jaccard_similarity(text1, text2, n)
     
     def calculate_character_consistency(self, variations: List[str], 
                                       normalize_for_comparison: bool = True,
@@ -0,0 +1,239 @@
+# src/compareblocks/features/similarity.py
+"""
+Pluggable string similarity backends for character consistency tracking.
+Provides edit distance, LCS length and character n-gram Jaccard with memoization.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Set, Type
+
+try:
+    from rapidfuzz.distance import Levenshtein, LCSseq
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+class _PairCache:
+    """Bounded LRU cache for results of repeated string pairs."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[object]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _symmetric_key(kind: str, text1: str, text2: str) -> tuple:
+    """Cache key for symmetric measures so (a, b) and (b, a) share an entry."""
+    return (kind, text1, text2) if text1 <= text2 else (kind, text2, text1)
+
+
+def _trim_common_affixes(text1: str, text2: str) -> tuple:
+    """Strip the shared prefix and suffix; neither changes edit distance or LCS."""
+    prefix = 0
+    limit = min(len(text1), len(text2))
+    while prefix < limit and text1[prefix] == text2[prefix]:
+        prefix += 1
+
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and text1[-1 - suffix] == text2[-1 - suffix]:
+        suffix += 1
+
+    return text1[prefix:len(text1) - suffix], text2[prefix:len(text2) - suffix], prefix + suffix
+
+
+class SimilarityBackend:
+    """Pure-Python similarity backend using two-row dynamic programming."""
+
+    name = "python"
+
+    def __init__(self, cache_size: int = 4096):
+        """
+        Initialize the backend.
+
+        Args:
+            cache_size: Maximum number of memoized string pairs (0 disables memoization)
+        """
+        self._cache = _PairCache(cache_size)
+
+    def clear_cache(self) -> None:
+        """Drop all memoized results."""
+        self._cache.clear()
+
+    def levenshtein_distance(self, text1: str, text2: str,
+                             max_distance: Optional[int] = None) -> int:
+        """
+        Calculate the Levenshtein (edit) distance between two strings.
+
+        Args:
+            text1: First string
+            text2: Second string
+            max_distance: Optional early-exit threshold; once the distance is known
+                          to exceed it, max_distance + 1 is returned
+
+        Returns:
+            Edit distance (capped at max_distance + 1 when a threshold is given)
+        """
+        if text1 == text2:
+            return 0
+        if max_distance is not None and abs(len(text1) - len(text2)) > max_distance:
+            return max_distance + 1
+
+        key = _symmetric_key("levenshtein", text1, text2)
+        distance = self._cache.get(key)
+        if distance is not None:
+            if max_distance is not None and distance > max_distance:
+                return max_distance + 1
+            return distance
+
+        distance = self._compute_levenshtein(text1, text2, max_distance)
+        # Capped results are only bounds, so only exact distances are memoized
+        if max_distance is None or distance <= max_distance:
+            self._cache.put(key, distance)
+        return distance
+
+    def lcs_length(self, text1: str, text2: str) -> int:
+        """Calculate the length of the longest common subsequence."""
+        if text1 == text2:
+            return len(text1)
+
+        key = _symmetric_key("lcs", text1, text2)
+        length = self._cache.get(key)
+        if length is None:
+            length = self._compute_lcs(text1, text2)
+            self._cache.put(key, length)
+        return length
+
+    def jaccard_similarity(self, text1: str, text2: str, n: int = 2) -> float:
+        """Calculate Jaccard similarity using character n-grams."""
+        if len(text1) < n and len(text2) < n:
+            return 1.0 if text1 == text2 else 0.0
+
+        key = _symmetric_key(("jaccard", n), text1, text2)
+        similarity = self._cache.get(key)
+        if similarity is not None:
+            return similarity
+
+        ngrams1 = self._ngrams(text1, n)
+        ngrams2 = self._ngrams(text2, n)
+
+        if not ngrams1 and not ngrams2:
+            similarity = 1.0
+        else:
+            intersection = len(ngrams1 & ngrams2)
+            union = len(ngrams1) + len(ngrams2) - intersection
+            similarity = intersection / union if union > 0 else 0.0
+
+        self._cache.put(key, similarity)
+        return similarity
+
+    @staticmethod
+    def _ngrams(text: str, n: int) -> Set[str]:
+        return set(text[i:i+n] for i in range(len(text) - n + 1))
+
+    def _compute_levenshtein(self, text1: str, text2: str, max_distance: Optional[int] = None) -> int:
+        text1, text2, _ = _trim_common_affixes(text1, text2)
+        # Keep the shorter string along the row to minimise memory
+        if len(text1) < len(text2):
+            text1, text2 = text2, text1
+        if not text2:
+            return len(text1)
+
+        previous = list(range(len(text2) + 1))
+        for i, char1 in enumerate(text1, 1):
+            current = [i]
+            for j, char2 in enumerate(text2, 1):
+                if char1 == char2:
+                    current.append(previous[j - 1])
+                else:
+                    current.append(1 + min(previous[j], current[j - 1], previous[j - 1]))
+            # Every alignment passes through this row, so its minimum bounds the distance
+            if max_distance is not None and min(current) > max_distance:
+                return max_distance + 1
+            previous = current
+        if max_distance is not None and previous[-1] > max_distance:
+            return max_distance + 1
+        return previous[-1]
+
+    def _compute_lcs(self, text1: str, text2: str) -> int:
+        text1, text2, common = _trim_common_affixes(text1, text2)
+        if len(text1) < len(text2):
+            text1, text2 = text2, text1
+        if not text2:
+            return common
+
+        previous = [0] * (len(text2) + 1)
+        for char1 in text1:
+            current = [0]
+            for j, char2 in enumerate(text2, 1):
+                if char1 == char2:
+                    current.append(previous[j - 1] + 1)
+                else:
+                    current.append(max(previous[j], current[j - 1]))
+            previous = current
+        return common + previous[-1]
+
+
+class RapidFuzzSimilarityBackend(SimilarityBackend):
+    """Compiled backend using rapidfuzz's bit-parallel edit distance and LCS."""
+
+    name = "rapidfuzz"
+
+    def __init__(self, cache_size: int = 4096):
+        if not RAPIDFUZZ_AVAILABLE:
+            raise ImportError("rapidfuzz is required for the rapidfuzz similarity backend")
+        super().__init__(cache_size)
+
+    def _compute_levenshtein(self, text1: str, text2: str, max_distance: Optional[int] = None) -> int:
+        # rapidfuzz stops early and returns score_cutoff + 1 once the distance exceeds it
+        return Levenshtein.distance(text1, text2, score_cutoff=max_distance)
+
+    def _compute_lcs(self, text1: str, text2: str) -> int:
+        return LCSseq.similarity(text1, text2)
+
+
+SIMILARITY_BACKENDS: Dict[str, Type[SimilarityBackend]] = {
+    "python": SimilarityBackend,
+    "rapidfuzz": RapidFuzzSimilarityBackend,
+}
+
+
+def get_similarity_backend(name: Optional[str] = None, cache_size: int = 4096) -> SimilarityBackend:
+    """
+    Create a similarity backend by name.
+
+    Args:
+        name: Backend name ("python", "rapidfuzz"), or None/"auto" for the
+              fastest one available
+        cache_size: Maximum number of memoized string pairs
+
+    Returns:
+        SimilarityBackend instance
+    """
+    if name is None or name == "auto":
+        name = "rapidfuzz" if RAPIDFUZZ_AVAILABLE else "python"
+
+    if name not in SIMILARITY_BACKENDS:
+        raise ValueError(f"Unknown similarity backend: {name}")
+
+    return SIMILARITY_BACKENDS[name](cache_size=cache_size)
@@ -0,0 +1,227 @@
+# src/compareblocks/gbg/cache.py
+"""
+Content-addressed on-disk cache for Global Block Grid analysis results.
+Entries are keyed by the PDF's SHA-256 and the GBG configuration and evicted least-recently-used.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config.file_manager import file_manager
+
+
+GBG_VERSION = "1.0.0"
+
+_HASH_CHUNK_SIZE = 1 << 20
+_STAT_INDEX_NAME = "stat_index.json"
+
+
+@dataclass(frozen=True)
+class GBGCacheKey:
+    """Identifies one cached analysis: PDF content plus the settings that shape it."""
+    content_hash: str
+    min_block_area: float
+    merge_threshold: float
+    orientation_mode: str = "full"
+    gbg_version: str = GBG_VERSION
+
+    @property
+    def filename(self) -> str:
+        config = json.dumps(asdict(self), sort_keys=True)
+        config_digest = hashlib.sha256(config.encode("utf-8")).hexdigest()[:16]
+        return f"{self.content_hash}_{config_digest}.json"
+
+
+def hash_file(path: str) -> str:
+    """
+    Compute the SHA-256 of a file's content.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class GBGAnalysisCache:
+    """Size-bounded LRU cache of GBG results stored as JSON files."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to <configured cache directory>/gbg)
+            max_bytes: Total size of cached entries kept before evicting the oldest
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+
+        if cache_dir is None:
+            cache_dir = Path(file_manager.get_cache_directory()) / "gbg"
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stat_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def content_hash(self, pdf_path: str) -> str:
+        """
+        Content hash of a PDF, reusing the stored hash while size and mtime are unchanged.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            SHA-256 hex digest of the file
+        """
+        resolved = str(Path(pdf_path).resolve())
+        stat = os.stat(resolved)
+
+        with self._lock:
+            entry = self._load_stat_index().get(resolved)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        content_hash = hash_file(resolved)
+        with self._lock:
+            index = self._load_stat_index()
+            index[resolved] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                               "sha256": content_hash}
+            self._write_json(self.cache_dir / _STAT_INDEX_NAME, index)
+        return content_hash
+
+    def make_key(self, pdf_path: str, min_block_area: float, merge_threshold: float,
+                 orientation_mode: str = "full") -> GBGCacheKey:
+        """
+        Build the cache key for a PDF under the given GBG settings.
+
+        Args:
+            pdf_path: Path to the PDF file
+            min_block_area: Seed detector minimum block area
+            merge_threshold: Seed detector merge distance
+            orientation_mode: Seed detector page orientation mode
+
+        Returns:
+            GBGCacheKey for the analysis
+        """
+        return GBGCacheKey(
+            content_hash=self.content_hash(pdf_path),
+            min_block_area=float(min_block_area),
+            merge_threshold=float(merge_threshold),
+            orientation_mode=orientation_mode
+        )
+
+    def get(self, key: GBGCacheKey) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached analysis.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached GBG results, or None on a miss
+        """
+        entry_path = self.cache_dir / key.filename
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                results = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        # Touch the entry so eviction sees it as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        self.hits += 1
+        return results
+
+    def put(self, key: GBGCacheKey, results: Dict[str, Any]) -> None:
+        """
+        Store an analysis and evict old entries beyond max_bytes.
+
+        Args:
+            key: Cache key
+            results: GBG results to store
+        """
+        with self._lock:
+            self._write_json(self.cache_dir / key.filename, results)
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all cached entries and the stat index."""
+        with self._lock:
+            for entry_path in self._entry_paths():
+                entry_path.unlink(missing_ok=True)
+            (self.cache_dir / _STAT_INDEX_NAME).unlink(missing_ok=True)
+            self._stat_index = None
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get entry count, total size and hit/miss counters."""
+        entries = self._entry_paths()
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(entries),
+            "total_bytes": sum(p.stat().st_size for p in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def _entry_paths(self):
+        if not self.cache_dir.exists():
+            return []
+        return [p for p in self.cache_dir.glob("*.json") if p.name != _STAT_INDEX_NAME]
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits in max_bytes."""
+        entries = []
+        for entry_path in self._entry_paths():
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, entry_path.name, entry_path, stat.st_size))
+
+        total = sum(size for _, _, _, size in entries)
+        for _, _, entry_path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total -= size
+
+    def _load_stat_index(self) -> Dict[str, Dict[str, Any]]:
+        if self._stat_index is None:
+            try:
+                with open(self.cache_dir / _STAT_INDEX_NAME, 'r', encoding='utf-8') as f:
+                    self._stat_index = json.load(f)
+            except (OSError, ValueError):
+                self._stat_index = {}
+        return self._stat_index
+
+    def _write_json(self, path: Path, data: Any) -> None:
+        """Write JSON atomically so concurrent readers never see a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
@@ -62,6 +62,40 @@ class OrientationDetector:
             confidence=confidence
         )
     
+    def detect_page_orientation_fast(self, image: np.ndarray) -> OrientationHints:
+        """
+        Detect page-level orientation from axis projections without rotating the image.
+        
+        Row sums of the image rotated by 90/180/270 degrees are the column or row
+        sums of the original, reversed. Reversing a profile does not change its
+        variance, so the four candidates need only two sums over the original.
+        
+        Args:
+            image: Grayscale image array (a downsampled thumbnail is sufficient)
+            
+        Returns:
+            OrientationHints with page rotation and confidence
+        """
+        if len(image.shape) != 2:
+            raise ValueError("Image must be grayscale")
+        
+        row_variance = float(np.var(image.sum(axis=1, dtype=np.int64)))
+        column_variance = float(np.var(image.sum(axis=0, dtype=np.int64)))
+        
+        # 0/180 share the row profile and 90/270 the column profile; ties resolve to 0/90
+        profile_variances = [row_variance, column_variance, row_variance, column_variance]
+        best_rotation_idx = int(np.argmax(profile_variances))
+        best_rotation = [0, 90, 180, 270][best_rotation_idx]
+        
+        max_variance = profile_variances[best_rotation_idx]
+        avg_variance = (row_variance + column_variance) / 2
+        confidence = min(1.0, (max_variance - avg_variance) / max_variance) if max_variance > 0 else 0.0
+        
+        return OrientationHints(
+            page_rotation=float(best_rotation),
+            confidence=confidence
+        )
+    
     def detect_block_skew(self, image: np.ndarray, bbox_region: Optional[np.ndarray] = None) -> OrientationHints:
         """
         Detect individual text block skew using Hough line detection.
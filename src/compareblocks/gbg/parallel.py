@@ -0,0 +1,97 @@
+# src/compareblocks/gbg/parallel.py
+"""
+Document-scoped, page-parallel execution for the Global Block Grid.
+Each worker process opens the PDF exactly once and serves page tasks from that handle.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import fitz  # PyMuPDF
+
+from ..utils.workers import resolve_worker_count
+
+
+# Per-worker state populated by _init_worker; one open document per process
+_worker_state: Dict[str, Any] = {}
+
+PAGE_TASKS = ("seed_blocks", "gbg_page")
+
+
+def _init_worker(pdf_path: str, min_block_area: float, merge_threshold: float,
+                 orientation_mode: str = "full") -> None:
+    """Open the document and build the per-worker detector/processor."""
+    from .processor import GBGProcessor
+
+    # Output directories are the parent's concern; workers only compute pages
+    processor = GBGProcessor(
+        min_block_area=min_block_area,
+        merge_threshold=merge_threshold,
+        ensure_output_directories=False,
+        orientation_mode=orientation_mode
+    )
+
+    _worker_state["doc"] = fitz.open(pdf_path)
+    _worker_state["processor"] = processor
+
+
+def _run_page_task(task: str, page_num: int) -> Any:
+    """Run a single page task against the worker's open document."""
+    doc = _worker_state["doc"]
+    processor = _worker_state["processor"]
+
+    if task == "seed_blocks":
+        return processor.seed_detector.extract_page_seed_blocks(doc[page_num], page_num)
+
+    # gbg_page mirrors the per-page error handling of GBGProcessor.process_pdf
+    try:
+        return processor.process_open_page(doc[page_num], page_num)
+    except Exception as e:
+        return {"error": str(e), "page_info": None, "blocks": []}
+
+
+def map_document_pages(pdf_path: str, task: str, page_numbers: Iterable[int],
+                       max_workers: Optional[int] = None,
+                       min_block_area: float = 100.0,
+                       merge_threshold: float = 10.0,
+                       orientation_mode: str = "full") -> Iterator[Any]:
+    """
+    Fan page tasks for one PDF out across a process pool.
+
+    Args:
+        pdf_path: Path to the PDF file
+        task: Page task name ("seed_blocks" or "gbg_page")
+        page_numbers: Page numbers (0-indexed) to process
+        max_workers: Number of worker processes (None = one per CPU core)
+        min_block_area: Seed detector minimum block area
+        merge_threshold: Seed detector merge threshold
+        orientation_mode: Seed detector page orientation mode
+
+    Returns:
+        Iterator over per-page results, in the order of page_numbers
+    """
+    if task not in PAGE_TASKS:
+        raise ValueError(f"Unknown page task: {task}")
+
+    page_numbers = list(page_numbers)
+    if not page_numbers:
+        return iter(())
+
+    workers = resolve_worker_count(max_workers, len(page_numbers))
+    # Several pages per submission keeps IPC overhead low while still balancing load
+    chunksize = max(1, len(page_numbers) // (workers * 4))
+    worker_fn = partial(_run_page_task, task)
+
+    def _iterate() -> Iterator[Any]:
+        # spawn avoids forking a parent that may hold MuPDF/Qt state
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(str(pdf_path), min_block_area, merge_threshold, orientation_mode)
+        ) as executor:
+            yield from executor.map(worker_fn, page_numbers, chunksize=chunksize)
+
+    return _iterate()
@@ -6,12 +6,15 @@ Implements deterministic PDF page segmentation with stable IDs and orientation d
 
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import asdict
 
+import fitz  # PyMuPDF
+
 from .seed import SeedBlockDetector, PDFPageAnalyzer
 from .orientation import OrientationDetector
 from .types import SeedBlock, OrientationHints
+from .cache import GBGAnalysisCache, GBG_VERSION
 from ..config.file_manager import file_manager
 from ..io.pdf_metadata import PDFMetadataExtractor
 
@@ -19,21 +22,46 @@ from ..io.pdf_metadata import PDFMetadataExtractor
 class GBGProcessor:
     """Complete Global Block Grid processor for PDF analysis."""
     
-    def __init__(self):
-        """Initialize the GBG processor with all required components."""
-        self.seed_detector = SeedBlockDetector()
+    def __init__(self, min_block_area: float = 100.0, merge_threshold: float = 10.0,
+                 ensure_output_directories: bool = True,
+                 cache: Optional[GBGAnalysisCache] = None,
+                 orientation_mode: str = "full"):
+        """
+        Initialize the GBG processor with all required components.
+        
+        Args:
+            min_block_area: Minimum area for a seed block to be kept
+            merge_threshold: Distance threshold for merging nearby blocks
+            ensure_output_directories: Create the configured output directories
+            cache: Optional content-addressed cache for whole-document results
+            orientation_mode: Page orientation detection mode ("fast", "text" or "full")
+        """
+        self.seed_detector = SeedBlockDetector(min_block_area=min_block_area, merge_threshold=merge_threshold,
+                                               orientation_mode=orientation_mode)
         self.orientation_detector = OrientationDetector()
         self.pdf_metadata_extractor = PDFMetadataExtractor()
+        self.cache = cache
         # Ensure output directories exist
-        file_manager.ensure_output_directories()
+        if ensure_output_directories:
+            file_manager.ensure_output_directories()
     
-    def process_pdf(self, pdf_path: Optional[str] = None, output_path: Optional[str] = None) -> Dict[str, Any]:
+    def process_pdf(self, pdf_path: Optional[str] = None, output_path: Optional[str] = None,
+                    max_workers: int = 1) -> Dict[str, Any]:
         """
         Process entire PDF through complete GBG pipeline.
         
+        The PDF is opened once per process. With max_workers > 1 pages are
+        distributed over a process pool (one document handle per worker) and
+        the results are assembled in page order, so the output is identical
+        to the single-process pass.
+        
+        With a cache configured, an unchanged PDF analysed under the same
+        settings is served from the cache instead of being re-segmented.
+        
         Args:
             pdf_path: Path to PDF file (defaults to configured target PDF)
             output_path: Optional path to save results JSON (defaults to configured output path)
+            max_workers: Number of worker processes (1 = in-process, 0 = one per CPU core)
             
         Returns:
             Complete GBG analysis results
@@ -48,19 +76,28 @@ class GBGProcessor:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
         
-        print(f"Processing PDF: {pdf_path}")
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(str(pdf_path), self.seed_detector.min_block_area,
+                                            self.seed_detector.merge_threshold,
+                                            self.seed_detector.orientation_mode)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print(f"GBG cache hit: {pdf_path}")
+                # Identical content may live at another path; refresh the file-specific fields
+                cached.update(self._describe_pdf(pdf_path))
+                if output_path:
+                    self._save_results(cached, output_path)
+                    print(f"Results saved to: {output_path}")
+                return cached
         
-        # Extract proper PDF metadata
-        pdf_metadata = self.pdf_metadata_extractor.extract_pdf_metadata(str(pdf_path))
+        print(f"Processing PDF: {pdf_path}")
         
         # Initialize results structure with proper metadata
         results = {
-            "pdf_path": str(pdf_path),
-            "pdf_name": Path(pdf_path).name,
-            "pdf_display_name": self.pdf_metadata_extractor.get_display_name(str(pdf_path)),
-            "pdf_metadata": pdf_metadata,
+            **self._describe_pdf(pdf_path),
             "processing_metadata": {
-                "gbg_version": "1.0.0",
+                "gbg_version": GBG_VERSION,
                 "components": ["seed_detection", "orientation_analysis", "stable_ids"],
                 "encoding": file_manager.get_default_encoding(),
                 "validation_enabled": file_manager.is_validation_enabled()
@@ -77,33 +114,31 @@ class GBGProcessor:
         page_summaries = []
         
         # Process each page
-        for page_num in range(total_pages):
+        for page_num, page_result in self._iter_page_results(str(pdf_path), total_pages, max_workers):
             print(f"Processing page {page_num + 1}/{total_pages}")
             
-            try:
-                page_result = self.process_page(str(pdf_path), page_num)
+            if "error" in page_result:
+                print(f"Error processing page {page_num}: {page_result['error']}")
                 results["pages"][str(page_num)] = page_result
-                
-                # Collect blocks for summary
-                all_blocks.extend(page_result["blocks"])
-                page_summaries.append({
-                    "page": page_num,
-                    "block_count": len(page_result["blocks"]),
-                    "has_text": page_result["page_info"]["has_text"],
-                    "dimensions": f"{page_result['page_info']['width']}x{page_result['page_info']['height']}"
-                })
-                
-            except Exception as e:
-                print(f"Error processing page {page_num}: {e}")
-                results["pages"][str(page_num)] = {
-                    "error": str(e),
-                    "page_info": None,
-                    "blocks": []
-                }
+                continue
+            
+            results["pages"][str(page_num)] = page_result
+            
+            # Collect blocks for summary
+            all_blocks.extend(page_result["blocks"])
+            page_summaries.append({
+                "page": page_num,
+                "block_count": len(page_result["blocks"]),
+                "has_text": page_result["page_info"]["has_text"],
+                "dimensions": f"{page_result['page_info']['width']}x{page_result['page_info']['height']}"
+            })
         
         # Generate summary statistics
         results["summary"] = self._generate_summary(all_blocks, page_summaries, total_pages)
         
+        if cache_key is not None:
+            self.cache.put(cache_key, results)
+        
         # Save results if output path provided
         if output_path:
             self._save_results(results, output_path)
@@ -111,6 +146,15 @@ class GBGProcessor:
         
         return results
     
+    def _describe_pdf(self, pdf_path: Path) -> Dict[str, Any]:
+        """Build the path and metadata fields of the results for a PDF file."""
+        return {
+            "pdf_path": str(pdf_path),
+            "pdf_name": Path(pdf_path).name,
+            "pdf_display_name": self.pdf_metadata_extractor.get_display_name(str(pdf_path)),
+            "pdf_metadata": self.pdf_metadata_extractor.extract_pdf_metadata(str(pdf_path))
+        }
+    
     def process_page(self, pdf_path: str, page_num: int) -> Dict[str, Any]:
         """
         Process single page through complete GBG pipeline.
@@ -119,14 +163,36 @@ class GBGProcessor:
             pdf_path: Path to PDF file
             page_num: Page number (0-indexed)
             
+        Returns:
+            Complete page analysis results
+        """
+        doc = fitz.open(pdf_path)
+        
+        try:
+            if page_num >= len(doc):
+                raise ValueError(f"Page {page_num} does not exist in PDF")
+            
+            return self.process_open_page(doc[page_num], page_num)
+            
+        finally:
+            doc.close()
+    
+    def process_open_page(self, page: fitz.Page, page_num: int) -> Dict[str, Any]:
+        """
+        Process an already opened page through the complete GBG pipeline.
+        
+        Args:
+            page: PyMuPDF page object
+            page_num: Page number (0-indexed)
+            
         Returns:
             Complete page analysis results
         """
         # Get page information
-        page_info = PDFPageAnalyzer.get_page_info(pdf_path, page_num)
+        page_info = PDFPageAnalyzer.get_page_info_from_page(page, page_num)
         
         # Extract seed blocks
-        blocks = self.seed_detector.extract_seed_blocks(pdf_path, page_num)
+        blocks = self.seed_detector.extract_page_seed_blocks(page, page_num)
         
         # Convert blocks to serializable format
         serializable_blocks = []
@@ -262,19 +328,52 @@ class GBGProcessor:
             "page_summaries": page_summaries
         }
     
+    def _iter_page_results(self, pdf_path: str, total_pages: int,
+                           max_workers: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yield (page_num, page_result) in page order, in-process or across a process pool.
+        
+        Failed pages yield an error entry instead of raising.
+        """
+        if max_workers != 1 and total_pages > 1:
+            from .parallel import map_document_pages
+            
+            page_results = map_document_pages(
+                pdf_path, "gbg_page", range(total_pages), max_workers or None,
+                min_block_area=self.seed_detector.min_block_area,
+                merge_threshold=self.seed_detector.merge_threshold,
+                orientation_mode=self.seed_detector.orientation_mode
+            )
+            yield from enumerate(page_results)
+            return
+        
+        try:
+            doc = fitz.open(pdf_path)
+        except Exception as e:
+            for page_num in range(total_pages):
+                yield page_num, {"error": str(e), "page_info": None, "blocks": []}
+            return
+        
+        try:
+            for page_num in range(total_pages):
+                try:
+                    yield page_num, self.process_open_page(doc[page_num], page_num)
+                except Exception as e:
+                    yield page_num, {"error": str(e), "page_info": None, "blocks": []}
+        finally:
+            doc.close()
+    
     def _get_total_pages(self, pdf_path: str) -> int:
         """Get total number of pages in PDF."""
         try:
-            # Try to get page info for increasingly higher page numbers
-            page_num = 0
-            while True:
-                try:
-                    PDFPageAnalyzer.get_page_info(pdf_path, page_num)
-                    page_num += 1
-                except:
-                    return page_num
-        except:
+            doc = fitz.open(pdf_path)
+        except Exception:
             return 1
+        
+        try:
+            return len(doc)
+        finally:
+            doc.close()
     
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
@@ -10,6 +10,7 @@ from typing import List, Optional, Tuple
 from .types import BoundingBox, SeedBlock, OrientationHints
 from .ids import BlockIDGenerator
 from .orientation import OrientationDetector
+from ..io.raster import render_page_array
 
 try:
     import cv2
@@ -17,19 +18,71 @@ except ImportError:
     cv2 = None
 
 
+# "full" renders at 72 dpi and rotates the image; "fast" projects a grayscale
+# thumbnail; "text" is "fast" but trusts the PDF's text-line directions first.
+# Projections cannot tell 0 from 180 or 90 from 270 degrees, so "fast" and
+# "text" are opt-in and "full" is the default.
+ORIENTATION_MODES = ("fast", "text", "full")
+
+# Share of characters on one axis needed for text directions to decide orientation
+TEXT_DIRECTION_AGREEMENT = 0.95
+
+
+def pixmap_to_array(pix: fitz.Pixmap) -> np.ndarray:
+    """
+    View a pixmap's samples as a (height, width, n) uint8 array without copying.
+    
+    Args:
+        pix: PyMuPDF pixmap
+        
+    Returns:
+        Array backed by the pixmap buffer (valid while the pixmap is alive)
+    """
+    samples = np.frombuffer(pix.samples_mv, dtype=np.uint8)
+    rows = samples.reshape(pix.height, pix.stride)
+    return rows[:, :pix.width * pix.n].reshape(pix.height, pix.width, pix.n)
+
+
+def rgb_to_png_gray(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert an RGB page render to grayscale exactly as decoding its PNG in grayscale does.
+    
+    cv2.imdecode(..., IMREAD_GRAYSCALE) leaves the conversion to libpng, which
+    truncates a 15-bit fixed-point weighted sum; cv2.cvtColor rounds with
+    different weights, so its gray values (and the detected rotation) can differ.
+    
+    Args:
+        rgb: (height, width, 3) uint8 RGB array
+        
+    Returns:
+        (height, width) uint8 grayscale array
+    """
+    channels = rgb.astype(np.uint32)
+    gray = (9797 * channels[:, :, 0] + 19234 * channels[:, :, 1] + 3737 * channels[:, :, 2]) >> 15
+    return gray.astype(np.uint8)
+
+
 class SeedBlockDetector:
     """Detects and extracts seed blocks from PDF pages using PyMuPDF."""
     
-    def __init__(self, min_block_area: float = 100.0, merge_threshold: float = 10.0):
+    def __init__(self, min_block_area: float = 100.0, merge_threshold: float = 10.0,
+                 orientation_mode: str = "full", thumbnail_size: int = 256):
         """
         Initialize the seed block detector.
         
         Args:
             min_block_area: Minimum area for a block to be considered valid
             merge_threshold: Distance threshold for merging nearby blocks
+            orientation_mode: Page orientation detection mode ("fast", "text" or "full")
+            thumbnail_size: Longest side in pixels of the fast-mode page thumbnail
         """
+        if orientation_mode not in ORIENTATION_MODES:
+            raise ValueError(f"Unknown orientation mode: {orientation_mode}")
+        
         self.min_block_area = min_block_area
         self.merge_threshold = merge_threshold
+        self.orientation_mode = orientation_mode
+        self.thumbnail_size = thumbnail_size
         self.id_generator = BlockIDGenerator()
         self.orientation_detector = OrientationDetector() if cv2 is not None else None
     
@@ -50,63 +103,81 @@ class SeedBlockDetector:
             if page_num >= len(doc):
                 raise ValueError(f"Page {page_num} does not exist in PDF")
             
-            page = doc[page_num]
+            return self.extract_page_seed_blocks(doc[page_num], page_num)
             
-            # Get page dimensions
-            page_rect = page.rect
-            page_width = page_rect.width
-            page_height = page_rect.height
+        finally:
+            doc.close()
+    
+    def extract_page_seed_blocks(self, page: fitz.Page, page_num: int) -> List[SeedBlock]:
+        """
+        Extract seed blocks from an already opened PDF page.
+        
+        Args:
+            page: PyMuPDF page object
+            page_num: Page number (0-indexed)
             
-            # Extract text blocks using PyMuPDF
-            text_blocks = self._extract_text_blocks(page)
+        Returns:
+            List of SeedBlock objects
+        """
+        # Get page dimensions
+        page_rect = page.rect
+        page_width = page_rect.width
+        page_height = page_rect.height
+        
+        # Extract text blocks using PyMuPDF
+        text_dict = page.get_text("dict")
+        text_blocks = self._extract_text_blocks(page, text_dict)
+        
+        # Page orientation is detected lazily, so pages without kept blocks are never rendered
+        orientation_hints = None
+        
+        # Process blocks and generate stable IDs
+        seed_blocks = []
+        for block_data in text_blocks:
+            bbox, text_content = block_data
             
-            # Detect page-level orientation if OpenCV is available
-            orientation_hints = self._detect_page_orientation(page) if self.orientation_detector else OrientationHints()
+            # Skip blocks that are too small
+            if bbox.area() < self.min_block_area:
+                continue
             
-            # Process blocks and generate stable IDs
-            seed_blocks = []
-            for block_data in text_blocks:
-                bbox, text_content = block_data
-                
-                # Skip blocks that are too small
-                if bbox.area() < self.min_block_area:
-                    continue
-                
-                # Generate stable block ID
-                block_id = self.id_generator.generate_block_id(
-                    page_num, bbox, page_width, page_height
-                )
-                
-                # Create seed block
-                seed_block = SeedBlock(
-                    block_id=block_id,
-                    page=page_num,
-                    bbox=bbox,
-                    orientation_hints=orientation_hints,
-                    text_content=text_content,
-                    metadata={
-                        'page_width': page_width,
-                        'page_height': page_height,
-                        'extraction_method': 'pymupdf'
-                    }
-                )
-                
-                seed_blocks.append(seed_block)
+            if orientation_hints is None:
+                orientation_hints = self._detect_page_orientation(page, text_dict)
             
-            # Handle multi-column layouts by separating blocks
-            seed_blocks = self._separate_column_blocks(seed_blocks)
+            # Generate stable block ID
+            block_id = self.id_generator.generate_block_id(
+                page_num, bbox, page_width, page_height
+            )
             
-            return seed_blocks
+            # Create seed block
+            seed_block = SeedBlock(
+                block_id=block_id,
+                page=page_num,
+                bbox=bbox,
+                orientation_hints=orientation_hints,
+                text_content=text_content,
+                metadata={
+                    'page_width': page_width,
+                    'page_height': page_height,
+                    'extraction_method': 'pymupdf'
+                }
+            )
             
-        finally:
-            doc.close()
+            seed_blocks.append(seed_block)
+        
+        # Handle multi-column layouts by separating blocks
+        return self._separate_column_blocks(seed_blocks)
     
-    def extract_all_seed_blocks(self, pdf_path: str) -> List[SeedBlock]:
+    def extract_all_seed_blocks(self, pdf_path: str, max_workers: int = 1) -> List[SeedBlock]:
         """
         Extract seed blocks from all pages in a PDF.
         
+        The document is opened once. With max_workers > 1 pages are fanned
+        out across a process pool in which every worker holds its own
+        document handle; results are returned in page order either way.
+        
         Args:
             pdf_path: Path to the PDF file
+            max_workers: Number of worker processes (1 = in-process, 0 = one per CPU core)
             
         Returns:
             List of all SeedBlock objects from all pages
@@ -115,8 +186,23 @@ class SeedBlockDetector:
         all_blocks = []
         
         try:
-            for page_num in range(len(doc)):
-                page_blocks = self.extract_seed_blocks(pdf_path, page_num)
+            page_count = len(doc)
+            
+            if max_workers != 1 and page_count > 1:
+                from .parallel import map_document_pages
+                
+                page_results = map_document_pages(
+                    pdf_path, "seed_blocks", range(page_count), max_workers or None,
+                    min_block_area=self.min_block_area,
+                    merge_threshold=self.merge_threshold,
+                    orientation_mode=self.orientation_mode
+                )
+                for page_blocks in page_results:
+                    all_blocks.extend(page_blocks)
+                return all_blocks
+            
+            for page_num in range(page_count):
+                page_blocks = self.extract_page_seed_blocks(doc[page_num], page_num)
                 all_blocks.extend(page_blocks)
             
             return all_blocks
@@ -124,12 +210,14 @@ class SeedBlockDetector:
         finally:
             doc.close()
     
-    def _extract_text_blocks(self, page: fitz.Page) -> List[Tuple[BoundingBox, str]]:
+    def _extract_text_blocks(self, page: fitz.Page,
+                             text_dict: Optional[dict] = None) -> List[Tuple[BoundingBox, str]]:
         """
         Extract text blocks from a PyMuPDF page.
         
         Args:
             page: PyMuPDF page object
+            text_dict: Optional result of page.get_text("dict") to reuse
             
         Returns:
             List of (BoundingBox, text_content) tuples
@@ -137,7 +225,8 @@ class SeedBlockDetector:
         blocks = []
         
         # Get text blocks from PyMuPDF
-        text_dict = page.get_text("dict")
+        if text_dict is None:
+            text_dict = page.get_text("dict")
         
         for block in text_dict["blocks"]:
             if "lines" not in block:  # Skip image blocks
@@ -166,12 +255,14 @@ class SeedBlockDetector:
         
         return blocks
     
-    def _detect_page_orientation(self, page: fitz.Page) -> OrientationHints:
+    def _detect_page_orientation(self, page: fitz.Page,
+                                 text_dict: Optional[dict] = None) -> OrientationHints:
         """
         Detect page-level orientation using image analysis.
         
         Args:
             page: PyMuPDF page object
+            text_dict: Optional result of page.get_text("dict"), used in "text" mode
             
         Returns:
             OrientationHints for the page
@@ -179,17 +270,21 @@ class SeedBlockDetector:
         if self.orientation_detector is None:
             return OrientationHints()
         
+        if self.orientation_mode == "text":
+            hints = self._text_direction_orientation(
+                text_dict if text_dict is not None else page.get_text("dict")
+            )
+            if hints is not None:
+                return hints
+        
+        if self.orientation_mode != "full":
+            return self._detect_thumbnail_orientation(page)
+        
         try:
-            # Render page as image
-            mat = fitz.Matrix(1.0, 1.0)  # Standard resolution
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("png")
+            # Render page at standard resolution through the shared raster cache
+            img = rgb_to_png_gray(render_page_array(page, 72))
             
-            # Convert to OpenCV format
-            img_array = np.frombuffer(img_data, dtype=np.uint8)
-            img = cv2.imdecode(img_array, cv2.IMREAD_GRAYSCALE)
-            
-            if img is None:
+            if img.size == 0:
                 return OrientationHints()
             
             # Detect orientation
@@ -199,6 +294,68 @@ class SeedBlockDetector:
             # Fallback to default orientation if detection fails
             return OrientationHints()
     
+    def _detect_thumbnail_orientation(self, page: fitz.Page) -> OrientationHints:
+        """
+        Detect page orientation from a grayscale thumbnail read straight from the pixmap.
+        
+        Args:
+            page: PyMuPDF page object
+            
+        Returns:
+            OrientationHints for the page
+        """
+        try:
+            longest_side = max(page.rect.width, page.rect.height)
+            scale = min(1.0, self.thumbnail_size / longest_side) if longest_side > 0 else 1.0
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=fitz.csGRAY, alpha=False)
+            
+            img = pixmap_to_array(pix)[:, :, 0]
+            if img.size == 0:
+                return OrientationHints()
+            
+            return self.orientation_detector.detect_page_orientation_fast(img)
+            
+        except Exception:
+            # Fallback to default orientation if detection fails
+            return OrientationHints()
+    
+    def _text_direction_orientation(self, text_dict: dict) -> Optional[OrientationHints]:
+        """
+        Decide page orientation from PyMuPDF text-line directions when they agree.
+        
+        Like the projection profile, this only resolves the text axis: horizontal
+        lines map to 0 degrees and vertical lines to 90 degrees.
+        
+        Args:
+            text_dict: Result of page.get_text("dict")
+            
+        Returns:
+            OrientationHints, or None when the text layer is empty or mixed
+        """
+        horizontal_chars = 0
+        vertical_chars = 0
+        for block in text_dict.get("blocks", []):
+            for line in block.get("lines", []):
+                chars = sum(len(span["text"].strip()) for span in line["spans"])
+                cos_angle, sin_angle = line["dir"]
+                if abs(cos_angle) >= abs(sin_angle):
+                    horizontal_chars += chars
+                else:
+                    vertical_chars += chars
+        
+        total_chars = horizontal_chars + vertical_chars
+        if total_chars == 0:
+            return None
+        
+        agreement = max(horizontal_chars, vertical_chars) / total_chars
+        if agreement < TEXT_DIRECTION_AGREEMENT:
+            return None
+        
+        return OrientationHints(
+            page_rotation=0.0 if horizontal_chars >= vertical_chars else 90.0,
+            confidence=agreement
+        )
+    
     def _separate_column_blocks(self, blocks: List[SeedBlock]) -> List[SeedBlock]:
         """
         Separate blocks that span multiple columns into individual column blocks.
@@ -330,21 +487,34 @@ class PDFPageAnalyzer:
             if page_num >= len(doc):
                 raise ValueError(f"Page {page_num} does not exist in PDF")
             
-            page = doc[page_num]
-            rect = page.rect
-            
-            return {
-                'page_number': page_num,
-                'width': rect.width,
-                'height': rect.height,
-                'rotation': page.rotation,
-                'has_text': bool(page.get_text().strip()),
-                'block_count': len(page.get_text("dict")["blocks"])
-            }
+            return PDFPageAnalyzer.get_page_info_from_page(doc[page_num], page_num)
             
         finally:
             doc.close()
     
+    @staticmethod
+    def get_page_info_from_page(page: fitz.Page, page_num: int) -> dict:
+        """
+        Get basic information about an already opened PDF page.
+        
+        Args:
+            page: PyMuPDF page object
+            page_num: Page number (0-indexed)
+            
+        Returns:
+            Dictionary with page information
+        """
+        rect = page.rect
+        
+        return {
+            'page_number': page_num,
+            'width': rect.width,
+            'height': rect.height,
+            'rotation': page.rotation,
+            'has_text': bool(page.get_text().strip()),
+            'block_count': len(page.get_text("dict")["blocks"])
+        }
+    
     @staticmethod
     def analyze_layout_structure(pdf_path: str) -> dict:
         """
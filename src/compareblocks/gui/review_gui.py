@@ -24,6 +24,7 @@ from ..gbg.types import BoundingBox
 from ..gbg.processor import GBGProcessor
 from ..consensus.score import ConsensusScorer, VariationScore
 from ..mapping.variation_block import VariationBlock, VariationType
+from ..mapping.match import batch_iou, boxes_to_array
 from ..io.loader import NDJSONLoader
 from ..io.writer import NDJSONWriter
 from ..config.file_manager import file_manager
@@ -140,9 +141,9 @@ class ReviewDataManager:
         if variation.block_id and variation.block_id in self.variation_blocks:
             return variation.block_id
         
-        # Otherwise, find best matching block by IoU
-        best_match = None
-        best_iou = 0.0
+        # Otherwise, find best matching block by IoU against same-page seed variations
+        candidate_ids = []
+        candidate_boxes = []
         
         for block_id, existing_variations in self.variation_blocks.items():
             if not existing_variations:
@@ -154,14 +155,19 @@ class ReviewDataManager:
             if seed_variation.page != variation.page:
                 continue
             
-            # Calculate IoU
-            iou = self._calculate_iou(variation.bbox, seed_variation.bbox)
-            
-            if iou > best_iou and iou > 0.3:  # Minimum IoU threshold
-                best_match = block_id
-                best_iou = iou
+            candidate_ids.append(block_id)
+            candidate_boxes.append(seed_variation.bbox)
+        
+        if not candidate_ids:
+            return None
+        
+        ious = batch_iou(boxes_to_array([variation.bbox]), boxes_to_array(candidate_boxes))[0]
+        best_index = int(ious.argmax())
+        
+        if ious[best_index] > 0.3:  # Minimum IoU threshold
+            return candidate_ids[best_index]
         
-        return best_match
+        return None
     
     def _calculate_iou(self, bbox1: BoundingBox, bbox2: BoundingBox) -> float:
         """Calculate Intersection over Union for two bounding boxes."""
@@ -2,14 +2,50 @@
 
 """
 I/O module for NDJSON schema validation and processing.
+
+The variation store and columnar formats load numpy and pyarrow, so they are
+imported on first attribute access.
 """
 
+import importlib
+
 from .loader import NDJSONLoader, ValidationException, load_ndjson_file, validate_ndjson_record
-from .writer import NDJSONWriter, AnalyticsWriter, ExportException, write_consensus_file, write_analytics_file
+from .writer import (
+    NDJSONWriter, AnalyticsWriter, StreamingConsensusWriter, ExportException, write_consensus_file,
+    write_consensus_stream, write_analytics_file
+)
 from .schemas import get_input_schema, get_consensus_schema
 
+# Public name -> submodule providing it
+_LAZY_ATTRIBUTES = {
+    'VariationStore': '.variation_store',
+    'open_variation_store': '.variation_store',
+    'ColumnarWriter': '.columnar',
+    'ColumnarLoader': '.columnar',
+    'PYARROW_AVAILABLE': '.columnar',
+    'write_columnar_file': '.columnar',
+    'load_columnar_file': '.columnar',
+}
+
 __all__ = [
     'NDJSONLoader', 'ValidationException', 'load_ndjson_file', 'validate_ndjson_record',
-    'NDJSONWriter', 'AnalyticsWriter', 'ExportException', 'write_consensus_file', 'write_analytics_file',
+    'NDJSONWriter', 'AnalyticsWriter', 'StreamingConsensusWriter', 'ExportException', 'write_consensus_file',
+    'write_consensus_stream', 'write_analytics_file',
+    'VariationStore', 'open_variation_store',
+    'ColumnarWriter', 'ColumnarLoader', 'PYARROW_AVAILABLE', 'write_columnar_file', 'load_columnar_file',
     'get_input_schema', 'get_consensus_schema'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the submodule providing a public name on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
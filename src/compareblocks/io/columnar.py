@@ -0,0 +1,503 @@
+# src/compareblocks/io/columnar.py
+
+"""
+Columnar (Arrow IPC / Parquet) export and import for input variations and consensus decisions.
+Records are validated against the same JSON schemas as NDJSON and round-trip to the same dicts.
+"""
+
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .loader import NDJSONLoader, ValidationException, VALIDATION_MODES, parse_json_line
+from .schema_compiler import compile_schema
+from .schemas import get_consensus_schema, get_input_schema
+from .writer import NDJSONWriter, ExportException
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# File suffixes and the columnar format they select
+COLUMNAR_FORMATS = {".arrow": "arrow", ".feather": "arrow", ".parquet": "parquet"}
+
+# Rows per record batch (Arrow) or row group (Parquet) when writing
+DEFAULT_BATCH_ROWS = 65536
+
+# Column encodings:
+#   category - dictionary-encoded string (engines, documents, decision reasons)
+#   page     - dictionary-encoded int32
+#   bbox     - fixed-size list of 4 float64
+#   scores   - map<string, float64> for engine_scores
+#   json     - free-form objects stored as JSON text
+VARIATION_COLUMNS: List[Tuple[str, str]] = [
+    ("doc_id", "category"), ("page", "page"), ("engine", "category"), ("raw_text", "string"),
+    ("block_id", "string"), ("bbox", "bbox"), ("confidence", "float64"), ("orientation", "float64"),
+    ("metadata", "json"),
+]
+
+CONSENSUS_COLUMNS: List[Tuple[str, str]] = [
+    ("doc_id", "category"), ("page", "page"), ("block_id", "string"), ("selected_engine", "category"),
+    ("final_text", "string"), ("decision_reason", "category"), ("engine_scores", "scores"),
+    ("anomaly_score", "float64"), ("character_consistency_score", "float64"), ("bbox", "bbox"),
+    ("consensus_score", "float64"), ("variations_count", "int64"), ("manual_override", "bool"),
+    ("processing_metadata", "json"), ("word_consistency_score", "float64"),
+    ("spelling_accuracy_score", "float64"), ("consistency_details", "json"),
+]
+
+RECORD_KINDS = {"variations": VARIATION_COLUMNS, "consensus": CONSENSUS_COLUMNS}
+
+RECORD_SCHEMAS = {"variations": get_input_schema, "consensus": get_consensus_schema}
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("Columnar export requires pyarrow. Install with: pip install pyarrow")
+
+
+def _columns_for(kind: str) -> List[Tuple[str, str]]:
+    if kind not in RECORD_KINDS:
+        raise ValueError(f"Unknown record kind: {kind} (expected one of {tuple(RECORD_KINDS)})")
+    return RECORD_KINDS[kind]
+
+
+def columnar_format(file_path: Path, file_format: Optional[str] = None) -> str:
+    """
+    Resolve the columnar format for a file.
+
+    Args:
+        file_path: Columnar file path
+        file_format: Explicit format ("arrow" or "parquet"); taken from the suffix when None
+
+    Returns:
+        "arrow" or "parquet"
+    """
+    if file_format is None:
+        file_format = COLUMNAR_FORMATS.get(Path(file_path).suffix.lower())
+        if file_format is None:
+            raise ValueError(f"Cannot infer columnar format from {file_path} (use one of {tuple(COLUMNAR_FORMATS)})")
+    if file_format not in set(COLUMNAR_FORMATS.values()):
+        raise ValueError(f"Unknown columnar format: {file_format}")
+    return file_format
+
+
+def _arrow_type(encoding: str) -> "pa.DataType":
+    return {
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "page": pa.dictionary(pa.int32(), pa.int32()),
+        "string": pa.string(),
+        "float64": pa.float64(),
+        "int64": pa.int64(),
+        "bool": pa.bool_(),
+        "bbox": pa.list_(pa.float64(), 4),
+        "scores": pa.map_(pa.string(), pa.float64()),
+        "json": pa.string(),
+    }[encoding]
+
+
+def arrow_schema(kind: str) -> "pa.Schema":
+    """
+    Get the Arrow schema for a record kind.
+
+    Args:
+        kind: "variations" (input schema) or "consensus" (output schema)
+
+    Returns:
+        Arrow schema; absent optional fields are stored as nulls
+    """
+    _require_pyarrow()
+    return pa.schema([pa.field(name, _arrow_type(encoding)) for name, encoding in _columns_for(kind)])
+
+
+def records_to_batch(records: List[Dict[str, Any]], kind: str,
+                     dictionaries: Optional[Dict[str, Dict[Any, int]]] = None) -> "pa.RecordBatch":
+    """
+    Convert validated records into an Arrow record batch.
+
+    Args:
+        records: Records of one kind (already validated and normalized)
+        kind: "variations" or "consensus"
+        dictionaries: Value codes per dictionary-encoded column, shared across the
+                      batches of one file so each batch only extends the dictionaries
+
+    Returns:
+        Record batch with the kind's Arrow schema
+    """
+    if dictionaries is None:
+        dictionaries = {}
+    columns = _columns_for(kind)
+    known = {name for name, _ in columns}
+    arrays = []
+    for name, encoding in columns:
+        values = [record.get(name) for record in records]
+        if encoding == "json":
+            values = [None if value is None else json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+                      for value in values]
+        elif encoding == "scores":
+            values = [None if value is None else list(value.items()) for value in values]
+        arrow_type = _arrow_type(encoding)
+        if pa.types.is_dictionary(arrow_type):
+            codes = dictionaries.setdefault(name, {})
+            indices = [None if value is None else codes.setdefault(value, len(codes)) for value in values]
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(indices, type=arrow_type.index_type), pa.array(list(codes), type=arrow_type.value_type)
+            ))
+        else:
+            arrays.append(pa.array(values, type=arrow_type))
+    for record in records:
+        unknown = set(record) - known
+        if unknown:
+            raise ExportException(f"Fields without a column: {sorted(unknown)}")
+    return pa.RecordBatch.from_arrays(arrays, schema=arrow_schema(kind))
+
+
+def _column_values(column: "pa.ChunkedArray") -> List[Any]:
+    """Column values as Python objects, converting each dictionary value once per chunk."""
+    if pa.types.is_dictionary(column.type):
+        values = []
+        for chunk in column.chunks:
+            dictionary = chunk.dictionary.to_pylist()
+            values.extend(None if code is None else dictionary[code] for code in chunk.indices.to_pylist())
+        return values
+    if pa.types.is_fixed_size_list(column.type):
+        values = []
+        for chunk in column.chunks:
+            items = chunk.flatten()
+            if chunk.null_count or items.null_count:
+                values.extend(chunk.to_pylist())
+            else:
+                values.extend(items.to_numpy().reshape(-1, column.type.list_size).tolist())
+        return values
+    return column.to_pylist()
+
+
+def table_to_records(table: "pa.Table", kind: str) -> List[Dict[str, Any]]:
+    """
+    Convert an Arrow table back into records; null columns are left out of each record.
+
+    Args:
+        table: Table with the kind's columns
+        kind: "variations" or "consensus"
+
+    Returns:
+        Records in table order
+    """
+    decoded = []
+    for name, encoding in _columns_for(kind):
+        values = _column_values(table.column(name))
+        if encoding == "json":
+            values = [None if value is None else parse_json_line(value) for value in values]
+        elif encoding == "scores":
+            values = [None if value is None else dict(value) for value in values]
+        decoded.append((name, values))
+
+    records = [{} for _ in range(table.num_rows)]
+    for name, values in decoded:
+        for record, value in zip(records, values):
+            if value is not None:
+                record[name] = value
+    return records
+
+
+def _rows_with_null_items(column: "pa.ChunkedArray") -> np.ndarray:
+    """Row indices of list or map values that contain a null item."""
+    if pa.types.is_map(column.type):
+        column = column.cast(pa.list_(pa.struct([column.type.key_field, column.type.item_field])))
+        items = pc.struct_field(pc.list_flatten(column), [1])
+    else:
+        items = pc.list_flatten(column)
+    parents = pc.list_parent_indices(column).to_numpy()
+    return parents[pc.is_null(items).to_numpy(zero_copy_only=False)]
+
+
+def certain_rows(table: "pa.Table", kind: str) -> np.ndarray:
+    """
+    Find rows whose columns certainly satisfy the kind's JSON schema, using column-wide checks.
+
+    Column types already guarantee the JSON types and additionalProperties.
+    This checks required columns for nulls, numeric ranges, enums, and null
+    bbox or score items. JSON-text columns are not checked here. Like
+    compile_schema, False only means "not certain": those rows need the
+    per-record validator, which also produces the error message.
+
+    Args:
+        table: Table with the kind's Arrow schema
+        kind: "variations" or "consensus"
+
+    Returns:
+        Boolean array, one entry per row
+    """
+    schema = RECORD_SCHEMAS[kind]()
+    required = set(schema.get("required", []))
+    certain = np.ones(table.num_rows, dtype=bool)
+    for name, encoding in _columns_for(kind):
+        column = table.column(name)
+        subschema = schema["properties"][name]
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        if name in required:
+            certain &= pc.is_valid(column).to_numpy(zero_copy_only=False)
+        checks = []
+        if "minimum" in subschema:
+            checks.append(pc.greater_equal(column, subschema["minimum"]))
+        if "maximum" in subschema:
+            checks.append(pc.less_equal(column, subschema["maximum"]))
+        if "enum" in subschema:
+            checks.append(pc.is_in(column, value_set=pa.array(subschema["enum"], type=column.type)))
+        for check in checks:
+            # Nulls are absent optional fields; NaN compares false and is left to the validator
+            certain &= check.fill_null(True).to_numpy(zero_copy_only=False)
+        if encoding in ("bbox", "scores"):
+            certain[_rows_with_null_items(column)] = False
+    return certain
+
+
+class ColumnarWriter:
+    """Writes input variations or consensus decisions to Arrow IPC or Parquet files."""
+
+    def __init__(self, kind: str = "consensus", validate_output: bool = True,
+                 batch_rows: int = DEFAULT_BATCH_ROWS):
+        """
+        Initialize the columnar writer.
+
+        Args:
+            kind: "consensus" (output schema) or "variations" (input schema)
+            validate_output: Whether to validate records against the schema before writing
+            batch_rows: Rows per Arrow record batch or Parquet row group
+        """
+        _require_pyarrow()
+        _columns_for(kind)
+        if batch_rows < 1:
+            raise ValueError("batch_rows must be at least 1")
+        self.kind = kind
+        self.validate_output = validate_output
+        self.batch_rows = batch_rows
+        self.schema = arrow_schema(kind)
+        # Schema checks and normalization are the ones the NDJSON paths use
+        self._consensus_writer = NDJSONWriter(validate_output=validate_output)
+        self._variation_loader = NDJSONLoader()
+
+    def write_file(self, records: Iterable[Dict[str, Any]], file_path, overwrite: bool = False,
+                   file_format: Optional[str] = None) -> None:
+        """
+        Write records to a columnar file in batches.
+
+        Args:
+            records: Records to write (any iterable; consumed batch by batch)
+            file_path: Output file path (str or Path); .arrow/.feather or .parquet
+            overwrite: Whether to overwrite existing files
+            file_format: Explicit format ("arrow" or "parquet")
+
+        Raises:
+            ExportException: If validation or writing fails
+            FileExistsError: If file exists and overwrite=False
+        """
+        file_path = Path(file_path)
+        file_format = columnar_format(file_path, file_format)
+
+        if file_path.exists() and not overwrite:
+            raise FileExistsError(f"Output file already exists: {file_path}")
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            if file_format == "parquet":
+                with pq.ParquetWriter(str(file_path), self.schema) as writer:
+                    for batch in self._batches(records):
+                        writer.write_batch(batch, row_group_size=self.batch_rows)
+            else:
+                with pa.OSFile(str(file_path), 'wb') as sink, pa_ipc.new_file(
+                    sink, self.schema, options=pa_ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+                ) as writer:
+                    for batch in self._batches(records):
+                        writer.write_batch(batch)
+        except (ExportException, pa.ArrowException, OSError) as e:
+            # Do not leave a truncated file behind
+            file_path.unlink(missing_ok=True)
+            raise ExportException(f"Failed to write columnar file {file_path}: {e}")
+
+    def _batches(self, records: Iterable[Dict[str, Any]]) -> Iterable["pa.RecordBatch"]:
+        """Validate and convert records batch_rows at a time."""
+        iterator = iter(records)
+        dictionaries: Dict[str, Dict[Any, int]] = {}
+        offset = 0
+        while True:
+            chunk = list(islice(iterator, self.batch_rows))
+            if not chunk:
+                return
+            prepared = [self._prepare_record(record, offset + i) for i, record in enumerate(chunk)]
+            offset += len(chunk)
+            yield records_to_batch(prepared, self.kind, dictionaries)
+
+    def _prepare_record(self, record: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """Validate and normalize one record as the NDJSON writer or loader would."""
+        if not self.validate_output:
+            return record
+        try:
+            if self.kind == "consensus":
+                return self._consensus_writer.validate_consensus_record(record)
+            return self._variation_loader.validate_record(record)
+        except (ExportException, ValidationException) as e:
+            raise ExportException(f"Failed to write record {index}: {e}")
+
+
+class ColumnarLoader:
+    """Loads input variations or consensus decisions from Arrow IPC or Parquet files."""
+
+    def __init__(self, kind: str = "variations", validate: str = "full", sample_every: int = 100):
+        """
+        Initialize the columnar loader.
+
+        Args:
+            kind: "variations" (input schema) or "consensus" (output schema)
+            validate: Schema validation mode for loaded records ("full", "sample" or "off")
+            sample_every: Row interval for "sample" validation
+        """
+        _require_pyarrow()
+        _columns_for(kind)
+        if validate not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode: {validate} (expected one of {VALIDATION_MODES})")
+        self.kind = kind
+        self.validate = validate
+        self.sample_every = sample_every
+        self.schema = arrow_schema(kind)
+        self._variation_loader = NDJSONLoader(validate=validate, sample_every=sample_every)
+        self._consensus_writer = NDJSONWriter(validate_output=True)
+        properties = RECORD_SCHEMAS[kind]()["properties"]
+        self._nested_checks = [(name, compile_schema(properties[name]))
+                               for name, encoding in _columns_for(kind) if encoding == "json"]
+
+    def load_table(self, file_path, file_format: Optional[str] = None) -> "pa.Table":
+        """
+        Load a columnar file as an Arrow table.
+
+        Arrow IPC files are memory-mapped and read without copying; Parquet
+        files are decoded. Both are returned with the kind's Arrow schema.
+
+        Args:
+            file_path: Columnar file path (str or Path)
+            file_format: Explicit format ("arrow" or "parquet")
+
+        Returns:
+            Arrow table
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValidationException: If the file's columns do not match the kind
+        """
+        file_path = Path(file_path)
+        file_format = columnar_format(file_path, file_format)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Columnar file not found: {file_path}")
+
+        if file_format == "parquet":
+            table = pq.read_table(str(file_path))
+        else:
+            table = pa_ipc.open_file(pa.memory_map(str(file_path), 'r')).read_all()
+
+        if set(table.column_names) != set(self.schema.names):
+            raise ValidationException(
+                f"Columns {sorted(table.column_names)} do not match the {self.kind} schema {sorted(self.schema.names)}"
+            )
+        if not table.schema.equals(self.schema):
+            table = self._conform(table.select(self.schema.names))
+        return table
+
+    def _conform(self, table: "pa.Table") -> "pa.Table":
+        """Bring a table read from another writer or from Parquet to the kind's Arrow schema."""
+        columns = []
+        for field, column in zip(self.schema, table.columns):
+            if pa.types.is_dictionary(field.type) and not pa.types.is_dictionary(column.type):
+                # Parquet restores dictionary-encoded integers as plain integers
+                column = column.cast(field.type.value_type).dictionary_encode()
+            columns.append(column.cast(field.type))
+        return pa.Table.from_arrays(columns, schema=self.schema)
+
+    def load_file(self, file_path, file_format: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Load and validate records from a columnar file.
+
+        Args:
+            file_path: Columnar file path (str or Path)
+            file_format: Explicit format ("arrow" or "parquet")
+
+        Returns:
+            Validated records; row numbers in errors are 1-based
+
+        Raises:
+            ValidationException: If any record fails validation
+            FileNotFoundError: If file doesn't exist
+        """
+        table = self.load_table(file_path, file_format)
+        records = table_to_records(table, self.kind)
+        # Only rows the column-wide checks cannot certify go through the per-record validator
+        certain = certain_rows(table, self.kind) if self.validate != "off" else None
+        for row, record in enumerate(records, 1):
+            if self.validate == "full" or (self.validate == "sample" and (row - 1) % self.sample_every == 0):
+                if not (certain[row - 1] and self._nested_values_certain(record)):
+                    self._validate(record, row)
+            if self.kind == "variations":
+                self._variation_loader._validate_mapping_requirements(record, row)
+                self._variation_loader._normalize_record(record, copy=False)
+        return records
+
+    def _nested_values_certain(self, record: Dict[str, Any]) -> bool:
+        """Check the JSON-text columns of a record with their compiled schemas."""
+        for name, is_certainly_valid in self._nested_checks:
+            value = record.get(name)
+            if value is not None and not is_certainly_valid(value):
+                return False
+        return True
+
+    def _validate(self, record: Dict[str, Any], row: int) -> None:
+        if self.kind == "variations":
+            self._variation_loader._validate_schema(record, row)
+            return
+        try:
+            self._consensus_writer.validate_consensus_record(record)
+        except ExportException as e:
+            raise ValidationException(str(e), row, record)
+
+
+def write_columnar_file(records: Iterable[Dict[str, Any]], file_path: Path, kind: str = "consensus",
+                        overwrite: bool = False) -> None:
+    """
+    Convenience function to write records to an Arrow IPC or Parquet file.
+
+    Args:
+        records: Records to write
+        file_path: Output file path (.arrow/.feather or .parquet)
+        kind: "consensus" or "variations"
+        overwrite: Whether to overwrite existing files
+
+    Raises:
+        ExportException: If export fails
+    """
+    ColumnarWriter(kind=kind).write_file(records, file_path, overwrite)
+
+
+def load_columnar_file(file_path: Path, kind: str = "variations", validate: str = "full") -> List[Dict[str, Any]]:
+    """
+    Convenience function to load and validate records from an Arrow IPC or Parquet file.
+
+    Args:
+        file_path: Columnar file path (.arrow/.feather or .parquet)
+        kind: "variations" or "consensus"
+        validate: Schema validation mode ("full", "sample" or "off")
+
+    Returns:
+        List of validated records
+
+    Raises:
+        ValidationException: If validation fails
+    """
+    return ColumnarLoader(kind=kind, validate=validate).load_file(file_path)
@@ -6,12 +6,54 @@ Provides clear error messages for malformed records and handles both block_id an
 """
 
 import json
-from typing import List, Dict, Any, Iterator, Optional
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 import jsonschema
 from jsonschema import ValidationError
 
 from .schemas import get_input_schema
+from .schema_compiler import compile_schema
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Schema validation modes: every record, every Nth record (trusted producers), or none
+VALIDATION_MODES = ("full", "sample", "off")
+
+# Lines handed to a worker process at a time by parallel loading
+DEFAULT_CHUNK_LINES = 20000
+
+
+def parse_json_line(line: str) -> Any:
+    """
+    Parse one JSON line, using orjson when it is installed.
+    
+    Lines orjson rejects are re-parsed with json, so json's extensions
+    (NaN, Infinity, big integers) and error messages are kept.
+    
+    Args:
+        line: JSON text
+        
+    Returns:
+        Parsed value
+        
+    Raises:
+        json.JSONDecodeError: If the line is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
 
 
 class ValidationException(Exception):
@@ -23,6 +65,10 @@ class ValidationException(Exception):
         self.record = record
         super().__init__(self._format_message())
     
+    def __reduce__(self):
+        # Keep the line number and record when raised in a worker process
+        return (self.__class__, (self.message, self.line_number, self.record))
+    
     def _format_message(self) -> str:
         """Format the error message with context."""
         if self.line_number is not None:
@@ -33,16 +79,38 @@ class ValidationException(Exception):
 class NDJSONLoader:
     """Loads and validates NDJSON files containing text extraction variations."""
     
-    def __init__(self):
+    def __init__(self, validate: str = "full", sample_every: int = 100):
+        """
+        Initialize the loader.
+        
+        Args:
+            validate: Schema validation mode for loaded files: "full" validates every
+                      record, "sample" every sample_every-th line, "off" none (for trusted
+                      internal producers). Records are always normalized and must still
+                      have a block_id or bbox.
+            sample_every: Line interval for "sample" validation
+        """
+        if validate not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode: {validate} (expected one of {VALIDATION_MODES})")
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        
         self.schema = get_input_schema()
         self.validator = jsonschema.Draft7Validator(self.schema)
+        self.validate = validate
+        self.sample_every = sample_every
+        # Plain-Python check of the same schema; jsonschema only runs for records it cannot accept
+        self._is_certainly_valid = compile_schema(self.schema)
     
-    def load_file(self, file_path) -> List[Dict[str, Any]]:
+    def load_file(self, file_path, max_workers: int = 1,
+                  chunk_lines: int = DEFAULT_CHUNK_LINES) -> List[Dict[str, Any]]:
         """
         Load and validate an entire NDJSON file.
         
         Args:
             file_path: Path to the NDJSON file (str or Path)
+            max_workers: Worker processes for parsing (1 = in-process)
+            chunk_lines: Lines per worker task when max_workers > 1
             
         Returns:
             List of validated records
@@ -59,25 +127,11 @@ class NDJSONLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"NDJSON file not found: {file_path}")
         
-        records = []
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-                
-                try:
-                    record = json.loads(line)
-                    validated_record = self.validate_record(record, line_num)
-                    records.append(validated_record)
-                except json.JSONDecodeError as e:
-                    raise ValidationException(
-                        f"Invalid JSON: {e.msg}",
-                        line_number=line_num,
-                        record=None
-                    )
+        if max_workers > 1:
+            return self._load_file_parallel(file_path, max_workers, chunk_lines)
         
-        return records
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return self.load_lines(enumerate(f, 1))
     
     def load_stream(self, file_path: Path) -> Iterator[Dict[str, Any]]:
         """
@@ -99,20 +153,93 @@ class NDJSONLoader:
         
         with open(file_path, 'r', encoding='utf-8') as f:
             for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
+                record = self._load_line(line, line_num)
+                if record is not None:
+                    yield record
+    
+    def load_lines(self, numbered_lines: Iterable[Tuple[int, str]]) -> List[Dict[str, Any]]:
+        """
+        Parse, validate and normalize numbered NDJSON lines.
+        
+        Args:
+            numbered_lines: (line number, line) pairs
+            
+        Returns:
+            Validated records (empty lines are skipped)
+            
+        Raises:
+            ValidationException: If any record fails validation
+        """
+        records = []
+        for line_num, line in numbered_lines:
+            record = self._load_line(line, line_num)
+            if record is not None:
+                records.append(record)
+        return records
+    
+    def _load_line(self, line: str, line_num: int) -> Optional[Dict[str, Any]]:
+        """Parse and validate one line; None for empty lines."""
+        line = line.strip()
+        if not line:  # Skip empty lines
+            return None
+        
+        try:
+            record = parse_json_line(line)
+        except json.JSONDecodeError as e:
+            raise ValidationException(
+                f"Invalid JSON: {e.msg}",
+                line_number=line_num,
+                record=None
+            )
+        
+        if self.validate == "full" or (self.validate == "sample" and (line_num - 1) % self.sample_every == 0):
+            self._validate_schema(record, line_num)
+        elif not isinstance(record, dict):
+            raise ValidationException("Validation error: record is not a JSON object", line_num, None)
+        
+        self._validate_mapping_requirements(record, line_num)
+        # Parsed records are not shared with the caller, so they are normalized in place
+        return self._normalize_record(record, copy=False)
+    
+    def _load_file_parallel(self, file_path: Path, max_workers: int, chunk_lines: int) -> List[Dict[str, Any]]:
+        """Parse chunks of numbered lines in worker processes, keeping file order."""
+        if chunk_lines < 1:
+            raise ValueError("chunk_lines must be at least 1")
+        
+        records = []
+        with open(file_path, 'r', encoding='utf-8') as f:
+            numbered_lines = enumerate(f, 1)
+            # spawn avoids forking a parent that may hold MuPDF/Qt state
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                pending = deque()
+                
+                def _submit_next() -> bool:
+                    chunk = list(islice(numbered_lines, chunk_lines))
+                    if not chunk:
+                        return False
+                    pending.append(executor.submit(_load_chunk, self.validate, self.sample_every, chunk))
+                    return True
                 
-                try:
-                    record = json.loads(line)
-                    validated_record = self.validate_record(record, line_num)
-                    yield validated_record
-                except json.JSONDecodeError as e:
-                    raise ValidationException(
-                        f"Invalid JSON: {e.msg}",
-                        line_number=line_num,
-                        record=None
-                    )
+                # Bound the lines in flight; results are consumed in file order
+                while len(pending) < max_workers * 2 and _submit_next():
+                    pass
+                while pending:
+                    records.extend(pending.popleft().result())
+                    _submit_next()
+        
+        return records
+    
+    def _validate_schema(self, record: Any, line_number: Optional[int] = None) -> None:
+        """Validate against the input schema, raising ValidationException with jsonschema's message."""
+        if self._is_certainly_valid(record):
+            return
+        try:
+            self.validator.validate(record)
+        except ValidationError as e:
+            raise ValidationException(self._format_validation_error(e), line_number, record)
     
     def validate_record(self, record: Dict[str, Any], line_number: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -128,19 +255,14 @@ class NDJSONLoader:
         Raises:
             ValidationException: If validation fails
         """
-        try:
-            # Validate against schema
-            self.validator.validate(record)
-            
-            # Additional validation for mapping flexibility
-            self._validate_mapping_requirements(record, line_number)
-            
-            # Normalize and return
-            return self._normalize_record(record)
-            
-        except ValidationError as e:
-            error_msg = self._format_validation_error(e)
-            raise ValidationException(error_msg, line_number, record)
+        # Validate against schema
+        self._validate_schema(record, line_number)
+        
+        # Additional validation for mapping flexibility
+        self._validate_mapping_requirements(record, line_number)
+        
+        # Normalize and return
+        return self._normalize_record(record)
     
     def _validate_mapping_requirements(self, record: Dict[str, Any], line_number: Optional[int] = None):
         """
@@ -163,17 +285,18 @@ class NDJSONLoader:
                 record
             )
     
-    def _normalize_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def _normalize_record(self, record: Dict[str, Any], copy: bool = True) -> Dict[str, Any]:
         """
         Normalize record fields for consistent processing.
         
         Args:
             record: The record to normalize
+            copy: Normalize a copy (False normalizes the record in place)
             
         Returns:
             Normalized record
         """
-        normalized = record.copy()
+        normalized = record.copy() if copy else record
         
         # Ensure confidence is present with default value
         if 'confidence' not in normalized:
@@ -188,7 +311,8 @@ class NDJSONLoader:
             bbox = normalized['bbox']
             if len(bbox) != 4:
                 raise ValidationException(f"Bounding box must have exactly 4 elements, got {len(bbox)}")
-            normalized['bbox'] = [float(x) for x in bbox]
+            if copy or not all(type(x) is float for x in bbox):
+                normalized['bbox'] = [float(x) for x in bbox]
         
         return normalized
     
@@ -209,12 +333,25 @@ class NDJSONLoader:
             return f"Validation error: {error.message}"
 
 
-def load_ndjson_file(file_path: Path) -> List[Dict[str, Any]]:
+_worker_loaders: Dict[Tuple[str, int], NDJSONLoader] = {}
+
+
+def _load_chunk(validate: str, sample_every: int, numbered_lines: List[Tuple[int, str]]) -> List[Dict[str, Any]]:
+    """Worker entry point: load a chunk of numbered lines with a per-process loader."""
+    key = (validate, sample_every)
+    if key not in _worker_loaders:
+        _worker_loaders[key] = NDJSONLoader(validate=validate, sample_every=sample_every)
+    return _worker_loaders[key].load_lines(numbered_lines)
+
+
+def load_ndjson_file(file_path: Path, validate: str = "full", max_workers: int = 1) -> List[Dict[str, Any]]:
     """
     Convenience function to load and validate an NDJSON file.
     
     Args:
         file_path: Path to the NDJSON file
+        validate: Schema validation mode ("full", "sample" or "off")
+        max_workers: Worker processes for parsing (1 = in-process)
         
     Returns:
         List of validated records
@@ -222,8 +359,8 @@ def load_ndjson_file(file_path: Path) -> List[Dict[str, Any]]:
     Raises:
         ValidationException: If validation fails
     """
-    loader = NDJSONLoader()
-    return loader.load_file(file_path)
+    loader = NDJSONLoader(validate=validate)
+    return loader.load_file(file_path, max_workers=max_workers)
 
 
 def validate_ndjson_record(record: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,320 @@
+# src/compareblocks/io/raster.py
+"""
+Document-level page rasterization shared by OCR engines and image analysis.
+Each (page, DPI, colorspace) is rendered once and served as read-only NumPy views.
+"""
+
+import atexit
+import shutil
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import fitz  # PyMuPDF
+import numpy as np
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+COLORSPACES = {
+    "rgb": fitz.csRGB,
+    "gray": fitz.csGRAY,
+}
+
+_PIL_MODES = {"rgb": "RGB", "gray": "L"}
+
+
+@dataclass(frozen=True)
+class RasterKey:
+    """Identifies one rendered page image."""
+    page: int
+    dpi: float
+    colorspace: str
+
+
+def _render_pixels(page: fitz.Page, dpi: float, colorspace: str) -> np.ndarray:
+    """Render a page into a (height, width, channels) uint8 array that owns its memory."""
+    scale = dpi / 72
+    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=COLORSPACES[colorspace], alpha=False)
+    # The copy lets the array outlive the pixmap; rows are then trimmed of stride padding
+    samples = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)
+    return samples[:, :pix.width * pix.n].reshape(pix.height, pix.width, pix.n)
+
+
+class PageRasterCache:
+    """Renders pages of one PDF on demand and keeps them in a memory-bounded LRU."""
+
+    def __init__(self, pdf_path: str, max_bytes: int = 512 * 1024 * 1024,
+                 spill: bool = True, spill_dir: Optional[str] = None):
+        """
+        Initialize the raster cache.
+
+        Args:
+            pdf_path: Path to the PDF file
+            max_bytes: In-memory budget for rendered pages
+            spill: Write evicted pages to memory-mapped files instead of dropping them
+            spill_dir: Directory for spilled pages (defaults to a private temporary directory)
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+
+        self.pdf_path = str(pdf_path)
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self._spill_root = Path(spill_dir) if spill_dir else None
+        self._spill_path: Optional[Path] = None
+        self._doc: Optional[fitz.Document] = None
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[RasterKey, np.ndarray]" = OrderedDict()
+        self._spilled: Dict[RasterKey, np.ndarray] = {}
+        self.memory_bytes = 0
+        self.render_counts: Counter = Counter()
+        self.hits = 0
+
+    @property
+    def render_count(self) -> int:
+        """Total number of page renders performed."""
+        return sum(self.render_counts.values())
+
+    def get_array(self, page_num: int, dpi: float = 72, colorspace: str = "rgb",
+                  page: Optional[fitz.Page] = None) -> np.ndarray:
+        """
+        Get a page image as a read-only (height, width, channels) uint8 array.
+
+        Args:
+            page_num: Page number (0-indexed)
+            dpi: Render resolution
+            colorspace: "rgb" or "gray"
+            page: Open page of this PDF to render from (the cache opens its own handle if None)
+
+        Returns:
+            Read-only array shared with every other caller of the same key
+        """
+        if colorspace not in COLORSPACES:
+            raise ValueError(f"Unknown colorspace: {colorspace}")
+
+        key = RasterKey(page=page_num, dpi=float(dpi), colorspace=colorspace)
+        with self._lock:
+            array = self._memory.get(key)
+            if array is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return array
+
+            array = self._spilled.get(key)
+            if array is not None:
+                self.hits += 1
+                return array
+
+            array = self._render(key, page)
+            self._memory[key] = array
+            self.memory_bytes += array.nbytes
+            self._evict()
+            return array
+
+    def get_pil_image(self, page_num: int, dpi: float = 72, colorspace: str = "rgb"):
+        """
+        Get a page image as a PIL image backed by the cached buffer.
+
+        Args:
+            page_num: Page number (0-indexed)
+            dpi: Render resolution
+            colorspace: "rgb" or "gray"
+
+        Returns:
+            PIL.Image.Image
+        """
+        if not PIL_AVAILABLE:
+            raise ImportError("Pillow is required for PIL page images")
+
+        array = self.get_array(page_num, dpi, colorspace)
+        height, width = array.shape[:2]
+        mode = _PIL_MODES[colorspace]
+        return Image.frombuffer(mode, (width, height), array, "raw", mode, 0, 1)
+
+    def get_cache_info(self) -> Dict[str, int]:
+        """Get render, hit and memory statistics."""
+        with self._lock:
+            return {
+                "renders": self.render_count,
+                "hits": self.hits,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self.memory_bytes,
+                "spilled_entries": len(self._spilled),
+                "max_bytes": self.max_bytes
+            }
+
+    def close(self) -> None:
+        """Release rendered pages, spill files and the document handle."""
+        with self._lock:
+            self._memory.clear()
+            self._spilled.clear()
+            self.memory_bytes = 0
+            if self._doc is not None:
+                self._doc.close()
+                self._doc = None
+            if self._spill_path is not None:
+                shutil.rmtree(self._spill_path, ignore_errors=True)
+            self._spill_path = None
+
+    def _render(self, key: RasterKey, page: Optional[fitz.Page] = None) -> np.ndarray:
+        """Render one page image, from the caller's page when given, else the cache's own handle."""
+        if page is None:
+            if self._doc is None:
+                self._doc = fitz.open(self.pdf_path)
+            page = self._doc[key.page]
+
+        array = _render_pixels(page, key.dpi, key.colorspace)
+        self.render_counts[key] += 1
+        array.setflags(write=False)
+        return array
+
+    def _evict(self) -> None:
+        """Move least-recently-used pages out of memory until within budget."""
+        while self.memory_bytes > self.max_bytes and len(self._memory) > 1:
+            key, array = self._memory.popitem(last=False)
+            self.memory_bytes -= array.nbytes
+            if self.spill:
+                self._spilled[key] = self._spill_to_disk(key, array)
+
+    def _spill_to_disk(self, key: RasterKey, array: np.ndarray) -> np.ndarray:
+        """Write a page image to a memory-mapped file and return a read-only map of it."""
+        if self._spill_path is None:
+            if self._spill_root is not None:
+                self._spill_root.mkdir(parents=True, exist_ok=True)
+            self._spill_path = Path(tempfile.mkdtemp(
+                prefix="raster_", dir=str(self._spill_root) if self._spill_root else None
+            ))
+
+        path = self._spill_path / f"p{key.page}_{key.dpi:g}dpi_{key.colorspace}.raw"
+        mapped = np.memmap(path, dtype=np.uint8, mode='w+', shape=array.shape)
+        mapped[:] = array
+        mapped.flush()
+        del mapped
+        return np.memmap(path, dtype=np.uint8, mode='r', shape=array.shape)
+
+
+@dataclass
+class _SharedCache:
+    """A shared cache, the file state it was created for and its open scopes."""
+    signature: Tuple[int, int]
+    cache: PageRasterCache
+    users: int = 0
+
+
+# Caches of PDFs inside an open page_raster_scope, keyed by resolved path
+_shared_caches: Dict[str, _SharedCache] = {}
+_shared_lock = threading.Lock()
+
+
+def _file_signature(resolved: str) -> Tuple[int, int]:
+    stat = Path(resolved).stat()
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+@contextmanager
+def page_raster_scope(pdf_path: str, **kwargs) -> Iterator[PageRasterCache]:
+    """
+    Share page renders of a PDF for the duration of an extraction run.
+
+    While a scope is open, render_page_array serves pages of the file from one
+    cache, so engines and passes running inside it render each page once.
+    Scopes nest: the cache, its document handle and any spill files are
+    released when the outermost scope for the file exits.
+
+    Args:
+        pdf_path: Path to the PDF file
+        **kwargs: PageRasterCache options used when a new cache is created
+
+    Yields:
+        PageRasterCache for the file's current content
+    """
+    resolved = str(Path(pdf_path).resolve())
+    signature = _file_signature(resolved)
+
+    with _shared_lock:
+        entry = _shared_caches.get(resolved)
+        if entry is None or entry.signature != signature:
+            # A changed file gets a new cache; the stale one closes with its last scope
+            entry = _SharedCache(signature, PageRasterCache(resolved, **kwargs))
+            _shared_caches[resolved] = entry
+        entry.users += 1
+
+    try:
+        yield entry.cache
+    finally:
+        with _shared_lock:
+            entry.users -= 1
+            if entry.users == 0:
+                if _shared_caches.get(resolved) is entry:
+                    del _shared_caches[resolved]
+                entry.cache.close()
+
+
+def get_page_raster_cache(pdf_path: str) -> Optional[PageRasterCache]:
+    """
+    Get the shared raster cache of a PDF inside an open page_raster_scope.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        PageRasterCache for the file's current content, or None outside a scope
+    """
+    resolved = str(Path(pdf_path).resolve())
+    with _shared_lock:
+        entry = _shared_caches.get(resolved)
+    if entry is None or entry.signature != _file_signature(resolved):
+        return None
+    return entry.cache
+
+
+def release_page_raster_cache(pdf_path: Optional[str] = None) -> None:
+    """
+    Close shared raster caches and delete their spill files, even inside open scopes.
+
+    Args:
+        pdf_path: PDF whose cache to close (None = all)
+    """
+    with _shared_lock:
+        if pdf_path is None:
+            paths = list(_shared_caches)
+        else:
+            paths = [str(Path(pdf_path).resolve())]
+        for path in paths:
+            entry = _shared_caches.pop(path, None)
+            if entry is not None:
+                entry.cache.close()
+
+
+# Spill directories live in the temporary directory, so remove them at interpreter exit
+atexit.register(release_page_raster_cache)
+
+
+def render_page_array(page: fitz.Page, dpi: float = 72, colorspace: str = "rgb") -> np.ndarray:
+    """
+    Render an open page, sharing the render inside a page_raster_scope of its file.
+
+    Outside a scope (or for in-memory documents) the page is rendered directly.
+
+    Args:
+        page: PyMuPDF page object
+        dpi: Render resolution
+        colorspace: "rgb" or "gray"
+
+    Returns:
+        (height, width, channels) uint8 array; read-only when served from a shared cache
+    """
+    doc_path = page.parent.name if page.parent is not None else ""
+    cache = get_page_raster_cache(doc_path) if doc_path and Path(doc_path).is_file() else None
+    if cache is not None:
+        return cache.get_array(page.number, dpi, colorspace, page=page)
+    return np.ascontiguousarray(_render_pixels(page, dpi, colorspace))
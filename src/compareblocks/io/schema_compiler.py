@@ -0,0 +1,132 @@
+# src/compareblocks/io/schema_compiler.py
+
+"""
+Compiles the subset of JSON Schema used by the NDJSON schemas into plain Python predicates.
+A compiled predicate only answers "certainly valid"; anything else is left to jsonschema for the exact error.
+"""
+
+import re
+from typing import Any, Callable, Dict, List
+
+# Keywords that only document a schema
+_ANNOTATION_KEYWORDS = {"$schema", "description", "title", "$comment"}
+
+_SUPPORTED_KEYWORDS = _ANNOTATION_KEYWORDS | {
+    "type", "required", "properties", "patternProperties", "additionalProperties",
+    "items", "minItems", "maxItems", "minimum", "maximum", "enum"
+}
+
+SchemaPredicate = Callable[[Any], bool]
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) is int or type(value) is float
+
+
+# Strict type tests: values jsonschema also accepts (such as 1.0 for "integer") fall back to it
+_TYPE_CHECKS: Dict[str, SchemaPredicate] = {
+    "string": lambda value: type(value) is str,
+    "integer": lambda value: type(value) is int,
+    "number": _is_number,
+    "object": lambda value: type(value) is dict,
+    "array": lambda value: type(value) is list,
+    "boolean": lambda value: type(value) is bool,
+    "null": lambda value: value is None,
+}
+
+
+def _never_valid(value: Any) -> bool:
+    return False
+
+
+def compile_schema(schema: Dict[str, Any]) -> SchemaPredicate:
+    """
+    Compile a Draft 7 schema into a predicate.
+
+    The predicate returns True only for instances that certainly satisfy the
+    schema. False means "not certain": the caller must run the full validator,
+    which also produces the error message. Unsupported keywords make every
+    instance uncertain, so the predicate never accepts an invalid record.
+
+    Args:
+        schema: JSON Schema (dict)
+
+    Returns:
+        Predicate taking a parsed JSON value
+    """
+    if not isinstance(schema, dict) or set(schema) - _SUPPORTED_KEYWORDS:
+        return _never_valid
+
+    checks: List[SchemaPredicate] = []
+
+    if "type" in schema:
+        if not isinstance(schema["type"], str) or schema["type"] not in _TYPE_CHECKS:
+            return _never_valid
+        checks.append(_TYPE_CHECKS[schema["type"]])
+
+    if "enum" in schema:
+        options = list(schema["enum"])
+        checks.append(lambda value: any(type(value) is type(option) and value == option for option in options))
+
+    if "minimum" in schema or "maximum" in schema:
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+
+        def check_range(value: Any) -> bool:
+            if not _is_number(value):
+                return True
+            if minimum is not None and not minimum <= value:
+                return False
+            return maximum is None or value <= maximum
+        checks.append(check_range)
+
+    if {"items", "minItems", "maxItems"} & set(schema):
+        item_check = compile_schema(schema["items"]) if "items" in schema else None
+        min_items = schema.get("minItems", 0)
+        max_items = schema.get("maxItems")
+        if isinstance(schema.get("items"), list):
+            return _never_valid  # Tuple validation is not supported
+
+        def check_array(value: Any) -> bool:
+            if type(value) is not list:
+                return True
+            if len(value) < min_items or (max_items is not None and len(value) > max_items):
+                return False
+            return item_check is None or all(item_check(item) for item in value)
+        checks.append(check_array)
+
+    if {"required", "properties", "patternProperties", "additionalProperties"} & set(schema):
+        required = list(schema.get("required", []))
+        properties = {name: compile_schema(subschema) for name, subschema in schema.get("properties", {}).items()}
+        patterns = [(re.compile(pattern), compile_schema(subschema))
+                    for pattern, subschema in schema.get("patternProperties", {}).items()]
+        additional = schema.get("additionalProperties", True)
+        if additional not in (True, False):
+            return _never_valid  # Schema-valued additionalProperties is not supported
+
+        def check_object(value: Any) -> bool:
+            if type(value) is not dict:
+                return True
+            for name in required:
+                if name not in value:
+                    return False
+            for name, item in value.items():
+                known = False
+                property_check = properties.get(name)
+                if property_check is not None:
+                    known = True
+                    if not property_check(item):
+                        return False
+                for pattern, pattern_check in patterns:
+                    if type(name) is str and pattern.search(name):
+                        known = True
+                        if not pattern_check(item):
+                            return False
+                if not known and additional is False:
+                    return False
+            return True
+        checks.append(check_object)
+
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: all(check(value) for check in checks)
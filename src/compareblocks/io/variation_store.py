@@ -0,0 +1,280 @@
+# src/compareblocks/io/variation_store.py
+
+"""
+Memory-mapped NDJSON variation store with a persistent offset index.
+Records are looked up by block_id, page or engine and only the matching lines are decoded.
+"""
+
+import mmap
+import os
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .loader import NDJSONLoader
+
+# Bumped whenever the sidecar layout changes; older sidecars are rebuilt
+INDEX_VERSION = 1
+
+# Sidecar file written next to the NDJSON file
+INDEX_SUFFIX = ".idx.npz"
+
+def default_index_path(file_path: Union[str, Path]) -> Path:
+    """Get the sidecar index path for an NDJSON file."""
+    return Path(str(file_path) + INDEX_SUFFIX)
+
+
+def _group_positions(codes: np.ndarray, mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group record positions by key code, keeping file order within each group.
+
+    Args:
+        codes: Key code per record (codes index the sorted unique keys)
+        mask: Records to include (all when None)
+
+    Returns:
+        Tuple of (record positions ordered by code, group bounds per code)
+    """
+    positions = np.arange(len(codes), dtype=np.int64)
+    if mask is not None:
+        positions = positions[mask]
+    order = positions[np.argsort(codes[positions], kind="stable")]
+    n_keys = int(codes[positions].max()) + 1 if len(positions) else 0
+    bounds = np.searchsorted(codes[order], np.arange(n_keys + 1)).astype(np.int64)
+    return order, bounds
+
+
+class VariationStore:
+    """
+    Read-only view of an NDJSON variations file.
+
+    The file is memory-mapped, so only the pages holding looked-up lines are
+    read and resident memory does not grow with the file. An offset index
+    (line start, length and number, plus per block_id/page/engine groups) is
+    built with one validating pass the first time a file is opened and saved
+    as a sidecar; it is reused while the file's size and modification time
+    are unchanged.
+    """
+
+    def __init__(self, file_path: Union[str, Path], validate: str = "full",
+                 index_path: Optional[Union[str, Path]] = None, persist_index: bool = True):
+        """
+        Open a variations file, loading or building its offset index.
+
+        Args:
+            file_path: Path to the NDJSON input variations file
+            validate: Schema validation mode used while building the index
+                      (see NDJSONLoader); lookups decode already-validated lines
+            index_path: Sidecar index path (defaults to <file>.idx.npz)
+            persist_index: Whether a newly built index is written to the sidecar
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValidationException: If a record fails validation while indexing
+        """
+        self.file_path = Path(file_path)
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"NDJSON file not found: {self.file_path}")
+
+        self.index_path = Path(index_path) if index_path is not None else default_index_path(self.file_path)
+        self.validate = validate
+        self.index_built = False
+        indexing_loader = NDJSONLoader(validate=validate)
+        # Lines were validated when indexed; decoding only parses and normalizes
+        self._reader = NDJSONLoader(validate="off")
+
+        self._file = open(self.file_path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self._source_stamp = np.array([INDEX_VERSION, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+        # Empty files cannot be mapped
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+
+        self._index = self._read_index()
+        if self._index is None:
+            self._index = self._build_index(indexing_loader)
+            self.index_built = True
+            if persist_index:
+                self._write_index()
+
+        # Lookups touch scattered lines, so read-ahead would only pull in unused pages
+        if isinstance(self._data, mmap.mmap) and hasattr(mmap, "MADV_RANDOM"):
+            self._data.madvise(mmap.MADV_RANDOM)
+
+        self._offsets = self._index["offsets"]
+        self._lengths = self._index["lengths"]
+        self._line_numbers = self._index["line_numbers"]
+
+    def __enter__(self) -> "VariationStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Decode every record in file order."""
+        for position in range(len(self)):
+            yield self.get_record(position)
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+        self._file.close()
+
+    def get_record(self, position: int) -> Dict[str, Any]:
+        """
+        Decode one record.
+
+        Args:
+            position: Record position in file order (empty lines are not counted)
+
+        Returns:
+            Normalized record
+        """
+        start = int(self._offsets[position])
+        line = self._data[start:start + int(self._lengths[position])].decode('utf-8')
+        return self._reader._load_line(line, int(self._line_numbers[position]))
+
+    def get_variations_for_block(self, block_id: str) -> List[Dict[str, Any]]:
+        """Get the records carrying a block_id, in file order."""
+        return self._decode(self._lookup("block", block_id))
+
+    def get_variations_by_page(self, page: int) -> List[Dict[str, Any]]:
+        """Get the records on a page (1-based, as in the NDJSON file), in file order."""
+        return self._decode(self._lookup("page", page))
+
+    def get_variations_by_engine(self, engine: str) -> List[Dict[str, Any]]:
+        """Get the records produced by an engine, in file order."""
+        return self._decode(self._lookup("engine", engine))
+
+    def block_ids(self) -> List[str]:
+        """Get the sorted unique block_ids in the file."""
+        return self._index["block_keys"].tolist()
+
+    def pages(self) -> List[int]:
+        """Get the sorted unique pages in the file."""
+        return self._index["page_keys"].tolist()
+
+    def engines(self) -> List[str]:
+        """Get the sorted unique engines in the file."""
+        return self._index["engine_keys"].tolist()
+
+    def _lookup(self, key: str, value: Any) -> np.ndarray:
+        """Find the record positions whose key equals value."""
+        keys = self._index[f"{key}_keys"]
+        code = int(np.searchsorted(keys, value))
+        if code >= len(keys) or keys[code] != value:
+            return np.empty(0, dtype=np.int64)
+        bounds = self._index[f"{key}_bounds"]
+        return self._index[f"{key}_order"][bounds[code]:bounds[code + 1]]
+
+    def _decode(self, positions: np.ndarray) -> List[Dict[str, Any]]:
+        return [self.get_record(position) for position in positions.tolist()]
+
+    def _build_index(self, loader: NDJSONLoader) -> Dict[str, np.ndarray]:
+        """Scan the file once, validating every line and recording its offsets and keys."""
+        offsets, lengths, line_numbers = array('q'), array('q'), array('q')
+        pages, block_codes, engine_codes = array('q'), array('q'), array('q')
+        block_ids: Dict[str, int] = {}
+        engines: Dict[str, int] = {}
+
+        data = self._data
+        start = 0
+        line_num = 0
+        size = len(data)
+        while start < size:
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = size
+            line_num += 1
+            record = loader._load_line(data[start:end].decode('utf-8'), line_num)
+            if record is not None:
+                offsets.append(start)
+                lengths.append(end - start)
+                line_numbers.append(line_num)
+                pages.append(record['page'])
+                block_id = record.get('block_id')
+                block_codes.append(-1 if block_id is None else block_ids.setdefault(block_id, len(block_ids)))
+                engine_codes.append(engines.setdefault(record['engine'], len(engines)))
+            start = end + 1
+
+        index = {
+            "stamp": self._source_stamp,
+            "validate": np.array(loader.validate),
+            "offsets": np.frombuffer(offsets, dtype=np.int64).copy(),
+            "lengths": np.frombuffer(lengths, dtype=np.int64).copy(),
+            "line_numbers": np.frombuffer(line_numbers, dtype=np.int64).copy(),
+        }
+
+        # Re-code by sorted key so lookups are binary searches over the keys
+        page_values = np.frombuffer(pages, dtype=np.int64)
+        page_keys, page_codes = np.unique(page_values, return_inverse=True)
+        index["page_keys"] = page_keys
+        index["page_order"], index["page_bounds"] = _group_positions(page_codes.reshape(-1))
+
+        for key, names, codes in (("block", block_ids, block_codes), ("engine", engines, engine_codes)):
+            codes = np.frombuffer(codes, dtype=np.int64)
+            sorted_names = sorted(names)
+            remap = np.empty(len(names), dtype=np.int64)
+            remap[[names[name] for name in sorted_names]] = np.arange(len(names))
+            mask = codes >= 0
+            recoded = np.full(len(codes), -1, dtype=np.int64)
+            recoded[mask] = remap[codes[mask]]
+            index[f"{key}_keys"] = np.array(sorted_names, dtype=str)
+            index[f"{key}_order"], index[f"{key}_bounds"] = _group_positions(recoded, mask)
+
+        return index
+
+    def _read_index(self) -> Optional[Dict[str, np.ndarray]]:
+        """Load the sidecar index if it matches the file and validation mode."""
+        if not self.index_path.exists():
+            return None
+        try:
+            with np.load(self.index_path, allow_pickle=False) as sidecar:
+                index = {name: sidecar[name] for name in sidecar.files}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable variation index {self.index_path}: {e}")
+            return None
+
+        if not np.array_equal(index.get("stamp"), self._source_stamp):
+            return None
+        # An index validated with a weaker mode is rebuilt under a stricter one
+        indexed_mode = str(index.get("validate", ""))
+        if indexed_mode != self.validate and indexed_mode != "full":
+            return None
+        return index
+
+    def _write_index(self) -> None:
+        """Write the index atomically; an unwritable location keeps it in memory only."""
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix=INDEX_SUFFIX, dir=self.index_path.parent)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.savez(f, **self._index)
+                os.replace(temp_path, self.index_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            print(f"Warning: Could not write variation index {self.index_path}: {e}")
+
+
+def open_variation_store(file_path: Union[str, Path], validate: str = "full") -> VariationStore:
+    """
+    Convenience function to open an indexed, memory-mapped variations file.
+
+    Args:
+        file_path: Path to the NDJSON input variations file
+        validate: Schema validation mode used when the index is built
+
+    Returns:
+        VariationStore for per-block, per-page and per-engine lookups
+    """
+    return VariationStore(file_path, validate=validate)
@@ -5,13 +5,34 @@ NDJSON export functionality for consensus decisions and analytics.
 Ensures exported NDJSON maintains compatibility with import schema and includes all required fields.
 """
 
+import gzip
 import json
-from typing import List, Dict, Any, Optional, TextIO
+import os
+import uuid
+from typing import List, Dict, Any, BinaryIO, Iterable, Optional, TextIO
 from pathlib import Path
 import jsonschema
 from jsonschema import ValidationError
 
 from .schemas import get_consensus_schema
+from .schema_compiler import compile_schema
+
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
+
+
+# Schema validation modes for streamed output: every record, every Nth record, or none
+STREAM_VALIDATION_MODES = ("full", "sample", "off")
+
+# Output compression and the file suffix that selects it
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+# Serialized records buffered before each write to the output file
+DEFAULT_BATCH_RECORDS = 1000
 
 
 class ExportException(Exception):
@@ -33,6 +54,8 @@ class NDJSONWriter:
         if validate_output:
             self.schema = get_consensus_schema()
             self.validator = jsonschema.Draft7Validator(self.schema)
+            # Plain-Python check of the same schema; jsonschema only runs for records it cannot accept
+            self._is_certainly_valid = compile_schema(self.schema)
     
     def write_file(self, records: List[Dict[str, Any]], file_path, overwrite: bool = False) -> None:
         """
@@ -117,7 +140,8 @@ class NDJSONWriter:
         """
         try:
             # Validate against schema
-            self.validator.validate(record)
+            if not self._is_certainly_valid(record):
+                self.validator.validate(record)
             
             # Normalize and return
             return self._normalize_consensus_record(record)
@@ -180,6 +204,180 @@ class NDJSONWriter:
             return f"Validation error: {error.message}"
 
 
+class StreamingConsensusWriter:
+    """
+    Incrementally writes consensus records to NDJSON with bounded memory.
+    
+    Records are serialized into a buffer and written batch_size at a time to a
+    temporary file next to the destination. close() renames it into place, so
+    readers never see a partial file; a failed or aborted write leaves any
+    existing destination untouched.
+    """
+    
+    def __init__(self, file_path, overwrite: bool = False, validate: str = "sample",
+                 sample_every: int = 100, batch_size: int = DEFAULT_BATCH_RECORDS,
+                 compression: Optional[str] = None):
+        """
+        Open a streaming writer.
+        
+        Args:
+            file_path: Output file path (str or Path)
+            overwrite: Whether to replace an existing file when the write completes
+            validate: Schema validation mode: "full" validates every record, "sample"
+                      every sample_every-th record (starting with the first), "off" none.
+                      Records are normalized unless validation is off.
+            sample_every: Record interval for "sample" validation
+            batch_size: Records buffered between writes to the file
+            compression: "none", "gzip" or "zstd"; inferred from the suffix
+                         (.gz, .zst) when None
+            
+        Raises:
+            FileExistsError: If file exists and overwrite=False
+            ExportException: If the output cannot be opened or zstd is unavailable
+        """
+        if validate not in STREAM_VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode: {validate} (expected one of {STREAM_VALIDATION_MODES})")
+        if sample_every < 1 or batch_size < 1:
+            raise ValueError("sample_every and batch_size must be at least 1")
+        
+        self.file_path = Path(file_path)
+        if compression is None:
+            compression = COMPRESSION_SUFFIXES.get(self.file_path.suffix.lower(), "none")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression} (expected one of {COMPRESSIONS})")
+        if compression == "zstd" and not ZSTANDARD_AVAILABLE:
+            raise ExportException("zstd compression requires zstandard. Install with: pip install zstandard")
+        
+        if self.file_path.exists() and not overwrite:
+            raise FileExistsError(f"Output file already exists: {self.file_path}")
+        
+        self.validate = validate
+        self.sample_every = sample_every
+        self.batch_size = batch_size
+        self.compression = compression
+        self.records_written = 0
+        self._writer = NDJSONWriter(validate_output=validate != "off")
+        self._buffer: List[str] = []
+        self._closed = False
+        
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Created like a regular output file (umask permissions), under a unique hidden name
+        self._temp_path = self.file_path.with_name(f".{self.file_path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            self._raw = open(self._temp_path, 'xb')
+        except OSError as e:
+            raise ExportException(f"Failed to open NDJSON file {self.file_path}: {e}")
+        self._stream = self._open_compressed(self._raw)
+    
+    def _open_compressed(self, raw: BinaryIO) -> BinaryIO:
+        """Wrap the temporary file in the configured compressor."""
+        if self.compression == "gzip":
+            return gzip.GzipFile(filename=self.file_path.stem, mode='wb', fileobj=raw, mtime=0)
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+        return raw
+    
+    def __enter__(self) -> "StreamingConsensusWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Add one consensus record.
+        
+        Args:
+            record: Consensus decision record
+            
+        Raises:
+            ExportException: If the record fails validation or cannot be written
+        """
+        if self._closed:
+            raise ExportException(f"Writer for {self.file_path} is closed")
+        
+        index = self.records_written
+        try:
+            if self.validate == "full" or (self.validate == "sample" and index % self.sample_every == 0):
+                record = self._writer.validate_consensus_record(record)
+            elif self.validate == "sample":
+                record = self._writer._normalize_consensus_record(record)
+            line = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+        except Exception as e:
+            raise ExportException(f"Failed to write record {index}: {e}")
+        
+        self._buffer.append(line)
+        self.records_written += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+    
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add every record from an iterable, consuming it lazily.
+        
+        Args:
+            records: Consensus records (list, iterator or generator)
+            
+        Returns:
+            Total records written so far
+        """
+        for record in records:
+            self.write(record)
+        return self.records_written
+    
+    def flush(self) -> None:
+        """Write buffered records to the temporary file."""
+        if not self._buffer:
+            return
+        try:
+            self._stream.write(("\n".join(self._buffer) + "\n").encode('utf-8'))
+        except OSError as e:
+            raise ExportException(f"Failed to write NDJSON file {self.file_path}: {e}")
+        self._buffer.clear()
+    
+    def close(self) -> Path:
+        """
+        Flush, finish compression and atomically move the file into place.
+        
+        Returns:
+            Path of the written file
+            
+        Raises:
+            ExportException: If finalization fails (the temporary file is removed)
+        """
+        if self._closed:
+            return self.file_path
+        try:
+            self.flush()
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+            self._raw.close()
+            os.replace(self._temp_path, self.file_path)
+        except (OSError, ExportException) as e:
+            self.abort()
+            raise ExportException(f"Failed to write NDJSON file {self.file_path}: {e}")
+        self._closed = True
+        return self.file_path
+    
+    def abort(self) -> None:
+        """Discard everything written and remove the temporary file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer.clear()
+        for stream in (self._stream, self._raw):
+            try:
+                stream.close()
+            except (OSError, ValueError):
+                pass
+        self._temp_path.unlink(missing_ok=True)
+
+
 class AnalyticsWriter:
     """Specialized writer for analytics and reporting data."""
     
@@ -235,20 +433,45 @@ class AnalyticsWriter:
         self.writer.write_file(records, file_path, overwrite)
 
 
-def write_consensus_file(records: List[Dict[str, Any]], file_path: Path, overwrite: bool = False) -> None:
+def write_consensus_file(records: Iterable[Dict[str, Any]], file_path: Path, overwrite: bool = False) -> None:
     """
     Convenience function to write consensus records to NDJSON file.
     
+    Records are streamed and every record is validated; the file is only
+    replaced once all records have been written.
+    
     Args:
-        records: List of consensus decision records
+        records: Consensus decision records (list, iterator or generator)
         file_path: Output file path
         overwrite: Whether to overwrite existing files
         
     Raises:
         ExportException: If export fails
     """
-    writer = NDJSONWriter()
-    writer.write_file(records, file_path, overwrite)
+    write_consensus_stream(records, file_path, overwrite, validate="full")
+
+
+def write_consensus_stream(records: Iterable[Dict[str, Any]], file_path: Path, overwrite: bool = False,
+                           validate: str = "sample", compression: Optional[str] = None) -> int:
+    """
+    Convenience function to stream consensus records to an NDJSON file with bounded memory.
+    
+    Args:
+        records: Consensus decision records (list, iterator or generator)
+        file_path: Output file path (.gz or .zst selects compression)
+        overwrite: Whether to overwrite existing files
+        validate: Schema validation mode ("full", "sample" or "off")
+        compression: "none", "gzip" or "zstd" (inferred from the suffix when None)
+        
+    Returns:
+        Number of records written
+        
+    Raises:
+        ExportException: If export fails
+    """
+    with StreamingConsensusWriter(file_path, overwrite=overwrite, validate=validate,
+                                  compression=compression) as writer:
+        return writer.write_all(records)
 
 
 def write_analytics_file(analytics_data: Dict[str, Any], file_path: Path, overwrite: bool = False) -> None:
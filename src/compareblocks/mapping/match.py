@@ -4,11 +4,15 @@ IoU-based matching system for mapping external variations to seed blocks.
 Handles intersection-over-union calculations with configurable thresholds.
 """
 
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Sequence, Union
 from dataclasses import dataclass
+import numpy as np
 from ..gbg.types import BoundingBox, SeedBlock
 
 
+BoxArrayLike = Union[np.ndarray, Sequence[Any]]
+
+
 @dataclass
 class MatchConfig:
     """Configuration for IoU-based matching."""
@@ -28,6 +32,119 @@ class MatchResult:
     confidence: float
 
 
+@dataclass
+class BatchMatchResult:
+    """
+    Top-k seed matches for every row of a batch of external boxes.
+    
+    All arrays have shape (N, k). Slots without a candidate (overlap below
+    MatchConfig.min_area_overlap, or fewer than k seeds) have index -1,
+    zero scores, match type "no_match" and confidence 0.0.
+    """
+    indices: np.ndarray
+    iou_scores: np.ndarray
+    overlap_areas: np.ndarray
+    match_types: np.ndarray
+    confidences: np.ndarray
+
+
+def _box_row(bbox: Any, box_format: str) -> Tuple[float, float, float, float]:
+    """Convert one bbox into an (x, y, width, height) tuple; unusable boxes become zeros."""
+    try:
+        if isinstance(bbox, BoundingBox):
+            return (bbox.x, bbox.y, bbox.width, bbox.height)
+        if isinstance(bbox, dict):
+            if not all(key in bbox for key in ('x', 'y', 'width', 'height')):
+                return (0.0, 0.0, 0.0, 0.0)
+            return (bbox['x'], bbox['y'], bbox['width'], bbox['height'])
+        if bbox is None or len(bbox) < 4:
+            return (0.0, 0.0, 0.0, 0.0)
+        if box_format == "xyxy":
+            return (bbox[0], bbox[1], bbox[2] - bbox[0], bbox[3] - bbox[1])
+        return (bbox[0], bbox[1], bbox[2], bbox[3])
+    except (TypeError, ValueError):
+        return (0.0, 0.0, 0.0, 0.0)
+
+
+def boxes_to_array(bboxes: BoxArrayLike, box_format: str = "xywh") -> np.ndarray:
+    """
+    Convert bounding boxes into an (N, 4) float64 array of [x, y, width, height].
+    
+    Accepts BoundingBox objects, GBG bbox dicts (x/y/width/height keys) and
+    4-element sequences in either [x, y, width, height] ("xywh") or
+    [x0, y0, x1, y1] ("xyxy") layout. Missing or malformed boxes become
+    all-zero rows, which overlap nothing.
+    
+    Args:
+        bboxes: Boxes to convert, or an existing (N, 4) array
+        box_format: Layout of plain sequences, "xywh" or "xyxy"
+        
+    Returns:
+        (N, 4) float64 array in xywh layout
+    """
+    if box_format not in ("xywh", "xyxy"):
+        raise ValueError(f"Unknown box format: {box_format}")
+    
+    if isinstance(bboxes, np.ndarray):
+        array = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        if box_format == "xyxy":
+            array = np.column_stack((array[:, 0], array[:, 1],
+                                     array[:, 2] - array[:, 0], array[:, 3] - array[:, 1]))
+        return array
+    
+    rows = [_box_row(bbox, box_format) for bbox in bboxes]
+    if not rows:
+        return np.zeros((0, 4), dtype=np.float64)
+    return np.array(rows, dtype=np.float64)
+
+
+def batch_overlap_areas(external_boxes: np.ndarray, seed_boxes: np.ndarray) -> np.ndarray:
+    """
+    Compute the pairwise intersection areas of two xywh box arrays.
+    
+    Args:
+        external_boxes: (N, 4) array of external boxes
+        seed_boxes: (M, 4) array of seed boxes
+        
+    Returns:
+        (N, M) array of overlap areas
+    """
+    ex = external_boxes[:, None, :]
+    sd = seed_boxes[None, :, :]
+    
+    inter_w = np.minimum(ex[..., 0] + ex[..., 2], sd[..., 0] + sd[..., 2]) - np.maximum(ex[..., 0], sd[..., 0])
+    inter_h = np.minimum(ex[..., 1] + ex[..., 3], sd[..., 1] + sd[..., 3]) - np.maximum(ex[..., 1], sd[..., 1])
+    
+    return np.where((inter_w > 0) & (inter_h > 0), inter_w * inter_h, 0.0)
+
+
+def batch_iou(external_boxes: np.ndarray, seed_boxes: np.ndarray,
+              overlap_areas: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute the pairwise IoU matrix of two xywh box arrays.
+    
+    Produces the same values as IoUMatcher.calculate_iou for every pair.
+    
+    Args:
+        external_boxes: (N, 4) array of external boxes
+        seed_boxes: (M, 4) array of seed boxes
+        overlap_areas: Optional precomputed (N, M) overlap areas
+        
+    Returns:
+        (N, M) array of IoU scores
+    """
+    if overlap_areas is None:
+        overlap_areas = batch_overlap_areas(external_boxes, seed_boxes)
+    
+    ext_area = (external_boxes[:, 2] * external_boxes[:, 3])[:, None]
+    seed_area = (seed_boxes[:, 2] * seed_boxes[:, 3])[None, :]
+    union = ext_area + seed_area - overlap_areas
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        iou = np.where((overlap_areas > 0) & (union > 0), overlap_areas / union, 0.0)
+    return iou
+
+
 class IoUMatcher:
     """IoU-based matcher for mapping external variations to seed blocks."""
     
@@ -93,6 +210,134 @@ class IoUMatcher:
         
         return (x2_inter - x1_inter) * (y2_inter - y1_inter)
     
+    def classify_iou(self, iou_score: float) -> Tuple[str, float]:
+        """
+        Classify an IoU score into a match type and confidence.
+        
+        Args:
+            iou_score: IoU score between 0 and 1
+            
+        Returns:
+            Tuple of (match_type, confidence)
+        """
+        if iou_score >= self.config.exact_match_threshold:
+            return "exact", 1.0
+        if iou_score >= self.config.good_match_threshold:
+            return "good", 0.8
+        if iou_score >= self.config.partial_match_threshold:
+            return "partial", 0.5
+        return "no_match", 0.1
+    
+    def calculate_overlap_matrix(self, external_boxes: BoxArrayLike, seed_boxes: BoxArrayLike) -> np.ndarray:
+        """
+        Calculate overlap areas for every external/seed box pair in one call.
+        
+        Args:
+            external_boxes: (N, 4) xywh array or boxes accepted by boxes_to_array
+            seed_boxes: (M, 4) xywh array or boxes accepted by boxes_to_array
+            
+        Returns:
+            (N, M) overlap area matrix
+        """
+        return batch_overlap_areas(boxes_to_array(external_boxes), boxes_to_array(seed_boxes))
+    
+    def calculate_iou_matrix(self, external_boxes: BoxArrayLike, seed_boxes: BoxArrayLike) -> np.ndarray:
+        """
+        Calculate IoU for every external/seed box pair in one call.
+        
+        Args:
+            external_boxes: (N, 4) xywh array or boxes accepted by boxes_to_array
+            seed_boxes: (M, 4) xywh array or boxes accepted by boxes_to_array
+            
+        Returns:
+            (N, M) IoU matrix
+        """
+        return batch_iou(boxes_to_array(external_boxes), boxes_to_array(seed_boxes))
+    
+    def top_k_matches(self, external_boxes: BoxArrayLike, seed_boxes: BoxArrayLike,
+                      k: int = 1, chunk_size: int = 2048) -> BatchMatchResult:
+        """
+        Find the k best seed matches for every external box.
+        
+        Rows are ranked like match_to_seed_blocks: by IoU descending, ties
+        broken by seed order, excluding seeds below min_area_overlap. Rows
+        are processed in chunks so memory stays at chunk_size x M.
+        
+        Args:
+            external_boxes: (N, 4) xywh array or boxes accepted by boxes_to_array
+            seed_boxes: (M, 4) xywh array or boxes accepted by boxes_to_array
+            k: Number of matches per row
+            chunk_size: Number of external rows scored per chunk
+            
+        Returns:
+            BatchMatchResult with (N, k) arrays
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        
+        external = boxes_to_array(external_boxes)
+        seeds = boxes_to_array(seed_boxes)
+        n_rows = external.shape[0]
+        take = min(k, seeds.shape[0])
+        
+        indices = np.full((n_rows, k), -1, dtype=np.int64)
+        iou_scores = np.zeros((n_rows, k), dtype=np.float64)
+        overlap_areas = np.zeros((n_rows, k), dtype=np.float64)
+        
+        step = max(1, chunk_size)
+        for start in range(0, n_rows if take else 0, step):
+            stop = min(start + step, n_rows)
+            overlap = batch_overlap_areas(external[start:stop], seeds)
+            iou = batch_iou(external[start:stop], seeds, overlap)
+            eligible = overlap >= self.config.min_area_overlap
+            
+            # Ineligible pairs rank after every eligible one; stable sort keeps seed order on ties
+            ranking = np.where(eligible, iou, -1.0)
+            order = np.argsort(-ranking, axis=1, kind='stable')[:, :take]
+            rows = np.arange(stop - start)[:, None]
+            keep = eligible[rows, order]
+            
+            indices[start:stop, :take] = np.where(keep, order, -1)
+            iou_scores[start:stop, :take] = np.where(keep, iou[rows, order], 0.0)
+            overlap_areas[start:stop, :take] = np.where(keep, overlap[rows, order], 0.0)
+        
+        found = indices >= 0
+        config = self.config
+        match_types = np.select(
+            [found & (iou_scores >= config.exact_match_threshold),
+             found & (iou_scores >= config.good_match_threshold),
+             found & (iou_scores >= config.partial_match_threshold)],
+            ["exact", "good", "partial"],
+            default="no_match"
+        )
+        confidences = np.select(
+            [found & (iou_scores >= config.exact_match_threshold),
+             found & (iou_scores >= config.good_match_threshold),
+             found & (iou_scores >= config.partial_match_threshold),
+             found],
+            [1.0, 0.8, 0.5, 0.1],
+            default=0.0
+        )
+        
+        return BatchMatchResult(
+            indices=indices,
+            iou_scores=iou_scores,
+            overlap_areas=overlap_areas,
+            match_types=match_types,
+            confidences=confidences
+        )
+    
+    def _iou_from_overlap(self, bbox1: BoundingBox, bbox2: BoundingBox, overlap_area: float) -> float:
+        """Compute IoU from an already calculated overlap area (same result as calculate_iou)."""
+        if overlap_area <= 0:
+            return 0.0
+        
+        union_area = bbox1.area() + bbox2.area() - overlap_area
+        if union_area == 0:
+            return 0.0
+        
+        return overlap_area / union_area
+    
     def match_to_seed_blocks(
         self, 
         external_bbox: BoundingBox, 
@@ -117,27 +362,17 @@ class IoUMatcher:
             if page_filter is not None and seed_block.page != page_filter:
                 continue
             
-            # Calculate IoU and overlap
-            iou_score = self.calculate_iou(external_bbox, seed_block.bbox)
+            # Calculate overlap once and derive IoU from it
             overlap_area = self.calculate_overlap_area(external_bbox, seed_block.bbox)
             
             # Skip if below minimum area overlap
             if overlap_area < self.config.min_area_overlap:
                 continue
             
+            iou_score = self._iou_from_overlap(external_bbox, seed_block.bbox, overlap_area)
+            
             # Determine match type based on IoU thresholds
-            if iou_score >= self.config.exact_match_threshold:
-                match_type = "exact"
-                confidence = 1.0
-            elif iou_score >= self.config.good_match_threshold:
-                match_type = "good"
-                confidence = 0.8
-            elif iou_score >= self.config.partial_match_threshold:
-                match_type = "partial"
-                confidence = 0.5
-            else:
-                match_type = "no_match"
-                confidence = 0.1
+            match_type, confidence = self.classify_iou(iou_score)
             
             matches.append(MatchResult(
                 seed_block=seed_block,
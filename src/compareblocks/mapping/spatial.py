@@ -0,0 +1,221 @@
+# src/compareblocks/mapping/spatial.py
+"""
+Per-page uniform-grid spatial index over seed block bounding boxes.
+Lets IoU matching touch only the seed blocks that actually overlap a query box.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple, Iterator
+import numpy as np
+from ..gbg.types import BoundingBox, SeedBlock
+
+
+class SeedBlockSpatialIndex:
+    """Uniform-grid index of seed blocks, bucketed per page."""
+
+    def __init__(self, cell_size: float = 64.0):
+        """
+        Initialize the spatial index.
+
+        Args:
+            cell_size: Grid cell edge length in page units (PDF points)
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+
+        self.cell_size = cell_size
+        # page -> (cell_x, cell_y) -> block ids
+        self._cells: Dict[int, Dict[Tuple[int, int], List[str]]] = {}
+        # block_id -> (insertion order, seed block)
+        self._entries: Dict[str, Tuple[int, SeedBlock]] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, block_id: str) -> bool:
+        return block_id in self._entries
+
+    def _cell_keys(self, bbox: BoundingBox) -> Iterator[Tuple[int, int]]:
+        """Yield the grid cells covered by a bounding box."""
+        x0 = math.floor(bbox.x / self.cell_size)
+        y0 = math.floor(bbox.y / self.cell_size)
+        x1 = math.floor((bbox.x + bbox.width) / self.cell_size)
+        y1 = math.floor((bbox.y + bbox.height) / self.cell_size)
+
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def insert(self, seed_block: SeedBlock) -> None:
+        """
+        Insert or replace a seed block.
+
+        Replacing a block keeps its original insertion order, mirroring
+        how re-assigning a key in a dict keeps its position.
+
+        Args:
+            seed_block: Seed block to index
+        """
+        existing = self._entries.get(seed_block.block_id)
+        if existing is not None:
+            order = existing[0]
+            self.remove(seed_block.block_id)
+        else:
+            order = self._next_order
+            self._next_order += 1
+
+        self._entries[seed_block.block_id] = (order, seed_block)
+        page_cells = self._cells.setdefault(seed_block.page, {})
+        for key in self._cell_keys(seed_block.bbox):
+            page_cells.setdefault(key, []).append(seed_block.block_id)
+
+    def remove(self, block_id: str) -> Optional[SeedBlock]:
+        """
+        Remove a seed block from the index.
+
+        Args:
+            block_id: ID of the seed block to remove
+
+        Returns:
+            The removed seed block, or None if it was not indexed
+        """
+        entry = self._entries.pop(block_id, None)
+        if entry is None:
+            return None
+
+        seed_block = entry[1]
+        page_cells = self._cells.get(seed_block.page, {})
+        for key in self._cell_keys(seed_block.bbox):
+            bucket = page_cells.get(key)
+            if bucket is None:
+                continue
+            bucket.remove(block_id)
+            if not bucket:
+                del page_cells[key]
+
+        return seed_block
+
+    def query(self, page: int, bbox: BoundingBox) -> List[SeedBlock]:
+        """
+        Find seed blocks on a page whose bounding boxes overlap a query box.
+
+        Only blocks with a strictly positive intersection area are returned,
+        in the order they were first inserted.
+
+        Args:
+            page: Page number to search
+            bbox: Query bounding box
+
+        Returns:
+            Overlapping seed blocks
+        """
+        page_cells = self._cells.get(page)
+        if not page_cells:
+            return []
+
+        seen = set()
+        candidates = []
+        x2 = bbox.x + bbox.width
+        y2 = bbox.y + bbox.height
+
+        for key in self._cell_keys(bbox):
+            for block_id in page_cells.get(key, ()):
+                if block_id in seen:
+                    continue
+                seen.add(block_id)
+
+                order, seed_block = self._entries[block_id]
+                other = seed_block.bbox
+                # Same intersection test as IoUMatcher.calculate_overlap_area
+                if (min(x2, other.x + other.width) <= max(bbox.x, other.x) or
+                        min(y2, other.y + other.height) <= max(bbox.y, other.y)):
+                    continue
+                candidates.append((order, seed_block))
+
+        candidates.sort(key=lambda entry: entry[0])
+        return [seed_block for _, seed_block in candidates]
+
+    def blocks_on_page(self, page: int) -> List[SeedBlock]:
+        """Get all indexed seed blocks on a page in insertion order."""
+        entries = [entry for entry in self._entries.values() if entry[1].page == page]
+        entries.sort(key=lambda entry: entry[0])
+        return [seed_block for _, seed_block in entries]
+
+
+class BoxGridIndex:
+    """Uniform-grid index over an (N, 4) xywh box array, answering overlap queries with row indices."""
+
+    # Boxes covering more cells than this are kept in a list checked on every query
+    MAX_CELLS_PER_BOX = 1024
+
+    def __init__(self, boxes: np.ndarray, cell_size: float = 64.0):
+        """
+        Initialize the index.
+
+        Args:
+            boxes: (N, 4) float array of [x, y, width, height] rows (see mapping.match.boxes_to_array)
+            cell_size: Grid cell edge length in page units (PDF points)
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+
+        self.cell_size = cell_size
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._oversized: List[int] = []
+
+        for row, (x, y, width, height) in enumerate(self.boxes.tolist()):
+            # Boxes without positive, finite area overlap nothing
+            if not (width > 0 and height > 0 and math.isfinite(x + y + width + height)):
+                continue
+            x0, y0, x1, y1 = self._cell_range(x, y, width, height)
+            if (x1 - x0 + 1) * (y1 - y0 + 1) > self.MAX_CELLS_PER_BOX:
+                self._oversized.append(row)
+                continue
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    self._cells.setdefault((cx, cy), []).append(row)
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def _cell_range(self, x: float, y: float, width: float, height: float) -> Tuple[int, int, int, int]:
+        """Grid cells covered by a box as (x0, y0, x1, y1), inclusive."""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size),
+                math.floor((x + width) / self.cell_size), math.floor((y + height) / self.cell_size))
+
+    def query(self, bbox: Tuple[float, float, float, float]) -> np.ndarray:
+        """
+        Find boxes with a strictly positive intersection area with a query box.
+
+        Args:
+            bbox: Query box as (x, y, width, height)
+
+        Returns:
+            Sorted array of row indices into the indexed boxes
+        """
+        x, y, width, height = (float(value) for value in bbox)
+        if not (width > 0 and height > 0 and math.isfinite(x + y + width + height)):
+            return np.zeros(0, dtype=np.intp)
+
+        x0, y0, x1, y1 = self._cell_range(x, y, width, height)
+        rows = list(self._oversized)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > max(len(self._cells), 1):
+            # Query covers more cells than are occupied: scan the occupied ones
+            for (cx, cy), bucket in self._cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    rows.extend(bucket)
+        else:
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    rows.extend(self._cells.get((cx, cy), ()))
+        if not rows:
+            return np.zeros(0, dtype=np.intp)
+
+        candidates = np.unique(np.asarray(rows, dtype=np.intp))
+        other = self.boxes[candidates]
+        # Same intersection test as mapping.match.batch_overlap_areas
+        inter_w = np.minimum(x + width, other[:, 0] + other[:, 2]) - np.maximum(x, other[:, 0])
+        inter_h = np.minimum(y + height, other[:, 1] + other[:, 3]) - np.maximum(y, other[:, 1])
+        return candidates[(inter_w > 0) & (inter_h > 0)]
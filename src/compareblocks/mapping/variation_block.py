@@ -4,11 +4,14 @@ Variation block management system for handling multiple engine outputs.
 Creates child variation blocks for partial matches and overlapping regions.
 """
 
-from typing import List, Optional, Dict, Any, Union
+from pathlib import Path
+from typing import Iterable, List, Optional, Dict, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from ..gbg.types import BoundingBox, SeedBlock, OrientationHints
 from .match import IoUMatcher, MatchResult, MatchConfig
+from .spatial import SeedBlockSpatialIndex
+from ..io.loader import NDJSONLoader
 
 
 class VariationType(Enum):
@@ -101,11 +104,20 @@ class ExternalVariation:
 class VariationBlockManager:
     """Manages variation blocks and handles mapping to seed blocks."""
     
-    def __init__(self, match_config: Optional[MatchConfig] = None):
-        """Initialize the variation block manager."""
+    def __init__(self, match_config: Optional[MatchConfig] = None, index_cell_size: float = 64.0):
+        """
+        Initialize the variation block manager.
+        
+        Args:
+            match_config: IoU matching configuration
+            index_cell_size: Grid cell size of the seed block spatial index
+        """
         self.matcher = IoUMatcher(match_config)
         self.variation_blocks: Dict[str, VariationBlock] = {}
         self.seed_blocks: Dict[str, SeedBlock] = {}
+        self.spatial_index = SeedBlockSpatialIndex(cell_size=index_cell_size)
+        # block_id -> variation_id of the first SEED variation for that block
+        self._seed_variation_ids: Dict[str, str] = {}
         self._next_variation_id = 1
     
     def _generate_variation_id(self) -> str:
@@ -118,6 +130,7 @@ class VariationBlockManager:
         """Add seed blocks to the manager."""
         for seed_block in seed_blocks:
             self.seed_blocks[seed_block.block_id] = seed_block
+            self.spatial_index.insert(seed_block)
             
             # Create a variation block for the seed
             variation_id = self._generate_variation_id()
@@ -137,6 +150,7 @@ class VariationBlockManager:
                 original_metadata=seed_block.metadata or {}
             )
             self.variation_blocks[variation_id] = seed_variation
+            self._seed_variation_ids.setdefault(seed_block.block_id, variation_id)
     
     def map_external_variation(self, external_var: ExternalVariation) -> VariationBlock:
         """
@@ -170,11 +184,11 @@ class VariationBlockManager:
                 original_metadata=external_var.metadata
             )
         else:
-            # Find best match using IoU
-            seed_blocks_list = list(self.seed_blocks.values())
+            # Find best match using IoU against spatially overlapping candidates only
+            candidates = self.spatial_index.query(external_var.page, external_var.bbox)
             best_match = self.matcher.find_best_match(
                 external_var.bbox, 
-                seed_blocks_list, 
+                candidates, 
                 page_filter=external_var.page
             )
             
@@ -217,11 +231,11 @@ class VariationBlockManager:
                 )
                 
                 # Add this as a child to the parent seed block variation
-                parent_variations = self.get_variations_for_block(best_match.seed_block.block_id)
-                for parent_var in parent_variations:
-                    if parent_var.variation_type == VariationType.SEED:
-                        parent_var.add_child(variation_id)
-                        break
+                parent_var = self.variation_blocks.get(
+                    self._seed_variation_ids.get(best_match.seed_block.block_id, "")
+                )
+                if parent_var is not None:
+                    parent_var.add_child(variation_id)
             else:
                 # Create orphan variation
                 variation_block = VariationBlock(
@@ -244,6 +258,76 @@ class VariationBlockManager:
         self.variation_blocks[variation_id] = variation_block
         return variation_block
     
+    def map_external_variations(self, external_vars: Iterable[ExternalVariation]) -> List[VariationBlock]:
+        """
+        Map a batch of external variations to seed blocks.
+        
+        Args:
+            external_vars: External variations to map (any iterable, consumed once)
+            
+        Returns:
+            Created variation blocks in input order
+        """
+        return [self.map_external_variation(external_var) for external_var in external_vars]
+    
+    def external_variation_from_record(self, record: Dict[str, Any]) -> ExternalVariation:
+        """
+        Convert a validated NDJSON input record into an ExternalVariation.
+        
+        NDJSON pages are 1-based while seed blocks use 0-indexed pages.
+        Records carrying only a block_id take the bbox of that seed block.
+        
+        Args:
+            record: Validated input variation record
+            
+        Returns:
+            ExternalVariation ready for mapping
+            
+        Raises:
+            ValueError: If the record has no bbox and an unknown block_id
+        """
+        bbox_values = record.get('bbox')
+        block_id = record.get('block_id')
+        
+        if bbox_values:
+            bbox = BoundingBox(
+                x=bbox_values[0],
+                y=bbox_values[1],
+                width=bbox_values[2],
+                height=bbox_values[3]
+            )
+        elif block_id in self.seed_blocks:
+            bbox = self.seed_blocks[block_id].bbox
+        else:
+            raise ValueError(f"Record has no bbox and unknown block_id: {block_id}")
+        
+        return ExternalVariation(
+            doc_id=record['doc_id'],
+            page=record['page'] - 1,
+            engine=record['engine'],
+            raw_text=record['raw_text'],
+            bbox=bbox,
+            confidence=record.get('confidence', 0.0),
+            orientation=record.get('orientation'),
+            block_id=block_id,
+            metadata=record.get('metadata', {})
+        )
+    
+    def map_ndjson_file(self, file_path: Union[str, Path]) -> List[VariationBlock]:
+        """
+        Stream an NDJSON variations file and map every record to seed blocks.
+        
+        Args:
+            file_path: Path to the NDJSON input variations file
+            
+        Returns:
+            Created variation blocks in file order
+        """
+        records = NDJSONLoader().load_stream(Path(file_path))
+        return self.map_external_variations(
+            self.external_variation_from_record(record) for record in records
+        )
+    
     def get_variations_for_block(self, block_id: str) -> List[VariationBlock]:
         """Get all variations mapped to a specific seed block."""
         variations = []
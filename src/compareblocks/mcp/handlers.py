@@ -10,7 +10,7 @@ submission, status monitoring, and result retrieval.
 import json
 import uuid
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 from pathlib import Path
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -20,7 +20,9 @@ from .protocol import MCPMessage, MCPProtocol, MCPErrorCode
 from ..io.loader import NDJSONLoader
 from ..io.writer import NDJSONWriter
 from ..gbg.processor import GBGProcessor
+from ..gbg.cache import GBGAnalysisCache
 from ..consensus.score import ConsensusScorer
+from ..mapping.match import IoUMatcher, MatchConfig
 from ..config.file_manager import FileManager
 
 
@@ -63,15 +65,106 @@ class ProcessingSession:
         }
 
 
+class ExtractionQueueFullError(RuntimeError):
+    """Raised when the extraction job queue has no free slot."""
+
+
 class ExtractionHandler:
     """Handler for extraction submission requests."""
     
-    def __init__(self, validator: MCPValidator, protocol: MCPProtocol):
+    def __init__(self, validator: MCPValidator, protocol: MCPProtocol,
+                 max_concurrent_jobs: int = 2, max_queued_jobs: int = 16,
+                 executor_workers: int = 4, submission_timeout: float = 0.0):
+        """
+        Initialize extraction handler.
+        
+        Args:
+            validator: MCP request validator
+            protocol: MCP protocol helper
+            max_concurrent_jobs: Extraction jobs processed at the same time
+            max_queued_jobs: Accepted jobs waiting for a worker before submissions are refused
+            executor_workers: Threads running the CPU-bound processing stages
+            submission_timeout: Seconds a submission waits for a queue slot (0 = refuse at once)
+        """
+        if max_concurrent_jobs < 1 or max_queued_jobs < 1:
+            raise ValueError("max_concurrent_jobs and max_queued_jobs must be at least 1")
+        
         self.validator = validator
         self.protocol = protocol
         self.sessions: Dict[str, ProcessingSession] = {}
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.executor_workers = executor_workers
+        # Created on first use so the handler can be restarted after shutdown()
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.config_manager = FileManager()
+        # Resubmitting an unchanged PDF skips GBG segmentation
+        self.gbg_cache = GBGAnalysisCache()
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_queued_jobs = max_queued_jobs
+        self.submission_timeout = submission_timeout
+        # Set by the server to deliver notifications to subscribed clients
+        self.notification_sink: Optional[Callable[[MCPMessage], Awaitable[None]]] = None
+        
+        # Job queue and workers are bound to the event loop that first submits
+        self._job_queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for the CPU-bound processing stages, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.executor_workers)
+        return self._executor
+    
+    def _ensure_workers(self) -> asyncio.Queue:
+        """Create the job queue and worker tasks on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._job_queue is None or self._loop is not loop or loop.is_closed():
+            self._loop = loop
+            self._job_queue = asyncio.Queue(maxsize=self.max_queued_jobs)
+            self._workers = [
+                loop.create_task(self._job_worker())
+                for _ in range(self.max_concurrent_jobs)
+            ]
+        return self._job_queue
+    
+    async def _job_worker(self):
+        """Take sessions off the queue and process them one at a time."""
+        queue = self._job_queue
+        while True:
+            session = await queue.get()
+            try:
+                await self._process_extraction(session)
+            finally:
+                queue.task_done()
+    
+    def get_queue_info(self) -> Dict[str, Any]:
+        """Get job queue occupancy and concurrency limits."""
+        queued = self._job_queue.qsize() if self._job_queue is not None else 0
+        return {
+            "queued_jobs": queued,
+            "max_queued_jobs": self.max_queued_jobs,
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "processing_jobs": sum(1 for s in self.sessions.values() if s.status == "processing")
+        }
+    
+    async def wait_for_idle(self):
+        """Wait until every queued extraction job has finished."""
+        if self._job_queue is not None:
+            await self._job_queue.join()
+    
+    async def shutdown(self):
+        """Cancel queue workers and release the processing threads."""
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._job_queue = None
+        self._loop = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     async def handle_submission(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle extraction submission request."""
@@ -97,49 +190,74 @@ class ExtractionHandler:
             metadata=sanitized_data.get("metadata", {})
         )
         session.variations = sanitized_data["variations"]
+        
+        session.update_status("queued", 0.0)
         self.sessions[session_id] = session
         
-        # Start processing asynchronously
-        asyncio.create_task(self._process_extraction(session))
+        # Backpressure: refuse (or briefly wait) when the job queue is full
+        queue = self._ensure_workers()
+        try:
+            if self.submission_timeout > 0:
+                await asyncio.wait_for(queue.put(session), timeout=self.submission_timeout)
+            else:
+                queue.put_nowait(session)
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            del self.sessions[session_id]
+            raise ExtractionQueueFullError(
+                f"Extraction queue is full ({self.max_queued_jobs} jobs waiting); retry later"
+            )
         
         return {
             "session_id": session_id,
             "status": "accepted",
-            "message": "Extraction submission accepted for processing"
+            "message": "Extraction submission accepted for processing",
+            "queue_position": queue.qsize()
         }
     
+    def _run_gbg_stage(self, pdf_path: str) -> List[Dict[str, Any]]:
+        """Run GBG processing and collect seed blocks (executor thread)."""
+        gbg_results = GBGProcessor(cache=self.gbg_cache).process_pdf(pdf_path)
+        
+        seed_blocks = []
+        for page_data in gbg_results.get("pages", {}).values():
+            if isinstance(page_data, dict) and "blocks" in page_data:
+                seed_blocks.extend(page_data["blocks"])
+        return seed_blocks
+    
+    def _run_scoring_stage(self, mapped_variations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run consensus scoring (executor thread)."""
+        scores = ConsensusScorer().score_variations(mapped_variations)
+        return [score.to_dict() for score in scores]
+    
     async def _process_extraction(self, session: ProcessingSession):
-        """Process extraction in background."""
+        """Process extraction, offloading CPU-bound stages to the executor."""
+        loop = asyncio.get_running_loop()
         try:
             session.update_status("processing", 0.1)
             
             # Notify subscribers of status update
             await self._notify_status_update(session)
             
-            # Initialize processors
-            gbg_processor = GBGProcessor()
-            consensus_scorer = ConsensusScorer()
-            
             # Process PDF with GBG
             session.update_status("processing", 0.3)
-            pdf_path = Path(session.pdf_path)
-            gbg_results = gbg_processor.process_pdf(str(pdf_path))
-            
-            # Extract seed blocks from GBG results
-            seed_blocks = []
-            for page_data in gbg_results.get("pages", {}).values():
-                if isinstance(page_data, dict) and "blocks" in page_data:
-                    seed_blocks.extend(page_data["blocks"])
+            await self._notify_status_update(session)
+            seed_blocks = await loop.run_in_executor(
+                self.executor, self._run_gbg_stage, str(Path(session.pdf_path))
+            )
             
             # Map variations to blocks
             session.update_status("processing", 0.5)
-            mapped_variations = self._map_variations_to_blocks(
-                session.variations, seed_blocks
+            await self._notify_status_update(session)
+            mapped_variations = await loop.run_in_executor(
+                self.executor, self._map_variations_to_blocks, session.variations, seed_blocks
             )
             
             # Run consensus scoring
             session.update_status("processing", 0.7)
-            consensus_results = consensus_scorer.score_variations(mapped_variations)
+            await self._notify_status_update(session)
+            consensus_results = await loop.run_in_executor(
+                self.executor, self._run_scoring_stage, mapped_variations
+            )
             
             # Generate final results
             session.update_status("processing", 0.9)
@@ -162,20 +280,22 @@ class ExtractionHandler:
         # This would use the existing mapping logic from the system
         # For now, return a simplified mapping
         mapped = []
-        for variation in variations:
-            # Find best matching seed block based on bounding box
-            best_match = None
-            best_iou = 0.0
-            
-            var_bbox = variation.get("bbox", {})
-            for block in seed_blocks:
-                block_bbox = block.get("bbox", {})
-                iou = self._calculate_iou(var_bbox, block_bbox)
-                if iou > best_iou:
-                    best_iou = iou
-                    best_match = block
+        if not variations or not seed_blocks:
+            return mapped
+        
+        # Best seed block per variation, scored in row chunks so memory stays at chunk x seed blocks;
+        # no overlap floor, so every seed block competes as in a plain argmax over IoU
+        best = IoUMatcher(MatchConfig(min_area_overlap=0.0)).top_k_matches(
+            [self._normalize_bbox(variation.get("bbox", {})) for variation in variations],
+            [self._normalize_bbox(block.get("bbox", {})) for block in seed_blocks],
+            k=1, chunk_size=256
+        )
+        
+        for row, variation in enumerate(variations):
+            best_iou = float(best.iou_scores[row, 0])
             
-            if best_match and best_iou > 0.5:  # Minimum IoU threshold
+            if best_iou > 0.5:  # Minimum IoU threshold
+                best_match = seed_blocks[best.indices[row, 0]]
                 mapped_variation = variation.copy()
                 mapped_variation["block_id"] = best_match["block_id"]
                 mapped_variation["iou_score"] = best_iou
@@ -185,17 +305,8 @@ class ExtractionHandler:
     
     def _calculate_iou(self, bbox1, bbox2) -> float:
         """Calculate Intersection over Union for two bounding boxes."""
-        # Convert array format [x, y, width, height] to dict format if needed
-        def normalize_bbox(bbox):
-            if isinstance(bbox, list) and len(bbox) == 4:
-                return {"x": bbox[0], "y": bbox[1], "width": bbox[2], "height": bbox[3]}
-            elif isinstance(bbox, dict):
-                return bbox
-            else:
-                return {}
-        
-        bbox1 = normalize_bbox(bbox1)
-        bbox2 = normalize_bbox(bbox2)
+        bbox1 = self._normalize_bbox(bbox1)
+        bbox2 = self._normalize_bbox(bbox2)
         
         if not all(k in bbox1 for k in ["x", "y", "width", "height"]):
             return 0.0
@@ -220,6 +331,16 @@ class ExtractionHandler:
         
         return intersection / union if union > 0 else 0.0
     
+    @staticmethod
+    def _normalize_bbox(bbox) -> Dict[str, Any]:
+        """Convert array format [x, y, width, height] to dict format; anything else becomes {}."""
+        if isinstance(bbox, list) and len(bbox) == 4:
+            return {"x": bbox[0], "y": bbox[1], "width": bbox[2], "height": bbox[3]}
+        elif isinstance(bbox, dict):
+            return bbox
+        else:
+            return {}
+    
     def _generate_results(self, consensus_results: List[Dict[str, Any]], 
                          metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Generate final processing results."""
@@ -238,7 +359,7 @@ class ExtractionHandler:
     async def _notify_status_update(self, session: ProcessingSession):
         """Notify subscribers of status update."""
         notification = self.protocol.create_status_update(session.to_dict())
-        # In a real implementation, this would send to actual subscribers
+        await self._deliver_notification(notification)
         print(f"Status update notification: {notification.to_json()}")
     
     async def _notify_processing_complete(self, session: ProcessingSession):
@@ -247,6 +368,7 @@ class ExtractionHandler:
             "session_id": session.session_id,
             "results": session.results
         })
+        await self._deliver_notification(notification)
         print(f"Processing complete notification: {notification.to_json()}")
     
     async def _notify_error(self, session: ProcessingSession, error: str):
@@ -259,8 +381,18 @@ class ExtractionHandler:
                 "timestamp": datetime.now().isoformat()
             }
         )
+        await self._deliver_notification(notification)
         print(f"Error notification: {notification.to_json()}")
     
+    async def _deliver_notification(self, notification: MCPMessage):
+        """Forward a notification to subscribed clients when a sink is attached."""
+        if self.notification_sink is None:
+            return
+        try:
+            await self.notification_sink(notification)
+        except Exception as e:
+            print(f"Failed to deliver notification {notification.method}: {e}")
+    
     def get_session(self, session_id: str) -> Optional[ProcessingSession]:
         """Get processing session by ID."""
         return self.sessions.get(session_id)
@@ -17,18 +17,24 @@ from websockets.server import WebSocketServerProtocol
 
 from .protocol import MCPProtocol, MCPMessage, MCPErrorCode
 from .validation import MCPValidator
-from .handlers import ExtractionHandler, StatusHandler
+from .handlers import ExtractionHandler, ExtractionQueueFullError, StatusHandler
 
 
 class MCPServer:
     """MCP Server for BECR system."""
     
-    def __init__(self, host: str = "localhost", port: int = 8765):
+    def __init__(self, host: str = "localhost", port: int = 8765,
+                 max_concurrent_jobs: int = 2, max_queued_jobs: int = 16):
         self.host = host
         self.port = port
         self.protocol = MCPProtocol()
         self.validator = MCPValidator()
-        self.extraction_handler = ExtractionHandler(self.validator, self.protocol)
+        self.extraction_handler = ExtractionHandler(
+            self.validator, self.protocol,
+            max_concurrent_jobs=max_concurrent_jobs,
+            max_queued_jobs=max_queued_jobs
+        )
+        self.extraction_handler.notification_sink = self._send_to_subscribers
         self.status_handler = StatusHandler(self.extraction_handler)
         
         # Client management
@@ -82,6 +88,8 @@ class MCPServer:
         self.clients.clear()
         self.client_subscriptions.clear()
         
+        await self.extraction_handler.shutdown()
+        
         self.logger.info("MCP server stopped")
     
     async def _handle_client(self, websocket: WebSocketServerProtocol):
@@ -130,6 +138,14 @@ class MCPServer:
                     result = await self.handlers[message.method](client_id, message.params or {})
                     response = self.protocol.create_response(message.id, result)
                     await self._send_message(client_id, response)
+                except ExtractionQueueFullError as e:
+                    error_response = self.protocol.create_error_response(
+                        message.id,
+                        MCPErrorCode.SERVER_ERROR,
+                        str(e),
+                        self.extraction_handler.get_queue_info()
+                    )
+                    await self._send_message(client_id, error_response)
                 except Exception as e:
                     error_response = self.protocol.create_error_response(
                         message.id,
@@ -239,6 +255,12 @@ class MCPServer:
             "client_id": client_id
         }
     
+    async def _send_to_subscribers(self, notification: MCPMessage):
+        """Send a prepared notification to clients subscribed to its method."""
+        for client_id in list(self.protocol.get_subscribers(notification.method)):
+            if client_id in self.clients:
+                await self._send_message(client_id, notification)
+    
     async def broadcast_notification(self, event_type: str, data: Dict[str, Any]):
         """Broadcast notification to subscribed clients."""
         notification = self.protocol.create_notification(
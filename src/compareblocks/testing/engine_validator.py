@@ -431,9 +431,9 @@ class EngineValidator:
             return False
         
         elif func_name == "save_extraction":
-            # Should return file path string
-            if isinstance(result, str) and result:
-                return Path(result).exists() if result else False
+            # Should return the saved file's path (a string or an EngineOutput)
+            if result:
+                return Path(str(result)).exists()
             return False
         
         return True
@@ -0,0 +1,25 @@
+# src/compareblocks/utils/workers.py
+"""
+Worker-count resolution shared by the process and thread pools.
+"""
+
+import os
+from typing import Optional
+
+
+def resolve_worker_count(max_workers: Optional[int], task_count: Optional[int] = None) -> int:
+    """
+    Resolve the number of workers for a pool.
+
+    Args:
+        max_workers: Requested workers (None or 0 = one per CPU core)
+        task_count: Number of tasks to distribute; bounds the result when given
+
+    Returns:
+        Worker count (at least 1)
+    """
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+    if task_count is not None:
+        max_workers = min(max_workers, task_count)
+    return max(1, max_workers)
@@ -15,6 +15,27 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 
+def pytest_addoption(parser):
+    """Add the opt-in switch for timing benchmarks."""
+    parser.addoption("--run-benchmarks", action="store_true", default=False,
+                     help="Run tests marked 'benchmark' (wall-clock timing comparisons)")
+
+
+def pytest_configure(config):
+    """Register the benchmark marker whichever ini file is in use."""
+    config.addinivalue_line("markers", "benchmark: Opt-in wall-clock benchmarks (run with --run-benchmarks)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark tests unless --run-benchmarks is given; their timings depend on machine load."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark: run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 # Embedded MCP Server Fixture for Automated Testing
 @pytest_asyncio.fixture(scope="function")
 async def mcp_test_server():
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Integration tests for document-scoped, page-parallel GBG processing.
+Verifies that the process-pool pass matches the single-process pass exactly.
+"""
+
+import pytest
+from pathlib import Path
+
+from src.compareblocks.gbg.parallel import map_document_pages
+from src.compareblocks.gbg.processor import GBGProcessor
+from src.compareblocks.gbg.seed import SeedBlockDetector
+from src.compareblocks.utils.workers import resolve_worker_count
+
+
+FIXTURE_PDF = Path(__file__).parent.parent / "fixtures" / "multi_column.pdf"
+
+
+def _strip_timestamps(results):
+    """Remove per-page processing timestamps, which differ between runs."""
+    for page in results["pages"].values():
+        page.pop("processing_timestamp", None)
+    return results
+
+
+class TestGBGParallel:
+    """Test class for page-parallel GBG extraction."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        if not FIXTURE_PDF.exists():
+            pytest.skip("Fixture PDF not available")
+        self.pdf_path = str(FIXTURE_PDF)
+
+    def test_resolve_worker_count(self):
+        """Worker count is bounded by page count and defaults to CPU count."""
+        assert resolve_worker_count(8, 3) == 3
+        assert resolve_worker_count(2, 10) == 2
+        assert resolve_worker_count(None, 1) == 1
+        assert resolve_worker_count(0, 1000) >= 1
+
+    def test_unknown_task_rejected(self):
+        """Unknown page tasks raise ValueError."""
+        with pytest.raises(ValueError):
+            map_document_pages(self.pdf_path, "not_a_task", [0])
+
+    def test_extract_all_seed_blocks_parallel_matches_serial(self):
+        """Seed blocks from the process pool match the in-process pass."""
+        detector = SeedBlockDetector()
+        serial = detector.extract_all_seed_blocks(self.pdf_path)
+        parallel = detector.extract_all_seed_blocks(self.pdf_path, max_workers=2)
+
+        assert parallel == serial
+
+    def test_process_page_matches_open_page(self):
+        """process_page and process_open_page produce the same page analysis."""
+        import fitz
+
+        processor = GBGProcessor(ensure_output_directories=False)
+        from_path = processor.process_page(self.pdf_path, 0)
+
+        with fitz.open(self.pdf_path) as doc:
+            from_page = processor.process_open_page(doc[0], 0)
+
+        from_path.pop("processing_timestamp")
+        from_page.pop("processing_timestamp")
+        assert from_path == from_page
+
+    def test_process_pdf_parallel_matches_serial(self, tmp_path):
+        """The page-parallel GBG pass produces the same analysis JSON."""
+        processor = GBGProcessor()
+        serial = processor.process_pdf(self.pdf_path, str(tmp_path / "serial.json"))
+        parallel = processor.process_pdf(self.pdf_path, str(tmp_path / "parallel.json"), max_workers=2)
+
+        assert _strip_timestamps(parallel) == _strip_timestamps(serial)
+        assert parallel["summary"]["total_pages"] == serial["summary"]["total_pages"]
+
+    def test_unreadable_pdf_reports_page_error(self, tmp_path):
+        """A PDF that cannot be opened is reported as one failed page, not skipped."""
+        processor = GBGProcessor(ensure_output_directories=False)
+        missing = str(tmp_path / "missing.pdf")
+
+        assert processor._get_total_pages(missing) == 1
+        [(page_num, page_result)] = processor._iter_page_results(missing, 1, 1)
+        assert page_num == 0
+        assert "error" in page_result
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for the GBG candidate indexes used by the PyMuPDF block matcher.
+Verifies indexed lookups and batched scores equal the per-block computations they replace.
+"""
+
+import random
+import numpy as np
+import pytest
+from rapidfuzz import fuzz
+
+from src.compareblocks.association.candidates import (
+    BlockCandidateIndex, CharacterIndex, TokenOverlapIndex, batch_fuzzy_scores, first_best,
+    greedy_assignment
+)
+from src.compareblocks.association.pymupdf_matcher import (
+    SIMILARITY_SCORERS, PyMuPDFBlockMatcher, _CharacterBlocks
+)
+
+
+def _gbg_block(block_id, text, x=0.0, y=0.0, width=10.0, height=10.0):
+    return {'block_id': block_id, 'text': text, 'bbox': {'x': x, 'y': y, 'width': width, 'height': height}}
+
+
+def _single_char_page(n_lines=60, line_len=60, seed=0):
+    """GBG lines with one PyMuPDF block per character, shuffled."""
+    rng = random.Random(seed)
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 "
+    gbg_blocks, engine_blocks = [], []
+    for line in range(n_lines):
+        text = ''.join(rng.choice(alphabet) for _ in range(line_len)).strip() or "X"
+        y = 20 + line * 14
+        gbg_blocks.append({'block_id': f'g{line}', 'text_content': text,
+                           'bbox': {'x': 50, 'y': y, 'width': 6 * len(text), 'height': 12}})
+        for column, char in enumerate(text):
+            if char != ' ':
+                x = 50 + column * 6
+                engine_blocks.append({'block_id': f'e{line}_{column}', 'page': 0, 'text': char,
+                                      'bbox': [x, y, x + 5, y + 11]})
+    rng.shuffle(engine_blocks)
+    return {'pages': {'0': {'blocks': gbg_blocks}}}, {'blocks': engine_blocks}
+
+
+class TestBlockCandidateIndex:
+    """Test class for used-block bookkeeping and lookups."""
+
+    def test_first_available_follows_list_order(self):
+        """Key lookups return the first unused block and skip every block sharing a used id."""
+        blocks = [_gbg_block('a', 'Hello'), _gbg_block('b', 'hello'), _gbg_block('a', 'HELLO'),
+                  _gbg_block('c', 'hello')]
+        index = BlockCandidateIndex(blocks)
+        index.add_key_index('lower', lambda block: block['text'].lower())
+
+        assert index.first_available('lower', 'hello') == 0
+        index.mark_used('a')
+        assert index.first_available('lower', 'hello') == 1
+        index.mark_used('b')
+        assert index.first_available('lower', 'hello') == 3
+        assert index.first_available('lower', 'missing') is None
+        assert index.available.tolist() == [False, False, False, True]
+
+    def test_spatial_candidates_and_iou(self):
+        """Only overlapping blocks are candidates, scored with the matcher's IoU."""
+        blocks = [_gbg_block('a', 'x', 0, 0), _gbg_block('b', 'y', 100, 100), _gbg_block('c', 'z', 5, 5)]
+        index = BlockCandidateIndex(blocks, cell_size=16.0)
+        engine_bbox = [2.0, 2.0, 8.0, 8.0]
+        engine_box = np.array([[2.0, 2.0, 6.0, 6.0]])
+
+        positions = index.spatial_candidates((2.0, 2.0, 6.0, 6.0))
+        scores = index.iou(engine_box, positions)
+
+        matcher = PyMuPDFBlockMatcher()
+        assert positions.tolist() == [0, 2]
+        assert scores.tolist() == [matcher._calculate_bbox_similarity(engine_bbox, blocks[p]['bbox'])
+                                   for p in positions]
+
+    def test_first_best_keeps_first_maximum(self):
+        """Ties resolve to the earliest position and non-positive scores never win."""
+        positions = np.array([1, 4, 7])
+
+        assert first_best(np.array([0.2, 0.5, 0.5]), positions) == (4, 0.5)
+        assert first_best(np.array([0.2, 0.5, 0.5]), positions, np.array([True] * 4 + [False] * 4)) == (1, 0.2)
+        assert first_best(np.zeros(3), positions) == (None, 0.0)
+
+
+    def test_greedy_assignment_takes_best_pairs_first(self):
+        """Pairs are accepted by descending score, one per row and column key."""
+        scores = np.array([[0.8, 0.0, 0.6],
+                           [0.9, 0.7, 0.0],
+                           [0.9, 0.7, 0.5]])
+
+        assert greedy_assignment(scores, 0.5) == [(0, 2, 0.6), (1, 0, 0.9), (2, 1, 0.7)]
+        assert greedy_assignment(scores, 0.75) == [(1, 0, 0.9)]
+        # Rows 1 and 2 are the same block: once one is used, so is the other
+        assert greedy_assignment(scores, 0.5, row_keys=['a', 'b', 'b']) == [(0, 2, 0.6), (1, 0, 0.9)]
+        assert greedy_assignment(np.zeros((0, 3)), 0.5) == []
+
+class TestTextIndexes:
+    """Test class for character, token and fuzzy score indexes."""
+
+    def test_character_index_counts(self):
+        """Character lookups return containing blocks with occurrence counts."""
+        index = CharacterIndex(["ABBA", "CAB", "XYZ", "ABAB"])
+
+        positions, counts = index.containing("B")
+        assert positions.tolist() == [0, 1, 3]
+        assert counts.tolist() == [2.0, 1.0, 2.0]
+
+        positions, counts = index.containing("AB")
+        assert positions.tolist() == [0, 1, 3]
+        assert counts.tolist() == [1.0, 1.0, 2.0]
+        assert len(index.containing("Q")[0]) == 0
+
+    def test_token_overlap_matches_sets(self):
+        """Batched Jaccard overlap equals set arithmetic, including empty sets."""
+        token_sets = [{"a", "b"}, {"b", "c", "d"}, set(), {"e"}]
+        index = TokenOverlapIndex(token_sets)
+
+        for query in [{"b", "c"}, set(), {"z"}]:
+            expected = [len(query & tokens) / len(query | tokens) if (query or tokens) else 1.0
+                        for tokens in token_sets]
+            assert index.jaccard(query).tolist() == expected
+
+    def test_batch_fuzzy_scores_match_scalar_scorers(self):
+        """Batched scores equal the best scalar scorer at and above the cutoff."""
+        queries = ["hello world", "utah state", "x"]
+        choices = ["hello  world", "state of utah", "hello", "", "x y"]
+
+        scores = batch_fuzzy_scores(queries, choices, SIMILARITY_SCORERS, score_cutoff=0.7)
+
+        for row, query in enumerate(queries):
+            for column, choice in enumerate(choices):
+                expected = max(scorer(query, choice) / 100.0 for scorer in SIMILARITY_SCORERS)
+                if expected >= 0.7:
+                    assert scores[row, column] == expected
+                else:
+                    assert scores[row, column] <= expected
+        assert batch_fuzzy_scores([], choices, [fuzz.ratio]).shape == (0, 5)
+
+
+class TestIndexedPyMuPDFMatching:
+    """Test class for the indexed PyMuPDF matcher strategies."""
+
+    def test_character_view_matches_scalar_scores(self):
+        """Vectorized spatial and proximity scores equal the per-block methods."""
+        rng = random.Random(5)
+        blocks = []
+        for i in range(40):
+            x, y = rng.uniform(0, 300), rng.uniform(0, 300)
+            bbox = rng.choice([[x, y, x + 5, y + 10], [], [x, y]])
+            blocks.append({'block_id': f'e{i}', 'text': rng.choice("ABC"), 'bbox': bbox})
+        gbg_bbox = {'x': 50, 'y': 50, 'width': 150, 'height': 100}
+        matcher = PyMuPDFBlockMatcher()
+
+        view = _CharacterBlocks.from_blocks(blocks).view(gbg_bbox)
+        positions = np.arange(len(view.blocks))
+
+        assert view.spatial.tolist() == [matcher._calculate_bbox_similarity(b['bbox'], gbg_bbox)
+                                         for b in view.blocks]
+        for other in range(len(view.blocks)):
+            assert view.proximity(positions, other).tolist() == [
+                matcher._calculate_sequence_proximity(b, view.blocks[other]) for b in view.blocks
+            ]
+
+    def test_single_character_page(self):
+        """Thousands of single-character blocks are recombined into their lines."""
+        gbg_data, engine_data = _single_char_page()
+        assert len(engine_data['blocks']) > 3000
+
+        matches = PyMuPDFBlockMatcher().match_blocks(gbg_data, engine_data)
+
+        # Character boxes overlap their lines too little for the spatial strategies,
+        # so the characters are recombined into lines, each block at most once
+        engine_ids = [m.engine_block_id for m in matches]
+        assert len(engine_ids) == len(set(engine_ids)) > len(engine_data['blocks']) // 2
+        assert all(m.match_type.startswith('character_combination_') for m in matches)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
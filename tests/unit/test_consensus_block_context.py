@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for block-level feature caching in ConsensusScorer.
+Verifies cached scoring matches per-variation scoring; the speedup benchmark is opt-in.
+"""
+
+import statistics
+import time
+import pytest
+
+from src.compareblocks.consensus.score import BlockScoringContext, ConsensusScorer
+
+
+BASE_TEXT = "The quick brown fox jumps over the lazy dog near the river bank"
+NOISY_TEXTS = [
+    BASE_TEXT,
+    "The quick brown f0x jumps over the lazy dog near the river bank",
+    "The quick brown fox jumps ovcr the lazy dog near the rivcr bank",
+    "Tbe quick brown fox jumps over tbe lazy dog near the river",
+    "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG",
+]
+
+
+def _make_variations(k):
+    return [
+        {"text": NOISY_TEXTS[i % len(NOISY_TEXTS)] + ("" if i < len(NOISY_TEXTS) else f" {i}"),
+         "engine": f"engine_{i}",
+         "orientation": 0.0 if i % 4 else 90.0}
+        for i in range(k)
+    ]
+
+
+def _score_per_variation(scorer, variations, block_id=None):
+    """Pre-caching path: score_variation without a shared context recomputes the block features per variation."""
+    texts = [v["text"] for v in variations]
+    orientations = [v["orientation"] for v in variations if v.get("orientation") is not None]
+    expected_orientation = None
+    if orientations:
+        expected_orientation = statistics.mode(orientations) if len(set(orientations)) > 1 else orientations[0]
+    return [
+        scorer.score_variation(
+            variation_text=v["text"], engine_name=v["engine"], variation_index=i,
+            all_variations=texts, expected_orientation=expected_orientation,
+            actual_orientation=v.get("orientation"), block_id=block_id
+        )
+        for i, v in enumerate(variations)
+    ]
+
+
+class TestBlockScoringContext:
+    """Test class for block-level feature caching."""
+
+    @pytest.fixture(autouse=True)
+    def _deterministic_language_detection(self, monkeypatch):
+        """langdetect samples randomly per call; pin its seed so runs compare equal."""
+        try:
+            from langdetect import DetectorFactory
+        except ImportError:
+            return
+        monkeypatch.setattr(DetectorFactory, "seed", 0)
+
+    def setup_method(self):
+        """Set up the scorer."""
+        self.scorer = ConsensusScorer()
+
+    @pytest.mark.parametrize("block_id", [None, "block_1"])
+    def test_cached_scores_identical(self, block_id):
+        """score_variations produces the same VariationScore as per-variation scoring."""
+        variations = _make_variations(7)
+
+        cached = self.scorer.score_variations(variations, block_id=block_id)
+        uncached = _score_per_variation(self.scorer, variations, block_id=block_id)
+
+        assert cached == uncached
+        assert [s.to_dict() for s in cached] == [s.to_dict() for s in uncached]
+
+    def test_build_block_context(self):
+        """Block context holds the shared length, character and orientation features."""
+        texts = ["abc", "abcd", "abc"]
+        context = self.scorer.build_block_context(texts, [0.0, None, 0.0], block_id="b")
+
+        assert isinstance(context, BlockScoringContext)
+        assert context.length_consistency == self.scorer.core_extractor.compute_consistency_score(texts)
+        assert context.character_consistency.block_id == "b"
+        assert context.expected_orientation == 0.0
+        assert self.scorer.build_block_context(texts).expected_orientation is None
+
+    def test_build_block_context_rejects_mismatched_orientations(self):
+        """One orientation per variation text is required."""
+        with pytest.raises(ValueError):
+            self.scorer.build_block_context(["abc", "abcd", "abc"], [0.0, None, 90.0, 0.0])
+
+    @pytest.mark.benchmark
+    def test_benchmark_block_context_speedup(self):
+        """Report cached scoring time against the pre-caching per-variation scorer."""
+        print("\nengines  per-variation(ms)  cached(ms)  speedup")
+        for k in (5, 10, 20):
+            variations = _make_variations(k)
+
+            start = time.perf_counter()
+            per_variation = _score_per_variation(self.scorer, variations, block_id="bench")
+            per_variation_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            cached = self.scorer.score_variations(variations, block_id="bench")
+            cached_time = time.perf_counter() - start
+
+            assert cached == per_variation
+            print(f"{k:>7}  {per_variation_time * 1000:>17.1f}  {cached_time * 1000:>10.1f}  "
+                  f"{per_variation_time / cached_time:>6.1f}x")
+
+if __name__ == "__main__":
+    pytest.main([__file__])
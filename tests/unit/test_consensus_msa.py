@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for center-star multiple sequence alignment used by TokenLevelMerger.
+Verifies banded DP optimality and column consistency; the merge timing benchmark is opt-in.
+"""
+
+import random
+import time
+import numpy as np
+import pytest
+
+from src.compareblocks.consensus import msa
+from src.compareblocks.consensus.merge import TokenLevelMerger
+from src.compareblocks.consensus.msa import (
+    CenterStarAligner, banded_alignment, edit_distance, encode_token_sequences
+)
+
+
+WORDS = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+
+
+def _noisy_copies(count, length, edits, seed=0):
+    rng = random.Random(seed)
+    base = [rng.choice(WORDS) for _ in range(length)]
+    copies = []
+    for _ in range(count):
+        tokens = list(base)
+        for _ in range(edits):
+            pos = rng.randrange(len(tokens))
+            op = rng.random()
+            if op < 0.5:
+                tokens[pos] = rng.choice(WORDS) + "x"
+            elif op < 0.75:
+                del tokens[pos]
+            else:
+                tokens.insert(pos, "inserted")
+        copies.append(tokens)
+    return base, copies
+
+
+def _alignment_cost(a, b, pairs):
+    return sum(1 for i, j in pairs if i < 0 or j < 0 or a[i] != b[j])
+
+
+class TestMultipleSequenceAlignment:
+    """Test class for the center-star aligner."""
+
+    def test_banded_alignment_is_optimal(self):
+        """Banded DP at the edit distance yields an alignment of that cost."""
+        _, copies = _noisy_copies(6, 120, 12, seed=1)
+        encoded, _ = encode_token_sequences(copies)
+        for a in encoded:
+            for b in encoded:
+                distance = edit_distance(a, b)
+                pairs = banded_alignment(a, b, distance)
+                assert _alignment_cost(a, b, pairs) == distance
+                assert [i for i, _ in pairs if i >= 0] == list(range(len(a)))
+                assert [j for _, j in pairs if j >= 0] == list(range(len(b)))
+
+    def test_numpy_fallback_matches_rapidfuzz(self, monkeypatch):
+        """The NumPy banded distance and alignment agree with rapidfuzz."""
+        _, copies = _noisy_copies(4, 200, 30, seed=2)
+        aligner = CenterStarAligner()
+        expected = aligner.align(copies)
+
+        monkeypatch.setattr(msa, "RAPIDFUZZ_AVAILABLE", False)
+        fallback = aligner.align(copies)
+
+        assert np.array_equal(fallback.distance_matrix, expected.distance_matrix)
+        assert fallback.center_index == expected.center_index
+
+    def test_rows_preserve_sequences(self):
+        """Every row has the same length and drops back to its input sequence."""
+        _, copies = _noisy_copies(7, 80, 10, seed=3)
+        alignment = CenterStarAligner().align(copies)
+
+        assert len({len(row) for row in alignment.rows}) == 1
+        for row, tokens in zip(alignment.rows, copies):
+            assert [token for token in row if token is not None] == tokens
+
+    def test_alignment_is_deterministic(self):
+        """Repeated alignment of the same input produces identical columns."""
+        _, copies = _noisy_copies(5, 60, 8, seed=4)
+        aligner = CenterStarAligner()
+        assert aligner.align(copies).rows == aligner.align(copies).rows
+
+    def test_time_budget_leaves_rows_unaligned(self):
+        """With no budget left, only the center and the closest sequence are aligned."""
+        _, copies = _noisy_copies(5, 60, 8, seed=5)
+        alignment = CenterStarAligner(time_budget=0.0).align(copies)
+
+        assert len(alignment.unaligned_indices) == 3
+        for index in alignment.unaligned_indices:
+            assert all(token is None for token in alignment.rows[index])
+
+    def test_merge_long_block(self):
+        """Merging ten noisy 2,000-token variations recovers the base text."""
+        base, copies = _noisy_copies(10, 1000, 6, seed=6)
+        variations = [" ".join(tokens) for tokens in copies]
+
+        result = TokenLevelMerger().merge_variations(variations)
+
+        assert result.merge_statistics['alignment_length'] >= 2000
+        assert result.merge_statistics['unaligned_variations'] == []
+        # Majority vote removes substitutions; single-source insertions survive gaps
+        merged_words = [w for w in result.merged_text.split() if w != "inserted"]
+        assert merged_words == base
+
+    @pytest.mark.benchmark
+    def test_benchmark_merge_long_block(self):
+        """Report the time to merge ten noisy 2,000-token variations."""
+        _, copies = _noisy_copies(10, 1000, 6, seed=6)
+        variations = [" ".join(tokens) for tokens in copies]
+        merger = TokenLevelMerger()
+
+        start = time.perf_counter()
+        merger.merge_variations(variations)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nMerged 10 x 2,000-token variations in {elapsed:.3f}s")
+
+    def test_merge_identical_variations(self):
+        """Identical variations merge to the same text with full confidence."""
+        text = "Revenue grew 12% in 2023, driven by services."
+        result = TokenLevelMerger().merge_variations([text, text, text])
+
+        assert result.merged_text == text
+        assert result.confidence_score == 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for process-pool batch consensus decisions.
+Verifies parallel decisions match the serial path and keep block order.
+"""
+
+import pickle
+import pytest
+
+from src.compareblocks.consensus.parallel import ConsensusEngineConfig, iter_parallel_decisions
+from src.compareblocks.consensus.policy import (
+    DecisionPolicyEngine, PolicyThresholds, batch_consensus_decisions
+)
+from src.compareblocks.consensus.score import ScoringWeights
+from src.compareblocks.utils.workers import resolve_worker_count
+
+
+TEXTS = [
+    "The quick brown fox jumps over the lazy dog near the river bank",
+    "The quick brown f0x jumps over the lazy dog near the river bank",
+    "Financial statements were prepared in accordance with standards",
+    "Financial statements wcre prepared in accordance with standards",
+    "Total revenue increased by twelve percent compared to last year",
+]
+
+
+def _make_blocks(count):
+    blocks = []
+    for i in range(count):
+        text = TEXTS[i % len(TEXTS)]
+        blocks.append([
+            {"text": f"{text} {i}", "engine": "pymupdf"},
+            {"text": f"{text.replace('e', 'c', 1)} {i}", "engine": "tesseract"},
+            {"text": f"{text.upper()} {i}", "engine": "paddleocr"},
+        ][: 1 + i % 3])
+    return blocks
+
+
+class TestParallelConsensus:
+    """Test class for parallel batch consensus."""
+
+    @pytest.fixture(autouse=True)
+    def _deterministic_language_detection(self, monkeypatch):
+        """langdetect samples randomly per call; pin the parent's seed to match workers."""
+        try:
+            from langdetect import DetectorFactory
+        except ImportError:
+            return
+        monkeypatch.setattr(DetectorFactory, "seed", 0)
+
+    def test_config_round_trip_is_picklable(self):
+        """Captured configuration pickles and rebuilds an equivalent engine."""
+        engine = DecisionPolicyEngine(policy_thresholds=PolicyThresholds(clear_winner_threshold=0.3))
+        engine.guard.scorer.weights = ScoringWeights(language_fitness=0.5).normalize()
+        engine.guard.scorer.consistency_tracker.add_override_terms(["BECR"])
+
+        config = pickle.loads(pickle.dumps(ConsensusEngineConfig.from_engine(engine)))
+        rebuilt = config.build_engine()
+
+        assert rebuilt.policy_thresholds == engine.policy_thresholds
+        assert rebuilt.guard.scorer.weights == engine.guard.scorer.weights
+        assert rebuilt.guard.scorer.consistency_tracker.override_terms == {"becr"}
+
+    def test_batch_decisions_parallel_matches_serial(self):
+        """Parallel policy decisions equal the serial decisions, in block order."""
+        engine = DecisionPolicyEngine()
+        blocks = _make_blocks(23)
+
+        serial = engine.batch_decisions(blocks)
+        parallel = list(iter_parallel_decisions(
+            blocks, config=ConsensusEngineConfig.from_engine(engine, language_detection_seed=0),
+            max_workers=2, chunk_size=4
+        ))
+
+        assert [d.to_dict() for d in parallel] == [d.to_dict() for d in serial]
+
+    def test_batch_consensus_decisions_parallel_matches_serial(self):
+        """Module-level batch decisions stream back in order from a generator input."""
+        blocks = _make_blocks(17)
+        thresholds = PolicyThresholds(merge_similarity_threshold=0.6)
+
+        serial = batch_consensus_decisions(blocks, thresholds)
+        parallel = batch_consensus_decisions(
+            (block for block in blocks), thresholds, max_workers=2, chunk_size=3
+        )
+
+        assert parallel == serial
+
+    def test_invalid_arguments(self):
+        """Unknown tasks and non-positive chunk sizes are rejected."""
+        with pytest.raises(ValueError):
+            iter_parallel_decisions([], task="unknown")
+        with pytest.raises(ValueError):
+            iter_parallel_decisions([], chunk_size=0)
+        assert resolve_worker_count(None) >= 1
+        assert resolve_worker_count(3) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy engine loading and import-free availability discovery.
+Includes an opt-in cold-start benchmark for importing the engines package and manager.
+"""
+
+import json
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+from src.compareblocks.engines import discovery
+from src.compareblocks.engines.discovery import (
+    EngineAvailabilityCache, EngineProbe, EngineRequirements, detect_available_engines, probe_engine
+)
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Modules that must not load when the engines package or manager is imported
+HEAVY_MODULES = ["fitz", "pymupdf", "numpy", "cv2", "pytesseract", "PIL", "paddleocr", "paddle",
+                 "docling", "kreuzberg"]
+
+# The manager defers PDF metadata (fitz, jsonschema) to first use and loads no engine stacks
+MANAGER_EXCLUDED_MODULES = HEAVY_MODULES + ["jsonschema"]
+
+# Cold import budget; eager engine imports took several hundred milliseconds
+COLD_IMPORT_BUDGET_SECONDS = 0.25
+
+
+def _cold_import(module_name):
+    """Import a module in a fresh interpreter and report its time and loaded heavy modules."""
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module_name}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], cwd=str(PROJECT_ROOT),
+                               capture_output=True, text=True, timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class TestColdImport:
+    """Test class for engines package import cost."""
+
+    def test_engines_package_loads_no_heavy_modules(self):
+        """Importing the engines package loads no engine stacks."""
+        run = _cold_import("src.compareblocks.engines")
+
+        assert run["heavy"] == []
+
+    def test_manager_loads_no_engine_stacks(self):
+        """Importing the engine manager loads no OCR or document-model stacks."""
+        run = _cold_import("src.compareblocks.engines.manager")
+
+        for module_name in MANAGER_EXCLUDED_MODULES:
+            assert module_name not in run["heavy"]
+
+    @pytest.mark.benchmark
+    def test_cold_start_budget(self):
+        """Importing the engines package and the manager stays within the cold import budget."""
+        # Best of three runs absorbs scheduler noise on loaded machines
+        package_runs = [_cold_import("src.compareblocks.engines") for _ in range(3)]
+        manager_runs = [_cold_import("src.compareblocks.engines.manager") for _ in range(3)]
+
+        print(f"\nengines: {min(run['elapsed'] for run in package_runs):.3f}s, "
+              f"manager: {min(run['elapsed'] for run in manager_runs):.3f}s")
+        assert min(run["elapsed"] for run in package_runs) < COLD_IMPORT_BUDGET_SECONDS
+        assert min(run["elapsed"] for run in manager_runs) < COLD_IMPORT_BUDGET_SECONDS
+
+    def test_lazy_attributes(self):
+        """Public names resolve on first access; unknown names raise AttributeError."""
+        import src.compareblocks.engines as engines
+
+        from src.compareblocks.engines import PyMuPDFEngine, EngineResult
+        assert PyMuPDFEngine.__name__ == "PyMuPDFEngine"
+        assert EngineResult.__module__.endswith("engines.manager")
+        assert "TesseractEngine" in dir(engines)
+        with pytest.raises(AttributeError):
+            engines.NoSuchEngine
+
+
+class TestEngineProbes:
+    """Test class for package and binary probes."""
+
+    def test_probe_reports_missing_requirements(self, monkeypatch):
+        """Missing packages and executables make an engine unavailable."""
+        monkeypatch.setattr(discovery, "module_installed", lambda name: name not in ("PIL", "tesserocr"))
+        monkeypatch.setattr(discovery.shutil, "which", lambda name: None)
+        monkeypatch.setitem(discovery.ENGINE_REQUIREMENTS, "fake", EngineRequirements(binaries=("fake-bin",)))
+
+        probe = probe_engine("tesseract")
+        fake_probe = probe_engine("fake")
+
+        assert not probe.available
+        assert probe.missing_modules == ["PIL", "tesserocr"]
+        assert "package 'PIL'" in probe.reason
+        assert not fake_probe.available
+        assert fake_probe.missing_binaries == ["fake-bin"]
+        assert "executable 'fake-bin'" in fake_probe.reason
+
+    def test_tesseract_available_with_either_backend(self, monkeypatch):
+        """Tesseract is available through tesserocr alone or pytesseract with its executable."""
+        monkeypatch.setattr(discovery.shutil, "which", lambda name: None)
+        monkeypatch.setattr(discovery, "module_installed", lambda name: name != "pytesseract")
+        assert probe_engine("tesseract").available
+
+        monkeypatch.setattr(discovery.shutil, "which", lambda name: "/usr/bin/" + name)
+        monkeypatch.setattr(discovery, "module_installed", lambda name: name != "tesserocr")
+        assert probe_engine("tesseract").available
+
+        monkeypatch.setattr(discovery, "module_installed", lambda name: name not in ("tesserocr", "pytesseract"))
+        probe = probe_engine("tesseract")
+        assert not probe.available
+        assert probe.missing_modules == ["tesserocr"]
+
+    def test_paddleocr_requires_paddle(self, monkeypatch):
+        """PaddleOCR without the PaddlePaddle framework is unavailable."""
+        monkeypatch.setattr(discovery, "module_installed", lambda name: name != "paddle")
+
+        probe = probe_engine("paddleocr")
+
+        assert not probe.available
+        assert probe.missing_modules == ["paddle"]
+
+    def test_probe_does_not_import(self):
+        """Probing finds installed packages without importing them."""
+        assert discovery.module_installed("json")
+        assert not discovery.module_installed("definitely_not_an_installed_package")
+        assert not probe_engine("unknown").available
+
+        completed = subprocess.run(
+            [sys.executable, "-c",
+             "import sys\n"
+             "from src.compareblocks.engines.discovery import probe_engines\n"
+             "probe_engines()\n"
+             "print(any(m in sys.modules for m in ('pytesseract', 'PIL', 'paddleocr', 'docling')))"],
+            cwd=str(PROJECT_ROOT), capture_output=True, text=True, timeout=120
+        )
+        assert completed.stdout.strip().splitlines()[-1] == "False"
+
+
+class TestAvailabilityManifest:
+    """Test class for the cached availability manifest."""
+
+    def _counting_probes(self, monkeypatch):
+        calls = []
+
+        def fake_probe_engines(engine_names=None):
+            calls.append(1)
+            return {name: EngineProbe(name, name == "pymupdf") for name in discovery.ENGINE_REQUIREMENTS}
+
+        monkeypatch.setattr(discovery, "probe_engines", fake_probe_engines)
+        return calls
+
+    def test_manifest_reused_until_environment_changes(self, tmp_path, monkeypatch):
+        """A manifest is reused until the environment or engine requirements change."""
+        calls = self._counting_probes(monkeypatch)
+        cache = EngineAvailabilityCache(str(tmp_path / "engines.json"))
+
+        first = detect_available_engines(cache=cache)
+        second = detect_available_engines(cache=cache)
+
+        assert first == second
+        assert first["pymupdf"] and not first["docling"]
+        assert len(calls) == 1
+
+        monkeypatch.setitem(discovery.ENGINE_REQUIREMENTS, "paddleocr", EngineRequirements(modules=("paddleocr",)))
+        detect_available_engines(cache=cache)
+        assert len(calls) == 2
+
+        monkeypatch.setattr(discovery, "environment_fingerprint", lambda: "changed")
+        detect_available_engines(cache=cache)
+        assert len(calls) == 3
+
+    def test_refresh_and_corrupt_manifest(self, tmp_path, monkeypatch):
+        """Refreshing or a corrupt manifest triggers a new probe."""
+        calls = self._counting_probes(monkeypatch)
+        cache = EngineAvailabilityCache(str(tmp_path / "engines.json"))
+
+        detect_available_engines(cache=cache)
+        detect_available_engines(cache=cache, refresh=True)
+        assert len(calls) == 2
+
+        cache.manifest_path.write_text("{not json", encoding="utf-8")
+        detect_available_engines(cache=cache)
+        assert len(calls) == 3
+        assert json.loads(cache.manifest_path.read_text(encoding="utf-8"))["engines"]["pymupdf"]["available"]
+
+    def test_expired_manifest(self, tmp_path, monkeypatch):
+        """Manifests older than max_age are re-probed."""
+        calls = self._counting_probes(monkeypatch)
+        cache = EngineAvailabilityCache(str(tmp_path / "engines.json"), max_age=0)
+
+        detect_available_engines(cache=cache)
+        monkeypatch.setattr(discovery.time, "time", lambda: 1e12)
+        detect_available_engines(cache=cache)
+
+        assert len(calls) == 2
+
+    def test_manager_uses_discovery(self, monkeypatch):
+        """The engine manager reports probed availability without building engines."""
+        from src.compareblocks.engines import manager as manager_module
+
+        monkeypatch.setattr(manager_module, "detect_available_engines",
+                            lambda: {'pymupdf': True, 'tesseract': True, 'docling': False})
+
+        engine_manager = manager_module.ExtractionEngineManager()
+
+        assert engine_manager.available_engines == {
+            'pymupdf': True, 'tesseract': True, 'paddleocr': False, 'kreuzberg': False, 'docling': False
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental page-level OCR re-extraction.
+Verifies page fingerprints, dirty page detection, page overrides, execution-only settings and spliced outputs.
+"""
+
+import json
+import fitz
+import pytest
+from pathlib import Path
+
+from src.compareblocks.config.engine_config import EngineConfigurationManager
+from src.compareblocks.engines import manager as manager_module, ocr_pool, tesseract_engine
+from src.compareblocks.engines.incremental import (
+    FingerprintInputs, build_page_fingerprints, configuration_fingerprint_inputs,
+    extract_engine_incrementally, find_dirty_pages, hash_configuration
+)
+from src.compareblocks.engines.parallel import resolve_page_numbers
+from src.compareblocks.io.raster import release_page_raster_cache
+
+from tests.unit.test_engines_parallel import FIXTURE_PDFS, FIXTURES, _build_three_page_pdf, _fake_image_to_data
+
+
+def _gbg_analysis(path, page_blocks):
+    """Write a minimal GBG analysis with the given block bboxes per page."""
+    pages = {
+        str(page_num): {"blocks": [{"block_id": f"blk_{page_num}_{i}", "bbox": {"x": x, "y": 0, "width": 10, "height": 5}}
+                                   for i, x in enumerate(xs)]}
+        for page_num, xs in page_blocks.items()
+    }
+    path.write_text(json.dumps({"pages": pages}), encoding="utf-8")
+    return str(path)
+
+
+class TestPageSelection:
+    """Test class for explicit page lists."""
+
+    def test_resolve_pages(self):
+        """Explicit pages are sorted, de-duplicated and clipped to the document."""
+        assert list(resolve_page_numbers(5, pages=[3, 1, 3, 9])) == [1, 3]
+        assert list(resolve_page_numbers(5, page_range=(1, 3))) == [1, 2]
+        with pytest.raises(ValueError):
+            resolve_page_numbers(5, pages=[-1])
+
+
+class TestPageFingerprints:
+    """Test class for page and block fingerprints."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, monkeypatch):
+        if not all((FIXTURES / name).exists() for name in FIXTURE_PDFS):
+            pytest.skip("Fixture PDFs not available")
+        monkeypatch.chdir(tmp_path)
+        self.tmp_path = tmp_path
+        self.pdf_path = tmp_path / "three_pages.pdf"
+        _build_three_page_pdf(self.pdf_path)
+
+    def test_fingerprints_are_stable(self):
+        """Unchanged inputs give identical fingerprints and no dirty pages."""
+        inputs = FingerprintInputs(default_config_hash="c")
+        first = build_page_fingerprints(str(self.pdf_path), inputs)
+        second = build_page_fingerprints(str(self.pdf_path), inputs)
+
+        stored = json.loads(json.dumps({str(k): v.__dict__ for k, v in first.items()}))
+        assert find_dirty_pages(stored, second) == []
+        assert len({fingerprint.content_hash for fingerprint in first.values()}) == 3
+
+    def test_changes_mark_pages_dirty(self):
+        """Page content, page configuration and GBG blocks each dirty only their page."""
+        gbg_path = _gbg_analysis(self.tmp_path / "gbg.json", {0: [0, 20], 1: [0]})
+        inputs = FingerprintInputs(default_config_hash="c", gbg_analysis_path=gbg_path)
+        stored = {str(k): v.__dict__ for k, v in build_page_fingerprints(str(self.pdf_path), inputs).items()}
+        assert stored["0"]["block_ids"] == ["blk_0_0", "blk_0_1"]
+
+        config_changed = FingerprintInputs(page_config_hashes={2: "other"}, default_config_hash="c",
+                                           gbg_analysis_path=gbg_path)
+        assert find_dirty_pages(stored, build_page_fingerprints(str(self.pdf_path), config_changed)) == [2]
+
+        _gbg_analysis(self.tmp_path / "gbg.json", {0: [0, 25], 1: [0]})
+        assert find_dirty_pages(stored, build_page_fingerprints(str(self.pdf_path), inputs)) == [0]
+
+        _gbg_analysis(self.tmp_path / "gbg.json", {0: [0, 20], 1: [0]})
+        with fitz.open(str(self.pdf_path)) as doc:
+            doc[1].insert_text((50, 50), "edited")
+            doc.save(str(self.tmp_path / "edited.pdf"))
+        assert find_dirty_pages(stored, build_page_fingerprints(str(self.tmp_path / "edited.pdf"), inputs)) == [1]
+
+    def test_missing_pages_are_dirty(self):
+        """Pages absent from the previous output are re-extracted even if fingerprints match."""
+        current = build_page_fingerprints(str(self.pdf_path), FingerprintInputs())
+        stored = {str(k): v.__dict__ for k, v in current.items()}
+
+        assert find_dirty_pages(stored, current, extracted_pages={"0", "2"}) == [1]
+
+    def test_page_overrides(self):
+        """Page overrides of applied settings change only their page's configuration hash and settings."""
+        config_manager = EngineConfigurationManager(self.tmp_path / "engine_configurations.ndjson")
+        config_manager.add_engine_configuration("tesseract")
+        before = configuration_fingerprint_inputs(config_manager, "tesseract", str(self.pdf_path))
+
+        config_manager.add_page_override("tesseract", str(self.pdf_path), 1, {"dpi": 150})
+        after = configuration_fingerprint_inputs(config_manager, "tesseract", str(self.pdf_path))
+
+        assert config_manager.get_page_configuration("tesseract", str(self.pdf_path), 1)["dpi"] == 150
+        assert "page_overrides" not in config_manager.get_page_configuration("tesseract", str(self.pdf_path), 0)
+        assert [p for p in range(3) if before.page_config_hashes[p] != after.page_config_hashes[p]] == [1]
+        assert after.page_settings == {0: {"dpi": 300, "lang": "eng"}, 1: {"dpi": 150, "lang": "eng"},
+                                       2: {"dpi": 300, "lang": "eng"}}
+        assert after.page_config_hashes[0] == hash_configuration(after.page_settings[0])
+
+        # Settings the engine does not apply leave every page clean
+        config_manager.add_page_override("tesseract", str(self.pdf_path), 2, {"psm": 4})
+        assert configuration_fingerprint_inputs(config_manager, "tesseract", str(self.pdf_path)) == after
+
+
+class TestIncrementalExtraction:
+    """Test class for spliced Tesseract re-extraction."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, monkeypatch):
+        if not all((FIXTURES / name).exists() for name in FIXTURE_PDFS):
+            pytest.skip("Fixture PDFs not available")
+        if not ocr_pool.PYTESSERACT_AVAILABLE:
+            pytest.skip("pytesseract not available")
+        monkeypatch.chdir(tmp_path)
+        self.pdf_path = tmp_path / "three_pages.pdf"
+        self.output_path = tmp_path / "out" / "three_pages_tesseract.json"
+        _build_three_page_pdf(self.pdf_path)
+
+        self.ocr_calls = []
+
+        def counting_image_to_data(*args, **kwargs):
+            self.ocr_calls.append(1)
+            return _fake_image_to_data(*args, **kwargs)
+
+        monkeypatch.setattr(ocr_pool.pytesseract, "image_to_data", counting_image_to_data)
+        monkeypatch.setattr(tesseract_engine.TesseractEngine, "is_available", lambda self: True)
+        monkeypatch.setattr(tesseract_engine.TesseractEngine, "_get_tesseract_version", lambda self: "test")
+        self.engine = tesseract_engine.TesseractEngine(dpi=72)
+        yield
+        release_page_raster_cache()
+
+    def _run(self, inputs, **kwargs):
+        return extract_engine_incrementally("tesseract", str(self.pdf_path), inputs,
+                                            output_path=str(self.output_path), engine=self.engine, **kwargs)
+
+    def test_reruns_only_changed_pages(self):
+        """Changing one page's configuration re-extracts and splices only that page."""
+        first = self._run(FingerprintInputs(default_config_hash="c"))
+        calls_per_page = len(self.ocr_calls) / 3
+        assert first.summary["incremental"]["full_extraction"] is True
+
+        self.ocr_calls.clear()
+        unchanged = self._run(FingerprintInputs(default_config_hash="c"))
+        assert self.ocr_calls == []
+        assert unchanged.summary["incremental"]["reextracted_pages"] == []
+
+        second = self._run(FingerprintInputs(page_config_hashes={1: "new"}, default_config_hash="c"),
+                           metadata={"extraction_metadata": {"config_hash": "h"}})
+
+        assert len(self.ocr_calls) == calls_per_page
+        assert second.summary["incremental"] == {"full_extraction": False, "reextracted_pages": [1],
+                                                 "reused_pages": [0, 2]}
+        saved = json.loads(Path(second).read_text(encoding="utf-8"))
+        full = self.engine.extract_pdf(str(self.pdf_path))
+        assert saved["pages"] == json.loads(json.dumps(full["pages"]))
+        assert saved["summary"]["total_blocks"] == full["summary"]["total_blocks"]
+        assert saved["page_fingerprints"]["1"]["config_hash"] == "new"
+        assert saved["extraction_metadata"]["config_hash"] == "h"
+        assert "pages_extracted" not in saved["extraction_metadata"]
+
+    def test_worker_count_change_reextracts_nothing(self, tmp_path):
+        """max_workers only changes how pages are extracted, so changing it leaves every page clean."""
+        config_manager = EngineConfigurationManager(tmp_path / "engine_configurations.ndjson")
+        config_manager.add_engine_configuration("tesseract")
+        self._run(configuration_fingerprint_inputs(config_manager, "tesseract", str(self.pdf_path)))
+
+        config_manager.add_pdf_override("tesseract", str(self.pdf_path), {"max_workers": 4})
+        self.ocr_calls.clear()
+        result = self._run(configuration_fingerprint_inputs(config_manager, "tesseract", str(self.pdf_path)))
+
+        assert config_manager.get_max_workers("tesseract", str(self.pdf_path)) == 4
+        assert self.ocr_calls == []
+        assert result.summary["incremental"]["reextracted_pages"] == []
+
+    def test_page_override_reextracts_page_with_its_settings(self, tmp_path):
+        """A page override re-extracts only that page, with the overridden settings."""
+        config_manager = EngineConfigurationManager(tmp_path / "engine_configurations.ndjson")
+        config_manager.add_engine_configuration("tesseract")
+        config_manager.add_pdf_override("tesseract", str(self.pdf_path), {"dpi": 72})
+        self._run(configuration_fingerprint_inputs(config_manager, "tesseract", str(self.pdf_path)))
+
+        config_manager.add_page_override("tesseract", str(self.pdf_path), 1, {"dpi": 96})
+        self.ocr_calls.clear()
+        result = self._run(configuration_fingerprint_inputs(config_manager, "tesseract", str(self.pdf_path)))
+
+        assert result.summary["incremental"]["reextracted_pages"] == [1]
+        saved = json.loads(Path(result).read_text(encoding="utf-8"))
+        assert [saved["pages"][str(p)]["metadata"]["dpi"] for p in range(3)] == [72, 96, 72]
+
+    def test_unusable_output_triggers_full_extraction(self):
+        """Outputs without fingerprints are replaced by a full extraction."""
+        self.output_path.parent.mkdir(parents=True)
+        self.output_path.write_text(json.dumps({"engine": "tesseract", "pages": {}}), encoding="utf-8")
+
+        result = self._run(FingerprintInputs())
+
+        assert result.summary["incremental"]["full_extraction"] is True
+        assert result.summary["incremental"]["reextracted_pages"] == [0, 1, 2]
+
+    def test_manager_routes_fingerprinted_runs(self, monkeypatch):
+        """OCR engines with fingerprint inputs go through incremental extraction."""
+        calls = []
+        monkeypatch.setattr(manager_module, "extract_engine_incrementally",
+                            lambda engine_name, pdf_path, inputs, max_workers=1: calls.append(engine_name) or "")
+        monkeypatch.setattr(manager_module, "save_tesseract_extraction",
+                            lambda pdf_path, max_workers=1: calls.append("full") or "")
+
+        manager_module.run_engine_extraction("tesseract", str(self.pdf_path), fingerprint_inputs=FingerprintInputs())
+        manager_module.run_engine_extraction("tesseract", str(self.pdf_path))
+
+        assert calls == ["tesseract", "full"]
+
+    def test_rejects_other_engines(self):
+        """Only page-keyed OCR engines can be re-extracted incrementally."""
+        with pytest.raises(ValueError):
+            extract_engine_incrementally("docling", str(self.pdf_path), FingerprintInputs())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
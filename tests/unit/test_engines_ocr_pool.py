@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent Tesseract worker pool.
+Verifies futures keep order, workers reuse their Tesseract instance and engines batch regions.
+"""
+
+import threading
+import time
+import types
+import numpy as np
+import pytest
+
+from src.compareblocks.engines import ocr_pool
+from src.compareblocks.engines.ocr_pool import TesseractWorkerPool, tsv_to_dict
+
+
+def _ocr_dict(words, conf=90):
+    n = len(words)
+    return {'level': [5] * n, 'page_num': [1] * n, 'block_num': [1] * n, 'par_num': [1] * n,
+            'line_num': [1] * n, 'word_num': list(range(1, n + 1)), 'left': [0] * n,
+            'top': [0] * n, 'width': [10] * n, 'height': [10] * n, 'conf': [conf] * n,
+            'text': list(words)}
+
+
+class FakeTessBaseAPI:
+    """Stands in for tesserocr.PyTessBaseAPI and counts model loads."""
+    created = []
+
+    def __init__(self, lang='eng', psm=None, oem=None, variables=None):
+        self.lang = lang
+        self.psm = psm
+        self.oem = oem
+        self.variables = variables
+        self.ended = False
+        self.image = None
+        FakeTessBaseAPI.created.append(self)
+
+    def SetImage(self, image):
+        self.image = image
+
+    def Recognize(self):
+        time.sleep(0.01)
+
+    def GetTSVText(self, page):
+        return f"5\t1\t1\t1\t1\t1\t0\t0\t{self.image.size[0]}\t{self.image.size[1]}\t96.0\tword\n"
+
+    def End(self):
+        self.ended = True
+
+
+class TestTesseractWorkerPool:
+    """Test class for TesseractWorkerPool."""
+
+    def test_tsv_parsing_matches_pytesseract(self):
+        """C API TSV output parses to the same dict pytesseract builds."""
+        pytesseract = pytest.importorskip("pytesseract")
+        tsv = ("1\t1\t0\t0\t0\t0\t0\t0\t100\t50\t-1\t\n"
+               "5\t1\t1\t1\t1\t1\t10\t10\t30\t12\t95.5\tHello\n"
+               "5\t1\t1\t1\t1\t2\t45\t10\t30\t12\t91.2\tworld\n")
+        expected = pytesseract.pytesseract.file_to_dict(
+            ocr_pool._TSV_HEADER + "\n" + tsv, '\t', -1
+        )
+        assert tsv_to_dict(tsv) == expected
+
+    def test_futures_preserve_order_and_run_concurrently(self, monkeypatch):
+        """Batch results come back in submission order while workers overlap."""
+        if not ocr_pool.PYTESSERACT_AVAILABLE:
+            pytest.skip("pytesseract not available")
+
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_image_to_data(image, lang, output_type, config=None):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return _ocr_dict([str(int(image[0, 0]))])
+
+        monkeypatch.setattr(ocr_pool.pytesseract, "image_to_data", fake_image_to_data)
+        pool = TesseractWorkerPool(max_workers=4, backend="pytesseract")
+        images = [np.full((5, 5), value, dtype=np.uint8) for value in range(8)]
+
+        futures = pool.submit_batch(images, config='--psm 6')
+        texts = [future.result()['text'][0] for future in futures]
+        pool.shutdown()
+
+        assert texts == [str(value) for value in range(8)]
+        assert max(peak) > 1
+
+    def test_tesserocr_workers_keep_model_loaded(self, monkeypatch):
+        """Each worker thread creates one API per segmentation mode and reuses it."""
+        FakeTessBaseAPI.created = []
+        monkeypatch.setattr(ocr_pool, "tesserocr",
+                            types.SimpleNamespace(PyTessBaseAPI=FakeTessBaseAPI), raising=False)
+        monkeypatch.setattr(ocr_pool, "TESSEROCR_AVAILABLE", True)
+
+        pool = TesseractWorkerPool(max_workers=2, backend="tesserocr")
+        images = [np.zeros((8, 12), dtype=np.uint8) for _ in range(20)]
+        results = [f.result() for f in pool.submit_batch(images, config='--psm 6')]
+        results += [f.result() for f in pool.submit_batch(images[:4])]
+        pool.shutdown()
+
+        assert all(r['text'] == ['word'] and r['width'] == [12] for r in results)
+        assert len(FakeTessBaseAPI.created) <= 4
+        assert {api.psm for api in FakeTessBaseAPI.created} == {6, None}
+        assert all(api.ended for api in FakeTessBaseAPI.created)
+
+    def test_tesserocr_applies_config_options(self, monkeypatch):
+        """--psm, --oem and -c options configure the API; other options need pytesseract."""
+        FakeTessBaseAPI.created = []
+        monkeypatch.setattr(ocr_pool, "tesserocr",
+                            types.SimpleNamespace(PyTessBaseAPI=FakeTessBaseAPI), raising=False)
+        monkeypatch.setattr(ocr_pool, "TESSEROCR_AVAILABLE", True)
+        monkeypatch.setattr(ocr_pool, "PYTESSERACT_AVAILABLE", False)
+
+        pool = TesseractWorkerPool(max_workers=1, backend="tesserocr")
+        image = np.zeros((8, 12), dtype=np.uint8)
+        result = pool.image_to_data(image, config="--oem 1 --psm 7 -c tessedit_char_whitelist=0123456789")
+        with pytest.raises(ValueError, match="pytesseract is not installed"):
+            pool.image_to_data(image, config="--dpi 300")
+        pool.shutdown()
+
+        assert result['text'] == ['word']
+        [api] = FakeTessBaseAPI.created
+        assert (api.psm, api.oem) == (7, 1)
+        assert api.variables == {"tessedit_char_whitelist": "0123456789"}
+
+    def test_invalid_backend(self):
+        """Unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            TesseractWorkerPool(backend="cuneiform")
+
+
+class TestGuidedEngineBatching:
+    """Test class for GBG-guided orientation tests on the pool."""
+
+    def test_orientation_batch_matches_per_rotation_preprocessing(self):
+        """Preprocessing once then rotating yields the images the old loop produced."""
+        cv2 = pytest.importorskip("cv2")
+        from src.compareblocks.engines.gbg_guided_tesseract_engine import GBGGuidedTesseractEngine
+
+        submitted = []
+
+        class RecordingPool:
+            max_workers = 1
+
+            def submit(self, image, config=""):
+                submitted.append((image, config))
+                from concurrent.futures import Future
+                future = Future()
+                words = ["english", "language", "arts"] if len(submitted) == 1 else ["xx"]
+                future.set_result(_ocr_dict(words))
+                return future
+
+        from src.compareblocks.engines.orientation_search import OrientationSearchConfig
+
+        # An unreachable early-exit bar makes the search test every angle
+        engine = GBGGuidedTesseractEngine(
+            ocr_pool=RecordingPool(),
+            orientation_search=OrientationSearchConfig(early_exit_confidence=1.1)
+        )
+        rng = np.random.default_rng(0)
+        region = rng.integers(0, 255, size=(40, 90, 3), dtype=np.uint8)
+
+        best = engine._test_orientations(region, "English Language Arts", 0)
+
+        rotations = [None, cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_180, cv2.ROTATE_90_COUNTERCLOCKWISE]
+        assert len(submitted) == len(rotations)
+        assert np.array_equal(submitted[0][0], engine._preprocess_for_ocr(region))
+        for rotation in rotations:
+            rotated = region if rotation is None else cv2.rotate(region, rotation)
+            expected = engine._preprocess_for_ocr(rotated)
+            assert any(np.array_equal(image, expected) for image, _ in submitted)
+        assert all(config == '--psm 6' for _, config in submitted)
+        assert best.angle == 0
+        assert best.text == "english language arts"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
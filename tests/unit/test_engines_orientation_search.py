@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests for the early-exit orientation search of the GBG-guided Tesseract engine.
+Verifies stage planning, hint handling, early exit and the per-document statistics.
+"""
+
+from concurrent.futures import Future
+import numpy as np
+import pytest
+
+from src.compareblocks.engines.orientation_search import (
+    ORIENTATION_ANGLES, OrientationSearchConfig, OrientationSearchStats, plan_orientation_stages,
+    predicted_angle, projection_axis_angle
+)
+
+
+def _ocr_dict(words, conf=90):
+    n = len(words)
+    return {'level': [5] * n, 'page_num': [1] * n, 'block_num': [1] * n, 'par_num': [1] * n,
+            'line_num': [1] * n, 'word_num': list(range(1, n + 1)), 'left': [0] * n,
+            'top': [0] * n, 'width': [10] * n, 'height': [10] * n, 'conf': [conf] * n,
+            'text': list(words)}
+
+
+def _striped_region(horizontal=True):
+    """White region with dark text-like lines along one axis."""
+    region = np.full((60, 60), 255, dtype=np.uint8)
+    for start in range(5, 60, 12):
+        if horizontal:
+            region[start:start + 4, 5:55] = 0
+        else:
+            region[5:55, start:start + 4] = 0
+    return region
+
+
+class AngleAwarePool:
+    """Fake OCR pool that reads the rotation back from the submitted image's shape."""
+    max_workers = 1
+
+    def __init__(self, good_angle, shape, text="english language arts"):
+        self.good_angle = good_angle
+        self.shape = shape
+        self.text = text
+        self.angles = []
+
+    def submit(self, image, config=""):
+        # Tall regions come back rotated by 90° or 270°; a marker pixel tells them apart
+        if image.shape[:2] == self.shape[:2]:
+            angle = 0 if image[0, 0] < 128 else 180
+        else:
+            angle = 270 if image[-1, 0] < 128 else 90
+        self.angles.append(angle)
+        words = self.text.split() if angle == self.good_angle else ["xx"]
+        future = Future()
+        future.set_result(_ocr_dict(words, conf=90 if angle == self.good_angle else 20))
+        return future
+
+
+def _marked_region():
+    """Wide BGR region with a black marker block in the top-left corner."""
+    region = np.full((40, 90, 3), 255, dtype=np.uint8)
+    region[:10, :10] = 0
+    return region
+
+
+class TestOrientationPlanning:
+    """Test class for orientation stage planning helpers."""
+
+    def test_stages_cover_every_angle_once(self):
+        """Every plan tries each rotation exactly once, predicted angle first."""
+        for first in (0, 90, 180, 270):
+            for axis in (None, 0, 90):
+                stages = plan_orientation_stages(first, axis)
+                flat = [angle for stage in stages for angle in stage]
+                assert sorted(flat) == [0, 90, 180, 270]
+                assert stages[0] == [first]
+
+    def test_projection_axis_reorders_stages(self):
+        """A projection axis across the prediction promotes the other axis."""
+        assert plan_orientation_stages(0, None) == [[0], [180], [90, 270]]
+        assert plan_orientation_stages(0, 0) == [[0], [180], [90, 270]]
+        assert plan_orientation_stages(0, 90) == [[0], [90, 270], [180]]
+
+    def test_predicted_angle_snaps_hints(self):
+        """GBG page rotation hints snap to the nearest right angle."""
+        assert predicted_angle({'orientation_hints': {'page_rotation': 88.0}}) == 90
+        assert predicted_angle({'orientation_hints': {'page_rotation': -90}}) == 270
+        assert predicted_angle({'orientation_hints': {'page_rotation': 'n/a'}}) == 0
+        assert predicted_angle({}) == 0
+        assert predicted_angle(None) == 0
+
+    def test_projection_axis(self):
+        """Row and column profiles reveal the text axis of striped regions."""
+        assert projection_axis_angle(_striped_region(horizontal=True)) == 0
+        assert projection_axis_angle(_striped_region(horizontal=False)) == 90
+        assert projection_axis_angle(np.full((20, 20), 255, dtype=np.uint8)) is None
+
+    def test_invalid_config(self):
+        """Negative early-exit bars are rejected."""
+        with pytest.raises(ValueError):
+            OrientationSearchConfig(early_exit_confidence=-0.1)
+
+    def test_stats_report_saved_passes(self):
+        """Saved passes are measured against four OCR passes per block."""
+        stats = OrientationSearchStats(blocks=3, ocr_passes=5, early_exits=2, predicted_hits=2)
+        assert stats.to_dict()['ocr_passes_saved'] == 7
+
+
+class TestGuidedEngineEarlyExit:
+    """Test class for the staged search inside GBGGuidedTesseractEngine."""
+
+    @pytest.fixture(autouse=True)
+    def _engine_module(self):
+        pytest.importorskip("cv2")
+        from src.compareblocks.engines import gbg_guided_tesseract_engine
+        self.module = gbg_guided_tesseract_engine
+
+    def _engine(self, pool, **config):
+        return self.module.GBGGuidedTesseractEngine(
+            ocr_pool=pool, orientation_search=OrientationSearchConfig(**config)
+        )
+
+    def test_confident_prediction_exits_after_one_pass(self):
+        """A confident result at the predicted angle skips the other rotations."""
+        region = _marked_region()
+        pool = AngleAwarePool(good_angle=90, shape=region.shape)
+        engine = self._engine(pool)
+        gbg_block = {'orientation_hints': {'page_rotation': 90.0}}
+
+        best = engine._test_orientations(region, "English Language Arts", 0, gbg_block)
+
+        assert best.angle == 90
+        assert pool.angles == [90]
+        stats = engine.orientation_stats.to_dict()
+        assert stats['ocr_passes_saved'] == 3
+        assert stats['early_exits'] == 1
+        assert stats['predicted_hits'] == 1
+
+    def test_wrong_prediction_falls_through_to_later_stages(self):
+        """When the predicted angle is poor, the search continues until it finds the text."""
+        region = _marked_region()
+        pool = AngleAwarePool(good_angle=180, shape=region.shape)
+        engine = self._engine(pool, use_projection_precheck=False)
+
+        best = engine._test_orientations(region, "English Language Arts", 0)
+
+        assert best.angle == 180
+        assert pool.angles == [0, 180]
+        assert engine.orientation_stats.predicted_hits == 0
+
+    def test_exhaustive_search_matches_previous_selection(self):
+        """Without early exit the chosen orientation equals the four-way maximum."""
+        region = _marked_region()
+        for good_angle in (0, 90, 180, 270):
+            pool = AngleAwarePool(good_angle=good_angle, shape=region.shape)
+            engine = self._engine(pool, early_exit_confidence=1.1)
+
+            best = engine._test_orientations(region, "English Language Arts", 0)
+            pending = engine._submit_rotations(engine._preprocess_for_ocr(region), ORIENTATION_ANGLES)
+            previous = engine._best_orientation(engine._score_pending(pending, "English Language Arts"))
+
+            assert best.angle == previous.angle == good_angle
+            assert sorted(pool.angles[:4]) == [0, 90, 180, 270]
+
+    def test_page_search_batches_blocks_and_reports_stats(self, monkeypatch):
+        """Page processing searches all blocks together and records the savings."""
+        region = _marked_region()
+        pool = AngleAwarePool(good_angle=0, shape=region.shape)
+        engine = self._engine(pool)
+        gbg_blocks = [{'block_id': f'b{i}', 'text_content': 'English Language Arts'} for i in range(3)]
+
+        monkeypatch.setattr(engine, "_get_gbg_blocks_for_page", lambda data, page_num: gbg_blocks)
+        monkeypatch.setattr(engine, "_extract_block_region",
+                            lambda image, block: (region, [0, 0, 45, 20]))
+        monkeypatch.setattr(self.module, "render_page_array",
+                            lambda page, dpi: np.zeros((10, 10, 3), dtype=np.uint8))
+
+        blocks = engine._process_page_with_gbg_guidance({0: object()}, 0, {})
+
+        assert [b.orientation.angle for b in blocks] == [0, 0, 0]
+        assert pool.angles == [0, 0, 0]
+        assert engine.orientation_stats.to_dict() == {
+            'blocks': 3, 'ocr_passes': 3, 'ocr_passes_saved': 9,
+            'early_exits': 3, 'predicted_hits': 3
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
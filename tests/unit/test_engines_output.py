@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Tests for single-pass engine output writing.
+Verifies JSON layouts, returned summaries and configuration metadata written with the results.
+"""
+
+import json
+import os
+import pickle
+import shutil
+import pytest
+from pathlib import Path
+
+from src.compareblocks.engines import manager as manager_module
+from src.compareblocks.engines.output import (
+    EngineOutput, merge_output_metadata, save_engine_output, write_engine_json
+)
+from src.compareblocks.engines.scheduler import EngineScheduler, SchedulerBudget
+
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+SAMPLE_RESULTS = {
+    "engine": "test",
+    "extraction_metadata": {"total_pages": 2, "dpi": 300},
+    "pages": {"0": {"blocks": [{"text": "Grüße", "bbox": [0, 0, 1, 1]}]}, "1": {"blocks": []}},
+    "empty": {},
+    "summary": {"total_blocks": 1}
+}
+
+
+def _output_runner(engine_name, pdf_path, max_workers, json_format="indented", metadata=None):
+    """Scheduler runner that saves a small output and marks its in-memory summary."""
+    results = json.loads(json.dumps(SAMPLE_RESULTS))
+    output_path = save_engine_output(results, Path(pdf_path) / f"{engine_name}.json", json_format, metadata)
+    # Only the in-memory copy carries this flag, so readers of the file cannot see it
+    output_path.summary["in_memory"] = True
+    return output_path
+
+
+def _no_output_runner(engine_name, pdf_path, max_workers, **options):
+    """Scheduler runner for an engine whose extraction fails without raising."""
+    return None
+
+
+class TestJsonFormats:
+    """Test class for engine output JSON layouts."""
+
+    @pytest.mark.parametrize("json_format", ["indented", "compact", "stream"])
+    def test_formats_round_trip(self, tmp_path, json_format):
+        """Every layout loads back to the same results."""
+        output_path = tmp_path / "out.json"
+
+        write_engine_json(SAMPLE_RESULTS, str(output_path), json_format)
+
+        text = output_path.read_text(encoding="utf-8")
+        assert json.loads(text) == SAMPLE_RESULTS
+        assert "Grüße" in text
+        assert ("\n" in text) == (json_format == "indented")
+
+    def test_stream_matches_compact(self, tmp_path):
+        """The streaming writer produces the compact layout byte for byte."""
+        results = dict(SAMPLE_RESULTS, numbered={1: "a", 2: {"b": None}}, flag=True)
+
+        write_engine_json(results, str(tmp_path / "compact.json"), "compact")
+        write_engine_json(results, str(tmp_path / "stream.json"), "stream")
+
+        assert (tmp_path / "compact.json").read_bytes() == (tmp_path / "stream.json").read_bytes()
+
+    def test_unknown_format(self, tmp_path):
+        """Unknown layouts are rejected."""
+        with pytest.raises(ValueError):
+            write_engine_json(SAMPLE_RESULTS, str(tmp_path / "out.json"), "yaml")
+
+
+class TestEngineOutput:
+    """Test class for saved outputs returned with their summary."""
+
+    def test_save_returns_path_and_summary(self, tmp_path):
+        """The returned output gives the path and the summary, not the full results."""
+        results = json.loads(json.dumps(SAMPLE_RESULTS))
+
+        output_path = save_engine_output(results, str(tmp_path / "nested" / "out.json"), "compact",
+                                         metadata={"extraction_metadata": {"config_hash": "abc"}})
+
+        assert isinstance(output_path, EngineOutput)
+        assert output_path.path == str(tmp_path / "nested" / "out.json")
+        assert str(output_path) == os.fspath(output_path) == output_path.path
+        assert output_path.summary == {"total_blocks": 1}
+        assert not hasattr(output_path, "results")
+        saved = json.loads(Path(output_path).read_text(encoding="utf-8"))
+        assert saved["extraction_metadata"] == {"total_pages": 2, "dpi": 300, "config_hash": "abc"}
+
+    def test_pickles_path_and_summary(self):
+        """Crossing a process boundary sends only the path and summary."""
+        output_path = EngineOutput("out.json", {"total_blocks": 1})
+
+        restored = pickle.loads(pickle.dumps(output_path))
+
+        assert restored == output_path
+
+    def test_merge_output_metadata(self):
+        """Dict sections are updated; other sections are replaced."""
+        results = {"extraction_metadata": {"dpi": 300}, "note": "old"}
+
+        merge_output_metadata(results, {"extraction_metadata": {"config_hash": "x"}, "note": "new",
+                                        "processing_metadata": {"configuration": {}}})
+
+        assert results == {"extraction_metadata": {"dpi": 300, "config_hash": "x"}, "note": "new",
+                           "processing_metadata": {"configuration": {}}}
+
+
+class TestEngineSavePaths:
+    """Test class for engine save functions and the engine manager."""
+
+    def test_pymupdf_save_writes_metadata_in_one_pass(self, tmp_path, monkeypatch):
+        """PyMuPDF saves merged metadata and returns its summary."""
+        source = FIXTURES / "simple_single_column.pdf"
+        if not source.exists():
+            pytest.skip("Fixture PDF not available")
+        # PDF metadata stores paths relative to the working directory
+        monkeypatch.chdir(tmp_path)
+        pdf_path = tmp_path / "doc.pdf"
+        shutil.copy(source, pdf_path)
+
+        from src.compareblocks.engines.pymupdf_engine import save_raw_pymupdf_extraction
+
+        output_path = save_raw_pymupdf_extraction(str(pdf_path), str(tmp_path / "doc_pymupdf.json"),
+                                                  json_format="stream",
+                                                  metadata={"extraction_metadata": {"config_hash": "h"}})
+
+        saved = json.loads(Path(output_path).read_text(encoding="utf-8"))
+        assert saved["extraction_metadata"]["config_hash"] == "h"
+        assert saved["extraction_metadata"]["extraction_type"]
+        assert output_path.summary == saved["summary"]
+
+    def test_manager_uses_in_memory_summary(self, tmp_path, monkeypatch):
+        """In-process extraction never re-reads the output it just wrote."""
+        calls = []
+
+        def fake_save(pdf_path, json_format="indented", metadata=None):
+            calls.append((json_format, metadata))
+            return _output_runner("pymupdf", str(tmp_path), 1, json_format, metadata)
+
+        monkeypatch.setattr(manager_module, "save_raw_pymupdf_extraction", fake_save)
+        engine_manager = manager_module.ExtractionEngineManager(json_format="compact")
+
+        result = engine_manager.extract_with_engine(
+            "pymupdf", str(tmp_path), output_metadata={"extraction_metadata": {"config_hash": "h"}}
+        )
+
+        assert result.success
+        assert type(result.output_path) is str
+        assert result.metadata["in_memory"] is True
+        assert json.loads(Path(result.output_path).read_text(encoding="utf-8"))[
+            "extraction_metadata"]["config_hash"] == "h"
+        assert calls == [("compact", {"extraction_metadata": {"config_hash": "h"}})]
+
+    def test_failed_extraction_returns_none(self, tmp_path, monkeypatch):
+        """An engine that produces no output is reported as failed, in process and scheduled."""
+        monkeypatch.setattr(manager_module, "save_raw_pymupdf_extraction", lambda pdf_path: None)
+        monkeypatch.setattr(manager_module.ExtractionEngineManager, "_detect_available_engines",
+                            lambda self: {'pymupdf': True, 'docling': True})
+        scheduler = EngineScheduler(budget=SchedulerBudget(cpu_slots=2, memory_mb=100000),
+                                    runner=_no_output_runner, poll_interval=0.02)
+        engine_manager = manager_module.ExtractionEngineManager(scheduler=scheduler)
+
+        result = engine_manager.extract_with_engine("pymupdf", str(tmp_path))
+        scheduled = engine_manager.run_engines_scheduled(['docling'], str(tmp_path))['docling']
+
+        for failed in (result, scheduled):
+            assert not failed.success
+            assert failed.output_path == ""
+            assert failed.metadata is None
+
+    def test_scheduled_runs_receive_options_and_return_summary(self, tmp_path, monkeypatch):
+        """Engine processes write metadata themselves and send their summary back."""
+        monkeypatch.setattr(manager_module.ExtractionEngineManager, "_detect_available_engines",
+                            lambda self: {'pymupdf': True, 'docling': True})
+        scheduler = EngineScheduler(budget=SchedulerBudget(cpu_slots=2, memory_mb=100000),
+                                    runner=_output_runner, poll_interval=0.02)
+        engine_manager = manager_module.ExtractionEngineManager(scheduler=scheduler, json_format="stream")
+
+        results = engine_manager.run_engines_scheduled(
+            ['pymupdf', 'docling'], str(tmp_path),
+            output_metadata={'docling': {"extraction_metadata": {"config_hash": "d"}}}
+        )
+
+        assert results['docling'].metadata["in_memory"] is True
+        docling = json.loads((tmp_path / "docling.json").read_text(encoding="utf-8"))
+        assert docling["extraction_metadata"]["config_hash"] == "d"
+        assert "config_hash" not in json.loads((tmp_path / "pymupdf.json").read_text(encoding="utf-8"))[
+            "extraction_metadata"]
+        assert "\n" not in (tmp_path / "docling.json").read_text(encoding="utf-8")
+
+    def test_comprehensive_processor_skips_rewrite(self, tmp_path, monkeypatch):
+        """Configuration metadata is written with the results, not by a second rewrite."""
+        from src.compareblocks.engines.comprehensive_engine_gbg_processor import (
+            ComprehensiveEngineGBGProcessor, EngineConfigurationResult
+        )
+
+        monkeypatch.setattr(manager_module, "save_raw_pymupdf_extraction",
+                            lambda pdf_path, metadata=None: _output_runner("pymupdf", str(tmp_path), 1,
+                                                                           metadata=metadata))
+        processor = object.__new__(ComprehensiveEngineGBGProcessor)
+        processor.engine_manager = manager_module.ExtractionEngineManager()
+        processor.engine_manager.available_engines['pymupdf'] = True
+        rewrites = []
+        monkeypatch.setattr(processor, "enhance_engine_output_with_configuration",
+                            lambda *args: rewrites.append(args))
+        monkeypatch.setattr(processor, "_check_skip", lambda *args: None)
+        config_result = EngineConfigurationResult("pymupdf", {"dpi": 150}, True, "pdf_override")
+
+        result = processor.process_engine_with_configuration("pymupdf", config_result, str(tmp_path))
+
+        assert result.success, result.error_message
+        assert rewrites == []
+        assert result.configuration_hash == processor.generate_config_hash({"dpi": 150})
+        saved = json.loads((tmp_path / "pymupdf.json").read_text(encoding="utf-8"))
+        assert saved["extraction_metadata"]["config_hash"] == processor.generate_config_hash({"dpi": 150})
+        assert saved["extraction_metadata"]["config_source"] == "pdf_override"
+        assert saved["extraction_metadata"]["dpi"] == 300
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Tests for page-sharded OCR engine extraction.
+Verifies page ranges, per-worker engines and that sharded runs match in-process output.
+"""
+
+import fitz
+import numpy as np
+import pytest
+from pathlib import Path
+
+from src.compareblocks.config.engine_config import EngineConfigurationManager
+from src.compareblocks.engines import ocr_pool, parallel, paddleocr_engine, tesseract_engine
+from src.compareblocks.engines.output import EngineOutput
+from src.compareblocks.engines.parallel import page_range_suffix, resolve_page_numbers
+from src.compareblocks.io.raster import release_page_raster_cache
+
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+FIXTURE_PDFS = ["simple_single_column.pdf", "multi_column.pdf", "rotated_text.pdf"]
+
+
+def _fake_image_to_data(image, lang, output_type, config=None):
+    """Deterministic OCR output derived from the page pixels."""
+    array = np.asarray(image)
+    words = [f"w{int(array.mean())}", f"h{array.shape[0]}", "text"]
+    n = len(words)
+    return {'text': words, 'conf': [90, 80, 70], 'left': [10, 40, 70][:n], 'top': [5] * n,
+            'width': [20] * n, 'height': [10] * n, 'block_num': [1, 1, 2]}
+
+
+class FakePaddleOCR:
+    """Stands in for a loaded PaddleOCR model."""
+    loads = 0
+
+    def __init__(self):
+        FakePaddleOCR.loads += 1
+
+    def ocr(self, image, cls=True):
+        height, width = image.shape[:2]
+        return [[
+            [[[0, 0], [width / 2, 0], [width / 2, 20], [0, 20]], (f"mean {int(image.mean())}", 0.9)],
+            [[[0, 30], [width, 30], [width, 50], [0, 50]], (f"height {height}", 0.8)]
+        ]]
+
+
+def _build_three_page_pdf(pdf_path):
+    """Concatenate the fixture PDFs into one multi-page document."""
+    combined = fitz.open()
+    for name in FIXTURE_PDFS:
+        with fitz.open(str((FIXTURES / name).resolve())) as source:
+            combined.insert_pdf(source)
+    combined.save(str(pdf_path))
+    combined.close()
+
+
+def _in_process_map(engine_name, pdf_path, page_numbers, max_workers=None, engine_kwargs=None):
+    """Run the worker initializer and page tasks in this process."""
+    parallel._init_worker(engine_name, pdf_path, engine_kwargs or {})
+    try:
+        return [parallel._run_page_task(page_num) for page_num in page_numbers]
+    finally:
+        parallel._worker_state.pop("doc").close()
+
+
+class TestPageRanges:
+    """Test class for page range helpers."""
+
+    def test_resolve_page_numbers(self):
+        """Ranges are end-exclusive and clipped to the document."""
+        assert resolve_page_numbers(5) == range(5)
+        assert resolve_page_numbers(5, (1, 3)) == range(1, 3)
+        assert resolve_page_numbers(5, (3, 99)) == range(3, 5)
+        assert resolve_page_numbers(5, (7, 9)) == range(5, 5)
+
+    def test_invalid_page_range(self):
+        """Negative or reversed ranges are rejected."""
+        with pytest.raises(ValueError):
+            resolve_page_numbers(5, (-1, 2))
+        with pytest.raises(ValueError):
+            resolve_page_numbers(5, (3, 1))
+
+    def test_page_range_suffix(self):
+        """Only page-range runs get a distinct output filename."""
+        assert page_range_suffix({"extraction_metadata": {}}) == ""
+        assert page_range_suffix({"extraction_metadata": {"page_range": [2, 5]}}) == "_p2-5"
+
+    def test_unknown_engine(self):
+        """Only OCR engines can be page-sharded."""
+        with pytest.raises(ValueError):
+            list(parallel.map_engine_pages("docling", "missing.pdf", [0]))
+
+
+class TestShardedExtraction:
+    """Test class for sharded Tesseract and PaddleOCR extraction."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, monkeypatch):
+        if not all((FIXTURES / name).exists() for name in FIXTURE_PDFS):
+            pytest.skip("Fixture PDFs not available")
+
+        # PDF metadata stores paths relative to the working directory
+        monkeypatch.chdir(tmp_path)
+        self.pdf_path = tmp_path / "three_pages.pdf"
+        _build_three_page_pdf(self.pdf_path)
+
+        self.sharded_calls = []
+
+        def recording_map(*args, **kwargs):
+            self.sharded_calls.append(args)
+            return _in_process_map(*args, **kwargs)
+
+        monkeypatch.setattr(tesseract_engine, "map_engine_pages", recording_map)
+        monkeypatch.setattr(paddleocr_engine, "map_engine_pages", recording_map)
+        yield
+        release_page_raster_cache()
+
+    def _patch_tesseract(self, monkeypatch):
+        if not ocr_pool.PYTESSERACT_AVAILABLE:
+            pytest.skip("pytesseract not available")
+        monkeypatch.setattr(ocr_pool.pytesseract, "image_to_data", _fake_image_to_data)
+        monkeypatch.setattr(tesseract_engine.TesseractEngine, "is_available", lambda self: True)
+        monkeypatch.setattr(tesseract_engine.TesseractEngine, "_get_tesseract_version", lambda self: "test")
+
+    def _patch_paddle(self, monkeypatch):
+        FakePaddleOCR.loads = 0
+
+        def fake_get_ocr_engine(engine):
+            if engine._ocr_engine is None:
+                engine._ocr_engine = FakePaddleOCR()
+            return engine._ocr_engine
+
+        monkeypatch.setattr(paddleocr_engine, "PADDLEOCR_AVAILABLE", True)
+        monkeypatch.setattr(paddleocr_engine.PaddleOCREngine, "_get_ocr_engine", fake_get_ocr_engine)
+        monkeypatch.setattr(paddleocr_engine.PaddleOCREngine, "_get_paddleocr_version", lambda self: "test")
+
+    def test_tesseract_sharded_matches_in_process(self, monkeypatch):
+        """Sharded Tesseract extraction produces the same JSON as the in-process path."""
+        self._patch_tesseract(monkeypatch)
+        engine = tesseract_engine.TesseractEngine(dpi=72)
+
+        sequential = engine.extract_pdf(str(self.pdf_path))
+        sharded = engine.extract_pdf(str(self.pdf_path), max_workers=3)
+
+        assert len(self.sharded_calls) == 1
+        assert self.sharded_calls[0][0] == "tesseract"
+        assert sharded == sequential
+        assert list(sharded["pages"]) == ["0", "1", "2"]
+
+    def test_tesseract_page_range(self, monkeypatch):
+        """A page range extracts only its pages, identically to a full run."""
+        self._patch_tesseract(monkeypatch)
+        engine = tesseract_engine.TesseractEngine(dpi=72)
+
+        full = engine.extract_pdf(str(self.pdf_path))
+        shard = engine.extract_pdf(str(self.pdf_path), max_workers=2, page_range=(1, 3))
+
+        assert list(shard["pages"]) == ["1", "2"]
+        assert shard["pages"]["1"] == full["pages"]["1"]
+        assert shard["pages"]["2"] == full["pages"]["2"]
+        assert shard["extraction_metadata"]["page_range"] == [1, 3]
+        assert shard["summary"]["total_pages"] == 2
+
+    def test_paddleocr_sharded_matches_in_process(self, monkeypatch):
+        """Sharded PaddleOCR extraction matches and loads the model once per worker."""
+        self._patch_paddle(monkeypatch)
+        engine = paddleocr_engine.PaddleOCREngine()
+
+        sequential = engine.extract_pdf(str(self.pdf_path))
+        loads_before = FakePaddleOCR.loads
+        sharded = engine.extract_pdf(str(self.pdf_path), max_workers=2)
+
+        assert sharded == sequential
+        assert "error" not in sharded and len(sharded["pages"]) == 3
+        assert self.sharded_calls[0][0] == "paddleocr"
+        # The in-process stand-in plays a single worker: one model for all three pages
+        assert FakePaddleOCR.loads == loads_before + 1
+
+    def test_single_worker_stays_in_process(self, monkeypatch):
+        """max_workers=1 and single-page ranges never start worker processes."""
+        self._patch_tesseract(monkeypatch)
+        engine = tesseract_engine.TesseractEngine(dpi=72)
+
+        engine.extract_pdf(str(self.pdf_path))
+        engine.extract_pdf(str(self.pdf_path), max_workers=4, page_range=(0, 1))
+
+        assert self.sharded_calls == []
+
+    def test_save_page_range_uses_distinct_filename(self, monkeypatch, tmp_path):
+        """Page-range shards save next to each other instead of overwriting."""
+        self._patch_tesseract(monkeypatch)
+        monkeypatch.setattr(tesseract_engine.file_manager, "get_processing_directory",
+                            lambda: str(tmp_path / "processing"))
+        engine = tesseract_engine.TesseractEngine(dpi=72)
+
+        output = engine.save_extraction(str(self.pdf_path), page_range=(0, 2))
+
+        assert Path(output).name.endswith("_tesseract_p0-2.json")
+
+
+class TestMaxWorkersConfiguration:
+    """Test class for the max_workers engine setting."""
+
+    def test_max_workers_setting(self, tmp_path):
+        """max_workers defaults to in-process and honours PDF overrides."""
+        manager = EngineConfigurationManager(tmp_path / "engine_configurations.ndjson")
+        manager.add_engine_configuration("tesseract")
+        manager.add_engine_configuration("paddleocr")
+        pdf_path = FIXTURES / "multi_column.pdf"
+
+        assert manager.get_max_workers("tesseract") == 1
+        assert manager.get_max_workers("paddleocr") == 1
+
+        manager.add_pdf_override("tesseract", str(pdf_path), {"max_workers": 4})
+        assert manager.get_max_workers("tesseract", str(pdf_path)) == 4
+
+        assert manager.validate_parameter_value("paddleocr", "max_workers", 0)[0]
+        assert not manager.validate_parameter_value("tesseract", "max_workers", -1)[0]
+
+    def test_engine_manager_passes_configured_workers(self, tmp_path, monkeypatch):
+        """The engine manager runs OCR engines with the configured worker count."""
+        from src.compareblocks.engines import manager as manager_module
+
+        config_manager = EngineConfigurationManager(tmp_path / "engine_configurations.ndjson")
+        config_manager.add_engine_configuration("tesseract")
+        config_manager.add_pdf_override("tesseract", str(FIXTURES / "multi_column.pdf"), {"max_workers": 3})
+
+        calls = []
+        output = EngineOutput(str(tmp_path / "multi_column_tesseract.json"), {"total_pages": 1})
+        monkeypatch.setattr(manager_module, "save_tesseract_extraction",
+                            lambda pdf_path, max_workers=1: calls.append(max_workers) or output)
+        engine_manager = manager_module.ExtractionEngineManager(config_manager=config_manager)
+        engine_manager.available_engines["tesseract"] = True
+
+        result = engine_manager.extract_with_engine("tesseract", str(FIXTURES / "multi_column.pdf"))
+
+        assert calls == [3]
+        assert result.success
+        assert result.output_path == output.path
+
+
+class TestWorkerProcesses:
+    """Test class for real worker processes."""
+
+    def test_tesseract_worker_processes(self, tmp_path, monkeypatch):
+        """Spawned workers return the same pages as in-process OCR."""
+        if not tesseract_engine.TesseractEngine().is_available():
+            pytest.skip("Tesseract not available")
+        monkeypatch.chdir(tmp_path)
+        pdf_path = tmp_path / "three_pages.pdf"
+        _build_three_page_pdf(pdf_path)
+
+        engine = tesseract_engine.TesseractEngine(dpi=150)
+        sequential = engine.extract_pdf(str(pdf_path))
+        sharded = engine.extract_pdf(str(pdf_path), max_workers=2)
+
+        assert sharded["pages"] == sequential["pages"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-based engine scheduler.
+Verifies priority order, CPU and memory budgets, timeouts, cancellation and manager integration.
+"""
+
+import json
+import time
+import pytest
+from pathlib import Path
+
+from src.compareblocks.engines.output import EngineOutput
+from src.compareblocks.engines.scheduler import (
+    CostProfile, EngineResourceProfile, EngineScheduler, SchedulerBudget, get_engine_profile
+)
+
+
+# Runners execute in spawned engine processes, so they live at module level.
+# The "PDF path" is a scratch directory where each run records its timing.
+RUN_SECONDS = {'pymupdf': 0.05, 'kreuzberg': 1.0}
+
+
+def _recording_runner(engine_name, pdf_path, max_workers):
+    started = time.time()
+    time.sleep(RUN_SECONDS.get(engine_name, 0.4))
+    output_path = Path(pdf_path) / f"{engine_name}.json"
+    summary = {'engine': engine_name, 'max_workers': max_workers, 'started': started, 'finished': time.time()}
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'summary': summary}, f)
+    return EngineOutput(str(output_path), summary)
+
+
+def _hanging_runner(engine_name, pdf_path, max_workers):
+    if engine_name == 'paddleocr':
+        time.sleep(60)
+    return _recording_runner(engine_name, pdf_path, max_workers)
+
+
+def _failing_runner(engine_name, pdf_path, max_workers):
+    if engine_name == 'docling':
+        raise RuntimeError("docling exploded")
+    return _recording_runner(engine_name, pdf_path, max_workers)
+
+
+def _interval(tmp_path, engine_name):
+    with open(tmp_path / f"{engine_name}.json", 'r', encoding='utf-8') as f:
+        summary = json.load(f)['summary']
+    return summary['started'], summary['finished']
+
+
+def _overlaps(first, second):
+    return first[0] < second[1] and second[0] < first[1]
+
+
+class TestEngineProfiles:
+    """Test class for engine resource profiles."""
+
+    def test_cheap_engines_have_priority(self):
+        """I/O-light engines sort before CPU-bound and memory-heavy ones."""
+        assert get_engine_profile('pymupdf').cost == CostProfile.IO_LIGHT
+        assert get_engine_profile('docling').cost == CostProfile.MEMORY_HEAVY
+        assert (get_engine_profile('pymupdf').priority < get_engine_profile('tesseract').priority
+                < get_engine_profile('paddleocr').priority)
+        assert get_engine_profile('unknown').cost == CostProfile.CPU_BOUND
+
+    def test_page_workers_claim_cpu_slots(self):
+        """Page-parallel engines reserve one CPU slot per worker, within the budget."""
+        scheduler = EngineScheduler(budget=SchedulerBudget(cpu_slots=3, memory_mb=10000))
+
+        assert scheduler._make_job('tesseract', 1).cpu_slots == 2
+        assert scheduler._make_job('tesseract', 8).cpu_slots == 3
+        assert scheduler._make_job('docling', 1).memory_mb == 4096
+
+        small = EngineScheduler(budget=SchedulerBudget(cpu_slots=1, memory_mb=1000))
+        assert small._make_job('docling', 1).memory_mb == 1000
+
+    def test_profile_overrides(self):
+        """Callers can re-declare an engine's cost profile."""
+        profile = EngineResourceProfile(CostProfile.IO_LIGHT, cpu_slots=1, memory_mb=100)
+        scheduler = EngineScheduler(profiles={'docling': profile})
+
+        assert scheduler.get_profile('docling') is profile
+        assert scheduler.get_profile('paddleocr') == get_engine_profile('paddleocr')
+
+
+class TestEngineScheduler:
+    """Test class for EngineScheduler runs in engine processes."""
+
+    def test_single_slot_runs_in_priority_order(self, tmp_path):
+        """With one CPU slot engines run one at a time, cheapest first."""
+        scheduler = EngineScheduler(budget=SchedulerBudget(cpu_slots=1, memory_mb=100000),
+                                    runner=_recording_runner, poll_interval=0.02)
+        finished = []
+
+        outcomes = scheduler.run(['docling', 'tesseract', 'pymupdf'], str(tmp_path),
+                                 max_workers={'tesseract': 1},
+                                 on_result=lambda outcome: finished.append(outcome.engine_name))
+
+        assert finished == ['pymupdf', 'tesseract', 'docling']
+        assert all(outcome.success for outcome in outcomes.values())
+        intervals = [_interval(tmp_path, name) for name in finished]
+        assert intervals[0][1] <= intervals[1][0] and intervals[1][1] <= intervals[2][0]
+
+    def test_memory_budget_keeps_heavy_engines_apart(self, tmp_path):
+        """Memory-heavy engines that do not fit together never overlap."""
+        budget = SchedulerBudget(cpu_slots=8, memory_mb=5000)
+        scheduler = EngineScheduler(budget=budget, runner=_recording_runner, poll_interval=0.02)
+
+        outcomes = scheduler.run(['paddleocr', 'docling', 'kreuzberg'], str(tmp_path))
+
+        assert all(outcome.success for outcome in outcomes.values())
+        assert not _overlaps(_interval(tmp_path, 'paddleocr'), _interval(tmp_path, 'docling'))
+        # Kreuzberg fits alongside either heavy engine
+        assert _overlaps(_interval(tmp_path, 'kreuzberg'), _interval(tmp_path, 'paddleocr'))
+
+    def test_timeout_terminates_engine(self, tmp_path):
+        """An engine exceeding its timeout is terminated while others complete."""
+        scheduler = EngineScheduler(budget=SchedulerBudget(cpu_slots=8, memory_mb=100000),
+                                    timeouts={'paddleocr': 0.5}, runner=_hanging_runner,
+                                    poll_interval=0.02)
+
+        outcomes = scheduler.run(['paddleocr', 'pymupdf'], str(tmp_path))
+
+        assert outcomes['paddleocr'].status == "timeout"
+        assert not outcomes['paddleocr'].success
+        assert outcomes['pymupdf'].success
+
+    def test_cancel_before_run(self, tmp_path):
+        """A cancel issued before run() is honoured."""
+        scheduler = EngineScheduler(budget=SchedulerBudget(cpu_slots=8, memory_mb=100000),
+                                    runner=_recording_runner, poll_interval=0.02)
+        scheduler.cancel('docling')
+
+        outcomes = scheduler.run(['docling', 'pymupdf'], str(tmp_path))
+
+        assert outcomes['docling'].status == "cancelled"
+        assert outcomes['pymupdf'].success
+        assert not (tmp_path / "docling.json").exists()
+
+    def test_cancel_from_result_callback(self, tmp_path):
+        """Engines cancelled before they start are never launched."""
+        scheduler = EngineScheduler(budget=SchedulerBudget(cpu_slots=1, memory_mb=100000),
+                                    runner=_recording_runner, poll_interval=0.02)
+
+        def on_result(outcome):
+            if outcome.engine_name == 'pymupdf':
+                scheduler.cancel('docling')
+
+        outcomes = scheduler.run(['docling', 'pymupdf'], str(tmp_path), on_result=on_result)
+
+        assert outcomes['pymupdf'].success
+        assert outcomes['docling'].status == "cancelled"
+        assert not (tmp_path / "docling.json").exists()
+
+    def test_engine_failure_is_reported(self, tmp_path):
+        """Exceptions in an engine process become failed outcomes."""
+        scheduler = EngineScheduler(budget=SchedulerBudget(cpu_slots=8, memory_mb=100000),
+                                    runner=_failing_runner, poll_interval=0.02)
+
+        outcomes = scheduler.run(['docling', 'pymupdf'], str(tmp_path))
+
+        assert outcomes['docling'].status == "failed"
+        assert "docling exploded" in outcomes['docling'].error_message
+        assert outcomes['pymupdf'].success
+
+
+class TestManagerScheduling:
+    """Test class for scheduled runs through ExtractionEngineManager."""
+
+    def test_run_engines_scheduled(self, tmp_path, monkeypatch):
+        """Scheduled runs produce EngineResults with metadata, cheapest engine first."""
+        from src.compareblocks.engines import manager as manager_module
+
+        monkeypatch.setattr(manager_module.ExtractionEngineManager, "_detect_available_engines",
+                            lambda self: {'pymupdf': True, 'docling': True})
+        scheduler = EngineScheduler(budget=SchedulerBudget(cpu_slots=1, memory_mb=100000),
+                                    runner=_recording_runner, poll_interval=0.02)
+        engine_manager = manager_module.ExtractionEngineManager(scheduler=scheduler)
+        order = []
+
+        results = engine_manager.run_engines_scheduled(
+            ['docling', 'pymupdf'], str(tmp_path), on_result=lambda result: order.append(result.engine_name)
+        )
+
+        assert order == ['pymupdf', 'docling']
+        assert results['docling'].success
+        assert results['docling'].metadata['engine'] == 'docling'
+        assert results['pymupdf'].output_path == str(tmp_path / "pymupdf.json")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched anomaly feature kernel.
+Verifies exact agreement with AnomalyDetector; an opt-in micro-benchmark times 10k blocks.
+"""
+
+import random
+import time
+import pytest
+
+from src.compareblocks.features.anomaly import AnomalyDetector
+from src.compareblocks.features.anomaly_batch import (
+    ANOMALY_FEATURE_DTYPE, ANOMALY_FLAG_NAMES, extract_anomaly_feature_array, features_from_array
+)
+
+
+EDGE_TEXTS = [
+    "", "a", "ab", "abc", "abcd", "\n\n", "   ", "aaaaa", "aaaa", "IIl", "Il1|", "1a1", "a1b", "a\na\na",
+    "HELLO WORLD CAPS", "!!!...???", "x y z w", "line one\n\n  \nline two", "😀😀😀😀😀", "é́ ß Ω ٣ Ⅻ ǅ",
+    "snake_case_words __ _", "tab\there\x0bvertical　ideographic",
+]
+
+ALPHABET = list("abcXYZ019 _\n\t.,!?Il1|") + ["é", "ß", "Ω", "٣", " ", "𝔸", "😀", "\x0b", "Ⅻ", "ǅ", "ﬁ", "̀"]
+
+
+def _fuzzed_texts(count, seed=0):
+    rng = random.Random(seed)
+    texts = list(EDGE_TEXTS)
+    for _ in range(count):
+        symbols = rng.sample(ALPHABET, rng.randint(1, 6))
+        texts.append("".join(rng.choice(symbols) for _ in range(rng.choice([0, 1, 2, 3, 5, 10, 30, 100]))))
+    return texts
+
+
+def _block_texts(count, seed=0):
+    rng = random.Random(seed)
+    words = "Standards English Language Arts GRADE Strand reading 2023 the of a I l 1 | ___ --- ... ; é ß Ⅷ".split()
+    texts = []
+    for _ in range(count):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 40)))
+        if rng.random() < 0.2:
+            text = text.replace(" ", "\n")
+        texts.append(text)
+    return texts
+
+
+class TestAnomalyBatch:
+    """Test class for extract_anomaly_feature_array."""
+
+    def test_matches_scalar_features_exactly(self):
+        """Every field equals AnomalyDetector.extract_anomaly_features, flags included."""
+        detector = AnomalyDetector()
+        texts = _fuzzed_texts(3000)
+
+        batched = features_from_array(extract_anomaly_feature_array(texts))
+
+        for text, features in zip(texts, batched):
+            assert features == detector.extract_anomaly_features(text), repr(text)
+
+    def test_structured_array_layout(self):
+        """One record per text, flags stored as a bitmask over ANOMALY_FLAG_NAMES."""
+        features = extract_anomaly_feature_array(["a\nb\nc\nd", "", "plain words here"])
+
+        assert features.dtype == ANOMALY_FEATURE_DTYPE
+        assert len(features) == 3
+        assert features['anomaly_flags'][0] & (1 << ANOMALY_FLAG_NAMES.index('one_char_per_line'))
+        assert features['overall_anomaly_score'][1] == 1.0
+        assert len(extract_anomaly_feature_array([])) == 0
+
+    def test_detector_thresholds_are_used(self):
+        """Custom detector thresholds change the score as in the scalar path."""
+        detector = AnomalyDetector()
+        detector.high_digit_ratio_threshold = 0.0
+        texts = ["room 101 on floor 3", "no digits"]
+
+        batched = features_from_array(extract_anomaly_feature_array(texts, detector))
+
+        assert batched == [detector.extract_anomaly_features(text) for text in texts]
+
+    def test_variations_use_batch_path(self):
+        """extract_features_for_variations returns the same features for large and small inputs."""
+        detector = AnomalyDetector()
+        texts = _block_texts(50, seed=3)
+
+        expected = [detector.extract_anomaly_features(text) for text in texts]
+
+        assert detector.extract_features_for_variations(texts) == expected
+        assert detector.extract_features_for_variations(texts[:2]) == expected[:2]
+
+    @pytest.mark.benchmark
+    def test_benchmark_per_10k_blocks(self):
+        """Micro-benchmark: batched kernel against the per-text detector on 10k blocks."""
+        detector = AnomalyDetector()
+        texts = _block_texts(10000)
+        extract_anomaly_feature_array(texts[:10])  # Build the character class table
+
+        start = time.perf_counter()
+        scalar = [detector.extract_anomaly_features(text) for text in texts]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = features_from_array(extract_anomaly_feature_array(texts))
+        batch_time = time.perf_counter() - start
+
+        print(f"Anomaly features per 10k blocks: scalar {scalar_time:.3f}s, batched {batch_time:.3f}s")
+        assert batched == scalar
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for the pluggable similarity backends used by CharacterConsistencyTracker.
+Verifies every backend matches the full-table reference algorithms exactly.
+"""
+
+import random
+import pytest
+
+from src.compareblocks.features.consistency import CharacterConsistencyTracker
+from src.compareblocks.features.similarity import (
+    RAPIDFUZZ_AVAILABLE, SimilarityBackend, get_similarity_backend
+)
+
+
+def _reference_levenshtein(text1, text2):
+    m, n = len(text1), len(text2)
+    dp = [[0] * (n + 1) for _ in range(m + 1)]
+    for i in range(m + 1):
+        dp[i][0] = i
+    for j in range(n + 1):
+        dp[0][j] = j
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            if text1[i-1] == text2[j-1]:
+                dp[i][j] = dp[i-1][j-1]
+            else:
+                dp[i][j] = 1 + min(dp[i-1][j], dp[i][j-1], dp[i-1][j-1])
+    return dp[m][n]
+
+
+def _reference_lcs(text1, text2):
+    m, n = len(text1), len(text2)
+    dp = [[0] * (n + 1) for _ in range(m + 1)]
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            if text1[i-1] == text2[j-1]:
+                dp[i][j] = dp[i-1][j-1] + 1
+            else:
+                dp[i][j] = max(dp[i-1][j], dp[i][j-1])
+    return dp[m][n]
+
+
+def _reference_jaccard(text1, text2, n=2):
+    if len(text1) < n and len(text2) < n:
+        return 1.0 if text1 == text2 else 0.0
+    ngrams1 = set(text1[i:i+n] for i in range(len(text1) - n + 1))
+    ngrams2 = set(text2[i:i+n] for i in range(len(text2) - n + 1))
+    if not ngrams1 and not ngrams2:
+        return 1.0
+    union = len(ngrams1.union(ngrams2))
+    return len(ngrams1.intersection(ngrams2)) / union if union > 0 else 0.0
+
+
+def _random_pairs(count, seed=3):
+    rng = random.Random(seed)
+    alphabet = "abcde fgé1"
+    pairs = [("", ""), ("", "abc"), ("a", "a"), ("a", "b"), ("kitten", "sitting")]
+    for _ in range(count):
+        base = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        mutated = list(base)
+        for _ in range(rng.randint(0, 6)):
+            op = rng.random()
+            pos = rng.randint(0, len(mutated))
+            if op < 0.4 and mutated:
+                mutated[min(pos, len(mutated) - 1)] = rng.choice(alphabet)
+            elif op < 0.7:
+                mutated.insert(pos, rng.choice(alphabet))
+            elif mutated:
+                del mutated[min(pos, len(mutated) - 1)]
+        pairs.append((base, "".join(mutated)))
+    return pairs
+
+
+BACKENDS = ["python"] + (["rapidfuzz"] if RAPIDFUZZ_AVAILABLE else [])
+
+
+class TestSimilarityBackends:
+    """Test class for similarity backends."""
+
+    @pytest.mark.parametrize("backend_name", BACKENDS)
+    def test_backends_match_reference(self, backend_name):
+        """Edit distance, LCS and Jaccard are identical to the reference tables."""
+        backend = get_similarity_backend(backend_name)
+        for text1, text2 in _random_pairs(300):
+            assert backend.levenshtein_distance(text1, text2) == _reference_levenshtein(text1, text2)
+            assert backend.lcs_length(text1, text2) == _reference_lcs(text1, text2)
+            assert backend.jaccard_similarity(text1, text2) == _reference_jaccard(text1, text2)
+            assert backend.jaccard_similarity(text1, text2, 3) == _reference_jaccard(text1, text2, 3)
+
+    def test_early_exit_threshold(self):
+        """Distances beyond max_distance are reported as max_distance + 1."""
+        backend = SimilarityBackend()
+        assert backend.levenshtein_distance("kitten", "sitting", max_distance=5) == 3
+        assert backend.levenshtein_distance("kitten", "sitting", max_distance=2) == 3
+        assert backend.levenshtein_distance("a", "abcdefgh", max_distance=1) == 2
+
+    @pytest.mark.parametrize("backend_name", BACKENDS)
+    def test_capped_distance_matches_reference(self, backend_name):
+        """With a threshold every backend returns min(distance, max_distance + 1), cached or not."""
+        backend = get_similarity_backend(backend_name)
+        for max_distance in (0, 2, 5):
+            for text1, text2 in _random_pairs(150, seed=max_distance):
+                expected = min(_reference_levenshtein(text1, text2), max_distance + 1)
+                assert backend.levenshtein_distance(text1, text2, max_distance) == expected
+                assert backend.levenshtein_distance(text2, text1, max_distance) == expected
+
+    def test_capped_results_are_not_memoized(self):
+        """A capped lookup does not hide the exact distance from later uncapped calls."""
+        backend = SimilarityBackend()
+        assert backend.levenshtein_distance("abcdef", "uvwxyz", max_distance=1) == 2
+        assert backend.levenshtein_distance("abcdef", "uvwxyz") == 6
+
+    def test_tracker_passes_threshold(self):
+        """The tracker lets the backend stop once a pair's edit similarity is 0."""
+        calls = []
+
+        class RecordingBackend(SimilarityBackend):
+            def levenshtein_distance(self, text1, text2, max_distance=None):
+                calls.append((text1, text2, max_distance))
+                return super().levenshtein_distance(text1, text2, max_distance)
+
+        CharacterConsistencyTracker(RecordingBackend()).calculate_character_consistency(["abcd", "abce", "xy"])
+
+        assert calls
+        assert all(max_distance == max(len(text1), len(text2)) - 1 for text1, text2, max_distance in calls)
+
+    def test_memoization_is_symmetric_and_bounded(self):
+        """Repeated pairs hit the cache in either order and the cache stays bounded."""
+        backend = SimilarityBackend(cache_size=2)
+        backend.levenshtein_distance("abc", "abd")
+        backend.levenshtein_distance("abd", "abc")
+        assert len(backend._cache) == 1
+
+        backend.lcs_length("abc", "xbc")
+        backend.lcs_length("abcd", "xbc")
+        assert len(backend._cache) == 2
+
+        backend.clear_cache()
+        assert len(backend._cache) == 0
+
+    def test_unknown_backend(self):
+        """Unknown backend names raise ValueError."""
+        with pytest.raises(ValueError):
+            get_similarity_backend("missing")
+
+    def test_tracker_scores_identical_across_backends(self):
+        """Consistency details do not depend on the selected backend."""
+        variations = [
+            "The quick brown fox jumps over the lazy dog",
+            "The quick brown f0x jumps over the lazy dog",
+            "Tbe quick brown fox jumps ovcr the lazy dog",
+        ]
+        results = [
+            CharacterConsistencyTracker(name).calculate_character_consistency(variations)
+            for name in BACKENDS
+        ]
+        for result in results[1:]:
+            assert result == results[0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
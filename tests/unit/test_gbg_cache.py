@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed GBG analysis cache.
+Verifies cache hits, configuration-aware keys, the stat pre-check and LRU eviction.
+"""
+
+import json
+import os
+import shutil
+import time
+import pytest
+from pathlib import Path
+
+from src.compareblocks.gbg import cache as gbg_cache
+from src.compareblocks.gbg.cache import GBGAnalysisCache, GBGCacheKey
+from src.compareblocks.gbg.processor import GBGProcessor
+
+
+FIXTURE_PDF = Path(__file__).parent.parent / "fixtures" / "multi_column.pdf"
+
+
+def _strip_volatile(results):
+    """Drop fields that legitimately differ between two runs on the same file."""
+    results = json.loads(json.dumps(results))
+    results["pdf_metadata"].pop("extraction_timestamp", None)
+    for page in results["pages"].values():
+        page.pop("processing_timestamp", None)
+    return results
+
+
+class TestGBGAnalysisCache:
+    """Test class for GBGAnalysisCache."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, monkeypatch):
+        if not FIXTURE_PDF.exists():
+            pytest.skip("Fixture PDF not available")
+        # PDF metadata records paths relative to the working directory
+        monkeypatch.chdir(tmp_path)
+        self.tmp_path = tmp_path
+        self.pdf_path = tmp_path / "document.pdf"
+        shutil.copyfile(FIXTURE_PDF.resolve(), self.pdf_path)
+        self.cache = GBGAnalysisCache(cache_dir=str(tmp_path / "cache"))
+
+    def _processor(self, **kwargs):
+        return GBGProcessor(ensure_output_directories=False, cache=self.cache, **kwargs)
+
+    def test_repeat_run_is_served_from_cache(self):
+        """The second run hits the cache and returns the same analysis."""
+        output_path = self.tmp_path / "out" / "gbg.json"
+        first = self._processor().process_pdf(str(self.pdf_path), output_path=str(output_path))
+        output_path.unlink()
+
+        second = self._processor().process_pdf(str(self.pdf_path), output_path=str(output_path))
+
+        assert self.cache.hits == 1
+        assert _strip_volatile(second) == _strip_volatile(first)
+        assert output_path.exists()
+
+    def test_cached_results_match_uncached(self):
+        """Cached output is identical to a processor run without a cache."""
+        self._processor().process_pdf(str(self.pdf_path), output_path="")
+        cached = self._processor().process_pdf(str(self.pdf_path), output_path="")
+        uncached = GBGProcessor(ensure_output_directories=False).process_pdf(
+            str(self.pdf_path), output_path=""
+        )
+
+        assert self.cache.hits == 1
+        assert _strip_volatile(cached) == _strip_volatile(uncached)
+
+    def test_same_content_at_new_path(self):
+        """A copy of the PDF hits the cache but reports its own path."""
+        self._processor().process_pdf(str(self.pdf_path), output_path="")
+        copy_path = self.tmp_path / "copy.pdf"
+        shutil.copyfile(self.pdf_path, copy_path)
+
+        results = self._processor().process_pdf(str(copy_path), output_path="")
+
+        assert self.cache.hits == 1
+        assert results["pdf_path"] == str(copy_path)
+        assert results["pdf_name"] == "copy.pdf"
+
+    def test_configuration_changes_key(self):
+        """Different GBG settings do not share cache entries."""
+        self._processor().process_pdf(str(self.pdf_path), output_path="")
+        self._processor(min_block_area=50.0).process_pdf(str(self.pdf_path), output_path="")
+
+        assert self.cache.hits == 0
+        assert self.cache.get_cache_info()["entries"] == 2
+
+    def test_stat_precheck_skips_hashing(self, monkeypatch):
+        """Unchanged size and mtime reuse the stored hash; a modified file is re-hashed."""
+        calls = []
+        original_hash = gbg_cache.hash_file
+
+        def counting_hash(path):
+            calls.append(path)
+            return original_hash(path)
+
+        monkeypatch.setattr(gbg_cache, "hash_file", counting_hash)
+
+        first = self.cache.content_hash(str(self.pdf_path))
+        # A fresh instance reads the persisted stat index
+        reopened = GBGAnalysisCache(cache_dir=str(self.cache.cache_dir))
+        assert reopened.content_hash(str(self.pdf_path)) == first
+        assert len(calls) == 1
+
+        with open(self.pdf_path, 'ab') as f:
+            f.write(b"\n%")
+        stat = self.pdf_path.stat()
+        os.utime(self.pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert reopened.content_hash(str(self.pdf_path)) != first
+        assert len(calls) == 2
+
+    def test_lru_eviction(self):
+        """Entries beyond max_bytes are evicted least recently used first."""
+        cache = GBGAnalysisCache(cache_dir=str(self.tmp_path / "small"), max_bytes=2500)
+        payload = {"data": "x" * 1000}
+        keys = [GBGCacheKey(content_hash=f"{i:064x}", min_block_area=100.0, merge_threshold=10.0)
+                for i in range(3)]
+
+        cache.put(keys[0], payload)
+        time.sleep(0.01)
+        cache.put(keys[1], payload)
+        time.sleep(0.01)
+        # Reading the first entry makes the second the least recently used
+        assert cache.get(keys[0]) == payload
+        time.sleep(0.01)
+        cache.put(keys[2], payload)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == payload
+        assert cache.get(keys[2]) == payload
+        assert cache.get_cache_info()["total_bytes"] <= 2500
+
+    def test_clear(self):
+        """Clearing removes every entry."""
+        self._processor().process_pdf(str(self.pdf_path), output_path="")
+        self.cache.clear()
+
+        assert self.cache.get_cache_info()["entries"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for fast, thumbnail-based page orientation detection.
+Verifies the projection shortcut, zero-copy pixmap access and the text-direction path.
+"""
+
+import cv2
+import fitz
+import numpy as np
+import pytest
+from pathlib import Path
+
+from src.compareblocks.gbg.orientation import OrientationDetector
+from src.compareblocks.gbg.processor import GBGProcessor
+from src.compareblocks.gbg.seed import SeedBlockDetector, pixmap_to_array, rgb_to_png_gray
+
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+HEALTH_PDF = (Path(__file__).parent.parent.parent / "Source_docs" / "Health - CoreStandards1"
+              / "Health - CoreStandards1.pdf")
+
+
+def _png_gray(page):
+    """Grayscale page image as full mode computed it before the shared raster: via a PNG round-trip."""
+    pix = page.get_pixmap(matrix=fitz.Matrix(1.0, 1.0))
+    return cv2.imdecode(np.frombuffer(pix.tobytes("png"), dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+
+
+def _striped_image():
+    """White page with dark horizontal text-like stripes."""
+    rng = np.random.default_rng(0)
+    image = np.full((300, 200), 255, dtype=np.uint8)
+    for top in range(20, 280, 24):
+        image[top:top + 10, 15:185] = rng.integers(0, 80, size=(10, 170))
+    return image
+
+
+class TestFastOrientation:
+    """Test class for fast orientation detection."""
+
+    def setup_method(self):
+        """Set up the detectors."""
+        self.detector = OrientationDetector()
+
+    def test_fast_matches_rotating_detector(self):
+        """Axis projections pick the same rotation as rotating the full image."""
+        image = _striped_image()
+        for rotated in (image, np.ascontiguousarray(np.rot90(image))):
+            fast = self.detector.detect_page_orientation_fast(rotated)
+            full = self.detector.detect_page_orientation(rotated)
+
+            assert fast.page_rotation % 180 == full.page_rotation % 180
+            assert fast.confidence == pytest.approx(full.confidence, abs=0.02)
+
+    def test_fast_rejects_color_image(self):
+        """Only grayscale images are accepted."""
+        with pytest.raises(ValueError):
+            self.detector.detect_page_orientation_fast(np.zeros((4, 4, 3), dtype=np.uint8))
+
+    def test_pixmap_to_array_is_zero_copy(self):
+        """The array views the pixmap buffer directly."""
+        doc = fitz.open(str(FIXTURES / "multi_column.pdf"))
+        try:
+            pix = doc[0].get_pixmap(colorspace=fitz.csGRAY, matrix=fitz.Matrix(0.5, 0.5))
+            array = pixmap_to_array(pix)
+
+            assert array.shape == (pix.height, pix.width, 1)
+            assert not array.flags['OWNDATA']
+            assert array.tobytes() == pix.samples
+        finally:
+            doc.close()
+
+    @pytest.mark.parametrize("name", ["multi_column.pdf", "rotated_text.pdf", "simple_single_column.pdf"])
+    def test_fast_mode_agrees_with_full_mode(self, name):
+        """Thumbnail detection reports the same page rotation as the full-resolution path."""
+        doc = fitz.open(str(FIXTURES / name))
+        try:
+            page = doc[0]
+            fast = SeedBlockDetector(orientation_mode="fast")._detect_page_orientation(page)
+            full = SeedBlockDetector(orientation_mode="full")._detect_page_orientation(page)
+
+            # Projections cannot tell 0 from 180; the rotating path picks by rounding noise
+            assert fast.page_rotation % 180 == full.page_rotation % 180
+            assert fast.confidence == pytest.approx(full.confidence, abs=0.05)
+        finally:
+            doc.close()
+
+    def test_text_mode_skips_rendering(self, monkeypatch):
+        """Uniform text directions decide orientation without rendering the page."""
+        detector = SeedBlockDetector(orientation_mode="text")
+
+        def fail_render(page):
+            raise AssertionError("page should not be rendered")
+
+        monkeypatch.setattr(detector, "_detect_thumbnail_orientation", fail_render)
+
+        doc = fitz.open(str(FIXTURES / "multi_column.pdf"))
+        try:
+            blocks = detector.extract_page_seed_blocks(doc[0], 0)
+        finally:
+            doc.close()
+
+        assert blocks
+        assert all(b.orientation_hints.page_rotation == 0.0 for b in blocks)
+        assert all(b.orientation_hints.confidence >= 0.95 for b in blocks)
+
+    def test_orientation_is_lazy(self, monkeypatch):
+        """Pages without kept blocks never run orientation detection."""
+        detector = SeedBlockDetector(min_block_area=1e12)
+        calls = []
+        monkeypatch.setattr(detector, "_detect_page_orientation",
+                            lambda page, text_dict=None: calls.append(page))
+
+        doc = fitz.open(str(FIXTURES / "multi_column.pdf"))
+        try:
+            assert detector.extract_page_seed_blocks(doc[0], 0) == []
+        finally:
+            doc.close()
+
+        assert calls == []
+
+    def test_default_mode_is_full(self):
+        """Detectors and processors default to the full detector, whose hints distinguish 0 from 180."""
+        doc = fitz.open(str(FIXTURES / "simple_single_column.pdf"))
+        try:
+            page = doc[0]
+            default = SeedBlockDetector()._detect_page_orientation(page)
+            full = SeedBlockDetector(orientation_mode="full")._detect_page_orientation(page)
+        finally:
+            doc.close()
+
+        assert default == full
+        assert GBGProcessor(ensure_output_directories=False).seed_detector.orientation_mode == "full"
+
+    def test_full_mode_matches_png_decode(self):
+        """Full mode reproduces the PNG-decoded grayscale, so rotations and confidences are unchanged."""
+        if not HEALTH_PDF.exists():
+            pytest.skip("Health - CoreStandards1.pdf not available")
+        detector = SeedBlockDetector(orientation_mode="full")
+        doc = fitz.open(str(HEALTH_PDF))
+        try:
+            for page_num in range(6):
+                page = doc[page_num]
+                expected = _png_gray(page)
+                pix = page.get_pixmap(matrix=fitz.Matrix(1.0, 1.0))
+
+                assert np.array_equal(rgb_to_png_gray(pixmap_to_array(pix)), expected)
+                assert detector._detect_page_orientation(page) == \
+                    detector.orientation_detector.detect_page_orientation(expected)
+            # cv2.cvtColor's rounding turned this page upside down
+            assert detector._detect_page_orientation(doc[4]).page_rotation == 0.0
+        finally:
+            doc.close()
+
+    def test_unknown_mode(self):
+        """Unknown orientation modes are rejected."""
+        with pytest.raises(ValueError):
+            SeedBlockDetector(orientation_mode="sideways")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
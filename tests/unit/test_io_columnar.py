@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Tests for Arrow IPC / Parquet export and import of variations and consensus decisions.
+Verifies round trips equal the NDJSON paths, schema validation, size against NDJSON, and an opt-in load time benchmark.
+"""
+
+import json
+import random
+import time
+import jsonschema
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import pyarrow as pa
+
+from src.compareblocks.io.columnar import (
+    ColumnarLoader, ColumnarWriter, arrow_schema, certain_rows, load_columnar_file, table_to_records,
+    write_columnar_file
+)
+from src.compareblocks.io.schemas import CONSENSUS_OUTPUT_SCHEMA, INPUT_VARIATION_SCHEMA
+from src.compareblocks.io.loader import NDJSONLoader, ValidationException
+from src.compareblocks.io.writer import ExportException, NDJSONWriter
+
+
+ENGINES = ["tesseract", "pymupdf", "paddleocr", "kreuzberg", "docling"]
+
+# Schema violations that still fit the Arrow column types
+MUTATIONS = {
+    "variations": [("page", 0), ("confidence", 1.5), ("confidence", -0.1), ("confidence", float("nan")),
+                   ("bbox", [1.0, None, 3.0, 4.0]), ("metadata", []), ("raw_text", None), ("engine", None)],
+    "consensus": [("page", -2), ("decision_reason", "guess"), ("anomaly_score", -1.0),
+                  ("character_consistency_score", 1.2), ("engine_scores", {"tesseract": None}),
+                  ("variations_count", 0), ("consistency_details", {"total_characters": -1}),
+                  ("processing_metadata", "text"), ("final_text", None)],
+}
+
+
+def _variations(count):
+    records = []
+    for i in range(count):
+        record = {"doc_id": "doc", "page": i % 40 + 1, "engine": ENGINES[i % 5],
+                  "raw_text": f"Block {i} text ünïcode", "confidence": (i % 10) / 10}
+        if i % 3:
+            record["block_id"] = f"p{i % 40}_b{i // 40}"
+        if i % 3 != 1:
+            record["bbox"] = [i * 1.5, 2, 300, 12.25]
+        if i % 4 == 0:
+            record["orientation"] = 90
+            record["metadata"] = {"source": ENGINES[i % 5], "nested": {"k": [1, 2]}}
+        records.append(record)
+    return records
+
+
+def _consensus(count):
+    records = []
+    for i in range(count):
+        record = {"doc_id": "doc", "page": i % 40 + 1, "block_id": f"p{i % 40}_b{i // 40}",
+                  "selected_engine": ENGINES[i % 5], "final_text": f"Final text {i}",
+                  "decision_reason": ["highest_score", "merged_result"][i % 2],
+                  "engine_scores": {engine: 0.5 + j / 10 for j, engine in enumerate(ENGINES[:i % 5 + 1])},
+                  "anomaly_score": 0.1, "character_consistency_score": 0.95, "bbox": [1, 2, 3, 4]}
+        if i % 2:
+            record.update(variations_count=3, manual_override=False, processing_metadata={"run": i},
+                          consistency_details={"total_characters": 10, "normalized_for_comparison": True})
+        records.append(record)
+    return records
+
+
+class TestColumnarRoundTrip:
+    """Test class for columnar export and import."""
+
+    @pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+    def test_variations_match_ndjson_loading(self, tmp_path, suffix):
+        """Variations read back equal the records NDJSONLoader produces."""
+        records = _variations(300)
+        ndjson_path = tmp_path / "vars.ndjson"
+        ndjson_path.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+        columnar_path = tmp_path / f"vars{suffix}"
+
+        ColumnarWriter(kind="variations", batch_rows=64).write_file(records, columnar_path)
+
+        assert load_columnar_file(columnar_path) == NDJSONLoader().load_file(ndjson_path)
+
+    @pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+    def test_consensus_round_trip(self, tmp_path, suffix):
+        """Consensus decisions read back equal the records the NDJSON writer emits."""
+        records = _consensus(120)
+        path = tmp_path / f"consensus{suffix}"
+
+        write_columnar_file(iter(records), path)
+
+        writer = NDJSONWriter()
+        assert load_columnar_file(path, kind="consensus") == [writer.validate_consensus_record(r) for r in records]
+
+    @pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+    def test_table_schema_is_dictionary_encoded(self, tmp_path, suffix):
+        """Engine and page columns are dictionary-encoded in both formats."""
+        path = tmp_path / f"vars{suffix}"
+        ColumnarWriter(kind="variations").write_file(_variations(50), path)
+
+        table = ColumnarLoader().load_table(path)
+
+        assert table.schema.equals(arrow_schema("variations"))
+        assert pa.types.is_dictionary(table.schema.field("engine").type)
+        assert pa.types.is_dictionary(table.schema.field("page").type)
+        assert pa.types.is_fixed_size_list(table.schema.field("bbox").type)
+
+
+class TestColumnarValidation:
+    """Test class for schema validation on columnar export and import."""
+
+    def test_invalid_record_is_not_written(self, tmp_path):
+        """Records failing the schema raise ExportException and leave no file."""
+        records = _consensus(5)
+        records[3]["decision_reason"] = "guess"
+        path = tmp_path / "consensus.arrow"
+
+        with pytest.raises(ExportException, match="record 3"):
+            ColumnarWriter(batch_rows=2).write_file(records, path)
+        assert not path.exists()
+
+    def test_loaded_records_are_validated(self, tmp_path):
+        """Unvalidated writes are caught by the loader with the row number."""
+        records = _variations(5)
+        records[2]["confidence"] = 1.5
+        path = tmp_path / "vars.parquet"
+        ColumnarWriter(kind="variations", validate_output=False).write_file(records, path)
+
+        with pytest.raises(ValidationException) as e:
+            load_columnar_file(path)
+        assert e.value.line_number == 3
+        assert len(load_columnar_file(path, validate="off")) == 5
+
+    def test_wrong_kind_and_existing_file(self, tmp_path):
+        """Files of the other kind are rejected and existing files are kept."""
+        path = tmp_path / "consensus.arrow"
+        write_columnar_file(_consensus(3), path)
+
+        with pytest.raises(ValidationException):
+            load_columnar_file(path, kind="variations")
+        with pytest.raises(FileExistsError):
+            write_columnar_file(_consensus(3), path)
+        with pytest.raises(ValueError):
+            write_columnar_file(_consensus(3), tmp_path / "consensus.csv")
+
+
+    @pytest.mark.parametrize("kind", ["variations", "consensus"])
+    def test_column_checks_never_certify_invalid_rows(self, tmp_path, kind):
+        """Rows passing the column-wide and nested checks are valid under jsonschema."""
+        rng = random.Random(3)
+        records = _variations(400) if kind == "variations" else _consensus(400)
+        for record in records:
+            for field, value in rng.sample(MUTATIONS[kind], rng.randint(0, 2)):
+                record[field] = value
+        path = tmp_path / f"{kind}.arrow"
+        ColumnarWriter(kind=kind, validate_output=False).write_file(records, path)
+        loader = ColumnarLoader(kind=kind)
+        table = loader.load_table(path)
+        validator = jsonschema.Draft7Validator(INPUT_VARIATION_SCHEMA if kind == "variations"
+                                               else CONSENSUS_OUTPUT_SCHEMA)
+
+        certain = certain_rows(table, kind)
+
+        loaded = table_to_records(table, kind)
+        for is_certain, record in zip(certain, loaded):
+            if is_certain and loader._nested_values_certain(record):
+                assert validator.is_valid(record)
+        assert 0 < certain.sum() < len(records)
+
+
+class TestColumnarBenchmark:
+    """Compare columnar files against NDJSON."""
+
+    def _write_ndjson(self, tmp_path, records):
+        """Write records as NDJSON and return the path."""
+        ndjson_path = tmp_path / "vars.ndjson"
+        ndjson_path.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+        return ndjson_path
+
+    def test_size_against_ndjson(self, tmp_path):
+        """Columnar files are smaller than NDJSON."""
+        records = _variations(20000)
+        ndjson_path = self._write_ndjson(tmp_path, records)
+        writer = ColumnarWriter(kind="variations", validate_output=False)
+
+        for suffix in (".arrow", ".parquet"):
+            path = tmp_path / f"vars{suffix}"
+            writer.write_file(records, path)
+
+            assert ColumnarLoader().load_table(path).num_rows == len(records)
+            assert path.stat().st_size < ndjson_path.stat().st_size
+
+    @pytest.mark.benchmark
+    def test_load_time_against_ndjson(self, tmp_path):
+        """Tables load faster than NDJSON records."""
+        records = _variations(20000)
+        ndjson_path = self._write_ndjson(tmp_path, records)
+        writer = ColumnarWriter(kind="variations", validate_output=False)
+        loader = ColumnarLoader()
+
+        start = time.perf_counter()
+        NDJSONLoader().load_file(ndjson_path)
+        ndjson_time = time.perf_counter() - start
+
+        for suffix in (".arrow", ".parquet"):
+            path = tmp_path / f"vars{suffix}"
+            writer.write_file(records, path)
+
+            start = time.perf_counter()
+            loader.load_table(path)
+            table_time = time.perf_counter() - start
+
+            print(f"{suffix}: {path.stat().st_size / ndjson_path.stat().st_size:.2f}x NDJSON size, "
+                  f"table load {table_time * 1000:.1f} ms vs NDJSON {ndjson_time * 1000:.1f} ms")
+            assert table_time < ndjson_time
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
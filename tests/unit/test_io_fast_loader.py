@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for the high-throughput NDJSON loading path.
+Verifies the compiled schema check, optional orjson parsing, validation modes and parallel loading.
+"""
+
+import copy
+import json
+import pickle
+import random
+import pytest
+import jsonschema
+from pathlib import Path
+
+from src.compareblocks.io import loader as loader_module
+from src.compareblocks.io.loader import NDJSONLoader, ValidationException, load_ndjson_file
+from src.compareblocks.io.schema_compiler import compile_schema
+from src.compareblocks.io.schemas import CONSENSUS_OUTPUT_SCHEMA, INPUT_VARIATION_SCHEMA
+
+
+VALID_RECORD = {
+    "doc_id": "doc", "page": 1, "engine": "tesseract", "raw_text": "Hello world",
+    "block_id": "p1_b1", "bbox": [1.0, 2, 3.5, 4], "confidence": 0.9, "orientation": 0,
+    "metadata": {"k": 1}
+}
+
+MUTATIONS = [
+    ("page", 0), ("page", 1.0), ("page", True), ("page", "1"), ("confidence", 1.5), ("confidence", -0.1),
+    ("confidence", float("nan")), ("bbox", [1, 2, 3]), ("bbox", [1, 2, 3, "4"]), ("bbox", [1, 2, 3, True]),
+    ("bbox", (1, 2, 3, 4)), ("metadata", []), ("raw_text", None), ("block_id", 7), ("extra", 1),
+    ("orientation", "0"), ("engine", ["x"]),
+]
+
+
+def _mutated_records(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        record = copy.deepcopy(VALID_RECORD)
+        for field, value in rng.sample(MUTATIONS, rng.randint(0, 2)):
+            record[field] = value
+        for field in rng.sample(sorted(record), rng.randint(0, 1)):
+            del record[field]
+        yield record
+
+
+def _write_lines(path: Path, records):
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+    return path
+
+
+class TestSchemaCompiler:
+    """Test class for compiled schema predicates."""
+
+    def test_never_accepts_invalid_records(self):
+        """Compiled predicates accept only records jsonschema accepts, and the valid template."""
+        for schema in (INPUT_VARIATION_SCHEMA, CONSENSUS_OUTPUT_SCHEMA):
+            validator = jsonschema.Draft7Validator(schema)
+            predicate = compile_schema(schema)
+            for record in _mutated_records(400):
+                if predicate(record):
+                    assert validator.is_valid(record)
+        assert compile_schema(INPUT_VARIATION_SCHEMA)(VALID_RECORD)
+
+    def test_unsupported_keywords_defer_to_jsonschema(self):
+        """Schemas with unknown keywords never certify a record."""
+        predicate = compile_schema({"type": "object", "oneOf": [{"type": "object"}]})
+
+        assert predicate({}) is False
+
+
+class TestFastLoader:
+    """Test class for NDJSONLoader fast paths."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_matches_reference_loading(self, tmp_path, monkeypatch, use_orjson):
+        """Loaded records equal json.loads + jsonschema + normalization of a copy."""
+        if use_orjson and not loader_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not available")
+        monkeypatch.setattr(loader_module, "ORJSON_AVAILABLE", use_orjson)
+        validator = jsonschema.Draft7Validator(INPUT_VARIATION_SCHEMA)
+        records = [r for r in _mutated_records(300, seed=1)
+                   if validator.is_valid(r) and (r.get("block_id") or r.get("bbox"))]
+        path = _write_lines(tmp_path / "in.ndjson", records)
+
+        loaded = NDJSONLoader().load_file(path)
+
+        reference = [NDJSONLoader()._normalize_record(r) for r in records]
+        # Compared as JSON text: NaN confidences are valid but never equal themselves
+        assert json.dumps(loaded) == json.dumps(reference)
+        assert all(type(x) is float for r in loaded if "bbox" in r for x in r["bbox"])
+
+    def test_errors_match_jsonschema(self, tmp_path):
+        """Invalid records report jsonschema's message and the line number."""
+        bad = dict(VALID_RECORD, page=0)
+        path = _write_lines(tmp_path / "bad.ndjson", [VALID_RECORD, {}, bad])
+        path.write_text(path.read_text().replace("{}\n", "\n"), encoding="utf-8")
+
+        with pytest.raises(ValidationException) as e:
+            NDJSONLoader().load_file(path)
+
+        expected = jsonschema.Draft7Validator(INPUT_VARIATION_SCHEMA).iter_errors(bad).__next__().message
+        assert e.value.line_number == 3
+        assert str(e.value) == f"Line 3: Field 'page': {expected}"
+
+    def test_validation_modes(self, tmp_path):
+        """'off' skips schema checks, 'sample' checks every Nth line, mapping checks always run."""
+        extra = dict(VALID_RECORD, extra=True)
+        path = _write_lines(tmp_path / "in.ndjson", [VALID_RECORD, extra, VALID_RECORD])
+
+        assert len(load_ndjson_file(path, validate="off")) == 3
+        assert len(NDJSONLoader(validate="sample", sample_every=2).load_file(path)) == 3
+        with pytest.raises(ValidationException):
+            NDJSONLoader(validate="sample", sample_every=1).load_file(path)
+        with pytest.raises(ValueError):
+            NDJSONLoader(validate="nope")
+
+        unmappable = {k: v for k, v in VALID_RECORD.items() if k not in ("block_id", "bbox")}
+        with pytest.raises(ValidationException):
+            load_ndjson_file(_write_lines(tmp_path / "u.ndjson", [unmappable]), validate="off")
+
+    def test_invalid_json_keeps_message(self, tmp_path):
+        """JSON errors are reported with json's message whichever parser is used."""
+        path = tmp_path / "broken.ndjson"
+        path.write_text(json.dumps(VALID_RECORD) + "\n{\"doc_id\": \n", encoding="utf-8")
+
+        with pytest.raises(ValidationException) as e:
+            NDJSONLoader().load_file(path)
+
+        try:
+            json.loads('{"doc_id":')
+        except json.JSONDecodeError as error:
+            assert str(e.value) == f"Line 2: Invalid JSON: {error.msg}"
+
+    def test_exception_pickles_with_context(self):
+        """ValidationException keeps its line number and record across processes."""
+        error = pickle.loads(pickle.dumps(ValidationException("bad", 12, {"a": 1})))
+
+        assert (error.line_number, error.record, str(error)) == (12, {"a": 1}, "Line 12: bad")
+
+
+class TestParallelLoader:
+    """Test class for multi-process chunked loading."""
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Chunked worker parsing returns the same records in file order."""
+        records = [dict(VALID_RECORD, block_id=f"b{i}", page=i % 7 + 1) for i in range(500)]
+        path = _write_lines(tmp_path / "in.ndjson", records)
+
+        serial = NDJSONLoader().load_file(path)
+        parallel = NDJSONLoader().load_file(path, max_workers=2, chunk_lines=64)
+
+        assert parallel == serial
+
+    def test_parallel_error_line_numbers(self, tmp_path):
+        """The first invalid line is reported with its file line number."""
+        records = [dict(VALID_RECORD, block_id=f"b{i}") for i in range(300)]
+        records[150]["page"] = 0
+        records[250]["page"] = 0
+        path = _write_lines(tmp_path / "in.ndjson", records)
+
+        with pytest.raises(ValidationException) as e:
+            NDJSONLoader().load_file(path, max_workers=2, chunk_lines=50)
+
+        assert e.value.line_number == 151
+        assert e.value.record["block_id"] == "b150"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
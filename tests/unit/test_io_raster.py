@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared page raster cache.
+Verifies pages render once per key, views are read-only and evicted pages spill to disk.
+"""
+
+import io
+import shutil
+import fitz
+import numpy as np
+import pytest
+from pathlib import Path
+from PIL import Image
+
+from src.compareblocks.io import raster
+from src.compareblocks.io.raster import (
+    PageRasterCache, get_page_raster_cache, page_raster_scope, release_page_raster_cache, render_page_array
+)
+
+
+FIXTURE_PDF = Path(__file__).parent.parent / "fixtures" / "multi_column.pdf"
+
+
+class TestPageRasterCache:
+    """Test class for PageRasterCache and the shared cache registry."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
+        if not FIXTURE_PDF.exists():
+            pytest.skip("Fixture PDF not available")
+        self.tmp_path = tmp_path
+        self.pdf_path = tmp_path / "document.pdf"
+        shutil.copyfile(FIXTURE_PDF, self.pdf_path)
+        yield
+        release_page_raster_cache()
+
+    def test_renders_once_per_key(self):
+        """Repeated requests share one render; a new DPI or colorspace renders again."""
+        cache = PageRasterCache(str(self.pdf_path))
+        first = cache.get_array(0, 144)
+        second = cache.get_array(0, 144)
+        cache.get_array(0, 300)
+        gray = cache.get_array(0, 144, "gray")
+
+        assert first is second
+        assert cache.render_count == 3
+        assert gray.shape == first.shape[:2] + (1,)
+        cache.close()
+
+    def test_matches_png_round_trip(self):
+        """Cached pixels equal the previous render-encode-decode path."""
+        cache = PageRasterCache(str(self.pdf_path))
+        doc = fitz.open(str(self.pdf_path))
+        try:
+            pix = doc[0].get_pixmap(matrix=fitz.Matrix(2.0, 2.0))
+            expected = np.array(Image.open(io.BytesIO(pix.tobytes("png"))))
+        finally:
+            doc.close()
+
+        array = cache.get_array(0, 144)
+        image = cache.get_pil_image(0, 144)
+
+        assert np.array_equal(array, expected)
+        assert np.array_equal(np.asarray(image), expected)
+        cache.close()
+
+    def test_arrays_are_read_only(self):
+        """Consumers cannot modify pixels shared with other engines."""
+        cache = PageRasterCache(str(self.pdf_path))
+        array = cache.get_array(0, 72)
+
+        with pytest.raises(ValueError):
+            array[0, 0, 0] = 0
+        cache.close()
+
+    def test_evicted_pages_spill_to_memory_maps(self):
+        """Pages beyond the memory budget are served from disk without re-rendering."""
+        cache = PageRasterCache(str(self.pdf_path), max_bytes=1, spill_dir=str(self.tmp_path / "spill"))
+        first = np.array(cache.get_array(0, 72))
+        cache.get_array(0, 96)
+
+        spilled = cache.get_array(0, 72)
+
+        assert isinstance(spilled, np.memmap)
+        assert np.array_equal(spilled, first)
+        assert cache.render_count == 2
+        assert cache.get_cache_info()["spilled_entries"] == 1
+
+        cache.close()
+        assert list((self.tmp_path / "spill").iterdir()) == []
+
+    def test_eviction_without_spill_rerenders(self):
+        """With spilling disabled, evicted pages are rendered again on demand."""
+        cache = PageRasterCache(str(self.pdf_path), max_bytes=1, spill=False)
+        cache.get_array(0, 72)
+        cache.get_array(0, 96)
+        cache.get_array(0, 72)
+
+        assert cache.render_count == 3
+        cache.close()
+
+    def test_shared_cache_across_document_handles(self):
+        """Within a scope, pages of separately opened documents share the file's raster cache."""
+        with page_raster_scope(str(self.pdf_path)) as cache:
+            for _ in range(3):
+                doc = fitz.open(str(self.pdf_path))
+                try:
+                    render_page_array(doc[0], 144)
+                finally:
+                    doc.close()
+
+            assert get_page_raster_cache(str(self.pdf_path)) is cache
+            assert cache.render_count == 1
+
+    def test_no_shared_cache_outside_scope(self):
+        """Without an active scope, pages render directly and nothing is retained."""
+        doc = fitz.open(str(self.pdf_path))
+        try:
+            array = render_page_array(doc[0], 72)
+        finally:
+            doc.close()
+
+        assert array.flags.c_contiguous
+        assert get_page_raster_cache(str(self.pdf_path)) is None
+        assert raster._shared_caches == {}
+
+    def test_nested_scopes_release_at_outermost_exit(self):
+        """Inner scopes reuse the outer cache; spill files are deleted when the outer scope exits."""
+        spill_dir = self.tmp_path / "spill"
+        with page_raster_scope(str(self.pdf_path), max_bytes=1, spill_dir=str(spill_dir)) as outer:
+            with page_raster_scope(str(self.pdf_path)) as inner:
+                assert inner is outer
+                outer.get_array(0, 72)
+                outer.get_array(0, 96)
+            assert get_page_raster_cache(str(self.pdf_path)) is outer
+            assert any(spill_dir.iterdir())
+
+        assert get_page_raster_cache(str(self.pdf_path)) is None
+        assert list(spill_dir.iterdir()) == []
+
+    def test_release_deletes_spill_files(self):
+        """Force-releasing closes open scopes' caches and removes their spill files."""
+        spill_dir = self.tmp_path / "spill"
+        with page_raster_scope(str(self.pdf_path), max_bytes=1, spill_dir=str(spill_dir)) as cache:
+            cache.get_array(0, 72)
+            cache.get_array(0, 96)
+            release_page_raster_cache()
+
+            assert list(spill_dir.iterdir()) == []
+            assert get_page_raster_cache(str(self.pdf_path)) is None
+
+    def test_shared_cache_invalidated_on_change(self):
+        """Modifying the PDF replaces its shared cache."""
+        with page_raster_scope(str(self.pdf_path)) as before:
+            with open(self.pdf_path, 'ab') as f:
+                f.write(b"\n%")
+
+            assert get_page_raster_cache(str(self.pdf_path)) is None
+            with page_raster_scope(str(self.pdf_path)) as after:
+                assert after is not before
+
+    def test_renders_from_given_page(self):
+        """The page object passed in is rendered, not a fresh copy loaded from the file."""
+        doc = fitz.open(str(self.pdf_path))
+        try:
+            page = doc[0]
+            page.draw_rect(page.rect, color=(0, 0, 0), fill=(0, 0, 0))
+            with page_raster_scope(str(self.pdf_path)):
+                cached = render_page_array(page, 72)
+            direct = render_page_array(page, 72)
+        finally:
+            doc.close()
+
+        assert not cached.any()
+        assert np.array_equal(cached, direct)
+
+    def test_tesseract_engine_uses_shared_cache(self, monkeypatch):
+        """Repeated OCR passes over a page rasterize it once."""
+        from src.compareblocks.engines import ocr_pool, tesseract_engine
+        if not ocr_pool.PYTESSERACT_AVAILABLE:
+            pytest.skip("pytesseract not available")
+
+        images = []
+
+        def fake_image_to_data(image, lang, output_type):
+            images.append(image)
+            return {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [],
+                    'height': [], 'block_num': []}
+
+        monkeypatch.setattr(ocr_pool.pytesseract, "image_to_data", fake_image_to_data)
+        pool = ocr_pool.TesseractWorkerPool(max_workers=1, backend="pytesseract")
+        engine = tesseract_engine.TesseractEngine(dpi=150, ocr_pool=pool)
+
+        with page_raster_scope(str(self.pdf_path)) as cache:
+            doc = fitz.open(str(self.pdf_path))
+            try:
+                for _ in range(2):
+                    engine._extract_page_ocr(doc[0], 0)
+            finally:
+                doc.close()
+                pool.shutdown()
+
+            assert cache.render_count == 1
+            assert images[0].mode == "RGB"
+            assert images[0].size == cache.get_array(0, 150).shape[1::-1]
+
+    def test_invalid_colorspace(self):
+        """Unknown colorspaces are rejected."""
+        cache = PageRasterCache(str(self.pdf_path))
+        with pytest.raises(ValueError):
+            cache.get_array(0, 72, "cmyk")
+        assert raster.COLORSPACES.keys() == {"rgb", "gray"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
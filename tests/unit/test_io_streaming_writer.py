@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming consensus writer.
+Verifies output equals NDJSONWriter, sampled validation, atomic finalization and compression.
+"""
+
+import gzip
+import io
+import json
+import pytest
+import tracemalloc
+
+from src.compareblocks.io import writer as writer_module
+from src.compareblocks.io.writer import (
+    ExportException, NDJSONWriter, StreamingConsensusWriter, write_consensus_file, write_consensus_stream
+)
+
+
+def _decision(i):
+    return {
+        "doc_id": "doc", "page": i % 30 + 1, "block_id": f"p{i % 30}_b{i}", "selected_engine": "tesseract",
+        "final_text": f"Consensus text {i} – ünïcode", "decision_reason": "highest_score",
+        "engine_scores": {"tesseract": 1, "pymupdf": 0.5}, "anomaly_score": 0,
+        "character_consistency_score": 0.9, "bbox": [1, 2, 3, 4], "manual_override": False
+    }
+
+
+def _decisions(count):
+    for i in range(count):
+        yield _decision(i)
+
+
+def _reference_text(records):
+    stream = io.StringIO()
+    NDJSONWriter().write_stream(records, stream)
+    return stream.getvalue()
+
+
+class TestStreamingConsensusWriter:
+    """Test class for StreamingConsensusWriter."""
+
+    def test_output_matches_ndjson_writer(self, tmp_path):
+        """Full validation writes exactly what NDJSONWriter writes, from a generator."""
+        path = tmp_path / "consensus.ndjson"
+
+        count = write_consensus_stream(_decisions(2500), path, validate="full")
+
+        assert count == 2500
+        assert path.read_text(encoding="utf-8") == _reference_text(list(_decisions(2500)))
+        assert [p.name for p in tmp_path.iterdir()] == ["consensus.ndjson"]
+
+    def test_sampled_validation(self, tmp_path):
+        """Sampling validates every Nth record; unsampled records are still normalized."""
+        records = list(_decisions(10))
+        records[3]["decision_reason"] = "guess"
+
+        write_consensus_stream(records, tmp_path / "sampled.ndjson", validate="sample")
+        with pytest.raises(ExportException, match="record 3"):
+            write_consensus_stream(records, tmp_path / "every3.ndjson", validate="full")
+
+        lines = (tmp_path / "sampled.ndjson").read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[5])["bbox"] == [1.0, 2.0, 3.0, 4.0]
+        assert json.loads(lines[3])["decision_reason"] == "guess"
+
+    def test_failure_keeps_existing_file(self, tmp_path):
+        """A failed write leaves the previous file and no temporary files."""
+        path = tmp_path / "consensus.ndjson"
+        path.write_text("previous\n", encoding="utf-8")
+        records = list(_decisions(50))
+        records[40]["page"] = 0
+
+        with pytest.raises(ExportException):
+            write_consensus_stream(records, path, overwrite=True, validate="full")
+
+        assert path.read_text(encoding="utf-8") == "previous\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["consensus.ndjson"]
+        with pytest.raises(FileExistsError):
+            StreamingConsensusWriter(path)
+
+    def test_file_appears_only_on_close(self, tmp_path):
+        """Records are flushed in batches to a temporary file that is renamed on close."""
+        path = tmp_path / "consensus.ndjson"
+        writer = StreamingConsensusWriter(path, batch_size=10)
+        writer.write_all(_decisions(25))
+
+        assert not path.exists()
+        assert writer.close() == path
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 25
+        with pytest.raises(ExportException):
+            writer.write(_decision(0))
+
+    def test_gzip_compression(self, tmp_path):
+        """A .gz suffix writes gzip-compressed NDJSON."""
+        path = tmp_path / "consensus.ndjson.gz"
+
+        write_consensus_stream(_decisions(300), path)
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert f.read() == _reference_text(list(_decisions(300)))
+
+    def test_zstd_compression(self, tmp_path):
+        """zstd is used when installed and reported when it is not."""
+        path = tmp_path / "consensus.ndjson.zst"
+        if not writer_module.ZSTANDARD_AVAILABLE:
+            with pytest.raises(ExportException, match="zstandard"):
+                write_consensus_stream(_decisions(3), path)
+            return
+
+        write_consensus_stream(_decisions(300), path)
+
+        import zstandard
+        with open(path, "rb") as f:
+            text = zstandard.ZstdDecompressor().stream_reader(f).read().decode("utf-8")
+        assert text == _reference_text(list(_decisions(300)))
+
+    def test_memory_is_bounded(self, tmp_path):
+        """Peak traced memory does not grow with the number of streamed decisions."""
+        peaks = []
+        for count in (2000, 20000):
+            tracemalloc.start()
+            write_consensus_stream(_decisions(count), tmp_path / f"c{count}.ndjson", validate="off")
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        assert peaks[1] < peaks[0] * 2
+
+    def test_write_consensus_file_accepts_generators(self, tmp_path):
+        """write_consensus_file streams with full validation."""
+        path = tmp_path / "consensus.ndjson"
+
+        write_consensus_file(_decisions(20), path)
+
+        assert path.read_text(encoding="utf-8") == _reference_text(list(_decisions(20)))
+        with pytest.raises(ValueError):
+            StreamingConsensusWriter(tmp_path / "x.ndjson", validate="never")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped, offset-indexed NDJSON variation store.
+Verifies lookups return the records the loader produces and the sidecar index is reused and refreshed.
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+
+from src.compareblocks.io.loader import NDJSONLoader, ValidationException
+from src.compareblocks.io.variation_store import VariationStore, default_index_path
+
+
+def _records():
+    records = []
+    for i in range(60):
+        record = {"doc_id": "doc", "page": i % 4 + 1, "engine": ["tesseract", "pymupdf", "paddle"][i % 3],
+                  "raw_text": f"text é {i}", "confidence": 0.5}
+        if i % 5:
+            record["block_id"] = f"p{i % 4}_b{i % 7}"
+        if i % 2 or "block_id" not in record:
+            record["bbox"] = [i, 2, 3, 4]
+        records.append(record)
+    return records
+
+
+def _write(path: Path, records, line_end="\n"):
+    path.write_text(line_end.join(json.dumps(r, ensure_ascii=False) for r in records) + "\n\n",
+                    encoding="utf-8", newline="")
+    return path
+
+
+class TestVariationStore:
+    """Test class for VariationStore lookups and index persistence."""
+
+    def test_lookups_match_loaded_records(self, tmp_path):
+        """Block, page and engine lookups equal filtering the fully loaded file."""
+        path = _write(tmp_path / "vars.ndjson", _records(), line_end="\r\n")
+        loaded = NDJSONLoader().load_file(path)
+
+        with VariationStore(path) as store:
+            assert len(store) == len(loaded)
+            assert list(store) == loaded
+            for block_id in store.block_ids():
+                assert store.get_variations_for_block(block_id) == [
+                    r for r in loaded if r.get("block_id") == block_id]
+            for page in store.pages():
+                assert store.get_variations_by_page(page) == [r for r in loaded if r["page"] == page]
+            for engine in store.engines():
+                assert store.get_variations_by_engine(engine) == [r for r in loaded if r["engine"] == engine]
+            assert store.get_variations_for_block("missing") == []
+            assert store.get_variations_by_page(99) == []
+            assert store.block_ids() == sorted({r["block_id"] for r in loaded if "block_id" in r})
+
+    def test_sidecar_is_reused_until_file_changes(self, tmp_path):
+        """The index is built once, reused, and rebuilt when the file changes."""
+        path = _write(tmp_path / "vars.ndjson", _records())
+
+        first = VariationStore(path)
+        first.close()
+        second = VariationStore(path)
+        second.close()
+        assert default_index_path(path).exists()
+        assert (first.index_built, second.index_built) == (True, False)
+
+        records = _records()[:10]
+        _write(path, records)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with VariationStore(path) as store:
+            assert store.index_built
+            assert len(store) == 10
+
+    def test_stricter_validation_rebuilds_index(self, tmp_path):
+        """An index built without validation is not trusted by a validating open."""
+        path = _write(tmp_path / "vars.ndjson", _records() + [dict(_records()[1], extra=True)])
+
+        with VariationStore(path, validate="off") as store:
+            assert len(store) == 61
+        with pytest.raises(ValidationException) as e:
+            VariationStore(path)
+        assert e.value.line_number == 61
+
+    def test_empty_file_and_unpersisted_index(self, tmp_path):
+        """Empty files give an empty store; persist_index=False writes no sidecar."""
+        path = tmp_path / "empty.ndjson"
+        path.write_text("", encoding="utf-8")
+
+        with VariationStore(path, persist_index=False) as store:
+            assert len(store) == 0
+            assert store.get_variations_by_engine("tesseract") == []
+            assert store.pages() == []
+        assert not default_index_path(path).exists()
+
+    def test_missing_file(self, tmp_path):
+        """Opening a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            VariationStore(tmp_path / "missing.ndjson")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
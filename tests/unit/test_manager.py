@@ -131,7 +131,7 @@ class TestManager:
     
     def test_extraction_engine_manager_init(self):
         """Test ExtractionEngineManager initialization."""
-        with patch('src.compareblocks.engines.manager.PDFMetadataExtractor'):
+        with patch('src.compareblocks.io.pdf_metadata.PDFMetadataExtractor'):
             manager = ExtractionEngineManager()
             assert hasattr(manager, 'metadata_extractor')
             assert hasattr(manager, 'available_engines')
@@ -139,7 +139,7 @@ class TestManager:
     
     def test_extraction_engine_manager_detect_engines(self):
         """Test engine detection functionality."""
-        with patch('src.compareblocks.engines.manager.PDFMetadataExtractor'):
+        with patch('src.compareblocks.io.pdf_metadata.PDFMetadataExtractor'):
             manager = ExtractionEngineManager()
             engines = manager._detect_available_engines()
             
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for the NumPy batch IoU kernel in mapping.match.
+Verifies batch results are identical to the per-pair IoUMatcher methods.
+"""
+
+import random
+import numpy as np
+import pytest
+
+from src.compareblocks.gbg.types import BoundingBox, OrientationHints, SeedBlock
+from src.compareblocks.mapping.match import (
+    IoUMatcher, MatchConfig, batch_iou, batch_overlap_areas, boxes_to_array
+)
+from src.compareblocks.association.pymupdf_matcher import PyMuPDFBlockMatcher
+from src.compareblocks.mcp.handlers import ExtractionHandler
+from src.compareblocks.mcp.protocol import MCPProtocol
+from src.compareblocks.mcp.validation import MCPValidator
+
+
+def _random_boxes(count, seed):
+    rng = random.Random(seed)
+    return [
+        BoundingBox(x=rng.uniform(0, 300), y=rng.uniform(0, 300),
+                    width=rng.uniform(1, 120), height=rng.uniform(1, 60))
+        for _ in range(count)
+    ]
+
+
+class TestBatchIoUKernel:
+    """Test class for the batch IoU kernel."""
+
+    def setup_method(self):
+        """Set up random external and seed boxes."""
+        self.matcher = IoUMatcher()
+        self.external = _random_boxes(60, seed=1)
+        self.seeds = _random_boxes(80, seed=2)
+
+    def test_boxes_to_array_formats(self):
+        """All supported box representations convert to xywh rows."""
+        array = boxes_to_array([
+            BoundingBox(x=1, y=2, width=3, height=4),
+            [1, 2, 3, 4],
+            {"x": 1, "y": 2, "width": 3, "height": 4, "area": 12},
+            None,
+            {"x": 1},
+        ])
+        assert array.tolist() == [[1, 2, 3, 4]] * 3 + [[0, 0, 0, 0]] * 2
+
+        corners = boxes_to_array([[1, 2, 4, 6]], box_format="xyxy")
+        assert corners.tolist() == [[1, 2, 3, 4]]
+
+        with pytest.raises(ValueError):
+            boxes_to_array([], box_format="polar")
+
+    def test_matrices_match_scalar_methods(self):
+        """IoU and overlap matrices equal the scalar results bit for bit."""
+        iou = self.matcher.calculate_iou_matrix(self.external, self.seeds)
+        overlap = self.matcher.calculate_overlap_matrix(self.external, self.seeds)
+
+        assert iou.shape == (60, 80)
+        for i, ext in enumerate(self.external):
+            for j, seed in enumerate(self.seeds):
+                assert iou[i, j] == self.matcher.calculate_iou(ext, seed)
+                assert overlap[i, j] == self.matcher.calculate_overlap_area(ext, seed)
+
+    def test_kernel_functions_accept_arrays(self):
+        """Module-level kernels work directly on (N,4) arrays."""
+        ext = boxes_to_array(self.external)
+        seeds = boxes_to_array(self.seeds)
+        overlap = batch_overlap_areas(ext, seeds)
+
+        assert np.array_equal(batch_iou(ext, seeds, overlap), batch_iou(ext, seeds))
+
+    def test_top_k_matches_scalar_ranking(self):
+        """Top-k results follow match_to_seed_blocks ordering and thresholds."""
+        seed_blocks = [
+            SeedBlock(block_id=f"b{i}", page=0, bbox=bbox, orientation_hints=OrientationHints())
+            for i, bbox in enumerate(self.seeds)
+        ]
+        result = self.matcher.top_k_matches(self.external, self.seeds, k=3, chunk_size=7)
+
+        for row, ext in enumerate(self.external):
+            expected = self.matcher.match_to_seed_blocks(ext, seed_blocks)[:3]
+            for slot in range(3):
+                if slot < len(expected):
+                    assert seed_blocks[result.indices[row, slot]] is expected[slot].seed_block
+                    assert result.iou_scores[row, slot] == expected[slot].iou_score
+                    assert result.match_types[row, slot] == expected[slot].match_type
+                    assert result.confidences[row, slot] == expected[slot].confidence
+                else:
+                    assert result.indices[row, slot] == -1
+                    assert result.confidences[row, slot] == 0.0
+
+    def test_top_k_uses_config_thresholds(self):
+        """Match types come from the matcher's MatchConfig."""
+        matcher = IoUMatcher(MatchConfig(exact_match_threshold=0.99, good_match_threshold=0.2))
+        box = [[0.0, 0.0, 10.0, 10.0]]
+        result = matcher.top_k_matches(np.array(box), np.array([[0.0, 0.0, 10.0, 5.0]]))
+
+        assert result.iou_scores[0, 0] == 0.5
+        assert result.match_types[0, 0] == "good"
+
+        with pytest.raises(ValueError):
+            matcher.top_k_matches(box, box, k=0)
+
+    def test_top_k_with_no_seeds(self):
+        """An empty seed set yields empty slots for every row."""
+        result = self.matcher.top_k_matches(self.external, [], k=2)
+        assert result.indices.shape == (60, 2)
+        assert (result.indices == -1).all()
+
+
+class TestMatcherBBoxSimilarityRouting:
+    """Engine matchers produce the same bbox similarities through the kernel."""
+
+    def test_pymupdf_similarity_matrix_matches_scalar(self):
+        """PyMuPDFBlockMatcher batch similarity equals the per-pair helper."""
+        matcher = PyMuPDFBlockMatcher()
+        rng = random.Random(5)
+        engine_blocks = []
+        for i in range(25):
+            x, y = rng.uniform(0, 200), rng.uniform(0, 200)
+            engine_blocks.append({"block_id": f"e{i}", "bbox": [x, y, x + rng.uniform(1, 80), y + rng.uniform(1, 40)]})
+        gbg_blocks = [
+            {"block_id": f"g{i}", "bbox": {"x": b.x, "y": b.y, "width": b.width, "height": b.height}}
+            for i, b in enumerate(_random_boxes(30, seed=6))
+        ]
+
+        matrix = matcher._calculate_bbox_similarity_matrix(engine_blocks, gbg_blocks)
+        for i, engine_block in enumerate(engine_blocks):
+            for j, gbg_block in enumerate(gbg_blocks):
+                assert matrix[i, j] == matcher._calculate_bbox_similarity(engine_block["bbox"], gbg_block["bbox"])
+
+    def test_mcp_mapping_requires_four_element_bboxes(self):
+        """The MCP handler only maps [x, y, width, height] lists of exactly four values."""
+        handler = ExtractionHandler(MCPValidator(), MCPProtocol())
+        seed_blocks = [{"block_id": "blk_1", "bbox": {"x": 0.0, "y": 0.0, "width": 10.0, "height": 10.0}}]
+        variations = [{"raw_text": "a", "bbox": [0.0, 0.0, 10.0, 10.0]},
+                      {"raw_text": "b", "bbox": [0.0, 0.0, 10.0, 10.0, 1.0]}]
+
+        mapped = handler._map_variations_to_blocks(variations, seed_blocks)
+
+        assert [variation["raw_text"] for variation in mapped] == ["a"]
+        assert handler._calculate_iou(variations[0]["bbox"], seed_blocks[0]["bbox"]) == 1.0
+        assert handler._calculate_iou(variations[1]["bbox"], seed_blocks[0]["bbox"]) == 0.0
+
+    def test_mcp_mapping_picks_best_block(self):
+        """Chunked top-1 matching maps each variation to its best seed block, first one on ties."""
+        handler = ExtractionHandler(MCPValidator(), MCPProtocol())
+        boxes = _random_boxes(600, seed=7)
+        seed_blocks = [{"block_id": f"blk_{i}", "bbox": {"x": b.x, "y": b.y, "width": b.width, "height": b.height}}
+                       for i, b in enumerate(boxes[:300])]
+        # Every other variation duplicates a seed block, so some rows pass the 0.5 threshold
+        variations = [{"raw_text": str(i), "bbox": [b.x, b.y, b.width, b.height]}
+                      for i, b in enumerate(boxes[300:] + boxes[:300:2])]
+
+        mapped = handler._map_variations_to_blocks(variations, seed_blocks)
+
+        expected = []
+        for variation in variations:
+            scores = [handler._calculate_iou(variation["bbox"], block["bbox"]) for block in seed_blocks]
+            best = max(range(len(scores)), key=lambda j: (scores[j], -j))
+            if scores[best] > 0.5:
+                expected.append((variation["raw_text"], seed_blocks[best]["block_id"]))
+        assert [(v["raw_text"], v["block_id"]) for v in mapped] == expected
+        assert len(expected) >= 150
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
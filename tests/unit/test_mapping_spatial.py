@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Tests for the seed block spatial index and batched variation mapping.
+Verifies indexed matching returns the same results as a full linear scan.
+"""
+
+import json
+import random
+import numpy as np
+import pytest
+from pathlib import Path
+
+from src.compareblocks.gbg.types import BoundingBox, OrientationHints, SeedBlock
+from src.compareblocks.mapping.match import IoUMatcher, batch_overlap_areas
+from src.compareblocks.mapping.spatial import BoxGridIndex, SeedBlockSpatialIndex
+from src.compareblocks.mapping.variation_block import (
+    ExternalVariation, VariationBlockManager, VariationType
+)
+
+
+def _seed(block_id, page, x, y, width, height, text="seed"):
+    return SeedBlock(
+        block_id=block_id,
+        page=page,
+        bbox=BoundingBox(x=x, y=y, width=width, height=height),
+        orientation_hints=OrientationHints(),
+        text_content=text
+    )
+
+
+def _random_seed_blocks(count, pages=3, seed=7):
+    rng = random.Random(seed)
+    blocks = []
+    for i in range(count):
+        blocks.append(_seed(
+            f"blk_{i:05d}", rng.randrange(pages),
+            rng.uniform(0, 500), rng.uniform(0, 700),
+            rng.uniform(5, 200), rng.uniform(5, 80)
+        ))
+    return blocks
+
+
+class TestSeedBlockSpatialIndex:
+    """Test class for SeedBlockSpatialIndex."""
+
+    def test_query_returns_only_overlapping_blocks(self):
+        """Query returns overlapping blocks on the requested page only."""
+        index = SeedBlockSpatialIndex(cell_size=50.0)
+        index.insert(_seed("a", 0, 0, 0, 100, 100))
+        index.insert(_seed("b", 0, 300, 300, 50, 50))
+        index.insert(_seed("c", 1, 0, 0, 100, 100))
+        # Touching edges have zero intersection area and are excluded
+        index.insert(_seed("d", 0, 100, 0, 50, 50))
+
+        result = index.query(0, BoundingBox(x=10, y=10, width=50, height=50))
+
+        assert [block.block_id for block in result] == ["a"]
+
+    def test_insert_replace_and_remove(self):
+        """Replacing keeps insertion order and removal clears grid cells."""
+        index = SeedBlockSpatialIndex(cell_size=50.0)
+        index.insert(_seed("a", 0, 0, 0, 100, 100))
+        index.insert(_seed("b", 0, 10, 10, 100, 100))
+        index.insert(_seed("a", 0, 20, 20, 100, 100))
+
+        query_box = BoundingBox(x=30, y=30, width=10, height=10)
+        assert [block.block_id for block in index.query(0, query_box)] == ["a", "b"]
+        assert len(index) == 2
+
+        removed = index.remove("a")
+        assert removed.bbox.x == 20
+        assert "a" not in index
+        assert [block.block_id for block in index.query(0, query_box)] == ["b"]
+        assert index.remove("missing") is None
+
+    def test_invalid_cell_size(self):
+        """Non-positive cell sizes are rejected."""
+        with pytest.raises(ValueError):
+            SeedBlockSpatialIndex(cell_size=0)
+
+    def test_indexed_best_match_equals_linear_scan(self):
+        """Best matches through the index match a linear scan of all blocks."""
+        seed_blocks = _random_seed_blocks(400)
+        index = SeedBlockSpatialIndex()
+        for block in seed_blocks:
+            index.insert(block)
+
+        matcher = IoUMatcher()
+        rng = random.Random(11)
+        for _ in range(300):
+            base = rng.choice(seed_blocks)
+            bbox = BoundingBox(
+                x=base.bbox.x + rng.uniform(0, 3),
+                y=base.bbox.y + rng.uniform(0, 3),
+                width=base.bbox.width * rng.uniform(0.5, 1.2),
+                height=base.bbox.height * rng.uniform(0.5, 1.2)
+            )
+            linear = matcher.find_best_match(bbox, seed_blocks, page_filter=base.page)
+            indexed = matcher.find_best_match(bbox, index.query(base.page, bbox), page_filter=base.page)
+
+            if linear is None:
+                assert indexed is None
+            else:
+                assert indexed.seed_block.block_id == linear.seed_block.block_id
+                assert indexed.iou_score == linear.iou_score
+                assert indexed.match_type == linear.match_type
+
+
+class TestBatchedVariationMapping:
+    """Test class for batched VariationBlockManager mapping."""
+
+    def setup_method(self):
+        """Set up a manager with a few seed blocks."""
+        self.manager = VariationBlockManager()
+        self.manager.add_seed_blocks([
+            _seed("p0_a", 0, 10, 10, 200, 40, "Hello world"),
+            _seed("p0_b", 0, 10, 100, 200, 40, "Second block"),
+            _seed("p1_a", 1, 10, 10, 200, 40, "Next page"),
+        ])
+
+    def test_map_external_variations(self):
+        """Batch mapping classifies exact, partial and orphan variations."""
+        variations = [
+            ExternalVariation(doc_id="doc", page=0, engine="ocr", raw_text="Hello world",
+                              bbox=BoundingBox(x=10, y=10, width=200, height=40)),
+            ExternalVariation(doc_id="doc", page=0, engine="ocr", raw_text="Second",
+                              bbox=BoundingBox(x=10, y=100, width=100, height=40)),
+            ExternalVariation(doc_id="doc", page=0, engine="ocr", raw_text="Nowhere",
+                              bbox=BoundingBox(x=400, y=400, width=50, height=20)),
+        ]
+
+        mapped = self.manager.map_external_variations(iter(variations))
+
+        assert [v.variation_type for v in mapped] == [
+            VariationType.EXTERNAL, VariationType.CHILD, VariationType.ORPHAN
+        ]
+        assert mapped[0].block_id == "p0_a"
+        assert mapped[1].parent_block_id == "p0_b"
+
+        seed_variation = [
+            v for v in self.manager.get_variations_for_block("p0_b")
+            if v.variation_type == VariationType.SEED
+        ][0]
+        assert mapped[1].variation_id in seed_variation.child_blocks
+
+    def test_map_ndjson_file(self, tmp_path: Path):
+        """NDJSON records are mapped with 1-based pages converted to 0-based."""
+        ndjson_path = tmp_path / "variations.ndjson"
+        records = [
+            {"doc_id": "doc", "page": 2, "engine": "ocr", "raw_text": "Next page",
+             "bbox": [10.0, 10.0, 200.0, 40.0]},
+            {"doc_id": "doc", "page": 1, "engine": "ocr", "raw_text": "Hello world",
+             "block_id": "p0_a"},
+        ]
+        ndjson_path.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+
+        mapped = self.manager.map_ndjson_file(ndjson_path)
+
+        assert [v.block_id for v in mapped] == ["p1_a", "p0_a"]
+        assert [v.page for v in mapped] == [1, 0]
+        assert mapped[1].bbox == self.manager.seed_blocks["p0_a"].bbox
+
+    def test_record_without_bbox_or_known_block(self):
+        """Records that cannot be placed raise ValueError."""
+        with pytest.raises(ValueError):
+            self.manager.external_variation_from_record({
+                "doc_id": "doc", "page": 1, "engine": "ocr",
+                "raw_text": "x", "block_id": "unknown"
+            })
+
+
+class TestBoxGridIndex:
+    """Test class for the array-based box grid index."""
+
+    def test_query_matches_overlap_scan(self):
+        """Grid queries return exactly the boxes with positive overlap area."""
+        rng = random.Random(3)
+        boxes = np.array([[rng.uniform(0, 500), rng.uniform(0, 700), rng.uniform(0, 90), rng.uniform(0, 30)]
+                          for _ in range(300)] + [[0, 0, 5000, 5000], [10, 10, 0, 5]])
+        index = BoxGridIndex(boxes, cell_size=32.0)
+
+        for _ in range(50):
+            query = (rng.uniform(-50, 500), rng.uniform(-50, 700), rng.uniform(1, 400), rng.uniform(1, 100))
+            expected = np.flatnonzero(batch_overlap_areas(np.array([query]), boxes)[0] > 0)
+            assert index.query(query).tolist() == expected.tolist()
+
+    def test_degenerate_queries(self):
+        """Queries without positive area match nothing; cell size must be positive."""
+        index = BoxGridIndex(np.array([[0.0, 0.0, 10.0, 10.0]]))
+
+        assert len(index.query((5, 5, 0, 3))) == 0
+        assert index.query((5, 5, 1, 1)).tolist() == [0]
+        with pytest.raises(ValueError):
+            BoxGridIndex(np.zeros((0, 4)), cell_size=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded, non-blocking MCP extraction job queue.
+Verifies CPU-bound stages run off the event loop and submissions get backpressure.
+"""
+
+import asyncio
+import time
+import pytest
+from pathlib import Path
+
+from src.compareblocks.mcp.handlers import ExtractionHandler, ExtractionQueueFullError
+from src.compareblocks.mcp.protocol import MCPProtocol
+from src.compareblocks.mcp.validation import MCPValidator
+
+
+FIXTURE_PDF = Path(__file__).parent.parent / "fixtures" / "multi_column.pdf"
+
+
+def _submission():
+    return {
+        "pdf_path": str(FIXTURE_PDF.resolve().relative_to(Path.cwd().resolve())),
+        "variations": [{
+            "doc_id": "doc", "page": 1, "engine": "test_engine",
+            "raw_text": "Hello world", "bbox": [10.0, 10.0, 100.0, 20.0]
+        }]
+    }
+
+
+class TestExtractionQueue:
+    """Test class for the extraction job queue."""
+
+    def setup_method(self):
+        """Set up a handler with slow, stubbed processing stages."""
+        if not FIXTURE_PDF.exists():
+            pytest.skip("Fixture PDF not available")
+        try:
+            FIXTURE_PDF.resolve().relative_to(Path.cwd().resolve())
+        except ValueError:
+            pytest.skip("Tests must run from the repository root")
+
+        self.handler = ExtractionHandler(MCPValidator(), MCPProtocol(),
+                                         max_concurrent_jobs=1, max_queued_jobs=2)
+        self.notifications = []
+
+        async def sink(notification):
+            self.notifications.append(notification)
+
+        self.handler.notification_sink = sink
+
+        def slow_gbg_stage(pdf_path):
+            # Blocking sleep stands in for CPU-bound GBG work
+            time.sleep(0.3)
+            return [{"block_id": "blk_1", "bbox": {"x": 10.0, "y": 10.0, "width": 100.0, "height": 20.0}}]
+
+        self.handler._run_gbg_stage = slow_gbg_stage
+
+    def test_event_loop_stays_responsive(self):
+        """Ticks keep running on the loop while a job is being processed."""
+        async def scenario():
+            response = await self.handler.handle_submission(_submission())
+            ticks = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < 0.25:
+                await asyncio.sleep(0.01)
+                ticks += 1
+            await self.handler.wait_for_idle()
+            await self.handler.shutdown()
+            return response, ticks
+
+        response, ticks = asyncio.run(scenario())
+
+        assert response["status"] == "accepted"
+        assert ticks >= 10
+        session = self.handler.get_session(response["session_id"])
+        assert session.status == "completed"
+        assert session.results["total_blocks"] == 1
+
+        methods = [n.method for n in self.notifications]
+        assert methods.count("status_update") >= 2
+        assert methods[-1] == "processing_complete"
+
+    def test_queue_full_raises(self):
+        """Submissions beyond the queue capacity are refused and not registered."""
+        async def scenario():
+            accepted = [await self.handler.handle_submission(_submission())]
+            # Let the single worker take the first job off the queue
+            await asyncio.sleep(0.05)
+            accepted += [await self.handler.handle_submission(_submission()) for _ in range(2)]
+            with pytest.raises(ExtractionQueueFullError):
+                await self.handler.handle_submission(_submission())
+            info = self.handler.get_queue_info()
+            await self.handler.wait_for_idle()
+            await self.handler.shutdown()
+            return accepted, info
+
+        # One job starts processing, two wait in the queue, the fourth is refused
+        accepted, info = asyncio.run(scenario())
+
+        assert len(accepted) == 3
+        assert info["queued_jobs"] == 2
+        assert len(self.handler.list_sessions()) == 3
+        assert all(s.status == "completed" for s in self.handler.list_sessions())
+
+    def test_restart_after_shutdown(self):
+        """A handler that was shut down accepts and processes jobs again."""
+        async def run_one():
+            response = await self.handler.handle_submission(_submission())
+            await self.handler.wait_for_idle()
+            await self.handler.shutdown()
+            return response
+
+        first = asyncio.run(run_one())
+        second = asyncio.run(run_one())
+
+        assert self.handler.get_session(first["session_id"]).status == "completed"
+        assert self.handler.get_session(second["session_id"]).status == "completed"
+        assert self.handler._executor is None
+
+    def test_invalid_limits(self):
+        """Concurrency and queue limits must be positive."""
+        with pytest.raises(ValueError):
+            ExtractionHandler(MCPValidator(), MCPProtocol(), max_concurrent_jobs=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for batched OCR-aware matching in TesseractBlockMatcher.
+Verifies matrix scores equal the pairwise strategies and assignment is one-to-one and best-first.
+"""
+
+import random
+import pytest
+
+from src.compareblocks.association.tesseract_matcher import TesseractBlockMatcher
+
+
+WORDS = ["Utah", "State", "Standards", "English", "Language", "Arts", "GRADE", "Strand", "reading",
+         "writing", "board", "of", "education", "adopted", "May", "2023", "Speaking", "listening"]
+
+
+def _corrupt(text, rng):
+    """Apply typical OCR substitutions to some characters."""
+    swaps = {"l": "1", "O": "0", "S": "5", "B": "8", "e": "c", "a": "o"}
+    return ''.join(swaps[c] if c in swaps and rng.random() < 0.3 else c for c in text)
+
+
+def _page(seed):
+    rng = random.Random(seed)
+    gbg_blocks, engine_blocks = [], []
+    for i in range(rng.randint(2, 25)):
+        text = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 6)))
+        if rng.random() < 0.3:
+            text = text.upper()
+        gbg_blocks.append({'block_id': f'g{i}', 'text_content': text,
+                           'bbox': {'x': 10, 'y': 20 * i, 'width': 200, 'height': 15}})
+        for copy in range(rng.choice([0, 1, 1, 2])):
+            engine_text = _corrupt(text, rng) if rng.random() < 0.7 else ' '.join(rng.sample(WORDS, 3))
+            engine_blocks.append({'block_id': f'e{i}_{copy}', 'page': 0, 'text': engine_text,
+                                  'bbox': [10, 20 * i, 210, 20 * i + 15], 'confidence': 0.9})
+    rng.shuffle(engine_blocks)
+    return {'pages': {'0': {'blocks': gbg_blocks}}}, {'blocks': engine_blocks}
+
+
+class TestBatchedTesseractMatching:
+    """Test class for batched Tesseract strategies."""
+
+    def setup_method(self):
+        """Set up the matcher."""
+        self.matcher = TesseractBlockMatcher()
+
+    def test_matches_are_one_to_one_and_rescorable(self):
+        """Each block is used once and every score equals the pairwise strategy's score."""
+        try_methods = {
+            'exact_text': self.matcher._try_exact_match,
+            'ocr_normalized': self.matcher._try_ocr_normalized_match,
+            'fuzzy_content': self.matcher._try_fuzzy_content_match,
+            'pattern_based': self.matcher._try_pattern_match,
+        }
+        for seed in range(40):
+            gbg_data, engine_data = _page(seed)
+            gbg_by_id = {b['block_id']: b for b in self.matcher._extract_gbg_blocks_by_page(gbg_data)[0]}
+            engine_by_id = {b['block_id']: b for b in self.matcher._extract_engine_blocks_by_page(engine_data)[0]}
+
+            matches = self.matcher.match_blocks(gbg_data, engine_data)
+
+            assert len({m.engine_block_id for m in matches}) == len(matches)
+            assert len({m.gbg_block_id for m in matches}) == len(matches)
+            for match in matches:
+                pairwise = try_methods[match.match_type](engine_by_id[match.engine_block_id],
+                                                         gbg_by_id[match.gbg_block_id])
+                assert pairwise == match
+
+    def test_best_scoring_pair_wins(self):
+        """A later engine block with a better score takes the GBG block regardless of order."""
+        gbg_data = {'pages': {'0': {'blocks': [
+            {'block_id': 'g0', 'text_content': 'Reading Standards', 'bbox': {'x': 0, 'y': 0, 'width': 9, 'height': 9}}
+        ]}}}
+        engine_blocks = [
+            {'block_id': 'weak', 'page': 0, 'text': 'Readimg Stamdards', 'bbox': [0, 0, 9, 9]},
+            {'block_id': 'strong', 'page': 0, 'text': 'Reading 5tandards', 'bbox': [0, 0, 9, 9]},
+        ]
+
+        for blocks in (engine_blocks, engine_blocks[::-1]):
+            matches = self.matcher.match_blocks(gbg_data, {'blocks': blocks})
+            assert [(m.engine_block_id, m.match_type) for m in matches] == [('strong', 'ocr_normalized')]
+
+    def test_exact_matches_come_first(self):
+        """Whitespace and case differences match exactly before any fuzzy strategy."""
+        gbg_data = {'pages': {'0': {'blocks': [
+            {'block_id': 'g0', 'text_content': 'Utah  State\nStandards', 'bbox': {}}
+        ]}}}
+        engine_data = {'blocks': [{'block_id': 'e0', 'page': 0, 'text': 'utah state standards', 'bbox': []}]}
+
+        matches = self.matcher.match_blocks(gbg_data, engine_data)
+
+        assert [(m.match_type, m.similarity_score) for m in matches] == [('exact_text', 1.0)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])